@@ -0,0 +1,106 @@
+from datetime import date
+
+from models.bencana import Bencana
+from models.korban import Korban
+from models.obat import Obat
+from models.pemeriksaan import Pemeriksaan
+from models.posko import Posko
+from models.resep_obat import ResepObat
+from models.tenaga_medis import TenagaMedis
+
+
+def _tanggal(nilai: date | None) -> str | None:
+    return nilai.isoformat() if nilai is not None else None
+
+
+def bencana_ke_dict(bencana: Bencana) -> dict:
+    return {
+        "id_bencana": bencana.get_id_bencana(),
+        "jenis": bencana.get_jenis(),
+        "lokasi": bencana.get_lokasi(),
+        "tanggal_mulai": _tanggal(bencana.get_tanggal_mulai()),
+        "status": bencana.get_status().value,
+    }
+
+
+def posko_ke_dict(posko: Posko) -> dict:
+    return {
+        "id_posko": posko.get_id_posko(),
+        "id_bencana": posko.get_bencana().get_id_bencana(),
+        "nama_posko": posko.get_nama_posko(),
+        "alamat_posko": posko.get_alamat_posko(),
+        "kapasitas_posko": posko.get_kapasitas_posko(),
+        "status_posko": posko.get_status_posko().value,
+    }
+
+
+def _orang_ke_dict(orang) -> dict:
+    return {
+        "id_orang": orang.get_id_orang(),
+        "nama_orang": orang.get_nama_orang(),
+        "alamat_orang": orang.get_alamat_orang(),
+        "jenis_kelamin_orang": orang.get_jenis_kelamin_orang().value,
+        "tanggal_lahir_orang": _tanggal(orang.get_tanggal_lahir_orang()),
+    }
+
+
+def tenaga_medis_ke_dict(tenaga_medis: TenagaMedis) -> dict:
+    data = _orang_ke_dict(tenaga_medis)
+    data.update(
+        id_posko=tenaga_medis.get_posko().get_id_posko(),
+        no_izin_praktik=tenaga_medis.get_no_izin_praktik(),
+        role=tenaga_medis.get_role().value,
+        spesialisasi=tenaga_medis.get_spesialisasi(),
+    )
+    return data
+
+
+def korban_ke_dict(korban: Korban) -> dict:
+    data = _orang_ke_dict(korban)
+    data.update(
+        id_posko=korban.get_posko().get_id_posko(),
+        status_triase=korban.get_status_triase().value,
+        kondisi_awal=korban.get_kondisi_awal(),
+        lokasi_ditemukan=korban.get_lokasi_ditemukan(),
+    )
+    return data
+
+
+def obat_ke_dict(obat: Obat) -> dict:
+    return {
+        "id_obat": obat.get_id_obat(),
+        "nama": obat.get_nama_obat(),
+        "stok": obat.get_stock_obat(),
+        "satuan": obat.get_satuan_obat(),
+        "tanggal_kadaluarsa": _tanggal(obat.get_tanggal_kadaluarsa_obat()),
+        "titik_pesan_ulang": obat.get_titik_pesan_ulang(),
+    }
+
+
+def pemeriksaan_ke_dict(pemeriksaan: Pemeriksaan) -> dict:
+    return {
+        "id_pemeriksaan": pemeriksaan.get_id_pemeriksaan(),
+        "id_korban": pemeriksaan.get_korban().get_id_orang(),
+        "id_tenaga_medis": pemeriksaan.get_tenaga_medis().get_id_orang(),
+        "tanggal_pemeriksaan": _tanggal(pemeriksaan.get_tanggal_pemeriksaan()),
+        "keluhan": pemeriksaan.get_keluhan(),
+        "diagnosa": pemeriksaan.get_diagnosa(),
+        "status_triase": pemeriksaan.get_status_triase().value,
+    }
+
+
+def resep_ke_dict(resep: ResepObat) -> dict:
+    return {
+        "id_resep": resep.get_id_resep(),
+        "id_pemeriksaan": resep.get_pemeriksaan().get_id_pemeriksaan(),
+        "tanggal_resep": _tanggal(resep.get_tanggal_resep()),
+        "items": [
+            {
+                "id_obat": item.get_obat().get_id_obat(),
+                "qty": item.get_qty(),
+                "aturan_pakai": item.get_aturan_pakai(),
+                "dosis": item.get_dosis(),
+            }
+            for item in resep.get_items()
+        ],
+    }
@@ -0,0 +1,539 @@
+"""
+Server HTTP/JSON lokal di atas service (stdlib http.server, tanpa dependensi).
+
+Endpoint (ENTITAS: bencana, posko, tenaga-medis, korban, obat, pemeriksaan, resep):
+    GET  /kesehatan            -> {"status": "ok"}
+    POST /ENTITAS              -> buat_*(**body), 201 {"id_...": ...}
+    POST /ENTITAS/batch        -> body berupa list record, 200 {"hasil": [...]}
+    GET  /ENTITAS              -> seluruh data, di-stream (chunked) dari iter_semua_*()
+    GET  /ENTITAS/<id>         -> satu data, 404 jika tidak ada
+
+Field body sama dengan parameter method buat_* pada service; field
+tanggal_* ditulis sebagai "YYYY-MM-DD". Error dikembalikan sebagai
+{"error": "..."}: ValueError -> 400, KonflikVersi -> 409, RuntimeError -> 500.
+
+Koneksi memakai HTTP/1.1 keep-alive, tetapi worker dipegang per request,
+bukan per koneksi: di antara request, koneksi diparkir pada thread penjaga
+(selector) dan baru dikirim lagi ke pool saat request berikutnya tiba.
+Koneksi yang menganggur BATAS_IDLE detik ditutup. Jumlah worker dibatasi;
+request berikutnya menunggu di antrian terbatas, dan jika antrian juga
+penuh langsung dijawab 503.
+
+Cara pakai (dari root project):
+    python -m api.server                 # sqlite (data/dhms.db), port 8080
+    python -m api.server memory 8081     # in-memory (dibungkus RepositoryAmanThread)
+    python -m api.server sqlite 8080 data/posko.db
+"""
+import inspect
+import json
+import selectors
+import socket
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit
+
+from main import buat_layanan, buat_repository_memory, buat_repository_sqlite
+from repositories.base_repository import KonflikVersi
+from utils.loggers import get_logger
+
+from .serialisasi import (
+    bencana_ke_dict,
+    korban_ke_dict,
+    obat_ke_dict,
+    pemeriksaan_ke_dict,
+    posko_ke_dict,
+    resep_ke_dict,
+    tenaga_medis_ke_dict,
+)
+
+JUMLAH_WORKER_DEFAULT = 8
+BATAS_IDLE = 5.0  # detik; koneksi keep-alive yang menganggur ditutup
+BATAS_BACA = 5.0  # detik; klien yang berhenti di tengah request diputus
+BATAS_KONEKSI_IDLE = 512  # koneksi yang diparkir; jika penuh, yang paling lama ditutup
+BATAS_BODY = 8 * 1024 * 1024
+BATAS_BATCH = 1_000
+UKURAN_POTONGAN = 64 * 1024  # byte per chunk saat streaming list
+
+# path -> (nama service / akhiran method buat_*, ambil_*, iter_semua_*; field ID; serializer)
+_ENTITAS: dict[str, tuple[str, str, Callable[[object], dict]]] = {
+    "bencana": ("bencana", "id_bencana", bencana_ke_dict),
+    "posko": ("posko", "id_posko", posko_ke_dict),
+    "tenaga-medis": ("tenaga_medis", "id_orang", tenaga_medis_ke_dict),
+    "korban": ("korban", "id_orang", korban_ke_dict),
+    "obat": ("obat", "id_obat", obat_ke_dict),
+    "pemeriksaan": ("pemeriksaan", "id_pemeriksaan", pemeriksaan_ke_dict),
+    "resep": ("resep", "id_resep", resep_ke_dict),
+}
+
+
+class _GalatHTTP(Exception):
+    """Error yang langsung dipetakan ke status HTTP tertentu."""
+
+    def __init__(self, status: int, pesan: str):
+        super().__init__(pesan)
+        self.status = status
+        self.pesan = pesan
+
+
+def _ke_json(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _tanda_tangan(fungsi: Callable) -> inspect.Signature:
+    return inspect.signature(fungsi)
+
+
+def _argumen(fungsi: Callable, record) -> dict:
+    """
+    Mengubah satu record JSON menjadi kwargs untuk method service.
+
+    Field tanggal_* diubah dari "YYYY-MM-DD" menjadi date; field yang tidak
+    dikenal atau field wajib yang tidak ada menghasilkan ValueError.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Record harus berupa objek JSON")
+    kwargs = {}
+    for nama, nilai in record.items():
+        if nama.startswith("tanggal_") and isinstance(nilai, str):
+            try:
+                nilai = date.fromisoformat(nilai)
+            except ValueError:
+                raise ValueError(f"Format {nama} harus YYYY-MM-DD")
+        kwargs[nama] = nilai
+    try:
+        _tanda_tangan(fungsi).bind(**kwargs)
+    except TypeError as e:
+        raise ValueError(f"Field tidak valid: {e}")
+    return kwargs
+
+
+class PenanganAPI(BaseHTTPRequestHandler):
+    """
+    Handler satu koneksi; setiap handle() melayani tepat satu request.
+
+    Jika koneksi tetap dibuka (keep-alive), handler beserta buffer rfile-nya
+    disimpan ServerAPI sampai request berikutnya tiba, tanpa menahan worker.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "DHMS-API/1.0"
+    timeout = BATAS_BACA
+    disable_nagle_algorithm = True  # header dan body dikirim terpisah; jangan tunggu ACK tertunda
+    _logger = get_logger(__name__)
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+
+    def finish(self):
+        # Koneksi keep-alive dipakai lagi untuk request berikutnya: file socket jangan ditutup
+        if self.close_connection:
+            super().finish()
+
+    # ===== Dispatch =====
+    def do_GET(self):
+        self._layani(self._rute_get)
+
+    def do_POST(self):
+        self._layani(self._rute_post)
+
+    def _layani(self, rute: Callable[[list[str]], None]) -> None:
+        segmen = [s for s in urlsplit(self.path).path.split("/") if s]
+        try:
+            rute(segmen)
+        except _GalatHTTP as e:
+            self._kirim_json(e.status, {"error": e.pesan})
+        except KonflikVersi as e:
+            self._kirim_json(409, {"error": str(e)})
+        except ValueError as e:
+            self._kirim_json(400, {"error": str(e)})
+        except RuntimeError as e:
+            self._kirim_json(500, {"error": str(e)})
+        except Exception:
+            self._logger.exception("Kesalahan tak terduga saat melayani %s %s", self.command, self.path)
+            self._kirim_json(500, {"error": "Kesalahan internal server"})
+
+    def _entitas(self, nama: str) -> tuple[object, str, str, Callable[[object], dict]]:
+        if nama not in _ENTITAS:
+            raise _GalatHTTP(404, f"Endpoint /{nama} tidak ada")
+        akhiran, field_id, ke_dict = _ENTITAS[nama]
+        return self.server.layanan[akhiran], akhiran, field_id, ke_dict
+
+    def _rute_get(self, segmen: list[str]) -> None:
+        if not segmen or segmen == ["kesehatan"]:
+            self._kirim_json(200, {"status": "ok"})
+            return
+        if len(segmen) > 2:
+            raise _GalatHTTP(404, "Endpoint tidak ada")
+
+        layanan, akhiran, _, ke_dict = self._entitas(segmen[0])
+        if len(segmen) == 1:
+            self._kirim_stream(map(ke_dict, getattr(layanan, f"iter_semua_{akhiran}")()))
+            return
+
+        data = getattr(layanan, f"ambil_{akhiran}")(segmen[1])
+        if data is None:
+            raise _GalatHTTP(404, f"{segmen[0]} {segmen[1]} tidak ditemukan")
+        self._kirim_json(200, ke_dict(data))
+
+    def _rute_post(self, segmen: list[str]) -> None:
+        body = self._baca_json()
+        if len(segmen) not in (1, 2) or (len(segmen) == 2 and segmen[1] != "batch"):
+            raise _GalatHTTP(404, "Endpoint tidak ada")
+
+        layanan, akhiran, field_id, _ = self._entitas(segmen[0])
+        buat = getattr(layanan, f"buat_{akhiran}")
+        if len(segmen) == 1:
+            self._kirim_json(201, {field_id: buat(**_argumen(buat, body))})
+            return
+
+        if not isinstance(body, list):
+            raise ValueError("Body batch harus berupa list record")
+        if len(body) > BATAS_BATCH:
+            raise _GalatHTTP(413, f"Batch maksimal {BATAS_BATCH} record")
+        if akhiran == "korban":
+            hasil = self._batch_korban(layanan, body)
+        else:
+            hasil = self._batch_per_record(buat, field_id, body)
+        self._kirim_json(200, {"hasil": hasil})
+
+    # ===== Batch =====
+    @staticmethod
+    def _batch_per_record(buat: Callable, field_id: str, records: list) -> list[dict]:
+        """Memanggil buat_* per record; record yang gagal tidak menghentikan record lain."""
+        hasil = []
+        for i, record in enumerate(records):
+            baris = {"indeks": i, "sukses": False, field_id: None, "error": None}
+            try:
+                baris[field_id] = buat(**_argumen(buat, record))
+                baris["sukses"] = True
+            except (TypeError, ValueError, RuntimeError) as e:
+                baris["error"] = str(e)
+            hasil.append(baris)
+        return hasil
+
+    @staticmethod
+    def _batch_korban(korban_service, records: list) -> list[dict]:
+        """Registrasi massal lewat buat_korban_batch (satu tambah_banyak per repository)."""
+        hasil: list[dict | None] = [None] * len(records)
+        valid, indeks_valid = [], []
+        for i, record in enumerate(records):
+            try:
+                valid.append(_argumen(korban_service.buat_korban, record))
+                indeks_valid.append(i)
+            except ValueError as e:
+                hasil[i] = {"indeks": i, "sukses": False, "id_orang": None, "error": str(e)}
+        for i, baris in zip(indeks_valid, korban_service.buat_korban_batch(valid)):
+            baris["indeks"] = i
+            hasil[i] = baris
+        return hasil
+
+    # ===== I/O =====
+    def _baca_json(self):
+        panjang = self.headers.get("Content-Length")
+        if panjang is None:
+            self.close_connection = True
+            raise _GalatHTTP(411, "Header Content-Length wajib diisi")
+        try:
+            panjang = int(panjang)
+        except ValueError:
+            self.close_connection = True
+            raise _GalatHTTP(400, "Content-Length tidak valid")
+        if panjang > BATAS_BODY:
+            self.close_connection = True  # body tidak dibaca, koneksi tidak bisa dipakai ulang
+            raise _GalatHTTP(413, f"Body maksimal {BATAS_BODY} byte")
+        try:
+            return json.loads(self.rfile.read(panjang))
+        except ValueError:
+            raise ValueError("Body bukan JSON yang valid")
+
+    def _kirim_json(self, status: int, data) -> None:
+        body = _ke_json(data)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _kirim_stream(self, items: Iterator[dict]) -> None:
+        """
+        Mengirim list JSON dengan Transfer-Encoding: chunked.
+
+        Data dibaca dari iterator halaman demi halaman, jadi memori server
+        tidak bergantung pada jumlah data. Jika iterasi gagal di tengah jalan
+        status 200 sudah terkirim: koneksi ditutup tanpa chunk penutup agar
+        klien tahu respons terpotong.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        potongan, ukuran, pemisah = [b"["], 1, b""
+        try:
+            for item in items:
+                data = pemisah + _ke_json(item)
+                potongan.append(data)
+                ukuran += len(data)
+                pemisah = b","
+                if ukuran >= UKURAN_POTONGAN:
+                    self._tulis_chunk(b"".join(potongan))
+                    potongan, ukuran = [], 0
+        except OSError:
+            self._logger.warning("Klien %s terputus saat streaming %s", self.address_string(), self.path)
+            self.close_connection = True
+            return
+        except Exception:
+            self._logger.exception("Streaming %s gagal, koneksi ditutup", self.path)
+            self.close_connection = True
+            return
+        potongan.append(b"]")
+        self._tulis_chunk(b"".join(potongan))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _tulis_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def log_message(self, format, *args):
+        self._logger.debug("%s - " + format, self.address_string(), *args)
+
+
+class ServerAPI(HTTPServer):
+    """
+    HTTPServer dengan pool worker terbatas.
+
+    ThreadingHTTPServer membuat satu thread baru per koneksi tanpa batas;
+    di sini request dilayani ThreadPoolExecutor berukuran tetap. Paling
+    banyak jumlah_worker + panjang_antrian request diproses atau menunggu
+    sekaligus; sisanya langsung dijawab 503 agar klien bisa mencoba lagi.
+
+    Koneksi yang belum mengirim request (baru atau keep-alive di antara
+    request) tidak memakai worker: koneksi itu diparkir pada selector milik
+    thread penjaga, yang mengirimnya ke pool begitu ada data masuk dan
+    menutupnya setelah BATAS_IDLE detik tanpa request.
+    """
+
+    request_queue_size = 128  # backlog listen(); default socketserver hanya 5
+
+    def __init__(
+        self,
+        alamat: tuple[str, int],
+        layanan: dict,
+        jumlah_worker: int = JUMLAH_WORKER_DEFAULT,
+        panjang_antrian: int | None = None,
+    ):
+        """
+        Inisialisasi server (socket langsung di-bind).
+
+        Args:
+            alamat (tuple[str, int]): (host, port); port 0 memilih port bebas.
+            layanan (dict): Service hasil main.buat_layanan().
+            jumlah_worker (int, optional): Request yang dilayani bersamaan. Default: 8.
+            panjang_antrian (int | None, optional): Request yang boleh menunggu worker.
+                Default: 4 x jumlah_worker.
+        """
+        if not isinstance(jumlah_worker, int) or jumlah_worker <= 0:
+            raise ValueError("Jumlah worker harus integer positif")
+        if panjang_antrian is None:
+            panjang_antrian = 4 * jumlah_worker
+        super().__init__(alamat, PenanganAPI)
+        self.layanan = layanan
+        self._pool = ThreadPoolExecutor(max_workers=jumlah_worker, thread_name_prefix="api")
+        self._slot = threading.BoundedSemaphore(jumlah_worker + panjang_antrian)
+        self._logger = get_logger(__name__)
+
+        # Koneksi yang menunggu diparkir dikumpulkan di _antrian_parkir lalu diambil penjaga
+        self._kunci_parkir = threading.Lock()
+        self._antrian_parkir: list[tuple[socket.socket, tuple, PenanganAPI | None]] = []
+        self._berhenti = False
+        self._bangun_baca, self._bangun_tulis = socket.socketpair()
+        self._bangun_baca.setblocking(False)
+        self._bangun_tulis.setblocking(False)
+        self._penjaga = threading.Thread(target=self._jaga, name="api-penjaga", daemon=True)
+        self._penjaga.start()
+
+    def process_request(self, request, client_address):
+        if self._ada_data(request):
+            self._kirim(request, client_address)
+        else:
+            self._parkir(request, client_address, None)
+
+    def _kirim(self, request, client_address, penangan: PenanganAPI | None = None) -> None:
+        """Mengirim satu request ke pool, atau menjawab 503 jika antrian penuh."""
+        if not self._slot.acquire(blocking=False):
+            self._logger.warning("Antrian worker penuh, request dari %s ditolak", client_address)
+            self._tolak(request)
+            self._tutup(request, penangan)
+            return
+        self._pool.submit(self._proses, request, client_address, penangan)
+
+    def _proses(self, request, client_address, penangan: PenanganAPI | None) -> None:
+        """Melayani satu request di worker, lalu memarkir koneksi jika tetap dibuka."""
+        try:
+            if penangan is None:
+                penangan = self.RequestHandlerClass(request, client_address, self)
+            else:
+                penangan.handle()
+                penangan.finish()
+            lanjut = not penangan.close_connection
+        except Exception:
+            self.handle_error(request, client_address)
+            lanjut = False
+        finally:
+            self._slot.release()
+
+        if not lanjut:
+            self.shutdown_request(request)
+        elif self._ada_data(request, penangan.rfile):
+            # Request pipelined sudah ada di buffer rfile; selector tidak akan melihatnya
+            self._kirim(request, client_address, penangan)
+        else:
+            self._parkir(request, client_address, penangan)
+
+    def _ada_data(self, request: socket.socket, rfile=None) -> bool:
+        """Cek tanpa blocking apakah sudah ada data (EOF atau error juga dianggap ada)."""
+        request.setblocking(False)
+        try:
+            if rfile is not None:
+                return bool(rfile.peek(1))
+            request.recv(1, socket.MSG_PEEK)
+            return True
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
+        finally:
+            request.settimeout(self.RequestHandlerClass.timeout)
+
+    def _parkir(self, request, client_address, penangan: PenanganAPI | None) -> None:
+        with self._kunci_parkir:
+            if not self._berhenti:
+                self._antrian_parkir.append((request, client_address, penangan))
+                try:
+                    self._bangun_tulis.send(b"\0")
+                except OSError:
+                    pass  # buffer socketpair penuh: penjaga toh sudah akan bangun
+                return
+        self._tutup(request, penangan)
+
+    def _tutup(self, request, penangan: PenanganAPI | None) -> None:
+        if penangan is not None:
+            penangan.close_connection = True
+            penangan.finish()
+        self.shutdown_request(request)
+
+    def _jaga(self) -> None:
+        """
+        Loop thread penjaga: menunggu request berikutnya pada koneksi yang diparkir.
+
+        BATAS_IDLE sama untuk semua koneksi, jadi urutan parkir juga urutan
+        batas waktunya: koneksi yang kedaluwarsa selalu ada di depan dict.
+        """
+        selector = selectors.DefaultSelector()
+        selector.register(self._bangun_baca, selectors.EVENT_READ)
+        parkir: dict[socket.socket, tuple[float, tuple, PenanganAPI | None]] = {}
+        try:
+            while True:
+                tunggu = None
+                if parkir:
+                    tunggu = max(0.0, next(iter(parkir.values()))[0] - time.monotonic())
+                for kunci, _ in selector.select(tunggu):
+                    if kunci.fileobj is self._bangun_baca:
+                        try:
+                            self._bangun_baca.recv(4096)
+                        except BlockingIOError:
+                            pass
+                        continue
+                    selector.unregister(kunci.fileobj)
+                    _, client_address, penangan = parkir.pop(kunci.fileobj)
+                    self._kirim(kunci.fileobj, client_address, penangan)
+
+                with self._kunci_parkir:
+                    if self._berhenti:
+                        break
+                    baru, self._antrian_parkir = self._antrian_parkir, []
+                sekarang = time.monotonic()
+                for request, client_address, penangan in baru:
+                    if len(parkir) >= BATAS_KONEKSI_IDLE:
+                        terlama = next(iter(parkir))
+                        selector.unregister(terlama)
+                        self._tutup(terlama, parkir.pop(terlama)[2])
+                    parkir[request] = (sekarang + BATAS_IDLE, client_address, penangan)
+                    selector.register(request, selectors.EVENT_READ)
+                while parkir:
+                    request, (batas, _, penangan) = next(iter(parkir.items()))
+                    if batas > sekarang:
+                        break
+                    del parkir[request]
+                    selector.unregister(request)
+                    self._tutup(request, penangan)
+        except Exception:
+            self._logger.exception("Thread penjaga koneksi berhenti karena error")
+        finally:
+            with self._kunci_parkir:
+                self._berhenti = True
+                sisa, self._antrian_parkir = self._antrian_parkir, []
+            for request, (_, _, penangan) in parkir.items():
+                self._tutup(request, penangan)
+            for request, _, penangan in sisa:
+                self._tutup(request, penangan)
+            selector.close()
+
+    @staticmethod
+    def _tolak(request: socket.socket) -> None:
+        body = _ke_json({"error": "Server sedang penuh, coba lagi"})
+        try:
+            request.settimeout(1.0)
+            request.sendall(
+                b"HTTP/1.1 503 Service Unavailable\r\nContent-Type: application/json; charset=utf-8\r\n"
+                b"Content-Length: %d\r\nRetry-After: 1\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+            )
+        except OSError:
+            pass
+
+    def handle_error(self, request, client_address):
+        self._logger.exception("Koneksi %s berakhir dengan error", client_address)
+
+    def server_close(self):
+        super().server_close()
+        with self._kunci_parkir:
+            self._berhenti = True
+        try:
+            self._bangun_tulis.send(b"\0")
+        except OSError:
+            pass
+        self._penjaga.join()
+        self._pool.shutdown(wait=True)
+        self._bangun_baca.close()
+        self._bangun_tulis.close()
+
+
+def main(backend: str, port: int, path_db: str = "data/dhms.db") -> None:
+    # Server melayani banyak koneksi sekaligus: repository in-memory wajib dibungkus kunci
+    repos = buat_repository_sqlite(path_db) if backend == "sqlite" else buat_repository_memory(aman_thread=True)
+    server = ServerAPI(("127.0.0.1", port), buat_layanan(repos))
+    host, port = server.server_address
+    print(f"Server API ({backend}) berjalan di http://{host}:{port} (Ctrl+C untuk berhenti)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else "sqlite",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8080,
+        sys.argv[3] if len(sys.argv) > 3 else "data/dhms.db",
+    )
@@ -0,0 +1,61 @@
+"""
+Benchmark analitik konsumsi obat untuk banyak SKU.
+
+Mengisi counter harian untuk JUMLAH_SKU obat di beberapa bencana selama
+satu jendela penuh, lalu mengukur laju_konsumsi, ramalan_eksponensial,
+hari_sampai_habis dan ringkasan() untuk semua baris sekaligus.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_analitik_konsumsi
+    python -m benchmarks.bench_analitik_konsumsi 20000
+"""
+import logging
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from models.obat import Obat
+from services.analitik_konsumsi import AnalitikKonsumsi
+
+JUMLAH_SKU = 5_000
+JUMLAH_BENCANA = 3
+ULANGAN = 20
+
+
+def _ukur(nama: str, fungsi) -> None:
+    fungsi()  # pemanasan
+    mulai = time.perf_counter()
+    for _ in range(ULANGAN):
+        fungsi()
+    durasi = (time.perf_counter() - mulai) / ULANGAN
+    print(f"  {nama:<22} {durasi * 1e3:8.2f} ms")
+
+
+def main(jumlah_sku: int) -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(1)
+    hari_ini = date.today()
+    analitik = AnalitikKonsumsi()
+
+    mulai = time.perf_counter()
+    for i in range(jumlah_sku):
+        id_obat = f"obat-{i}"
+        analitik.perbarui_stok(
+            id_obat, Obat(id_obat, f"Obat {i}", rng.randint(0, 2_000), "Tablet", hari_ini + timedelta(days=365))
+        )
+        for b in range(JUMLAH_BENCANA):
+            for h in range(28):
+                if rng.random() < 0.5:
+                    analitik.catat(f"bencana-{b}", id_obat, rng.randint(1, 20), hari_ini - timedelta(days=h))
+    durasi_isi = time.perf_counter() - mulai
+    print(f"{len(analitik.kunci())} baris (bencana, obat), pengisian {durasi_isi:.2f} s")
+
+    _ukur("laju_konsumsi", lambda: analitik.laju_konsumsi(7, hari_ini))
+    _ukur("ramalan_eksponensial", lambda: analitik.ramalan_eksponensial(0.3, hari_ini))
+    _ukur("hari_sampai_habis", lambda: analitik.hari_sampai_habis(0.3, hari_ini))
+    _ukur("ringkasan (list dict)", lambda: analitik.ringkasan(hari_ini=hari_ini))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_SKU)
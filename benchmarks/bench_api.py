@@ -0,0 +1,251 @@
+"""
+Load test server API: latensi p50/p95/p99 dan request/s.
+
+Beberapa klien (thread) mengirim request bersamaan lewat koneksi HTTP/1.1
+keep-alive (http.client), masing-masing satu koneksi. Skenario:
+    - korban, koneksi baru   : POST /korban, satu koneksi TCP per request
+                               (sebelum; tanpa keep-alive)
+    - korban                 : POST /korban (intake korban)
+    - korban batch           : POST /korban/batch, UKURAN_BATCH record per request
+    - pemeriksaan            : POST /pemeriksaan pada korban yang sudah terdaftar
+    - resep                  : POST /resep pada pemeriksaan yang sudah ada
+    - kesehatan, klien idle  : GET /kesehatan dari koneksi baru selagi
+                               JUMLAH_KLIEN_IDLE koneksi keep-alive (lebih
+                               banyak dari worker) menganggur; jika koneksi
+                               idle menahan worker, latensi maks mendekati
+                               BATAS_IDLE server
+
+Seluruh data awal (bencana, posko, dokter, obat, korban, pemeriksaan)
+dibuat lewat API juga, sehingga harness ini bisa diarahkan ke server yang
+sudah berjalan. Tanpa URL, server dijalankan di proses yang sama (logging
+dimatikan) untuk backend memory-aman dan sqlite; klien dan server berbagi
+CPU dan GIL, jadi angkanya batas bawah.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api 5000
+    python -m benchmarks.bench_api 2000 http://127.0.0.1:8080
+"""
+import http.client
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from api.server import ServerAPI
+from main import buat_layanan, buat_repository_memory, buat_repository_sqlite
+
+JUMLAH_REQUEST_DEFAULT = 2_000
+JUMLAH_KLIEN = 8
+JUMLAH_WORKER = 8
+JUMLAH_KLIEN_IDLE = 2 * JUMLAH_WORKER
+UKURAN_BATCH = 100
+
+
+class _Klien:
+    """Satu koneksi keep-alive; jika baru_per_request=True, setiap request membuka koneksi baru."""
+
+    def __init__(self, host: str, port: int, baru_per_request: bool = False):
+        self._host, self._port = host, port
+        self._baru_per_request = baru_per_request
+        self._koneksi = None if baru_per_request else http.client.HTTPConnection(host, port)
+
+    def kirim(self, metode: str, path: str, body=None) -> tuple[int, object]:
+        koneksi = self._koneksi or http.client.HTTPConnection(self._host, self._port)
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        header = {"Content-Type": "application/json"} if data is not None else {}
+        if self._baru_per_request:
+            header["Connection"] = "close"
+        koneksi.request(metode, path, body=data, headers=header)
+        respons = koneksi.getresponse()
+        hasil = json.loads(respons.read())
+        if self._baru_per_request:
+            koneksi.close()
+        return respons.status, hasil
+
+    def tutup(self) -> None:
+        if self._koneksi is not None:
+            self._koneksi.close()
+
+
+def _wajib(status_hasil: tuple[int, object], status: int = 201):
+    kode, hasil = status_hasil
+    if kode != status:
+        raise RuntimeError(f"HTTP {kode}: {hasil}")
+    return hasil
+
+
+def _record_korban(no: int, id_posko: str) -> dict:
+    return {
+        "nama_orang": f"Korban {no}", "alamat_orang": "Cianjur", "jenis_kelamin_orang": "perempuan",
+        "tanggal_lahir_orang": "1990-01-01", "status_triase": "hijau", "kondisi_awal": "Luka ringan",
+        "lokasi_ditemukan": "Reruntuhan", "id_posko": id_posko,
+    }
+
+
+def _siapkan(klien: _Klien, jumlah: int) -> dict:
+    """Membuat data awal; mengembalikan ID yang dipakai skenario."""
+    id_bencana = _wajib(klien.kirim("POST", "/bencana", {
+        "jenis": "Gempa Bumi", "lokasi": "Cianjur", "tanggal_mulai": "2024-11-21", "status": "aktif",
+    }))["id_bencana"]
+    id_posko = _wajib(klien.kirim("POST", "/posko", {
+        "bencana_id": id_bencana, "nama_posko": "Posko Uji Beban", "alamat_posko": "Jl. 1",
+        "kapasitas_posko": 10_000_000, "status_posko": "aktif",
+    }))["id_posko"]
+    id_dokter = _wajib(klien.kirim("POST", "/tenaga-medis", {
+        "nama_orang": "Dr. Budi", "alamat_orang": "Jakarta", "jenis_kelamin_orang": "laki-laki",
+        "tanggal_lahir_orang": "1985-05-20", "id_posko": id_posko, "no_izin_praktik": "SIP-1",
+        "role": "dokter", "spesialisasi": "Umum",
+    }))["id_orang"]
+    id_obat = _wajib(klien.kirim("POST", "/obat", {
+        "nama": "Paracetamol 500mg", "stok": 10_000_000, "satuan": "Tablet", "tanggal_kadaluarsa": "2030-12-31",
+    }))["id_obat"]
+
+    daftar_korban, daftar_pemeriksaan = [], []
+    for awal in range(0, jumlah, UKURAN_BATCH):
+        records = [_record_korban(i, id_posko) for i in range(awal, min(awal + UKURAN_BATCH, jumlah))]
+        hasil = _wajib(klien.kirim("POST", "/korban/batch", records), 200)["hasil"]
+        daftar_korban += [h["id_orang"] for h in hasil]
+        hasil = _wajib(klien.kirim("POST", "/pemeriksaan/batch", [
+            {"id_korban": id_korban, "id_tenaga_medis": id_dokter, "keluhan": "Demam",
+             "diagnosa": "Observasi", "status_triase": "hijau"}
+            for id_korban in daftar_korban[awal:]
+        ]), 200)["hasil"]
+        daftar_pemeriksaan += [h["id_pemeriksaan"] for h in hasil]
+    return {
+        "id_posko": id_posko, "id_dokter": id_dokter, "id_obat": id_obat,
+        "korban": daftar_korban, "pemeriksaan": daftar_pemeriksaan,
+    }
+
+
+def _skenario(nama: str, data: dict, i: int) -> tuple[str, str, object]:
+    if nama.startswith("korban batch"):
+        return "POST", "/korban/batch", [_record_korban(i * UKURAN_BATCH + j, data["id_posko"]) for j in range(UKURAN_BATCH)]
+    if nama.startswith("korban"):
+        return "POST", "/korban", _record_korban(i, data["id_posko"])
+    if nama == "pemeriksaan":
+        return "POST", "/pemeriksaan", {
+            "id_korban": data["korban"][i], "id_tenaga_medis": data["id_dokter"], "keluhan": "Sesak",
+            "diagnosa": "Trauma dada", "status_triase": "kuning",
+        }
+    return "POST", "/resep", {
+        "id_pemeriksaan": data["pemeriksaan"][i],
+        "items_input": [{"id_obat": data["id_obat"], "qty": 10, "aturan_pakai": "3x1 sesudah makan", "dosis": 500}],
+    }
+
+
+def _ukur(host: str, port: int, nama: str, data: dict, jumlah: int) -> tuple[float, list[float], int]:
+    """Mengembalikan (durasi, latensi per request dalam detik, jumlah request gagal)."""
+    latensi: list[list[float]] = [[] for _ in range(JUMLAH_KLIEN)]
+    gagal = [0] * JUMLAH_KLIEN
+    status_sukses = 200 if "batch" in nama else 201
+
+    def klien(no: int) -> None:
+        k = _Klien(host, port, baru_per_request="koneksi baru" in nama)
+        try:
+            for i in range(no, jumlah, JUMLAH_KLIEN):
+                metode, path, body = _skenario(nama, data, i)
+                mulai = time.perf_counter()
+                status, _ = k.kirim(metode, path, body)
+                latensi[no].append(time.perf_counter() - mulai)
+                gagal[no] += status != status_sukses
+        finally:
+            k.tutup()
+
+    threads = [threading.Thread(target=klien, args=(i,)) for i in range(JUMLAH_KLIEN)]
+    mulai = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - mulai, sorted(x for daftar in latensi for x in daftar), sum(gagal)
+
+
+def _ukur_dengan_klien_idle(host: str, port: int, jumlah: int) -> tuple[float, list[float], int]:
+    """Seperti _ukur, tetapi satu klien (koneksi baru per request) selagi koneksi lain menganggur."""
+    daftar_idle = [_Klien(host, port) for _ in range(JUMLAH_KLIEN_IDLE)]
+    try:
+        for k in daftar_idle:
+            _wajib(k.kirim("GET", "/kesehatan"), 200)
+        k = _Klien(host, port, baru_per_request=True)
+        latensi, gagal = [], 0
+        mulai = time.perf_counter()
+        for _ in range(jumlah):
+            awal = time.perf_counter()
+            status, _ = k.kirim("GET", "/kesehatan")
+            latensi.append(time.perf_counter() - awal)
+            gagal += status != 200
+        return time.perf_counter() - mulai, sorted(latensi), gagal
+    finally:
+        for k in daftar_idle:
+            k.tutup()
+
+
+def _persentil(terurut: list[float], p: float) -> float:
+    return terurut[min(len(terurut) - 1, int(len(terurut) * p))]
+
+
+def jalankan(host: str, port: int, jumlah: int) -> None:
+    klien = _Klien(host, port)
+    data = _siapkan(klien, jumlah)
+    klien.tutup()
+
+    skenario = (
+        ("korban, koneksi baru", jumlah),
+        ("korban", jumlah),
+        ("korban batch", max(1, jumlah // UKURAN_BATCH)),
+        ("pemeriksaan", jumlah),
+        ("resep", jumlah),
+    )
+    for nama, n in skenario:
+        durasi, latensi, gagal = _ukur(host, port, nama, data, n)
+        _cetak(nama, n, n * UKURAN_BATCH if "batch" in nama else n, durasi, latensi, gagal)
+
+    # Beberapa request saja: cukup untuk melihat apakah request pertama tertahan koneksi idle
+    n = min(jumlah, 100)
+    _cetak("kesehatan, klien idle", n, n, *_ukur_dengan_klien_idle(host, port, n))
+
+
+def _cetak(nama: str, n: int, record: int, durasi: float, latensi: list[float], gagal: int) -> None:
+    print(
+        f"  {nama:<21} {n:6} req {n / durasi:8.0f} req/s ({record / durasi:7.0f} record/s)  "
+        f"p50 {_persentil(latensi, 0.50) * 1e3:7.2f} ms  p95 {_persentil(latensi, 0.95) * 1e3:7.2f} ms  "
+        f"p99 {_persentil(latensi, 0.99) * 1e3:7.2f} ms  maks {latensi[-1] * 1e3:7.2f} ms  gagal={gagal}"
+    )
+
+
+def main(jumlah: int, url: str | None) -> None:
+    if url is not None:
+        alamat = urlsplit(url)
+        print(f"=== {url}: {JUMLAH_KLIEN} klien keep-alive ===")
+        jalankan(alamat.hostname, alamat.port or 80, jumlah)
+        return
+
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = {
+            "memory-aman": lambda: buat_repository_memory(aman_thread=True),
+            "sqlite": lambda: buat_repository_sqlite(str(Path(tmp) / "api.db")),
+        }
+        for nama, buat_repos in backend.items():
+            server = ServerAPI(("127.0.0.1", 0), buat_layanan(buat_repos()), jumlah_worker=JUMLAH_WORKER)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            print(f"=== {nama}: {JUMLAH_KLIEN} klien, {JUMLAH_WORKER} worker ===")
+            try:
+                jalankan(*server.server_address, jumlah)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_REQUEST_DEFAULT,
+        sys.argv[2] if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,71 @@
+"""
+Benchmark insert SQLite dengan ID acak (UUIDv4) vs ID urut waktu (UUIDv7).
+
+Setiap skema mengisi tabel dengan primary key TEXT (seperti tabel korban)
+per batch executemany, lalu mengukur waktu insert, ukuran file database,
+dan query "data 10% terakhir" sebagai rentang kunci (hanya bisa untuk v7).
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_id_urut_waktu
+    python -m benchmarks.bench_id_urut_waktu 200000
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from utils.generator_id import generate_id_batch
+
+JUMLAH_DEFAULT = 1_000_000
+UKURAN_BATCH = 10_000
+
+
+def _id_v4(jumlah: int) -> list[str]:
+    return [str(uuid.uuid4()) for _ in range(jumlah)]
+
+
+def _jalankan(label: str, buat_id, jumlah: int, folder: Path) -> None:
+    path = folder / f"{label}.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE korban (id_orang TEXT PRIMARY KEY, nama_orang TEXT NOT NULL)")
+
+    daftar_id = []
+    durasi = 0.0
+    for awal in range(0, jumlah, UKURAN_BATCH):
+        batch = buat_id(min(UKURAN_BATCH, jumlah - awal))
+        daftar_id += batch
+        mulai = time.perf_counter()
+        with conn:
+            conn.executemany("INSERT INTO korban VALUES (?, ?)", ((i, "Korban") for i in batch))
+        durasi += time.perf_counter() - mulai
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    ukuran = path.stat().st_size
+
+    # "Terdaftar terakhir": 10% ID terakhir yang dibuat
+    batas = daftar_id[-(jumlah // 10)]
+    mulai = time.perf_counter()
+    hasil = conn.execute("SELECT COUNT(*) FROM korban WHERE id_orang >= ?", (batas,)).fetchone()[0]
+    durasi_rentang = time.perf_counter() - mulai
+    conn.close()
+
+    print(
+        f"  {label:<12} insert {durasi:7.2f} s ({durasi / jumlah * 1e6:5.2f} us/baris)"
+        f"   file {ukuran / 2**20:7.1f} MiB   rentang 10% terakhir: {hasil:,} baris"
+        f" ({durasi_rentang * 1e3:.1f} ms)"
+    )
+
+
+def main(jumlah: int) -> None:
+    print(f"=== Insert {jumlah:,} baris SQLite, primary key TEXT ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        _jalankan("uuid4", _id_v4, jumlah, Path(tmp))
+        _jalankan("uuid7", generate_id_batch, jumlah, Path(tmp))
+    print("  (uuid4: hasil rentang tidak bermakna karena ID tidak urut waktu)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
@@ -0,0 +1,185 @@
+"""
+Benchmark impor massal CSV/JSONL: baris/s dan memori pipeline.
+
+"sebelum" membaca file dengan csv.DictReader / json.loads lalu memanggil
+buat_korban() / buat_tenaga_medis() / buat_obat() per baris (satu
+tambah() dan satu ID per record). "sesudah" memakai impor.pipeline.impor()
+(generator, buat_*_batch() per UKURAN_BATCH baris, checkpoint per batch).
+Sekitar 1% baris sengaja tidak valid (tanggal/enum salah) agar jalur error
+per baris ikut terukur.
+
+Impor yang dilanjutkan juga dicek: checkpoint dikembalikan ke posisi
+sebelum beberapa batch terakhir (seperti proses mati setelah batch
+tersimpan tetapi sebelum checkpoint-nya ditulis), lalu impor dijalankan
+ulang; jumlah data di repository tidak boleh bertambah.
+
+Memori pipeline diukur dengan tracemalloc pada tahap baca+konversi+batch
+untuk dua ukuran file; puncaknya harus tetap, tidak ikut naik dengan
+jumlah baris.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_impor
+    python -m benchmarks.bench_impor 200000
+"""
+import csv
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from impor.pipeline import JENIS_IMPOR, baca_csv, impor, konversi, per_batch
+from main import buat_layanan, buat_repository_memory, buat_repository_sqlite
+
+JUMLAH_DEFAULT = 100_000
+UKURAN_BATCH = 1_000
+
+_TRIASE = ("merah", "kuning", "hijau", "hitam")
+_BUAT_SATUAN = {"korban": "buat_korban", "tenaga_medis": "buat_tenaga_medis", "obat": "buat_obat"}
+
+
+def _record(jenis: str, i: int, id_posko: str) -> dict:
+    salah = i % 100 == 99  # ~1% baris tidak valid
+    if jenis == "korban":
+        return {
+            "nama_orang": f"Korban {i}", "alamat_orang": "Cianjur", "jenis_kelamin_orang": "perempuan",
+            "tanggal_lahir_orang": "1990-13-01" if salah else "1990-01-01",
+            "status_triase": _TRIASE[i % 4], "kondisi_awal": "Luka ringan",
+            "lokasi_ditemukan": "Reruntuhan", "id_posko": id_posko,
+        }
+    if jenis == "tenaga_medis":
+        return {
+            "nama_orang": f"Perawat {i}", "alamat_orang": "Bandung", "jenis_kelamin_orang": "laki-laki",
+            "tanggal_lahir_orang": "1988-02-02", "id_posko": id_posko, "no_izin_praktik": f"SIP-{i}",
+            "role": "bidan" if salah else "perawat", "spesialisasi": "Gawat Darurat",
+        }
+    return {
+        "nama": f"Obat {i}", "stok": "x" if salah else str(100 + i % 50), "satuan": "Tablet",
+        "tanggal_kadaluarsa": "2030-12-31", "titik_pesan_ulang": "10",
+    }
+
+
+def _tulis(path: Path, jenis: str, jumlah: int, id_posko: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as berkas:
+        if path.suffix == ".csv":
+            penulis = None
+            for i in range(jumlah):
+                record = _record(jenis, i, id_posko)
+                if penulis is None:
+                    penulis = csv.DictWriter(berkas, fieldnames=list(record))
+                    penulis.writeheader()
+                penulis.writerow(record)
+        else:
+            for i in range(jumlah):
+                berkas.write(json.dumps(_record(jenis, i, id_posko)) + "\n")
+
+
+def _siapkan(repos: tuple, path: Path, jenis: str, jumlah: int) -> dict:
+    """Membuat layanan + posko, lalu menulis file sumber yang merujuk posko itu."""
+    layanan = buat_layanan(repos)
+    id_bencana = layanan["bencana"].buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = layanan["posko"].buat_posko(id_bencana, "Posko Utama", "Jl. Raya No. 1", jumlah * 2, "aktif")
+    _tulis(path, jenis, jumlah, id_posko)
+    return layanan
+
+
+def _impor_per_baris(jenis: str, path: Path, layanan: dict) -> tuple[int, int]:
+    """Cara sebelum: DictReader/json.loads + buat_*() per baris. Mengembalikan (sukses, gagal)."""
+    nama_layanan, _, konverter = JENIS_IMPOR[jenis]
+    buat = getattr(layanan[nama_layanan], _BUAT_SATUAN[jenis])
+    sukses = gagal = 0
+    with open(path, encoding="utf-8", newline="") as berkas:
+        records = csv.DictReader(berkas) if path.suffix == ".csv" else map(json.loads, berkas)
+        for record in records:
+            try:
+                for kolom, fungsi in konverter.items():
+                    if kolom in record:
+                        record[kolom] = fungsi(record[kolom])
+                buat(**record)
+                sukses += 1
+            except ValueError:
+                gagal += 1
+    return sukses, gagal
+
+
+def _cek_lanjut_setelah_crash(tmp: Path, jumlah: int) -> tuple[int, int]:
+    """Mengembalikan (jumlah korban setelah impor pertama, setelah dilanjutkan dari checkpoint lama)."""
+    path, path_checkpoint = tmp / "lanjut.csv", tmp / "lanjut.ckpt"
+    layanan = _siapkan(buat_repository_memory(), path, "korban", jumlah)
+    checkpoint_lama = []
+
+    def laporan(progres: dict) -> None:
+        if not checkpoint_lama:  # checkpoint setelah batch pertama
+            checkpoint_lama.append(path_checkpoint.read_text(encoding="utf-8"))
+
+    impor("korban", path, layanan, ukuran_batch=UKURAN_BATCH, path_checkpoint=path_checkpoint, laporan=laporan)
+    sebelum = sum(1 for _ in layanan["korban"].iter_semua_korban())
+    path_checkpoint.write_text(checkpoint_lama[0], encoding="utf-8")
+    impor("korban", path, layanan, ukuran_batch=UKURAN_BATCH, path_checkpoint=path_checkpoint)
+    return sebelum, sum(1 for _ in layanan["korban"].iter_semua_korban())
+
+
+def _puncak_pipeline(path: Path, konverter: dict) -> int:
+    """Puncak alokasi (byte) saat hanya membaca file lewat tahap baca+konversi+batch."""
+    tracemalloc.start()
+    for _ in per_batch(konversi(baca_csv(path), konverter), UKURAN_BATCH):
+        pass
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return puncak
+
+
+def main(jumlah: int) -> None:
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        print(f"=== Impor {jumlah:,} baris per file (batch {UKURAN_BATCH}) ===")
+        for jenis in JENIS_IMPOR:
+            for akhiran in (".csv", ".jsonl"):
+                path = tmp / f"{jenis}{akhiran}"
+
+                layanan = _siapkan(buat_repository_memory(), path, jenis, jumlah)
+                mulai = time.perf_counter()
+                sukses, gagal = _impor_per_baris(jenis, path, layanan)
+                durasi_lama = time.perf_counter() - mulai
+                del layanan
+
+                hasil_memori = impor(
+                    jenis, path, _siapkan(buat_repository_memory(), path, jenis, jumlah),
+                    ukuran_batch=UKURAN_BATCH, path_checkpoint=tmp / f"{jenis}{akhiran}.memory.ckpt",
+                )
+                if (hasil_memori["sukses"], hasil_memori["gagal"]) != (sukses, gagal):
+                    raise RuntimeError(f"Hasil berbeda: per baris {sukses}/{gagal}, pipeline {hasil_memori['sukses']}/{hasil_memori['gagal']}")
+
+                hasil_sqlite = impor(
+                    jenis, path, _siapkan(buat_repository_sqlite(str(tmp / f"{jenis}{akhiran}.db")), path, jenis, jumlah),
+                    ukuran_batch=UKURAN_BATCH, path_checkpoint=tmp / f"{jenis}{akhiran}.sqlite.ckpt",
+                )
+                print(
+                    f"  {jenis:<12} {akhiran:<6} sebelum (per baris) {jumlah / durasi_lama:9,.0f} baris/s   "
+                    f"sesudah memory {hasil_memori['baris_per_detik']:9,.0f} baris/s "
+                    f"({durasi_lama / hasil_memori['durasi']:4.1f}x)   "
+                    f"sqlite {hasil_sqlite['baris_per_detik']:9,.0f} baris/s   gagal={gagal}"
+                )
+
+        n = min(jumlah, 10 * UKURAN_BATCH)
+        sebelum, sesudah = _cek_lanjut_setelah_crash(tmp, n)
+        print(f"=== Lanjut dari checkpoint lama ({n:,} baris korban) ===")
+        print(f"  data sebelum {sebelum:,}, sesudah dilanjutkan {sesudah:,}: {'OK' if sebelum == sesudah else 'DUPLIKAT'}")
+        if sebelum != sesudah:
+            raise RuntimeError(f"Impor yang dilanjutkan menyimpan ulang {sesudah - sebelum} baris")
+
+        print("=== Memori pipeline (baca+konversi+batch, CSV korban) ===")
+        for n in (jumlah // 4, jumlah):
+            path = tmp / f"memori_{n}.csv"
+            _tulis(path, "korban", n, "posko")
+            print(f"  {n:>9,} baris: puncak {_puncak_pipeline(path, JENIS_IMPOR['korban'][2]) / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
@@ -0,0 +1,139 @@
+"""
+Benchmark kontensi RepositoryAmanThread pada 1, 4, 16 dan 64 thread.
+
+Setiap thread menjalankan campuran 95% ambil_berdasarkan_id dan 5% tambah
+pada KorbanRepositoryMemory, dibandingkan tiga varian:
+    - tanpa kunci : repository apa adanya (tidak aman, hanya pembanding)
+    - mutex       : RepositoryAmanThread dengan KunciMutex (default)
+    - baca-tulis  : RepositoryAmanThread dengan KunciBacaTulis (opsional)
+
+Setelah itu setiap varian diuji dengan semua thread menambahkan ID yang
+sama: jumlah tambah() yang sukses harus persis sama dengan jumlah ID unik.
+
+Catatan: di CPython dengan GIL, pembaca tidak benar-benar berjalan paralel,
+jadi angka baca-tulis terutama menunjukkan overhead kunci; manfaat paralel
+baru terlihat di build free-threaded atau jika baca melakukan I/O.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_kunci_repository
+    python -m benchmarks.bench_kunci_repository 400000
+"""
+import logging
+import random
+import sys
+import threading
+import time
+from datetime import date
+
+from models.bencana import Bencana
+from models.korban import Korban
+from models.posko import Posko
+from repositories.korban_repository import KorbanRepositoryMemory
+from repositories.repository_aman_thread import RepositoryAmanThread
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+from utils.generator_id import generate_id, generate_id_batch
+from utils.kunci_baca_tulis import KunciBacaTulis, KunciMutex
+
+JUMLAH_OPERASI_DEFAULT = 200_000
+JUMLAH_THREAD = (1, 4, 16, 64)
+JUMLAH_AWAL = 10_000
+RASIO_TULIS = 0.05
+JUMLAH_ID_GANDA = 2_000
+
+
+def _korban(id_orang: str, posko: Posko) -> Korban:
+    return Korban._dari_tepercaya(
+        id_orang, "Korban", "Cianjur", JenisKelamin.PEREMPUAN, date(1990, 1, 1),
+        StatusTriase.HIJAU, "Luka ringan", "Reruntuhan", posko,
+    )
+
+
+def _buat_repo(varian: str, posko: Posko, daftar_id: list[str]):
+    repo = KorbanRepositoryMemory()
+    repo.tambah_banyak([_korban(i, posko) for i in daftar_id])
+    if varian == "mutex":
+        return RepositoryAmanThread(repo, KunciMutex())
+    if varian == "baca-tulis":
+        return RepositoryAmanThread(repo, KunciBacaTulis())
+    return repo
+
+
+def _jalankan_thread(jumlah_thread: int, kerja) -> float:
+    mulai_bersama = threading.Barrier(jumlah_thread + 1)
+
+    def pekerja(nomor: int) -> None:
+        mulai_bersama.wait()
+        kerja(nomor)
+
+    threads = [threading.Thread(target=pekerja, args=(n,)) for n in range(jumlah_thread)]
+    for t in threads:
+        t.start()
+    mulai_bersama.wait()
+    mulai = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - mulai
+
+
+def _ukur_campuran(varian: str, jumlah_thread: int, jumlah_operasi: int, posko: Posko) -> float:
+    daftar_id = generate_id_batch(JUMLAH_AWAL)
+    repo = _buat_repo(varian, posko, daftar_id)
+    per_thread = jumlah_operasi // jumlah_thread
+
+    def kerja(nomor: int) -> None:
+        rng = random.Random(nomor)
+        for _ in range(per_thread):
+            if rng.random() < RASIO_TULIS:
+                repo.tambah(_korban(generate_id(), posko))
+            else:
+                repo.ambil_berdasarkan_id(daftar_id[rng.randrange(JUMLAH_AWAL)])
+
+    return per_thread * jumlah_thread / _jalankan_thread(jumlah_thread, kerja)
+
+
+def _uji_id_ganda(varian: str, jumlah_thread: int, posko: Posko) -> int:
+    """Mengembalikan jumlah tambah() sukses untuk ID yang sama dari semua thread."""
+    repo = _buat_repo(varian, posko, [])
+    daftar_id = generate_id_batch(JUMLAH_ID_GANDA)
+    sukses = [0] * jumlah_thread
+    # Pergantian thread yang sangat sering memperbesar peluang race cek-lalu-insert
+    interval_lama = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+
+    def kerja(nomor: int) -> None:
+        for id_orang in daftar_id:
+            sukses[nomor] += repo.tambah(_korban(id_orang, posko))
+
+    try:
+        _jalankan_thread(jumlah_thread, kerja)
+    finally:
+        sys.setswitchinterval(interval_lama)
+    return sum(sukses)
+
+
+def main(jumlah_operasi: int) -> None:
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+
+    bencana = Bencana(generate_id(), "Gempa Bumi", "Cianjur", date.today(), StatusBencana.AKTIF)
+    posko = Posko(generate_id(), bencana, "Posko Utama", "Jl. Raya No. 1", 1_000_000, StatusPosko.AKTIF)
+    varian_semua = ("tanpa kunci", "mutex", "baca-tulis")
+
+    print(f"=== {jumlah_operasi:,} operasi ({1 - RASIO_TULIS:.0%} ambil / {RASIO_TULIS:.0%} tambah), ribu op/s ===")
+    print(f"  {'thread':>6} " + "".join(f"{v:>14}" for v in varian_semua))
+    for jumlah_thread in JUMLAH_THREAD:
+        hasil = [_ukur_campuran(v, jumlah_thread, jumlah_operasi, posko) / 1e3 for v in varian_semua]
+        print(f"  {jumlah_thread:>6} " + "".join(f"{h:>14.1f}" for h in hasil))
+
+    print(f"\n=== {JUMLAH_ID_GANDA:,} ID yang sama ditambahkan dari setiap thread (harus {JUMLAH_ID_GANDA:,}) ===")
+    print(f"  {'thread':>6} " + "".join(f"{v:>14}" for v in varian_semua))
+    for jumlah_thread in JUMLAH_THREAD[1:]:
+        hasil = [_uji_id_ganda(v, jumlah_thread, posko) for v in varian_semua]
+        print(f"  {jumlah_thread:>6} " + "".join(f"{h:>14,}" for h in hasil))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_OPERASI_DEFAULT)
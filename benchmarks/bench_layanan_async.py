@@ -0,0 +1,182 @@
+"""
+Benchmark fasad async: 1.000 coroutine intake berjalan bersamaan.
+
+Setiap coroutine intake mendaftarkan satu korban (buat_korban) lalu
+membuat pemeriksaannya (buat_pemeriksaan, triase korban ikut disinkron).
+Tiga varian dibandingkan:
+    - sinkron di coroutine : service dipanggil langsung dari coroutine
+                             (sebelum; setiap query & log memblokir loop)
+    - fasad                : LayananAsync, service jalan di executor
+    - fasad + FK paralel   : PemeriksaanServiceAsync, korban & tenaga medis
+                             dimuat bersamaan lewat RepositoryAsync
+
+Selain throughput, sebuah coroutine "detak" tidur 1 ms berulang-ulang dan
+mencatat keterlambatannya (maks dan p99): inilah jeda event loop tidak bisa
+melayani koneksi lain di gateway. Terakhir, latensi buat_pemeriksaan diukur
+tanpa beban (satu permintaan pada satu waktu), tempat pemuatan FK
+bersamaan paling terasa.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_layanan_async
+    python -m benchmarks.bench_layanan_async 2000
+"""
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from main import buat_repository_memory, buat_repository_sqlite
+from repositories.repository_async import RepositoryAsync
+from services.bencana_service import BencanaService
+from services.korban_service import KorbanService
+from services.layanan_async import LayananAsync, PemeriksaanServiceAsync
+from services.pemeriksaan_service import PemeriksaanService
+from services.posko_service import PoskoService
+from services.tenaga_medis import TenagaMedisService
+
+JUMLAH_INTAKE_DEFAULT = 1_000
+JUMLAH_WORKER = 8
+JUMLAH_DOKTER = 4
+JUMLAH_LATENSI = 500
+
+
+def _siapkan(repos):
+    bencana_repo, posko_repo, orang_repo, tm_repo, korban_repo, _, pemeriksaan_repo, _ = repos
+
+    id_bencana = BencanaService(bencana_repo).buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = PoskoService(posko_repo, bencana_repo).buat_posko(id_bencana, "Posko", "Jl. 1", 1_000_000, "aktif")
+    tm_service = TenagaMedisService(tm_repo, orang_repo, posko_repo)
+    daftar_dokter = [
+        tm_service.buat_tenaga_medis(
+            f"Dokter {i}", "Jakarta", "laki-laki", date(1985, 5, 20), id_posko, f"SIP-{i}", "dokter", "Umum"
+        )
+        for i in range(JUMLAH_DOKTER)
+    ]
+    korban_service = KorbanService(korban_repo, orang_repo, posko_repo)
+    pemeriksaan_service = PemeriksaanService(pemeriksaan_repo, korban_repo, tm_repo, orang_repo)
+    return korban_service, pemeriksaan_service, id_posko, daftar_dokter
+
+
+class _Sinkron:
+    """Varian "sebelum": method service dipanggil langsung di coroutine."""
+
+    def __init__(self, layanan):
+        self._layanan = layanan
+
+    def __getattr__(self, nama):
+        fungsi = getattr(self._layanan, nama)
+
+        async def langsung(*args, **kwargs):
+            return fungsi(*args, **kwargs)
+
+        return langsung
+
+
+async def _detak(berhenti: asyncio.Event, hasil: list[float]) -> None:
+    """Mencatat keterlambatan setiap detak event loop (detik)."""
+    loop = asyncio.get_running_loop()
+    while not berhenti.is_set():
+        mulai = loop.time()
+        await asyncio.sleep(0.001)
+        hasil.append(loop.time() - mulai - 0.001)
+
+
+async def _intake(korban_async, pemeriksaan_async, id_posko: str, id_dokter: str, no: int) -> None:
+    id_korban = await korban_async.buat_korban(
+        f"Korban {no}", "Cianjur", "perempuan", date(1990, 1, 1), "hijau", "Luka ringan", "Reruntuhan", id_posko
+    )
+    await pemeriksaan_async.buat_pemeriksaan(id_korban, id_dokter, "Sesak", "Trauma dada", "kuning")
+
+
+def _buat_varian(varian: str, repos, korban_service, pemeriksaan_service, executor):
+    _, _, _, tm_repo, korban_repo, _, _, _ = repos
+    if varian == "sinkron di coroutine":
+        return _Sinkron(korban_service), _Sinkron(pemeriksaan_service)
+    if varian == "fasad":
+        return LayananAsync(korban_service, executor), LayananAsync(pemeriksaan_service, executor)
+    return LayananAsync(korban_service, executor), PemeriksaanServiceAsync(
+        pemeriksaan_service,
+        RepositoryAsync(korban_repo, executor),
+        RepositoryAsync(tm_repo, executor),
+        executor,
+    )
+
+
+async def _ukur(varian: str, repos, jumlah: int) -> tuple[float, float, float]:
+    """Mengembalikan (durasi, keterlambatan loop maks, keterlambatan loop p99)."""
+    korban_service, pemeriksaan_service, id_posko, daftar_dokter = _siapkan(repos)
+    pemeriksaan_repo = repos[6]
+
+    with ThreadPoolExecutor(max_workers=JUMLAH_WORKER) as executor:
+        korban_async, pemeriksaan_async = _buat_varian(varian, repos, korban_service, pemeriksaan_service, executor)
+
+        berhenti, lag = asyncio.Event(), []
+        detak = asyncio.create_task(_detak(berhenti, lag))
+        await asyncio.sleep(0.01)  # biarkan detak mulai lebih dulu
+
+        mulai = time.perf_counter()
+        await asyncio.gather(*(
+            _intake(korban_async, pemeriksaan_async, id_posko, daftar_dokter[i % JUMLAH_DOKTER], i)
+            for i in range(jumlah)
+        ))
+        durasi = time.perf_counter() - mulai
+        berhenti.set()
+        await detak
+
+    assert pemeriksaan_repo.hitung() == jumlah, pemeriksaan_repo.hitung()
+    lag.sort()
+    return durasi, lag[-1], lag[int(len(lag) * 0.99)]
+
+
+async def _latensi_tanpa_beban(varian: str, repos, jumlah: int) -> float:
+    """Rata-rata latensi buat_pemeriksaan (detik) saat dipanggil satu per satu."""
+    korban_service, pemeriksaan_service, id_posko, daftar_dokter = _siapkan(repos)
+    daftar_korban = korban_service.buat_korban_batch([
+        {
+            "nama_orang": f"Korban {i}", "alamat_orang": "Cianjur", "jenis_kelamin_orang": "perempuan",
+            "tanggal_lahir_orang": date(1990, 1, 1), "status_triase": "hijau", "kondisi_awal": "Luka ringan",
+            "lokasi_ditemukan": "Reruntuhan", "id_posko": id_posko,
+        }
+        for i in range(jumlah)
+    ])
+
+    with ThreadPoolExecutor(max_workers=JUMLAH_WORKER) as executor:
+        _, pemeriksaan_async = _buat_varian(varian, repos, korban_service, pemeriksaan_service, executor)
+        await pemeriksaan_async.buat_pemeriksaan(daftar_korban[0]["id_orang"], daftar_dokter[0], "Sesak", "Trauma", "kuning")
+
+        mulai = time.perf_counter()
+        for hasil in daftar_korban[1:]:
+            await pemeriksaan_async.buat_pemeriksaan(hasil["id_orang"], daftar_dokter[0], "Sesak", "Trauma", "kuning")
+        return (time.perf_counter() - mulai) / (jumlah - 1)
+
+
+def main(jumlah: int) -> None:
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+    varian_semua = ("sinkron di coroutine", "fasad", "fasad + FK paralel")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = {
+            "sqlite": lambda v: buat_repository_sqlite(str(Path(tmp) / f"{v}.db")),
+            "memory-aman": lambda v: buat_repository_memory(aman_thread=True),
+        }
+        for nama, buat_repos in backend.items():
+            print(f"=== {nama}: {jumlah:,} intake bersamaan, executor {JUMLAH_WORKER} thread ===")
+            for varian in varian_semua:
+                durasi, lag_maks, lag_p99 = asyncio.run(_ukur(varian, buat_repos(varian.replace(" ", "_")), jumlah))
+                print(
+                    f"  {varian:<22} {durasi:7.3f} s  {jumlah / durasi:8.0f} intake/s  "
+                    f"loop terlambat maks {lag_maks * 1e3:7.1f} ms, p99 {lag_p99 * 1e3:6.1f} ms"
+                )
+            print(f"  latensi buat_pemeriksaan tanpa beban ({JUMLAH_LATENSI} permintaan berurutan):")
+            for varian in varian_semua[1:]:
+                latensi = asyncio.run(_latensi_tanpa_beban(varian, buat_repos(f"lat_{varian.replace(' ', '_')}"), JUMLAH_LATENSI))
+                print(f"    {varian:<20} {latensi * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_INTAKE_DEFAULT)
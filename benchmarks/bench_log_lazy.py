@@ -0,0 +1,95 @@
+"""
+Microbenchmark ambil_berdasarkan_id dengan logger di level WARNING.
+
+Pada level WARNING, log INFO "berhasil diambil" tidak pernah ditulis.
+"sebelum" mereproduksi gaya lama (f-string + datetime.now() dibangun di
+setiap panggilan), "sesudah" memakai KorbanRepositoryMemory apa adanya
+(argumen %-style, pesan hanya diformat jika record benar-benar ditulis).
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_log_lazy
+    python -m benchmarks.bench_log_lazy 1000000
+"""
+import logging
+import sys
+import time
+from datetime import date, datetime
+
+from models.bencana import Bencana
+from models.korban import Korban
+from models.posko import Posko
+from repositories.korban_repository import KorbanRepositoryMemory
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+from utils.generator_id import generate_id
+
+JUMLAH_DEFAULT = 200_000
+JUMLAH_KORBAN = 1_000
+
+
+class _KorbanRepositoryFString(KorbanRepositoryMemory):
+    """ambil_berdasarkan_id dengan pola logging sebelum perubahan."""
+
+    def ambil_berdasarkan_id(self, id_orang):
+        korban = self._penyimpanan.ambil(id_orang, self._PERAN)
+        if korban is None:
+            self.logger.warning(
+                f"Korban ID {id_orang} tidak ditemukan ({datetime.now()})"
+            )
+        else:
+            self.logger.info(
+                f"Korban ID {id_orang} berhasil diambil ({datetime.now()})"
+            )
+
+        return korban
+
+
+def _isi(repo: KorbanRepositoryMemory, posko: Posko) -> list[str]:
+    daftar_id = []
+    for i in range(JUMLAH_KORBAN):
+        korban = Korban(
+            id_orang=generate_id(),
+            nama_orang=f"Korban {i}",
+            alamat_orang="Cianjur",
+            jenis_kelamin_orang=JenisKelamin.PEREMPUAN,
+            tanggal_lahir_orang=date(1990, 1, 1),
+            status_triase=StatusTriase.HIJAU,
+            kondisi_awal="Luka ringan",
+            lokasi_ditemukan="Reruntuhan",
+            posko=posko,
+        )
+        repo.tambah(korban)
+        daftar_id.append(korban.get_id_orang())
+    return daftar_id
+
+
+def _ukur(repo: KorbanRepositoryMemory, daftar_id: list[str], jumlah: int) -> float:
+    ambil = repo.ambil_berdasarkan_id
+    n = len(daftar_id)
+    mulai = time.perf_counter()
+    for i in range(jumlah):
+        ambil(daftar_id[i % n])
+    return time.perf_counter() - mulai
+
+
+def main(jumlah: int) -> None:
+    bencana = Bencana(generate_id(), "Gempa Bumi", "Cianjur", date.today(), StatusBencana.AKTIF)
+    posko = Posko(generate_id(), bencana, "Posko Utama", "Jl. Raya No. 1", JUMLAH_KORBAN, StatusPosko.AKTIF)
+
+    hasil = {}
+    for label, kelas in (("sebelum (f-string)", _KorbanRepositoryFString), ("sesudah (lazy %)", KorbanRepositoryMemory)):
+        repo = kelas()
+        repo.logger.setLevel(logging.WARNING)
+        hasil[label] = _ukur(repo, _isi(repo, posko), jumlah)
+
+    print(f"=== {jumlah:,} x ambil_berdasarkan_id (logger level WARNING) ===")
+    for label, durasi in hasil.items():
+        print(f"  {label:<20} {durasi:8.3f} s   {durasi / jumlah * 1e9:8.1f} ns/op")
+    sebelum, sesudah = hasil.values()
+    print(f"  percepatan           {sebelum / sesudah:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
@@ -0,0 +1,118 @@
+"""
+Benchmark logging sinkron vs asinkron pada 10k panggilan KorbanService.buat_korban.
+
+Setiap buat_korban menulis beberapa baris INFO (service + repository).
+Output console dialihkan ke os.devnull dan logs/app.log ditulis di
+direktori sementara agar log asli tidak tercampur.
+
+Bagian kedua mengukur biaya per record di thread pemanggil saat antrian
+sudah penuh (tanpa thread penulis): record yang dibuang "buang"/"sampel"
+tidak boleh ikut diformat, jadi biayanya harus jauh di bawah "blok" yang
+memformat lalu mengantri.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_logging
+    python -m benchmarks.bench_logging 50000
+"""
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+from datetime import date
+
+from repositories.bencana_repository import BencanaRepositoryMemory
+from repositories.korban_repository import KorbanRepositoryMemory
+from repositories.orang_repository import OrangRepositoryMemory
+from repositories.posko_repository import PoskoRepositoryMemory
+from services.bencana_service import BencanaService
+from services.korban_service import KorbanService
+from services.posko_service import PoskoService
+from utils.loggers import (
+    AntrianLogHandler,
+    aktifkan_logging_asinkron,
+    hentikan_logging_asinkron,
+    jumlah_log_dibuang,
+)
+
+JUMLAH_DEFAULT = 10_000
+
+
+def _jalankan(jumlah: int) -> tuple[float, float, int]:
+    """Membuat `jumlah` korban; mengembalikan (durasi pemanggil, durasi sampai log tertulis, log dibuang)."""
+    bencana_repo = BencanaRepositoryMemory()
+    posko_repo = PoskoRepositoryMemory()
+    korban_service = KorbanService(KorbanRepositoryMemory(), OrangRepositoryMemory(), posko_repo)
+
+    id_bencana = BencanaService(bencana_repo).buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = PoskoService(posko_repo, bencana_repo).buat_posko(
+        id_bencana, "Posko Utama", "Jl. Raya No. 1", jumlah, "aktif"
+    )
+
+    mulai = time.perf_counter()
+    for i in range(jumlah):
+        korban_service.buat_korban(
+            nama_orang=f"Korban {i}",
+            alamat_orang="Cianjur",
+            jenis_kelamin_orang="laki-laki",
+            tanggal_lahir_orang=date(1990, 1, 1),
+            status_triase="kuning",
+            kondisi_awal="Luka ringan",
+            lokasi_ditemukan="Reruntuhan",
+            id_posko=id_posko,
+        )
+    durasi_pemanggil = time.perf_counter() - mulai
+    dibuang = jumlah_log_dibuang()
+
+    hentikan_logging_asinkron()  # no-op pada mode sinkron; flush antrian pada mode asinkron
+    return durasi_pemanggil, time.perf_counter() - mulai, dibuang
+
+
+def _biaya_per_record(kebijakan: str, jumlah: int) -> float:
+    """Mikrodetik per record di thread pemanggil; antrian "blok" dikosongkan tanpa menulis."""
+    antrian: queue.Queue = queue.Queue(maxsize=1)
+    handler = AntrianLogHandler(antrian, kebijakan)
+    data = {"nama_orang": "Korban", "status_triase": "kuning", "id_posko": "0" * 36}
+    record = logging.LogRecord(__name__, logging.INFO, __file__, 0, "Korban dibuat %s data=%s", ("0" * 36, data), None)
+
+    mulai = time.perf_counter()
+    for _ in range(jumlah):
+        if kebijakan == "blok":
+            antrian.get_nowait() if antrian.full() else None
+        elif not antrian.full():
+            antrian.put_nowait(None)
+        handler.handle(record)
+    return (time.perf_counter() - mulai) / jumlah * 1e6
+
+
+def main(jumlah: int) -> None:
+    stderr_asli = sys.stderr
+    cwd_asli = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            hasil = {"sinkron": _jalankan(jumlah)}
+            for kebijakan in ("blok", "buang", "sampel"):
+                aktifkan_logging_asinkron(kebijakan=kebijakan)
+                hasil[f"asinkron/{kebijakan}"] = _jalankan(jumlah)
+        finally:
+            sys.stderr = stderr_asli
+            os.chdir(cwd_asli)
+
+    print(f"=== {jumlah:,} x buat_korban ===")
+    print(f"  {'mode':<18} {'pemanggil':>12} {'us/korban':>11} {'sampai flush':>14} {'dibuang':>9}")
+    for mode, (pemanggil, total, dibuang) in hasil.items():
+        print(
+            f"  {mode:<18} {pemanggil:10.3f} s {pemanggil / jumlah * 1e6:11.2f} {total:12.3f} s {dibuang:9}"
+        )
+
+    print(f"=== Biaya per record INFO di pemanggil, antrian penuh ({jumlah * 10:,} record) ===")
+    for kebijakan in ("blok", "buang", "sampel"):
+        print(f"  {kebijakan:<18} {_biaya_per_record(kebijakan, jumlah * 10):8.2f} us/record")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
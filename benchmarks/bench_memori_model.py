@@ -0,0 +1,101 @@
+"""
+Benchmark memori per instance Korban (tracemalloc).
+
+"sebelum" memakai source Orang/Korban yang sama persis tetapi dieksekusi
+ulang tanpa __slots__ (atribut disimpan di __dict__ per instance, seperti
+sebelum perubahan). "sesudah" memakai models.Korban apa adanya.
+Posko dan tanggal lahir dipakai bersama, jadi selisihnya murni dari
+layout objek Korban (termasuk string ID/nama yang sama di kedua varian).
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_memori_model
+    python -m benchmarks.bench_memori_model 200000
+"""
+import ast
+import gc
+import inspect
+import sys
+import tracemalloc
+from datetime import date
+
+import models.korban
+import models.orang
+from models.bencana import Bencana
+from models.korban import Korban
+from models.posko import Posko
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+
+JUMLAH_DEFAULT = 1_000_000
+
+
+def _muat_tanpa_slots(modul, **ganti) -> dict:
+    """
+    Mengeksekusi ulang source modul model tanpa deklarasi __slots__.
+
+    Import nama yang ada di `ganti` dibuang dan diganti objek tersebut,
+    sehingga Korban versi __dict__ mewarisi Orang versi __dict__.
+    """
+    pohon = ast.parse(inspect.getsource(modul))
+    for node in ast.walk(pohon):
+        if isinstance(node, ast.ClassDef):
+            node.body = [
+                n for n in node.body
+                if not (isinstance(n, ast.Assign) and any(getattr(t, "id", None) == "__slots__" for t in n.targets))
+            ]
+    pohon.body = [
+        n for n in pohon.body
+        if not (isinstance(n, ast.ImportFrom) and all(a.name in ganti for a in n.names))
+    ]
+    ruang = {"__name__": f"{modul.__name__}_tanpa_slots", "__package__": modul.__package__, **ganti}
+    exec(compile(pohon, modul.__file__, "exec"), ruang)
+    return ruang
+
+
+_OrangDict = _muat_tanpa_slots(models.orang)["Orang"]
+_KorbanDict = _muat_tanpa_slots(models.korban, Orang=_OrangDict)["Korban"]
+
+
+def _ukur(kelas: type, jumlah: int, posko: Posko) -> int:
+    """Mengembalikan byte yang dialokasikan untuk `jumlah` instance kelas."""
+    lahir = date(1990, 1, 1)
+    gc.collect()
+    tracemalloc.start()
+    awal, _ = tracemalloc.get_traced_memory()
+    daftar = [
+        kelas(
+            id_orang=f"korban-{i:08d}",
+            nama_orang=f"Korban {i}",
+            alamat_orang="Cianjur",
+            jenis_kelamin_orang=JenisKelamin.PEREMPUAN,
+            tanggal_lahir_orang=lahir,
+            status_triase=StatusTriase.HIJAU,
+            kondisi_awal="Luka ringan",
+            lokasi_ditemukan="Reruntuhan",
+            posko=posko,
+        )
+        for i in range(jumlah)
+    ]
+    akhir, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert daftar[-1].get_nama_orang() == f"Korban {jumlah - 1}"
+    return akhir - awal
+
+
+def main(jumlah: int) -> None:
+    bencana = Bencana("b-1", "Gempa Bumi", "Cianjur", date.today(), StatusBencana.AKTIF)
+    posko = Posko("p-1", bencana, "Posko Utama", "Jl. Raya No. 1", jumlah, StatusPosko.AKTIF)
+
+    print(f"=== Memori {jumlah:,} Korban (tracemalloc) ===")
+    hasil = {}
+    for label, kelas in (("sebelum (__dict__)", _KorbanDict), ("sesudah (__slots__)", Korban)):
+        hasil[label] = _ukur(kelas, jumlah, posko)
+        print(f"  {label:<20} {hasil[label] / 2**20:9.1f} MiB   {hasil[label] / jumlah:7.1f} B/instance")
+    sebelum, sesudah = hasil.values()
+    print(f"  penghematan          {(sebelum - sesudah) / 2**20:9.1f} MiB   {1 - sesudah / sebelum:7.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
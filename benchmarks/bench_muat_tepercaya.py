@@ -0,0 +1,121 @@
+"""
+Benchmark memuat Korban dari SQLite: konstruktor tervalidasi vs _dari_tepercaya.
+
+"sebelum" memakai subclass KorbanRepositorySQLite yang membangun objek
+lewat Korban(...) (seluruh setter dijalankan, termasuk date.today() di
+set_tanggal_lahir_orang), seperti sebelum perubahan. "sesudah" memakai
+KorbanRepositorySQLite apa adanya (Korban._dari_tepercaya).
+
+Diukur dua hal: ambil_semua() lengkap (SELECT + hidrasi) dan hidrasi
+saja dari baris yang sudah di-fetch.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_muat_tepercaya
+    python -m benchmarks.bench_muat_tepercaya 100000
+"""
+import logging
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from models.bencana import Bencana
+from models.korban import Korban
+from models.posko import Posko
+from repositories.sqlite import (
+    SQLiteConnectionPool,
+    BencanaRepositorySQLite,
+    KorbanRepositorySQLite,
+    PoskoRepositorySQLite,
+)
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+from utils.generator_id import generate_id
+
+JUMLAH_DEFAULT = 1_000_000
+
+
+class _KorbanRepositoryValidasi(KorbanRepositorySQLite):
+    """_dari_baris dengan pola sebelum perubahan (konstruktor + setter)."""
+
+    def _dari_baris(self, conn, baris, cache):
+        kolom = dict(zip(self._KOLOM, baris))
+        return Korban(
+            id_orang=kolom["id_orang"],
+            nama_orang=kolom["nama_orang"],
+            alamat_orang=kolom["alamat_orang"],
+            jenis_kelamin_orang=JenisKelamin(kolom["jenis_kelamin_orang"]),
+            tanggal_lahir_orang=date.fromisoformat(kolom["tanggal_lahir_orang"]),
+            status_triase=StatusTriase(kolom["status_triase"]),
+            kondisi_awal=kolom["kondisi_awal"],
+            lokasi_ditemukan=kolom["lokasi_ditemukan"],
+            posko=self._posko_repo._muat(kolom["id_posko"], cache),
+        )
+
+
+def _isi(korban_repo: KorbanRepositorySQLite, posko: Posko, jumlah: int) -> None:
+    triase = list(StatusTriase)
+    korban_repo.tambah_banyak([
+        Korban(
+            id_orang=generate_id(),
+            nama_orang=f"Korban {i}",
+            alamat_orang="Cianjur",
+            jenis_kelamin_orang=JenisKelamin.LAKI_LAKI,
+            tanggal_lahir_orang=date(1990, 1, 1),
+            status_triase=triase[i % len(triase)],
+            kondisi_awal="Luka ringan",
+            lokasi_ditemukan="Reruntuhan",
+            posko=posko,
+        )
+        for i in range(jumlah)
+    ])
+
+
+def _ukur(fungsi) -> float:
+    mulai = time.perf_counter()
+    fungsi()
+    return time.perf_counter() - mulai
+
+
+def main(jumlah: int) -> None:
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+
+    bencana = Bencana(generate_id(), "Gempa Bumi", "Cianjur", date.today(), StatusBencana.AKTIF)
+    posko = Posko(generate_id(), bencana, "Posko Utama", "Jl. Raya No. 1", jumlah, StatusPosko.AKTIF)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = SQLiteConnectionPool(str(Path(tmp) / "bench.db"))
+        bencana_repo = BencanaRepositorySQLite(pool)
+        posko_repo = PoskoRepositorySQLite(pool, bencana_repo)
+        bencana_repo.tambah(bencana)
+        posko_repo.tambah(posko)
+        _isi(KorbanRepositorySQLite(pool, posko_repo), posko, jumlah)
+
+        with pool.koneksi() as conn:
+            baris = conn.execute(f"SELECT {', '.join(KorbanRepositorySQLite._KOLOM)} FROM korban").fetchall()
+
+        print(f"=== Memuat {jumlah:,} Korban dari SQLite ===")
+        hasil = {}
+        for label, kelas in (("sebelum (validasi)", _KorbanRepositoryValidasi), ("sesudah (tepercaya)", KorbanRepositorySQLite)):
+            repo = kelas(pool, posko_repo)
+            cache: dict = {}
+            with pool.koneksi() as conn:
+                hidrasi = _ukur(lambda: [repo._dari_baris(conn, b, cache) for b in baris])
+            semua = _ukur(repo.ambil_semua)
+            hasil[label] = (semua, hidrasi)
+            print(
+                f"  {label:<20} ambil_semua {semua:7.3f} s   hidrasi {hidrasi:7.3f} s"
+                f"   {hidrasi / jumlah * 1e6:6.2f} us/baris"
+            )
+
+        (semua_lama, hidrasi_lama), (semua_baru, hidrasi_baru) = hasil.values()
+        print(f"  percepatan           ambil_semua {semua_lama / semua_baru:6.2f}x   hidrasi {hidrasi_lama / hidrasi_baru:6.2f}x")
+        pool.tutup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
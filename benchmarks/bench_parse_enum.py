@@ -0,0 +1,90 @@
+"""
+Microbenchmark parse_enum untuk seluruh Enum yang dipakai service.
+
+"sebelum" mereproduksi implementasi lama (lower() + Enum.__call__, daftar
+value dibangun ulang saat gagal), "sesudah" memakai utils.enum_parser
+apa adanya (tabel lookup per kelas Enum). Input dicampur antara huruf
+kecil, Kapital, HURUF BESAR, campuran, dan sebagian kecil input tidak valid.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_parse_enum
+    python -m benchmarks.bench_parse_enum 5000000
+"""
+import sys
+import time
+
+from utils.enum_parser import parse_enum
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.role_tenaga_medis import RoleTenagaMedis
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+
+JUMLAH_DEFAULT = 1_000_000
+ENUM = (StatusTriase, JenisKelamin, StatusPosko, StatusBencana, RoleTenagaMedis)
+
+
+def _parse_enum_lama(enum_cls, value):
+    """parse_enum sebelum perubahan."""
+    if not isinstance(value, str):
+        raise ValueError("Nilai enum harus berupa string")
+
+    try:
+        return enum_cls(value.lower())
+    except ValueError:
+        valid_values = [e.value for e in enum_cls]
+        raise ValueError(
+            f"Nilai tidak valid. Pilihan yang tersedia: {valid_values}"
+        )
+
+
+def _input() -> list[tuple[type, str]]:
+    """Pasangan (kelas Enum, input) dengan variasi penulisan seperti data lapangan."""
+    hasil = []
+    for enum_cls in ENUM:
+        for anggota in enum_cls:
+            nilai = anggota.value
+            hasil += [(enum_cls, v) for v in (nilai, nilai.capitalize(), nilai.upper(), nilai.swapcase().capitalize())]
+        hasil.append((enum_cls, "tidak-valid"))
+    return hasil
+
+
+def _ukur(parse, data: list[tuple[type, str]], jumlah: int) -> float:
+    n = len(data)
+    mulai = time.perf_counter()
+    for i in range(jumlah):
+        enum_cls, value = data[i % n]
+        try:
+            parse(enum_cls, value)
+        except ValueError:
+            pass
+    return time.perf_counter() - mulai
+
+
+def main(jumlah: int) -> None:
+    data = _input()
+    for enum_cls, value in data:  # hasil kedua implementasi harus sama
+        try:
+            lama = _parse_enum_lama(enum_cls, value)
+        except ValueError as e:
+            lama = str(e)
+        try:
+            baru = parse_enum(enum_cls, value)
+        except ValueError as e:
+            baru = str(e)
+        assert lama == baru, (enum_cls, value, lama, baru)
+
+    hasil = {
+        "sebelum (Enum())": _ukur(_parse_enum_lama, data, jumlah),
+        "sesudah (tabel)": _ukur(parse_enum, data, jumlah),
+    }
+
+    print(f"=== {jumlah:,} x parse_enum ({len(data)} variasi input, {len(ENUM)} Enum) ===")
+    for label, durasi in hasil.items():
+        print(f"  {label:<20} {durasi:8.3f} s   {durasi / jumlah * 1e9:8.1f} ns/op")
+    sebelum, sesudah = hasil.values()
+    print(f"  percepatan           {sebelum / sesudah:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_DEFAULT)
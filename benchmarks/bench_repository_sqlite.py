@@ -0,0 +1,135 @@
+"""
+Benchmark KorbanRepositoryMemory vs KorbanRepositorySQLite.
+
+Mengukur tambah, ambil_berdasarkan_id, perbarui, ambil_semua dan hapus
+pada 10k, 100k dan 1M Korban.
+
+Cara pakai (dari root project):
+    python -m benchmarks.bench_repository_sqlite
+    python -m benchmarks.bench_repository_sqlite 10000 100000
+"""
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from models.bencana import Bencana
+from models.korban import Korban
+from models.posko import Posko
+from repositories.bencana_repository import BencanaRepositoryMemory
+from repositories.korban_repository import KorbanRepositoryMemory
+from repositories.posko_repository import PoskoRepositoryMemory
+from repositories.sqlite import (
+    SQLiteConnectionPool,
+    BencanaRepositorySQLite,
+    KorbanRepositorySQLite,
+    PoskoRepositorySQLite,
+)
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_bencana import StatusBencana
+from utils.enums.status_posko import StatusPosko
+from utils.enums.status_triase import StatusTriase
+from utils.generator_id import generate_id
+
+UKURAN_DEFAULT = (10_000, 100_000, 1_000_000)
+JUMLAH_SAMPEL = 10_000
+
+
+def _buat_korban(jumlah: int, posko: Posko) -> list[Korban]:
+    triase = list(StatusTriase)
+    return [
+        Korban(
+            id_orang=generate_id(),
+            nama_orang=f"Korban {i}",
+            alamat_orang="Cianjur",
+            jenis_kelamin_orang=JenisKelamin.LAKI_LAKI,
+            tanggal_lahir_orang=date(1990, 1, 1),
+            status_triase=triase[i % len(triase)],
+            kondisi_awal="Luka ringan",
+            lokasi_ditemukan="Reruntuhan",
+            posko=posko,
+        )
+        for i in range(jumlah)
+    ]
+
+
+def _ukur(label: str, fn, jumlah_operasi: int) -> None:
+    mulai = time.perf_counter()
+    fn()
+    durasi = time.perf_counter() - mulai
+    per_op = durasi / jumlah_operasi * 1e6 if jumlah_operasi else 0.0
+    print(f"    {label:<22} {durasi:9.3f} s   {per_op:9.2f} us/op")
+
+
+def _jalankan(nama: str, bencana_repo, posko_repo, korban_repo, bencana, posko, daftar_korban) -> None:
+    print(f"  [{nama}]")
+    bencana_repo.tambah(bencana)
+    posko_repo.tambah(posko)
+
+    sampel = random.sample(daftar_korban, min(JUMLAH_SAMPEL, len(daftar_korban)))
+
+    def tambah():
+        for korban in daftar_korban:
+            korban_repo.tambah(korban)
+
+    def ambil():
+        for korban in sampel:
+            korban_repo.ambil_berdasarkan_id(korban.get_id_orang())
+
+    def perbarui():
+        for korban in sampel:
+            korban_repo.perbarui(korban.get_id_orang(), korban)
+
+    def hapus():
+        for korban in sampel:
+            korban_repo.hapus(korban.get_id_orang())
+
+    _ukur("tambah", tambah, len(daftar_korban))
+    _ukur("ambil_berdasarkan_id", ambil, len(sampel))
+    _ukur("perbarui", perbarui, len(sampel))
+    _ukur("ambil_semua", korban_repo.ambil_semua, 1)
+    _ukur("hapus", hapus, len(sampel))
+
+
+def main(ukuran: list[int]) -> None:
+    # Logging INFO per operasi akan mendominasi hasil, jadi dimatikan
+    logging.disable(logging.CRITICAL)
+
+    bencana = Bencana(generate_id(), "Gempa Bumi", "Cianjur", date.today(), StatusBencana.AKTIF)
+    posko = Posko(generate_id(), bencana, "Posko Utama", "Jl. Raya No. 1", 1_000_000, StatusPosko.AKTIF)
+
+    for jumlah in ukuran:
+        print(f"\n=== {jumlah:,} Korban ===")
+        daftar_korban = _buat_korban(jumlah, posko)
+
+        _jalankan(
+            "memory",
+            BencanaRepositoryMemory(),
+            PoskoRepositoryMemory(),
+            KorbanRepositoryMemory(),
+            bencana,
+            posko,
+            daftar_korban,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = SQLiteConnectionPool(str(Path(tmp) / "bench.db"))
+            bencana_repo = BencanaRepositorySQLite(pool)
+            posko_repo = PoskoRepositorySQLite(pool, bencana_repo)
+            _jalankan(
+                "sqlite",
+                bencana_repo,
+                posko_repo,
+                KorbanRepositorySQLite(pool, posko_repo),
+                bencana,
+                posko,
+                daftar_korban,
+            )
+            pool.tutup()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or list(UKURAN_DEFAULT))
@@ -0,0 +1,145 @@
+"""
+Stress test multi-thread untuk kapasitas posko.
+
+Banyak thread "petugas" serentak (dilepas bersama lewat Barrier) mendaftarkan
+korban ke satu posko berkapasitas kecil. Cek sisa kapasitas dan penyimpanan
+harus atomik per posko: setelah semua thread selesai, isi posko harus tepat
+sama dengan kapasitasnya (tidak lebih) dan sisanya ditolak "Posko sudah penuh".
+
+Skenario per putaran (posko baru setiap putaran):
+    - buat_korban       : satu korban per thread
+    - buat_korban_batch : beberapa korban per thread dalam satu batch
+    - pindah posko      : perbarui_korban() memindahkan korban dari posko lain
+    - dialihkan         : buat_korban(alihkan_jika_penuh=True) ke dua posko penuh
+                          kecil; total yang diterima = jumlah kapasitas keduanya
+
+Cara pakai (dari root project):
+    python -m benchmarks.stress_kapasitas_posko
+    python -m benchmarks.stress_kapasitas_posko 64 50
+"""
+import logging
+import sys
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+from main import buat_layanan, buat_repository_memory, buat_repository_sqlite
+
+JUMLAH_THREAD = 32
+JUMLAH_PUTARAN = 20
+KAPASITAS = 5
+UKURAN_BATCH = 3
+
+
+def _record(i: int, id_posko: str) -> dict:
+    return {
+        "nama_orang": f"Korban {i}", "alamat_orang": "Cianjur", "jenis_kelamin_orang": "perempuan",
+        "tanggal_lahir_orang": date(1990, 1, 1), "status_triase": "kuning",
+        "kondisi_awal": "Luka ringan", "lokasi_ditemukan": "Reruntuhan", "id_posko": id_posko,
+    }
+
+
+def _serentak(jumlah_thread: int, kerja) -> list[int]:
+    """Menjalankan kerja(no) di banyak thread yang dilepas bersamaan; mengembalikan jumlah sukses per thread."""
+    mulai = threading.Barrier(jumlah_thread)
+    sukses = [0] * jumlah_thread
+
+    def petugas(no: int) -> None:
+        mulai.wait()
+        sukses[no] = kerja(no)
+
+    threads = [threading.Thread(target=petugas, args=(i,)) for i in range(jumlah_thread)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sukses
+
+
+def _putaran(layanan: dict, skenario: str, jumlah_thread: int, putaran: int) -> tuple[int, int]:
+    """Mengembalikan (isi posko tujuan, kapasitas yang boleh terisi)."""
+    korban = layanan["korban"]
+    id_bencana = layanan["bencana"].buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = layanan["posko"].buat_posko(id_bencana, f"Posko {putaran}", "Jl. 1", KAPASITAS, "aktif")
+
+    def satu(no: int, **opsi) -> int:
+        try:
+            korban.buat_korban(**_record(no, id_posko), **opsi)
+            return 1
+        except ValueError:
+            return 0
+
+    if skenario == "buat_korban":
+        _serentak(jumlah_thread, satu)
+        return len(korban.ambil_korban_berdasarkan_posko(id_posko)), KAPASITAS
+
+    if skenario == "buat_korban_batch":
+        def batch(no: int) -> int:
+            hasil = korban.buat_korban_batch([_record(no * UKURAN_BATCH + j, id_posko) for j in range(UKURAN_BATCH)])
+            return sum(h["sukses"] for h in hasil)
+
+        _serentak(jumlah_thread, batch)
+        return len(korban.ambil_korban_berdasarkan_posko(id_posko)), KAPASITAS
+
+    if skenario == "pindah posko":
+        id_asal = layanan["posko"].buat_posko(id_bencana, f"Posko asal {putaran}", "Jl. 2", jumlah_thread, "aktif")
+        daftar_id = [korban.buat_korban(**_record(i, id_asal)) for i in range(jumlah_thread)]
+
+        def pindah(no: int) -> int:
+            k = korban.ambil_korban(daftar_id[no])
+            try:
+                korban.perbarui_korban(
+                    daftar_id[no], k.get_nama_orang(), k.get_alamat_orang(), k.get_jenis_kelamin_orang().value,
+                    k.get_tanggal_lahir_orang(), k.get_status_triase().value, k.get_kondisi_awal(),
+                    k.get_lokasi_ditemukan(), id_posko,
+                )
+                return 1
+            except ValueError:
+                return 0
+
+        _serentak(jumlah_thread, pindah)
+        return len(korban.ambil_korban_berdasarkan_posko(id_posko)), KAPASITAS
+
+    # dialihkan: posko kedua menampung limpahan, total keduanya tetap dibatasi
+    id_cadangan = layanan["posko"].buat_posko(id_bencana, f"Posko cadangan {putaran}", "Jl. 3", KAPASITAS, "aktif")
+    _serentak(jumlah_thread, lambda no: satu(no, alihkan_jika_penuh=True))
+    return (
+        len(korban.ambil_korban_berdasarkan_posko(id_posko)) + len(korban.ambil_korban_berdasarkan_posko(id_cadangan)),
+        2 * KAPASITAS,
+    )
+
+
+def _jalankan(nama: str, layanan: dict, jumlah_thread: int, jumlah_putaran: int) -> bool:
+    ok = True
+    for skenario in ("buat_korban", "buat_korban_batch", "pindah posko", "dialihkan"):
+        melebihi = kurang = 0
+        for putaran in range(jumlah_putaran):
+            isi, kapasitas = _putaran(layanan, skenario, jumlah_thread, putaran)
+            melebihi += isi > kapasitas
+            kurang += isi < kapasitas
+        print(
+            f"  [{nama}, {skenario:<17}] {jumlah_putaran:3} putaran x {jumlah_thread} thread: "
+            f"melebihi kapasitas={melebihi:3}, tidak terisi penuh={kurang:3}"
+        )
+        ok = ok and melebihi == 0 and kurang == 0
+    return ok
+
+
+def main(jumlah_thread: int, jumlah_putaran: int) -> None:
+    logging.disable(logging.CRITICAL)
+
+    ok = _jalankan("memory-aman", buat_layanan(buat_repository_memory(aman_thread=True)), jumlah_thread, jumlah_putaran)
+    with tempfile.TemporaryDirectory() as tmp:
+        layanan = buat_layanan(buat_repository_sqlite(str(Path(tmp) / "stress.db")))
+        ok = _jalankan("sqlite", layanan, jumlah_thread, max(1, jumlah_putaran // 4)) and ok
+
+    print("LULUS" if ok else "GAGAL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_THREAD,
+        int(sys.argv[2]) if len(sys.argv) > 2 else JUMLAH_PUTARAN,
+    )
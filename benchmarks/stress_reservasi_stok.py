@@ -0,0 +1,182 @@
+"""
+Stress test multi-thread untuk reservasi stok obat.
+
+Beberapa thread "apoteker" menjalankan buat_resep, tambah_stok dan
+kurangi_stok secara acak pada sedikit obat yang sama (kontensi tinggi).
+Sebagian penyimpanan resep sengaja digagalkan untuk memicu rollback.
+Di akhir, stok setiap obat harus sama persis dengan
+stok awal + total penambahan - total pengurangan yang berhasil, dan
+selama berjalan stok tidak pernah negatif.
+
+Setiap obat juga punya satu lot yang sudah kadaluarsa (ditulis langsung
+ke repository, seperti lot yang kadaluarsa setelah diterima). Lot itu
+tidak boleh ikut terambil FEFO: isinya harus utuh sampai akhir.
+
+Cara pakai (dari root project):
+    python -m benchmarks.stress_reservasi_stok
+    python -m benchmarks.stress_reservasi_stok 16 2000
+"""
+import logging
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from main import buat_repository_memory, buat_repository_sqlite
+from services.bencana_service import BencanaService
+from services.korban_service import KorbanService
+from services.obat_service import ObatService
+from services.pemeriksaan_service import PemeriksaanService
+from services.posko_service import PoskoService
+from services.resep_obat_service import ResepObatService
+from services.tenaga_medis import TenagaMedisService
+
+JUMLAH_THREAD = 8
+OPERASI_PER_THREAD = 1_000
+JUMLAH_OBAT = 4
+STOK_AWAL = 200
+STOK_KADALUARSA = 50
+ID_LOT_KADALUARSA = "lot-kadaluarsa"
+RASIO_GAGAL_SIMPAN = 0.1
+
+
+class _ResepRepoGagalAcak:
+    """Membungkus repository resep dan menggagalkan sebagian tambah()."""
+
+    def __init__(self, repo):
+        self._repo = repo
+
+    def tambah(self, data):
+        if random.random() < RASIO_GAGAL_SIMPAN:
+            return False
+        return self._repo.tambah(data)
+
+    def __getattr__(self, nama):
+        return getattr(self._repo, nama)
+
+
+def _siapkan(repos):
+    bencana_repo, posko_repo, orang_repo, tm_repo, korban_repo, obat_repo, pemeriksaan_repo, resep_repo = repos
+
+    id_bencana = BencanaService(bencana_repo).buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = PoskoService(posko_repo, bencana_repo).buat_posko(id_bencana, "Posko", "Jl. 1", 10, "aktif")
+    id_dokter = TenagaMedisService(tm_repo, orang_repo, posko_repo).buat_tenaga_medis(
+        "Dr. Budi", "Jakarta", "laki-laki", date(1985, 5, 20), id_posko, "SIP-1", "dokter", "Umum"
+    )
+    id_korban = KorbanService(korban_repo, orang_repo, posko_repo).buat_korban(
+        "Ahmad", "Cianjur", "laki-laki", date(1990, 1, 1), "kuning", "Luka", "Rumah", id_posko
+    )
+    id_pemeriksaan = PemeriksaanService(pemeriksaan_repo, korban_repo, tm_repo, orang_repo).buat_pemeriksaan(
+        id_korban, id_dokter, "Demam", "Flu", "kuning"
+    )
+
+    obat_service = ObatService(obat_repo)
+    daftar_obat = [
+        obat_service.buat_obat(f"Obat {i}", STOK_AWAL, "Tablet", date.today() + timedelta(days=365))
+        for i in range(JUMLAH_OBAT)
+    ]
+    for id_obat in daftar_obat:
+        obat = obat_repo.ambil_berdasarkan_id(id_obat)
+        obat.tambah_lot(ID_LOT_KADALUARSA, STOK_KADALUARSA, date.today() - timedelta(days=3))
+        obat_repo.perbarui(id_obat, obat)
+    resep_service = ResepObatService(_ResepRepoGagalAcak(resep_repo), pemeriksaan_repo, obat_repo)
+    return obat_service, resep_service, id_pemeriksaan, daftar_obat
+
+
+def _jalankan(nama: str, repos, jumlah_thread: int, operasi: int) -> bool:
+    obat_service, resep_service, id_pemeriksaan, daftar_obat = _siapkan(repos)
+    delta = [{id_obat: 0 for id_obat in daftar_obat} for _ in range(jumlah_thread)]
+    statistik = [{"resep": 0, "resep_ditolak": 0, "tambah": 0, "kurangi": 0} for _ in range(jumlah_thread)]
+    stok_negatif = []
+    selesai = threading.Event()
+
+    def apoteker(no: int) -> None:
+        rng = random.Random(no)
+        for _ in range(operasi):
+            aksi = rng.random()
+            if aksi < 0.6:
+                pilihan = rng.sample(daftar_obat, rng.randint(1, min(3, len(daftar_obat))))
+                items = [
+                    {"id_obat": id_obat, "qty": rng.randint(1, 8), "aturan_pakai": "3x1", "dosis": 500}
+                    for id_obat in pilihan
+                ]
+                try:
+                    resep_service.buat_resep(id_pemeriksaan, items)
+                except (ValueError, RuntimeError):
+                    statistik[no]["resep_ditolak"] += 1
+                    continue
+                for item in items:
+                    delta[no][item["id_obat"]] -= item["qty"]
+                statistik[no]["resep"] += 1
+            elif aksi < 0.8:
+                id_obat, qty = rng.choice(daftar_obat), rng.randint(1, 10)
+                if obat_service.tambah_stok(id_obat, qty):
+                    delta[no][id_obat] += qty
+                    statistik[no]["tambah"] += 1
+            else:
+                id_obat, qty = rng.choice(daftar_obat), rng.randint(1, 15)
+                if obat_service.kurangi_stok(id_obat, qty):
+                    delta[no][id_obat] -= qty
+                    statistik[no]["kurangi"] += 1
+
+    def pengawas() -> None:
+        while not selesai.is_set():
+            for id_obat in daftar_obat:
+                obat = obat_service.ambil_obat(id_obat)
+                stok = min(obat.get_stock_obat(), obat.get_stok_tersedia())
+                if stok < 0:
+                    stok_negatif.append((id_obat, stok))
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=apoteker, args=(i,)) for i in range(jumlah_thread)]
+    thread_pengawas = threading.Thread(target=pengawas)
+    mulai = time.perf_counter()
+    thread_pengawas.start()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    durasi = time.perf_counter() - mulai
+    selesai.set()
+    thread_pengawas.join()
+
+    ok = not stok_negatif
+    print(f"  [{nama}] {jumlah_thread} thread x {operasi} operasi dalam {durasi:.2f} s")
+    total = {k: sum(s[k] for s in statistik) for k in statistik[0]}
+    print(f"    resep={total['resep']} ditolak={total['resep_ditolak']} tambah={total['tambah']} kurangi={total['kurangi']}")
+    for id_obat in daftar_obat:
+        diharapkan = STOK_AWAL + STOK_KADALUARSA + sum(d[id_obat] for d in delta)
+        obat = obat_service.ambil_obat(id_obat)
+        aktual = obat.get_stock_obat()
+        lot = obat.get_lot_berdasarkan_id(ID_LOT_KADALUARSA)
+        sisa_kadaluarsa = 0 if lot is None else lot.get_jumlah()
+        status = "OK" if aktual == diharapkan else "DRIFT"
+        if sisa_kadaluarsa != STOK_KADALUARSA:
+            status += f" LOT KADALUARSA TERAMBIL ({STOK_KADALUARSA - sisa_kadaluarsa})"
+        ok = ok and aktual == diharapkan and sisa_kadaluarsa == STOK_KADALUARSA
+        print(f"    obat {id_obat[:8]}: stok={aktual:5} diharapkan={diharapkan:5} {status}")
+    if stok_negatif:
+        print(f"    STOK NEGATIF terdeteksi: {stok_negatif[:5]}")
+    return ok
+
+
+def main(jumlah_thread: int, operasi: int) -> None:
+    logging.disable(logging.CRITICAL)
+
+    ok = _jalankan("memory", buat_repository_memory(), jumlah_thread, operasi)
+    with tempfile.TemporaryDirectory() as tmp:
+        repos = buat_repository_sqlite(str(Path(tmp) / "stress.db"))
+        ok = _jalankan("sqlite", repos, jumlah_thread, max(1, operasi // 10)) and ok
+
+    print("LULUS" if ok else "GAGAL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_THREAD,
+        int(sys.argv[2]) if len(sys.argv) > 2 else OPERASI_PER_THREAD,
+    )
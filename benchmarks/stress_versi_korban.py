@@ -0,0 +1,131 @@
+"""
+Stress test multi-thread untuk optimistic concurrency pada perbarui_korban.
+
+Beberapa thread "petugas" berulang kali membaca korban, menaikkan
+penghitung di kondisi_awal ("Diperiksa N kali"), lalu menyimpannya lewat
+KorbanService.perbarui_korban pada sedikit korban yang sama (kontensi
+tinggi). Di antara baca dan simpan thread sengaja mengalah (sleep(0)),
+seperti petugas yang sedang mengisi form.
+
+Dua mode dibandingkan:
+    - tanpa versi : perbarui_korban() tanpa argumen versi (last write wins)
+    - versi       : versi dari ambil_korban_dengan_versi() dikirim kembali;
+                    KonflikVersi diulang dengan membaca ulang data
+
+Mode "versi" harus berakhir dengan penghitung setiap korban sama persis
+dengan jumlah update yang berhasil (tidak ada update yang hilang); mode
+"tanpa versi" hanya ditampilkan sebagai pembanding.
+
+Cara pakai (dari root project):
+    python -m benchmarks.stress_versi_korban
+    python -m benchmarks.stress_versi_korban 16 500
+"""
+import logging
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from main import buat_repository_memory, buat_repository_sqlite
+from repositories.base_repository import KonflikVersi
+from services.bencana_service import BencanaService
+from services.korban_service import KorbanService
+from services.posko_service import PoskoService
+
+JUMLAH_THREAD = 8
+UPDATE_PER_THREAD = 300
+JUMLAH_KORBAN = 4
+
+
+def _siapkan(repos) -> tuple[KorbanService, list[str]]:
+    bencana_repo, posko_repo, orang_repo, _, korban_repo, _, _, _ = repos
+
+    id_bencana = BencanaService(bencana_repo).buat_bencana("Gempa Bumi", "Cianjur", date.today(), "aktif")
+    id_posko = PoskoService(posko_repo, bencana_repo).buat_posko(id_bencana, "Posko", "Jl. 1", 100, "aktif")
+    korban_service = KorbanService(korban_repo, orang_repo, posko_repo)
+    daftar_korban = [
+        korban_service.buat_korban(
+            f"Korban {i}", "Cianjur", "perempuan", date(1990, 1, 1), "kuning", "Diperiksa 0 kali", "Rumah", id_posko
+        )
+        for i in range(JUMLAH_KORBAN)
+    ]
+    return korban_service, daftar_korban
+
+
+def _naikkan(korban_service: KorbanService, id_orang: str, pakai_versi: bool) -> int:
+    """Satu update baca-ubah-simpan; mengembalikan jumlah konflik yang diulang."""
+    konflik = 0
+    while True:
+        korban, versi = korban_service.ambil_korban_dengan_versi(id_orang)
+        hitungan = int(korban.get_kondisi_awal().split()[1])
+        time.sleep(0)  # petugas masih mengisi form, thread lain boleh jalan
+        try:
+            korban_service.perbarui_korban(
+                id_orang,
+                korban.get_nama_orang(),
+                korban.get_alamat_orang(),
+                korban.get_jenis_kelamin_orang().value,
+                korban.get_tanggal_lahir_orang(),
+                korban.get_status_triase().value,
+                f"Diperiksa {hitungan + 1} kali",
+                korban.get_lokasi_ditemukan(),
+                korban.get_posko().get_id_posko(),
+                versi=versi if pakai_versi else None,
+            )
+            return konflik
+        except KonflikVersi:
+            konflik += 1
+
+
+def _jalankan(nama: str, repos, jumlah_thread: int, update: int, pakai_versi: bool) -> bool:
+    korban_service, daftar_korban = _siapkan(repos)
+    konflik = [0] * jumlah_thread
+
+    def petugas(no: int) -> None:
+        for i in range(update):
+            konflik[no] += _naikkan(korban_service, daftar_korban[(no + i) % JUMLAH_KORBAN], pakai_versi)
+
+    threads = [threading.Thread(target=petugas, args=(i,)) for i in range(jumlah_thread)]
+    mulai = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    durasi = time.perf_counter() - mulai
+
+    diharapkan = jumlah_thread * update
+    tersimpan = sum(
+        int(korban_service.ambil_korban(id_orang).get_kondisi_awal().split()[1]) for id_orang in daftar_korban
+    )
+    mode = "versi" if pakai_versi else "tanpa versi"
+    print(
+        f"  [{nama}, {mode:<11}] {diharapkan:6} update dalam {durasi:6.2f} s "
+        f"({diharapkan / durasi:8.0f} update/s), konflik diulang={sum(konflik):6}, "
+        f"update hilang={diharapkan - tersimpan:6}"
+    )
+    return tersimpan == diharapkan
+
+
+def main(jumlah_thread: int, update: int) -> None:
+    logging.disable(logging.CRITICAL)
+
+    ok = True
+    for pakai_versi in (False, True):
+        lulus = _jalankan("memory-aman", buat_repository_memory(aman_thread=True), jumlah_thread, update, pakai_versi)
+        ok = ok and (lulus or not pakai_versi)
+        with tempfile.TemporaryDirectory() as tmp:
+            repos = buat_repository_sqlite(str(Path(tmp) / "stress.db"))
+            lulus = _jalankan("sqlite", repos, jumlah_thread, max(1, update // 10), pakai_versi)
+            ok = ok and (lulus or not pakai_versi)
+
+    print("LULUS" if ok else "GAGAL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else JUMLAH_THREAD,
+        int(sys.argv[2]) if len(sys.argv) > 2 else UPDATE_PER_THREAD,
+    )
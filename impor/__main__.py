@@ -0,0 +1,60 @@
+"""
+CLI impor massal: korban, tenaga medis, atau manifest stok obat dari CSV/JSONL.
+
+Kolom/key sama dengan parameter buat_korban(), buat_tenaga_medis() atau
+buat_obat(); tanggal ditulis "YYYY-MM-DD". Error per baris ditulis ke
+<file>.galat.jsonl dan posisi batch terakhir yang tersimpan ke
+<file>.checkpoint.json. Menjalankan ulang perintah yang sama melanjutkan
+impor dari checkpoint; hapus file checkpoint untuk mengimpor ulang dari awal.
+
+Cara pakai (dari root project):
+    python -m impor korban data/korban_posko_a.csv
+    python -m impor obat manifest_gudang.jsonl data/dhms.db
+"""
+import sys
+import time
+
+from main import buat_layanan, buat_repository_sqlite
+
+from .pipeline import JENIS_IMPOR, baca_checkpoint, impor
+
+INTERVAL_LAPORAN = 1.0  # detik
+
+
+def main(jenis: str, path: str, path_db: str = "data/dhms.db") -> None:
+    if jenis not in JENIS_IMPOR:
+        print(f"Jenis impor tidak dikenal: {jenis}. Pilihan: {', '.join(sorted(JENIS_IMPOR))}")
+        sys.exit(2)
+
+    layanan = buat_layanan(buat_repository_sqlite(path_db))
+    terakhir = [0.0]
+
+    def laporan(progres: dict) -> None:
+        sekarang = time.monotonic()
+        if sekarang - terakhir[0] >= INTERVAL_LAPORAN:
+            terakhir[0] = sekarang
+            print(
+                f"  baris {progres['nomor_baris']:,}: {progres['sukses']:,} sukses, {progres['gagal']:,} gagal "
+                f"({progres['baris_per_detik']:,.0f} baris/s)",
+                flush=True,
+            )
+
+    path_checkpoint, path_galat = f"{path}.checkpoint.json", f"{path}.galat.jsonl"
+    checkpoint = baca_checkpoint(path_checkpoint)
+    if checkpoint is not None:
+        print(f"Melanjutkan dari checkpoint: setelah baris {checkpoint['nomor_baris']:,} ({path_checkpoint})")
+    hasil = impor(jenis, path, layanan, path_checkpoint=path_checkpoint, path_galat=path_galat, laporan=laporan)
+
+    print(
+        f"Impor {jenis} selesai: {hasil['baris']:,} baris diproses dalam {hasil['durasi']:.2f} s "
+        f"({hasil['baris_per_detik']:,.0f} baris/s). Total file: {hasil['sukses']:,} sukses, {hasil['gagal']:,} gagal."
+    )
+    if hasil["gagal"]:
+        print(f"Detail error per baris: {path_galat}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+    main(sys.argv[1], sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else "data/dhms.db")
@@ -0,0 +1,354 @@
+"""
+Pipeline impor massal CSV/JSONL berbasis generator.
+
+Tahapan (setiap tahap generator, jadi memori tetap berapa pun besar file):
+    baca_csv / baca_jsonl  -> (nomor_baris, offset, record, error)
+    konversi               -> tanggal "YYYY-MM-DD" -> date, angka -> int
+    per_batch              -> list berisi ukuran_batch baris
+    simpan                 -> buat_*_batch() service (validasi, parse_enum,
+                              model, tambah_banyak ke repository dalam
+                              UnitOfWork)
+
+nomor_baris adalah nomor baris fisik di file (header CSV = baris 1) dan
+offset adalah posisi byte setelah baris tersebut. Setelah setiap batch
+tersimpan, offset baris terakhirnya ditulis ke file checkpoint; impor yang
+terhenti dilanjutkan dengan seek langsung ke offset itu.
+
+ID setiap baris diturunkan dari (waktu mulai impor, path file, nomor
+baris) dengan generate_id_deterministik(); waktu mulai dan path ikut
+disimpan di checkpoint. Batch yang sudah tersimpan tetapi checkpoint-nya
+belum sempat ditulis (proses mati di antara keduanya) mendapat ID yang
+sama saat dilanjutkan, jadi dikenali dan tidak disimpan dua kali. Baris
+error batch itu bisa tertulis dua kali di file galat.
+
+Objek hasil impor berumur panjang (tersimpan di repository), jadi setelah
+setiap batch objek yang ada dipindah ke generasi permanen GC (gc.freeze)
+agar collector tidak memindainya ulang di setiap batch berikutnya;
+gc.unfreeze() dipanggil saat impor selesai. gc.freeze()/gc.unfreeze()
+berlaku untuk seluruh proses, jadi keduanya dilewati jika generasi
+permanen sudah terisi saat impor dimulai (milik pemanggil, misalnya
+freeze sebelum fork).
+"""
+import csv
+import gc
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+from utils.generator_id import generate_id_deterministik
+from utils.loggers import get_logger
+
+UKURAN_BATCH_DEFAULT = 1_000
+
+_logger = get_logger(__name__)
+
+
+def _tanggal(nilai) -> date:
+    if isinstance(nilai, date):
+        return nilai
+    try:
+        return date.fromisoformat(nilai)
+    except (TypeError, ValueError):
+        raise ValueError(f"Format tanggal harus YYYY-MM-DD, bukan {nilai!r}")
+
+
+def _bilangan(nilai) -> int:
+    if isinstance(nilai, int) and not isinstance(nilai, bool):
+        return nilai
+    try:
+        return int(nilai)
+    except (TypeError, ValueError):
+        raise ValueError(f"Harus bilangan bulat, bukan {nilai!r}")
+
+
+# jenis -> (nama service di main.buat_layanan(), method batch, konverter per kolom)
+JENIS_IMPOR: dict[str, tuple[str, str, dict[str, Callable]]] = {
+    "korban": ("korban", "buat_korban_batch", {"tanggal_lahir_orang": _tanggal}),
+    "tenaga_medis": ("tenaga_medis", "buat_tenaga_medis_batch", {"tanggal_lahir_orang": _tanggal}),
+    "obat": (
+        "obat", "buat_obat_batch",
+        {"stok": _bilangan, "tanggal_kadaluarsa": _tanggal, "titik_pesan_ulang": _bilangan},
+    ),
+}
+
+
+# ===== Tahap 1: baca =====
+def baca_csv(path: str | Path, offset: int = 0, nomor_baris: int = 0) -> Iterator[tuple]:
+    """
+    Membaca CSV (baris pertama = header) record demi record.
+
+    Args:
+        path (str | Path): File CSV (UTF-8, boleh dengan BOM).
+        offset (int, optional): Posisi byte awal; 0 berarti tepat setelah header.
+        nomor_baris (int, optional): Nomor baris fisik terakhir sebelum offset.
+
+    Yields:
+        tuple: (nomor_baris, offset_setelah, record dict | None, error | None).
+    """
+    with open(path, "rb") as berkas:
+        posisi = [0]
+
+        def baris_teks(mulai: int) -> Iterator[str]:
+            berkas.seek(mulai)
+            posisi[0] = mulai
+            for mentah in berkas:
+                posisi[0] += len(mentah)
+                yield mentah.decode("utf-8")
+
+        sumber_header = baris_teks(0)
+        pembaca_header = csv.reader(sumber_header)
+        header = next(pembaca_header, None)
+        if header is None:
+            return
+        header = [kolom.strip() for kolom in header]
+        header[0] = header[0].lstrip("\ufeff")
+        if offset <= posisi[0]:
+            offset, nomor_baris = posisi[0], pembaca_header.line_num
+        sumber_header.close()
+
+        pembaca = csv.reader(baris_teks(offset))
+        for kolom in pembaca:
+            if not kolom:
+                continue  # baris kosong
+            nomor = nomor_baris + pembaca.line_num
+            if len(kolom) != len(header):
+                yield nomor, posisi[0], None, f"Jumlah kolom {len(kolom)} tidak sama dengan header ({len(header)})"
+            else:
+                yield nomor, posisi[0], dict(zip(header, kolom)), None
+
+
+def baca_jsonl(path: str | Path, offset: int = 0, nomor_baris: int = 0) -> Iterator[tuple]:
+    """
+    Membaca JSON Lines (satu objek JSON per baris).
+
+    Args:
+        path (str | Path): File JSONL (UTF-8).
+        offset (int, optional): Posisi byte awal. Default: 0.
+        nomor_baris (int, optional): Nomor baris fisik terakhir sebelum offset.
+
+    Yields:
+        tuple: (nomor_baris, offset_setelah, record dict | None, error | None).
+    """
+    with open(path, "rb") as berkas:
+        berkas.seek(offset)
+        for nomor_baris, mentah in enumerate(berkas, nomor_baris + 1):
+            offset += len(mentah)
+            if not mentah.strip():
+                continue
+            try:
+                record = json.loads(mentah)
+            except ValueError as e:
+                yield nomor_baris, offset, None, f"JSON tidak valid: {e}"
+                continue
+            if isinstance(record, dict):
+                yield nomor_baris, offset, record, None
+            else:
+                yield nomor_baris, offset, None, "Baris harus berupa objek JSON"
+
+
+# ===== Tahap 2-3: konversi & batch =====
+def konversi(baris: Iterable[tuple], konverter: dict[str, Callable]) -> Iterator[tuple]:
+    """Mengubah tipe kolom (record diubah di tempat); kegagalan menjadi error baris."""
+    for nomor, offset, record, error in baris:
+        if error is None:
+            try:
+                for kolom, fungsi in konverter.items():
+                    if kolom in record:
+                        record[kolom] = fungsi(record[kolom])
+            except ValueError as e:
+                record, error = None, f"{kolom}: {e}"
+        yield nomor, offset, record, error
+
+
+def per_batch(baris: Iterable[tuple], ukuran: int) -> Iterator[list[tuple]]:
+    """Mengelompokkan baris menjadi list berukuran paling banyak `ukuran`."""
+    iterator = iter(baris)
+    while batch := list(islice(iterator, ukuran)):
+        yield batch
+
+
+# ===== Tahap 4: simpan =====
+def simpan(
+    batch_baris: Iterable[list[tuple]],
+    buat_batch: Callable[[list[dict], list[str]], list[dict]],
+    buat_id: Callable[[list[int]], list[str]],
+    ambil: Callable[[str], object] | None = None,
+) -> Iterator[tuple]:
+    """
+    Menyimpan setiap batch lewat method buat_*_batch service.
+
+    Args:
+        batch_baris (Iterable[list[tuple]]): Hasil per_batch().
+        buat_batch (Callable): buat_*_batch(records, daftar_id) service.
+        buat_id (Callable[[list[int]], list[str]]): ID untuk setiap nomor baris.
+        ambil (Callable[[str], object] | None, optional): ambil_* service. Jika
+            diberikan (impor dilanjutkan), baris yang ID-nya sudah ada di
+            repository dianggap sudah tersimpan dan tidak ditulis ulang.
+            Pengecekan berhenti setelah batch pertama yang belum tersimpan.
+
+    Yields:
+        tuple: (batch, error per baris) — error None berarti baris tersimpan.
+    """
+    periksa = ambil is not None
+    for batch in batch_baris:
+        error = [b[3] for b in batch]
+        daftar_id = buat_id([b[0] for b in batch])
+        indeks_valid = [i for i, e in enumerate(error) if e is None]
+        if periksa:
+            tersimpan = {i for i in indeks_valid if ambil(daftar_id[i]) is not None}
+            periksa = bool(tersimpan)
+            indeks_valid = [i for i in indeks_valid if i not in tersimpan]
+        hasil = (
+            buat_batch([batch[i][2] for i in indeks_valid], [daftar_id[i] for i in indeks_valid])
+            if indeks_valid else []
+        )
+        for i, h in zip(indeks_valid, hasil):
+            if not h["sukses"]:
+                error[i] = h["error"]
+        yield batch, error
+
+
+# ===== Checkpoint =====
+def baca_checkpoint(path: str | Path) -> dict | None:
+    """Membaca checkpoint impor; None jika belum ada."""
+    try:
+        with open(path, encoding="utf-8") as berkas:
+            return json.load(berkas)
+    except FileNotFoundError:
+        return None
+
+
+def tulis_checkpoint(path: str | Path, data: dict) -> None:
+    """Menulis checkpoint secara atomik (file sementara lalu os.replace)."""
+    sementara = f"{path}.tmp"
+    with open(sementara, "w", encoding="utf-8") as berkas:
+        json.dump(data, berkas)
+    os.replace(sementara, path)
+
+
+# ===== Orkestrasi =====
+def impor(
+    jenis: str,
+    path: str | Path,
+    layanan: dict,
+    ukuran_batch: int = UKURAN_BATCH_DEFAULT,
+    path_checkpoint: str | Path | None = None,
+    path_galat: str | Path | None = None,
+    laporan: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Mengimpor file CSV/JSONL ke repository lewat service.
+
+    Args:
+        jenis (str): "korban", "tenaga_medis" atau "obat".
+        path (str | Path): File sumber (.csv, .jsonl atau .ndjson).
+        layanan (dict): Service hasil main.buat_layanan().
+        ukuran_batch (int, optional): Baris per tambah_banyak(). Default: 1000.
+        path_checkpoint (str | Path | None, optional): File checkpoint; jika ada,
+            impor dilanjutkan dari offset tersimpan. None = tanpa checkpoint.
+        path_galat (str | Path | None, optional): File JSONL untuk error per baris
+            ({"baris", "error"}), ditambahkan di akhir file. None = tidak ditulis.
+        laporan (Callable[[dict], None] | None, optional): Dipanggil setelah setiap
+            batch dengan progres terkini (lihat nilai kembali).
+
+    Returns:
+        dict: "jenis", "baris" (diproses pada jalan ini), "sukses" dan "gagal"
+        (total untuk file, termasuk jalan sebelumnya), "durasi" (detik),
+        "baris_per_detik", "offset", "nomor_baris" (posisi terakhir) dan
+        "dilanjutkan" (True jika mulai dari checkpoint).
+
+    Raises:
+        ValueError: Jika jenis/format tidak dikenal, ukuran batch tidak valid,
+            atau checkpoint milik jenis impor lain.
+    """
+    if jenis not in JENIS_IMPOR:
+        raise ValueError(f"Jenis impor tidak dikenal: {jenis}. Pilihan: {sorted(JENIS_IMPOR)}")
+    if not isinstance(ukuran_batch, int) or ukuran_batch <= 0:
+        raise ValueError("Ukuran batch harus integer positif")
+    akhiran = Path(path).suffix.lower()
+    if akhiran == ".csv":
+        baca = baca_csv
+    elif akhiran in (".jsonl", ".ndjson"):
+        baca = baca_jsonl
+    else:
+        raise ValueError(f"Format file tidak didukung: {akhiran} (gunakan .csv atau .jsonl)")
+
+    nama_layanan, nama_method, konverter = JENIS_IMPOR[jenis]
+    buat_batch = getattr(layanan[nama_layanan], nama_method)
+    ambil = getattr(layanan[nama_layanan], f"ambil_{nama_layanan}")
+
+    progres = {
+        "jenis": jenis, "baris": 0, "sukses": 0, "gagal": 0, "durasi": 0.0, "baris_per_detik": 0.0,
+        "offset": 0, "nomor_baris": 0, "dilanjutkan": False,
+    }
+    # Dasar ID deterministik; diambil dari checkpoint agar ID tetap sama saat dilanjutkan
+    identitas = {"id_ms": time.time_ns() // 1_000_000, "sumber": str(Path(path).resolve())}
+    checkpoint = baca_checkpoint(path_checkpoint) if path_checkpoint is not None else None
+    if checkpoint is not None:
+        if checkpoint["jenis"] != jenis:
+            raise ValueError(f"Checkpoint {path_checkpoint} milik impor {checkpoint['jenis']}, bukan {jenis}")
+        progres.update(
+            offset=checkpoint["offset"], nomor_baris=checkpoint["nomor_baris"],
+            sukses=checkpoint["sukses"], gagal=checkpoint["gagal"], dilanjutkan=True,
+        )
+        identitas = {k: checkpoint.get(k, v) for k, v in identitas.items()}
+        _logger.info("Melanjutkan impor %s dari baris %s (offset %s)", path, progres["nomor_baris"], progres["offset"])
+
+    def tulis_progres() -> None:
+        tulis_checkpoint(path_checkpoint, {
+            "jenis": jenis, "offset": progres["offset"], "nomor_baris": progres["nomor_baris"],
+            "sukses": progres["sukses"], "gagal": progres["gagal"], **identitas,
+        })
+
+    if path_checkpoint is not None and checkpoint is None:
+        tulis_progres()  # dasar ID harus tersimpan sebelum batch pertama ditulis
+
+    galat = open(path_galat, "a", encoding="utf-8") if path_galat is not None else None
+    bekukan = gc.get_freeze_count() == 0
+    mulai = time.perf_counter()
+    try:
+        tahapan = simpan(
+            per_batch(konversi(baca(path, progres["offset"], progres["nomor_baris"]), konverter), ukuran_batch),
+            buat_batch,
+            lambda daftar_nomor: generate_id_deterministik(identitas["id_ms"], identitas["sumber"], daftar_nomor),
+            ambil if progres["dilanjutkan"] else None,
+        )
+        for batch, error in tahapan:
+            jumlah_gagal = 0
+            for (nomor, _, _, _), e in zip(batch, error):
+                if e is not None:
+                    jumlah_gagal += 1
+                    if galat is not None:
+                        galat.write(json.dumps({"baris": nomor, "error": e}, ensure_ascii=False) + "\n")
+            if galat is not None:
+                galat.flush()  # error batch ini harus sudah tertulis sebelum checkpoint melewatinya
+
+            progres["baris"] += len(batch)
+            progres["sukses"] += len(batch) - jumlah_gagal
+            progres["gagal"] += jumlah_gagal
+            progres["nomor_baris"], progres["offset"] = batch[-1][0], batch[-1][1]
+            if path_checkpoint is not None:
+                tulis_progres()
+            progres["durasi"] = time.perf_counter() - mulai
+            progres["baris_per_detik"] = progres["baris"] / progres["durasi"] if progres["durasi"] else 0.0
+            if laporan is not None:
+                laporan(dict(progres))
+            if bekukan:
+                gc.freeze()
+    finally:
+        if bekukan:
+            gc.unfreeze()
+        if galat is not None:
+            galat.close()
+
+    progres["durasi"] = time.perf_counter() - mulai
+    progres["baris_per_detik"] = progres["baris"] / progres["durasi"] if progres["durasi"] else 0.0
+    _logger.info(
+        "Impor %s %s selesai: %s baris, %s sukses, %s gagal (%.0f baris/s)",
+        jenis, path, progres["baris"], progres["sukses"], progres["gagal"], progres["baris_per_detik"],
+    )
+    return progres
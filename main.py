@@ -1,14 +1,28 @@
+import sys
 from datetime import date
 
 # Import Repositories
 from repositories.bencana_repository import BencanaRepositoryMemory
 from repositories.posko_repository import PoskoRepositoryMemory
+from repositories.penyimpanan_orang import PenyimpananOrangMemory
 from repositories.orang_repository import OrangRepositoryMemory
 from repositories.tenaga_medis_repository import TenagaMedisRepositoryMemory
 from repositories.korban_repository import KorbanRepositoryMemory
 from repositories.obat_repository import ObatRepositoryMemory
 from repositories.pemeriksaan_repository import PemeriksaanRepositoryMemory
 from repositories.resep_obat_repository import ResepObatRepositoryMemory
+from repositories.repository_aman_thread import RepositoryAmanThread
+from repositories.sqlite import (
+    SQLiteConnectionPool,
+    BencanaRepositorySQLite,
+    PoskoRepositorySQLite,
+    OrangRepositorySQLite,
+    TenagaMedisRepositorySQLite,
+    KorbanRepositorySQLite,
+    ObatRepositorySQLite,
+    PemeriksaanRepositorySQLite,
+    ResepObatRepositorySQLite,
+)
 
 # Import Services
 from services.bencana_service import BencanaService
@@ -18,28 +32,135 @@ from services.korban_service import KorbanService
 from services.obat_service import ObatService
 from services.pemeriksaan_service import PemeriksaanService
 from services.resep_obat_service import ResepObatService
+from services.reservasi_stok import ReservasiStok
+from services.pemantau_stok import PemantauStok
+from utils.antrian_triase import AntrianTriase
+from utils.kunci_baca_tulis import KunciBacaTulis, KunciMutex
 
-def main():
+try:
+    from services.analitik_konsumsi import AnalitikKonsumsi
+except ImportError:  # NumPy belum terpasang: analitik konsumsi dinonaktifkan
+    AnalitikKonsumsi = None
+
+def buat_repository_memory(aman_thread: bool = False, baca_paralel: bool = False) -> tuple:
+    """
+    Membuat seluruh repository in-memory (data hilang saat program berhenti).
+
+    Jika aman_thread=True, setiap repository dibungkus RepositoryAmanThread
+    (untuk beberapa terminal posko yang dilayani thread pool); repository
+    Orang/TenagaMedis/Korban berbagi satu kunci karena berbagi penyimpanan.
+    Kuncinya mutex, kecuali baca_paralel=True (KunciBacaTulis).
+    """
+    orang = PenyimpananOrangMemory()  # satu record per orang untuk repo Orang/TenagaMedis/Korban
+    repos = (
+        BencanaRepositoryMemory(),
+        PoskoRepositoryMemory(),
+        OrangRepositoryMemory(orang),
+        TenagaMedisRepositoryMemory(orang),
+        KorbanRepositoryMemory(orang),
+        ObatRepositoryMemory(),
+        PemeriksaanRepositoryMemory(),
+        ResepObatRepositoryMemory(),
+    )
+    if not aman_thread:
+        return repos
+
+    buat_kunci = KunciBacaTulis if baca_paralel else KunciMutex
+    kunci_orang = buat_kunci()
+    return tuple(
+        RepositoryAmanThread(repo, kunci_orang if repo.berbagi_penyimpanan(repos[2]) else buat_kunci())
+        for repo in repos
+    )
+
+
+def buat_repository_sqlite(path_db: str = "data/dhms.db") -> tuple:
+    """Membuat seluruh repository SQLite yang berbagi satu pool koneksi."""
+    pool = SQLiteConnectionPool(path_db)
+    bencana_repo = BencanaRepositorySQLite(pool)
+    posko_repo = PoskoRepositorySQLite(pool, bencana_repo)
+    orang_repo = OrangRepositorySQLite(pool, posko_repo)
+    tm_repo = TenagaMedisRepositorySQLite(pool, posko_repo)
+    korban_repo = KorbanRepositorySQLite(pool, posko_repo)
+    obat_repo = ObatRepositorySQLite(pool)
+    pemeriksaan_repo = PemeriksaanRepositorySQLite(pool, korban_repo, tm_repo)
+    resep_repo = ResepObatRepositorySQLite(pool, pemeriksaan_repo, obat_repo)
+    return (
+        bencana_repo,
+        posko_repo,
+        orang_repo,
+        tm_repo,
+        korban_repo,
+        obat_repo,
+        pemeriksaan_repo,
+        resep_repo,
+    )
+
+
+def buat_layanan(repos: tuple) -> dict:
+    """
+    Merangkai seluruh service di atas repository dari buat_repository_*().
+
+    Dipakai bersama oleh simulasi main() dan server API, sehingga antrian
+    triase, pemantau stok dan analitik konsumsi terpasang dengan cara yang sama.
+
+    Returns:
+        dict: Service berdasarkan nama ("bencana", "posko", "tenaga_medis",
+        "korban", "obat", "pemeriksaan", "resep", "pemantau_stok",
+        "analitik_konsumsi"; yang terakhir None jika NumPy tidak terpasang).
+    """
+    (
+        bencana_repo,
+        posko_repo,
+        orang_repo,
+        tm_repo,
+        korban_repo,
+        obat_repo,
+        pemeriksaan_repo,
+        resep_repo,
+    ) = repos
+
+    antrian_triase = AntrianTriase()
+    antrian_triase.isi_dari(korban_repo.iter_semua())
+    pemantau_stok = PemantauStok(ReservasiStok.untuk_repo(obat_repo))
+    pemantau_stok.isi_dari(obat_repo.iter_semua())
+    analitik_konsumsi = None
+    if AnalitikKonsumsi is not None:
+        analitik_konsumsi = AnalitikKonsumsi(ReservasiStok.untuk_repo(obat_repo))
+        analitik_konsumsi.isi_stok_dari(obat_repo.iter_semua())
+        analitik_konsumsi.isi_dari(resep_repo.iter_semua())
+    return {
+        "bencana": BencanaService(bencana_repo),
+        "posko": PoskoService(posko_repo, bencana_repo),
+        "tenaga_medis": TenagaMedisService(tm_repo, orang_repo, posko_repo),
+        "korban": KorbanService(korban_repo, orang_repo, posko_repo, antrian_triase),
+        "obat": ObatService(obat_repo),
+        "pemeriksaan": PemeriksaanService(pemeriksaan_repo, korban_repo, tm_repo, orang_repo, antrian_triase),
+        "resep": ResepObatService(resep_repo, pemeriksaan_repo, obat_repo, analitik_konsumsi=analitik_konsumsi),
+        "pemantau_stok": pemantau_stok,
+        "analitik_konsumsi": analitik_konsumsi,
+    }
+
+
+def main(backend: str = "memory"):
     print("=== MENGINISIALISASI SISTEM MANAJEMEN KESEHATAN BENCANA ===\n")
 
-    # 1. Inisialisasi Repository
-    bencana_repo = BencanaRepositoryMemory()
-    posko_repo = PoskoRepositoryMemory()
-    orang_repo = OrangRepositoryMemory()
-    tm_repo = TenagaMedisRepositoryMemory()
-    korban_repo = KorbanRepositoryMemory()
-    obat_repo = ObatRepositoryMemory()
-    pemeriksaan_repo = PemeriksaanRepositoryMemory()
-    resep_repo = ResepObatRepositoryMemory()
+    # 1. Inisialisasi Repository ("memory", "memory-aman" atau "sqlite")
+    if backend == "sqlite":
+        repos = buat_repository_sqlite()
+    else:
+        repos = buat_repository_memory(aman_thread=backend == "memory-aman")
 
     # 2. Inisialisasi Service (Dependency Injection)
-    bencana_service = BencanaService(bencana_repo)
-    posko_service = PoskoService(posko_repo, bencana_repo)
-    tm_service = TenagaMedisService(tm_repo, orang_repo, posko_repo)
-    korban_service = KorbanService(korban_repo, orang_repo, posko_repo)
-    obat_service = ObatService(obat_repo)
-    pemeriksaan_service = PemeriksaanService(pemeriksaan_repo, korban_repo, tm_repo, orang_repo)
-    resep_service = ResepObatService(resep_repo, pemeriksaan_repo, obat_repo)
+    layanan = buat_layanan(repos)
+    bencana_service = layanan["bencana"]
+    posko_service = layanan["posko"]
+    tm_service = layanan["tenaga_medis"]
+    korban_service = layanan["korban"]
+    obat_service = layanan["obat"]
+    pemeriksaan_service = layanan["pemeriksaan"]
+    resep_service = layanan["resep"]
+    pemantau_stok = layanan["pemantau_stok"]
+    analitik_konsumsi = layanan["analitik_konsumsi"]
 
     try:
         # 3. Skenario: Membuat Data Bencana
@@ -97,7 +218,8 @@ def main():
             nama="Paracetamol 500mg",
             stok=100,
             satuan="Tablet",
-            tanggal_kadaluarsa=date(2026, 12, 31)
+            tanggal_kadaluarsa=date(2026, 12, 31),
+            titik_pesan_ulang=20
         )
         id_obat_betadine = obat_service.buat_obat(
             nama="Betadine Cair",
@@ -150,6 +272,11 @@ def main():
         # Cek pengurangan stok
         stok_paracetamol = obat_service.ambil_obat(id_obat_paracetamol).get_stock_obat()
         print(f"   -> Sisa stok Paracetamol: {stok_paracetamol} (Awal: 100, Keluar: 10)")
+        print(f"   -> Obat perlu dipesan ulang: {pemantau_stok.jumlah_di_bawah_titik()}")
+        if analitik_konsumsi is not None:
+            for baris in analitik_konsumsi.ringkasan(id_bencana):
+                if baris["id_obat"] == id_obat_paracetamol:
+                    print(f"   -> Persediaan Paracetamol cukup untuk {baris['hari_sampai_habis']:.0f} hari")
 
         print("\n=== SIMULASI SELESAI DENGAN SUKSES ===")
 
@@ -159,4 +286,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1] if len(sys.argv) > 1 else "memory")
\ No newline at end of file
@@ -4,6 +4,7 @@ from .tenaga_medis import TenagaMedis
 from .pemeriksaan import Pemeriksaan
 from .resep_obat import ResepObat
 from .obat import Obat
+from .lot_obat import LotObat
 from .posko import Posko
 from .bencana import Bencana
 
@@ -15,6 +16,7 @@ __all__ = [
     "Pemeriksaan",
     "ResepObat",
     "Obat",
+    "LotObat",
     "Posko",
     "Bencana",
 ]
\ No newline at end of file
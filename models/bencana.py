@@ -14,6 +14,8 @@ class Bencana:
         status (StatusBencana): Status terkini dari bencana.
     """
 
+    __slots__ = ("__bencana_id", "__jenis", "__lokasi", "__tanggal_mulai", "__status")
+
     def __init__(self, id_bencana: str, jenis: str, lokasi: str, tanggal_mulai: date, status: StatusBencana):
         self.set_id_bencana(id_bencana)
         self.set_jenis(jenis)
@@ -21,6 +23,22 @@ class Bencana:
         self.set_tanggal_mulai(tanggal_mulai)
         self.set_status(status)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls, id_bencana: str, jenis: str, lokasi: str, tanggal_mulai: date, status: StatusBencana
+    ) -> "Bencana":
+        """Membuat Bencana dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Hanya untuk repository dan deserializer; nilai tidak divalidasi ulang.
+        """
+        bencana = cls.__new__(cls)
+        bencana.__bencana_id = id_bencana
+        bencana.__jenis = jenis
+        bencana.__lokasi = lokasi
+        bencana.__tanggal_mulai = tanggal_mulai
+        bencana.__status = status
+        return bencana
+
     # ===== Getter =====
     def get_id_bencana(self) -> str:
 
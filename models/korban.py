@@ -22,6 +22,8 @@ class Korban(Orang):
         posko (Posko): Posko tempat korban ditangani.
     """
 
+    __slots__ = ("__status_triase", "__kondisi_awal", "__lokasi_ditemukan", "__posko")
+
     def __init__(
         self,
         id_orang: str,
@@ -53,6 +55,27 @@ class Korban(Orang):
         self.set_lokasi_ditemukan(lokasi_ditemukan)
         self.set_posko(posko)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_orang: str,
+        nama_orang: str,
+        alamat_orang: str,
+        jenis_kelamin_orang: JenisKelamin,
+        tanggal_lahir_orang: date,
+        status_triase: StatusTriase,
+        kondisi_awal: str,
+        lokasi_ditemukan: str,
+        posko: Posko,
+    ) -> "Korban":
+        """Membuat Korban dari data yang sudah tervalidasi tanpa setter (lihat Orang._dari_tepercaya)."""
+        korban = super()._dari_tepercaya(id_orang, nama_orang, alamat_orang, jenis_kelamin_orang, tanggal_lahir_orang)
+        korban.__status_triase = status_triase
+        korban.__kondisi_awal = kondisi_awal
+        korban.__lokasi_ditemukan = lokasi_ditemukan
+        korban.__posko = posko
+        return korban
+
     # ===== Polymorphism (Override) =====
     def get_peran(self) -> str:
         """Mengembalikan peran orang.
@@ -0,0 +1,113 @@
+from datetime import date
+
+
+class LotObat:
+    """
+    Merepresentasikan satu lot (batch donasi) dari sebuah obat.
+
+    Tanggal kadaluarsa lot tidak ditolak jika sudah lewat, karena lot yang
+    kadaluarsa tetap perlu tercatat sampai dikeluarkan dari stok.
+
+    Attributes:
+        id_lot (str): ID lot (unik dalam satu obat).
+        jumlah (int): Sisa jumlah di lot ini.
+        tanggal_kadaluarsa (date): Tanggal kadaluarsa lot.
+    """
+
+    __slots__ = ("__id_lot", "__jumlah", "__tanggal_kadaluarsa")
+
+    def __init__(self, id_lot: str, jumlah: int, tanggal_kadaluarsa: date):
+        """
+        Inisialisasi objek LotObat.
+
+        Args:
+            id_lot (str): ID lot.
+            jumlah (int): Jumlah di lot.
+            tanggal_kadaluarsa (date): Tanggal kadaluarsa lot.
+
+        Raises:
+            ValueError: Jika salah satu argumen tidak valid.
+        """
+        self.set_id_lot(id_lot)
+        self.set_jumlah(jumlah)
+        self.set_tanggal_kadaluarsa(tanggal_kadaluarsa)
+
+    @classmethod
+    def _dari_tepercaya(cls, id_lot: str, jumlah: int, tanggal_kadaluarsa: date) -> "LotObat":
+        """Membuat LotObat dari data yang sudah tervalidasi (baris database) tanpa setter."""
+        lot = cls.__new__(cls)
+        lot.__id_lot = id_lot
+        lot.__jumlah = jumlah
+        lot.__tanggal_kadaluarsa = tanggal_kadaluarsa
+        return lot
+
+    # ===== Getter =====
+    def get_id_lot(self) -> str:
+        """
+        Mengambil ID lot.
+
+        Returns:
+            str: ID lot.
+        """
+        return self.__id_lot
+
+    def get_jumlah(self) -> int:
+        """
+        Mengambil sisa jumlah di lot.
+
+        Returns:
+            int: Jumlah di lot.
+        """
+        return self.__jumlah
+
+    def get_tanggal_kadaluarsa(self) -> date:
+        """
+        Mengambil tanggal kadaluarsa lot.
+
+        Returns:
+            date: Tanggal kadaluarsa.
+        """
+        return self.__tanggal_kadaluarsa
+
+    # ===== Setter =====
+    def set_id_lot(self, id_lot: str) -> None:
+        """
+        Mengatur ID lot.
+
+        Args:
+            id_lot (str): ID lot.
+
+        Raises:
+            ValueError: Jika ID lot bukan string atau kosong.
+        """
+        if not isinstance(id_lot, str) or not id_lot.strip():
+            raise ValueError("ID lot tidak boleh kosong")
+        self.__id_lot = id_lot
+
+    def set_jumlah(self, jumlah: int) -> None:
+        """
+        Mengatur jumlah di lot.
+
+        Args:
+            jumlah (int): Jumlah baru.
+
+        Raises:
+            ValueError: Jika jumlah bukan integer non-negatif.
+        """
+        if not isinstance(jumlah, int) or jumlah < 0:
+            raise ValueError("Jumlah lot harus berupa integer non-negatif")
+        self.__jumlah = jumlah
+
+    def set_tanggal_kadaluarsa(self, tanggal_kadaluarsa: date) -> None:
+        """
+        Mengatur tanggal kadaluarsa lot.
+
+        Args:
+            tanggal_kadaluarsa (date): Tanggal kadaluarsa.
+
+        Raises:
+            ValueError: Jika tanggal kadaluarsa bukan date.
+        """
+        if not isinstance(tanggal_kadaluarsa, date):
+            raise ValueError("Tanggal kadaluarsa lot harus bertipe date")
+        self.__tanggal_kadaluarsa = tanggal_kadaluarsa
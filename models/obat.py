@@ -1,5 +1,9 @@
+import heapq
+from collections.abc import Iterable
 from datetime import date
 
+from .lot_obat import LotObat
+
 class Obat:
 
     """
@@ -11,7 +15,35 @@ class Obat:
         stock_obat (int): Jumlah stock obat yang tersedia.
         satuan_obat (str): Satuan dari obat (misalnya: tablet, botol, dll).
         tanggal_kadaluarsa_obat (date): Tanggal kadaluarsa obat.
+        titik_pesan_ulang (int): Batas stok; stok di bawah nilai ini perlu dipesan ulang (0 = nonaktif).
+
+    Stok disimpan per lot di dalam min-heap berdasarkan tanggal kadaluarsa,
+    sehingga pengeluaran stok selalu mengambil lot yang paling cepat
+    kadaluarsa lebih dulu (FEFO) dalam O(log jumlah lot). Total stok
+    dijaga bertambah/berkurang bersama setiap perubahan lot, tidak
+    dijumlah ulang. Stok yang ditambah lewat set_stock_obat() masuk ke
+    lot default dengan tanggal kadaluarsa_obat.
+
+    Lot yang sudah kadaluarsa dipindah ke heap terpisah begitu tanggal
+    acuan (hari_ini) maju melewatinya, dan jumlahnya dijaga sebagai total
+    tersendiri; stok tersedia = total stok - total kadaluarsa tanpa
+    menjumlah ulang lot.
     """
+
+    __slots__ = (
+        "__id_obat",
+        "__nama_obat",
+        "__stock_obat",
+        "__satuan_obat",
+        "__tanggal_kadaluarsa_obat",
+        "__titik_pesan_ulang",
+        "__lot",
+        "__heap_lot",
+        "__urutan_lot",
+        "__heap_kadaluarsa",
+        "__stok_kadaluarsa",
+        "__batas_kadaluarsa",
+    )
     
     def __init__(
         self,
@@ -20,6 +52,7 @@ class Obat:
         stock_obat: int,
         satuan_obat: str,
         tanggal_kadaluarsa_obat: date,
+        titik_pesan_ulang: int = 0,
     ):
         """Inisialisasi objek Obat.
 
@@ -29,12 +62,81 @@ class Obat:
             stock_obat (int): Jumlah stock obat yang tersedia.
             satuan_obat (str): Satuan dari obat.
             tanggal_kadaluarsa_obat (date): Tanggal kadaluarsa obat.
+            titik_pesan_ulang (int, optional): Titik pesan ulang. Default: 0 (nonaktif).
         """
+        self.__stock_obat = 0
+        self.__lot: dict[str, tuple[LotObat, int]] = {}  # key: id_lot, value: (lot, urutan di heap)
+        self.__heap_lot: list[tuple[date, int, str]] = []  # (tanggal_kadaluarsa, urutan, id_lot)
+        self.__urutan_lot = 0
+        # Lot bertanggal < __batas_kadaluarsa ada di __heap_kadaluarsa, jumlahnya di __stok_kadaluarsa
+        self.__heap_kadaluarsa: list[tuple[date, int, str]] = []
+        self.__stok_kadaluarsa = 0
+        self.__batas_kadaluarsa: date | None = None
+
         self.set_id_obat(id_obat)
         self.set_nama_obat(nama_obat)
-        self.set_stock_obat(stock_obat)
         self.set_satuan_obat(satuan_obat)
+        # Tanggal diisi sebelum stok karena stok awal masuk ke lot bertanggal ini
         self.set_tanggal_kadaluarsa_obat(tanggal_kadaluarsa_obat)
+        self.set_stock_obat(stock_obat)
+        self.set_titik_pesan_ulang(titik_pesan_ulang)
+
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_obat: str,
+        nama_obat: str,
+        stock_obat: int,
+        satuan_obat: str,
+        tanggal_kadaluarsa_obat: date,
+        titik_pesan_ulang: int = 0,
+        lot: Iterable[tuple[str, int, date]] = (),
+    ) -> "Obat":
+        """
+        Membuat Obat dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Berbeda dengan __init__, tanggal kadaluarsa yang sudah lewat tetap
+        bisa dimuat (obat kadaluarsa yang masih tersimpan). Heap lot dibangun
+        sekali dengan heapify, bukan push per lot.
+
+        Args:
+            id_obat (str): ID obat.
+            nama_obat (str): Nama obat.
+            stock_obat (int): Total stok tersimpan.
+            satuan_obat (str): Satuan obat.
+            tanggal_kadaluarsa_obat (date): Tanggal kadaluarsa obat.
+            titik_pesan_ulang (int, optional): Titik pesan ulang. Default: 0.
+            lot (Iterable[tuple[str, int, date]], optional): (id_lot, jumlah, tanggal_kadaluarsa)
+                per lot. Jika total lot berbeda dengan stock_obat (baris lama tanpa lot),
+                selisihnya diterapkan seperti set_stock_obat().
+
+        Returns:
+            Obat: Objek obat.
+        """
+        obat = cls.__new__(cls)
+        obat.__id_obat = id_obat
+        obat.__nama_obat = nama_obat
+        obat.__satuan_obat = satuan_obat
+        obat.__tanggal_kadaluarsa_obat = tanggal_kadaluarsa_obat
+        obat.__titik_pesan_ulang = titik_pesan_ulang
+
+        obat.__lot = {}
+        obat.__heap_lot = []
+        total = 0
+        for urutan, (id_lot, jumlah, tanggal) in enumerate(lot, 1):
+            obat.__lot[id_lot] = (LotObat._dari_tepercaya(id_lot, jumlah, tanggal), urutan)
+            obat.__heap_lot.append((tanggal, urutan, id_lot))
+            total += jumlah
+        heapq.heapify(obat.__heap_lot)
+        obat.__urutan_lot = len(obat.__lot)
+        obat.__stock_obat = total
+        obat.__heap_kadaluarsa = []
+        obat.__stok_kadaluarsa = 0
+        obat.__batas_kadaluarsa = None
+
+        if total != stock_obat:
+            obat.set_stock_obat(stock_obat)
+        return obat
 
     # ===== Getter =====
     def get_id_obat(self) -> str:
@@ -90,6 +192,24 @@ class Obat:
         
         return self.__tanggal_kadaluarsa_obat
     
+    def get_titik_pesan_ulang(self) -> int:
+        """
+        Mengembalikan titik pesan ulang (reorder point) obat.
+
+        Returns:
+            int: Titik pesan ulang (0 = nonaktif).
+        """
+        return self.__titik_pesan_ulang
+
+    def perlu_pesan_ulang(self) -> bool:
+        """
+        Mengecek apakah stok sudah di bawah titik pesan ulang.
+
+        Returns:
+            bool: True jika stok < titik pesan ulang.
+        """
+        return self.__stock_obat < self.__titik_pesan_ulang
+
     # ===== Setter =====
     def set_id_obat(self, id_obat: str) -> None:
         """Mengubah ID obat.
@@ -120,6 +240,10 @@ class Obat:
     def set_stock_obat(self, stock_obat: int) -> None:
         """Mengubah stock obat.
 
+        Selisih terhadap stok saat ini diterapkan ke lot: pengurangan
+        diambil FEFO (termasuk lot kadaluarsa, karena ini koreksi jumlah fisik),
+        penambahan masuk ke lot default (tanggal kadaluarsa obat).
+
         Args:
             stock_obat (int): Stock obat baru.
 
@@ -128,7 +252,13 @@ class Obat:
         """
         if not isinstance(stock_obat, int) or stock_obat < 0:
             raise ValueError("Stock obat harus berupa integer non-negatif")
-        self.__stock_obat = stock_obat
+
+        selisih = stock_obat - self.__stock_obat
+        if selisih > 0:
+            self.tambah_lot_default(selisih)
+        elif selisih < 0:
+            # Koreksi hitung stok: lot kadaluarsa ikut dikurangi lebih dulu
+            self.__ambil(-selisih)
 
     def set_satuan_obat(self, satuan_obat: str) -> None:
         """Mengubah satuan obat.
@@ -158,3 +288,236 @@ class Obat:
             raise ValueError("Tanggal kadaluarsa tidak boleh di masa lalu")
         self.__tanggal_kadaluarsa_obat = tanggal_kadaluarsa_obat
 
+    def set_titik_pesan_ulang(self, titik_pesan_ulang: int) -> None:
+        """Mengubah titik pesan ulang obat.
+
+        Args:
+            titik_pesan_ulang (int): Titik pesan ulang baru.
+
+        Raises:
+            ValueError: Jika titik pesan ulang bukan integer non-negatif.
+        """
+        if not isinstance(titik_pesan_ulang, int) or titik_pesan_ulang < 0:
+            raise ValueError("Titik pesan ulang harus berupa integer non-negatif")
+        self.__titik_pesan_ulang = titik_pesan_ulang
+
+    # ===== Lot (FEFO) =====
+    def get_lot(self) -> list[LotObat]:
+        """
+        Mengembalikan lot yang masih berisi, urut dari yang paling cepat kadaluarsa.
+
+        Returns:
+            list[LotObat]: Daftar lot.
+        """
+        return [
+            self.__lot[id_lot][0]
+            for _, urutan, id_lot in sorted(self.__heap_kadaluarsa + self.__heap_lot)
+            if self.__lot_berlaku(id_lot, urutan)
+        ]
+
+    def get_lot_berdasarkan_id(self, id_lot: str) -> LotObat | None:
+        """
+        Mengambil satu lot berdasarkan ID.
+
+        Returns:
+            LotObat | None: Lot, atau None jika tidak ada / sudah habis.
+        """
+        entri = self.__lot.get(id_lot)
+        return None if entri is None else entri[0]
+
+    def get_stok_tersedia(self, hari_ini: date | None = None) -> int:
+        """
+        Mengembalikan stok yang boleh dikeluarkan (tanpa lot yang sudah kadaluarsa).
+
+        Lot kadaluarsa tetap dihitung di get_stock_obat() sampai dikeluarkan
+        (misalnya lewat sapu_kadaluarsa(keluarkan=True)), tetapi tidak pernah
+        diambil ambil_fefo().
+
+        Amortized O(log jumlah lot): hanya lot yang baru melewati hari_ini
+        yang dipindah, sisanya memakai total kadaluarsa yang dijaga.
+
+        Args:
+            hari_ini (date | None, optional): Tanggal acuan. Default: date.today().
+
+        Returns:
+            int: Stok yang belum kadaluarsa.
+        """
+        self.__geser_batas(hari_ini or date.today())
+        return self.__stock_obat - self.__stok_kadaluarsa
+
+    def get_kadaluarsa_terdekat(self) -> date | None:
+        """
+        Mengembalikan tanggal kadaluarsa lot terdekat.
+
+        Returns:
+            date | None: Tanggal kadaluarsa, atau None jika stok kosong.
+        """
+        self.__buang_lot_basi(self.__heap_kadaluarsa)
+        if self.__heap_kadaluarsa:
+            return self.__heap_kadaluarsa[0][0]
+        self.__buang_lot_basi(self.__heap_lot)
+        return self.__heap_lot[0][0] if self.__heap_lot else None
+
+    def tambah_lot(self, id_lot: str, jumlah: int, tanggal_kadaluarsa: date) -> LotObat:
+        """
+        Menambahkan stok sebagai lot (atau menambah lot dengan ID & tanggal yang sama).
+
+        Args:
+            id_lot (str): ID lot.
+            jumlah (int): Jumlah yang ditambahkan (positif).
+            tanggal_kadaluarsa (date): Tanggal kadaluarsa lot.
+
+        Returns:
+            LotObat: Lot yang ditambah.
+
+        Raises:
+            ValueError: Jika jumlah tidak valid, atau ID lot sudah dipakai dengan tanggal lain.
+        """
+        if not isinstance(jumlah, int) or jumlah <= 0:
+            raise ValueError("Jumlah lot harus berupa integer positif")
+
+        entri = self.__lot.get(id_lot)
+        if entri is not None:
+            lot = entri[0]
+            if lot.get_tanggal_kadaluarsa() != tanggal_kadaluarsa:
+                raise ValueError("ID lot sudah dipakai dengan tanggal kadaluarsa berbeda")
+            lot.set_jumlah(lot.get_jumlah() + jumlah)
+        else:
+            lot = LotObat(id_lot, jumlah, tanggal_kadaluarsa)
+            self.__urutan_lot += 1
+            self.__lot[id_lot] = (lot, self.__urutan_lot)
+            heap = self.__heap_kadaluarsa if self.__sudah_kadaluarsa(tanggal_kadaluarsa) else self.__heap_lot
+            heapq.heappush(heap, (tanggal_kadaluarsa, self.__urutan_lot, id_lot))
+
+        self.__stock_obat += jumlah
+        if self.__sudah_kadaluarsa(tanggal_kadaluarsa):
+            self.__stok_kadaluarsa += jumlah
+        return lot
+
+    def tambah_lot_default(self, jumlah: int) -> LotObat:
+        """
+        Menambahkan stok ke lot default (bertanggal kadaluarsa obat).
+
+        Args:
+            jumlah (int): Jumlah yang ditambahkan (positif).
+
+        Returns:
+            LotObat: Lot default yang ditambah.
+        """
+        tanggal = self.__tanggal_kadaluarsa_obat
+        return self.tambah_lot(f"default-{tanggal.isoformat()}", jumlah, tanggal)
+
+    def ambil_fefo(self, qty: int, hari_ini: date | None = None) -> list[tuple[str, date, int]]:
+        """
+        Mengeluarkan stok dari lot yang paling cepat kadaluarsa lebih dulu.
+
+        Lot yang sudah kadaluarsa (tanggal < hari_ini) dilewati dan tidak
+        dihitung sebagai stok tersedia.
+
+        Args:
+            qty (int): Jumlah yang dikeluarkan (positif).
+            hari_ini (date | None, optional): Tanggal acuan. Default: date.today().
+
+        Returns:
+            list[tuple[str, date, int]]: (id_lot, tanggal_kadaluarsa, jumlah diambil) per lot,
+            cukup untuk mengembalikan stok lewat tambah_lot().
+
+        Raises:
+            ValueError: Jika qty tidak valid atau stok yang belum kadaluarsa tidak cukup.
+        """
+        if not isinstance(qty, int) or qty <= 0:
+            raise ValueError("Qty harus berupa integer positif")
+
+        # Lot kadaluarsa sudah dipindah ke __heap_kadaluarsa; __heap_lot hanya berisi lot berlaku
+        if qty > self.get_stok_tersedia(hari_ini):
+            raise ValueError("Stok obat tidak cukup")
+        return self.__ambil(qty, termasuk_kadaluarsa=False)
+
+    def __ambil(self, qty: int, termasuk_kadaluarsa: bool = True) -> list[tuple[str, date, int]]:
+        """
+        Mengambil qty dari puncak heap (pemanggil sudah memastikan stok cukup).
+
+        Jika termasuk_kadaluarsa, lot kadaluarsa dihabiskan lebih dulu.
+        """
+        diambil = []
+        sisa = qty
+        heap = self.__heap_kadaluarsa if termasuk_kadaluarsa else self.__heap_lot
+        while sisa:
+            self.__buang_lot_basi(heap)
+            if not heap:
+                heap = self.__heap_lot
+                continue
+            tanggal, _, id_lot = heap[0]
+            lot = self.__lot[id_lot][0]
+            ambil = min(sisa, lot.get_jumlah())
+
+            if ambil == lot.get_jumlah():
+                heapq.heappop(heap)
+                del self.__lot[id_lot]
+            lot.set_jumlah(lot.get_jumlah() - ambil)
+            if heap is self.__heap_kadaluarsa:
+                self.__stok_kadaluarsa -= ambil
+
+            diambil.append((id_lot, tanggal, ambil))
+            sisa -= ambil
+
+        self.__stock_obat -= qty
+        return diambil
+
+    def keluarkan_lot(self, id_lot: str) -> int:
+        """
+        Mengeluarkan seluruh isi satu lot (misalnya lot kadaluarsa dimusnahkan).
+
+        Args:
+            id_lot (str): ID lot.
+
+        Returns:
+            int: Jumlah yang dikeluarkan (0 jika lot tidak ada).
+        """
+        entri = self.__lot.pop(id_lot, None)
+        if entri is None:
+            return 0
+
+        jumlah = entri[0].get_jumlah()
+        entri[0].set_jumlah(0)
+        self.__stock_obat -= jumlah
+        if self.__sudah_kadaluarsa(entri[0].get_tanggal_kadaluarsa()):
+            self.__stok_kadaluarsa -= jumlah
+        return jumlah
+
+    def __lot_berlaku(self, id_lot: str, urutan: int) -> bool:
+        entri = self.__lot.get(id_lot)
+        return entri is not None and entri[1] == urutan
+
+    def __buang_lot_basi(self, heap: list[tuple[date, int, str]]) -> None:
+        """Membuang entri heap milik lot yang sudah dikeluarkan."""
+        while heap and not self.__lot_berlaku(heap[0][2], heap[0][1]):
+            heapq.heappop(heap)
+
+    def __sudah_kadaluarsa(self, tanggal: date) -> bool:
+        """True jika lot bertanggal ini termasuk __heap_kadaluarsa/__stok_kadaluarsa."""
+        return self.__batas_kadaluarsa is not None and tanggal < self.__batas_kadaluarsa
+
+    def __geser_batas(self, hari_ini: date) -> None:
+        """
+        Memindah lot bertanggal < hari_ini dari __heap_lot ke __heap_kadaluarsa.
+
+        Lot kadaluarsa selalu di puncak __heap_lot, jadi hanya lot yang baru
+        kadaluarsa yang disentuh. Jika hari_ini mundur (jarang; misalnya
+        tanggal acuan eksplisit), kedua heap digabung dan dibagi ulang.
+        """
+        batas = self.__batas_kadaluarsa
+        if batas is not None and hari_ini < batas:
+            self.__heap_lot += self.__heap_kadaluarsa
+            heapq.heapify(self.__heap_lot)
+            self.__heap_kadaluarsa, self.__stok_kadaluarsa = [], 0
+        elif hari_ini == batas:
+            return
+
+        self.__batas_kadaluarsa = hari_ini
+        heap = self.__heap_lot
+        while heap and heap[0][0] < hari_ini:
+            entri = heapq.heappop(heap)
+            if self.__lot_berlaku(entri[2], entri[1]):
+                heapq.heappush(self.__heap_kadaluarsa, entri)
+                self.__stok_kadaluarsa += self.__lot[entri[2]][0].get_jumlah()
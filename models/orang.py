@@ -6,8 +6,21 @@ class Orang(ABC):
     """
     Abstract base class untuk merepresentasikan manusia
     dalam sistem penanganan kesehatan bencana.
+
+    Seluruh model memakai __slots__ (tanpa __dict__ per instance) agar
+    jutaan korban/pemeriksaan di memori tetap hemat. Nama slot "__x" ikut
+    di-mangle menjadi "_Kelas__x", jadi getter/setter tidak berubah.
+    Subclass wajib mendeklarasikan __slots__ sendiri.
     """
 
+    __slots__ = (
+        "__id_orang",
+        "__nama_orang",
+        "__alamat_orang",
+        "__jenis_kelamin_orang",
+        "__tanggal_lahir_orang",
+    )
+
     def __init__(
         self,
         id_orang: str,
@@ -32,6 +45,29 @@ class Orang(ABC):
         self.set_jenis_kelamin_orang(jenis_kelamin_orang)
         self.set_tanggal_lahir_orang(tanggal_lahir_orang)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_orang: str,
+        nama_orang: str,
+        alamat_orang: str,
+        jenis_kelamin_orang: JenisKelamin,
+        tanggal_lahir_orang: date,
+    ):
+        """Membuat objek dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Hanya untuk repository dan deserializer: nilai tidak divalidasi ulang,
+        jadi pemanggil wajib menjamin tipenya sudah benar. Subclass
+        memanggil method ini lewat super() lalu mengisi atributnya sendiri.
+        """
+        obj = cls.__new__(cls)
+        obj.__id_orang = id_orang
+        obj.__nama_orang = nama_orang
+        obj.__alamat_orang = alamat_orang
+        obj.__jenis_kelamin_orang = jenis_kelamin_orang
+        obj.__tanggal_lahir_orang = tanggal_lahir_orang
+        return obj
+
     # ===== Getter =====
     def get_id_orang(self) -> str:
         """Mengembalikan ID orang.
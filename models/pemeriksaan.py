@@ -18,6 +18,16 @@ class Pemeriksaan:
         status_triase (StatusTriase): Status triase setelah pemeriksaan.
     """
 
+    __slots__ = (
+        "__id_pemeriksaan",
+        "__korban",
+        "__tenaga_medis",
+        "__tanggal_pemeriksaan",
+        "__keluhan",
+        "__diagnosa",
+        "__status_triase",
+    )
+
     def __init__(
         self,
         id_pemeriksaan: str,
@@ -47,6 +57,31 @@ class Pemeriksaan:
         self.set_diagnosa(diagnosa)
         self.set_status_triase(status_triase)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_pemeriksaan: str,
+        tenaga_medis: TenagaMedis,
+        korban: Korban,
+        tanggal_pemeriksaan: date,
+        keluhan: str,
+        diagnosa: str,
+        status_triase: StatusTriase,
+    ) -> "Pemeriksaan":
+        """Membuat Pemeriksaan dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Hanya untuk repository dan deserializer; nilai tidak divalidasi ulang.
+        """
+        pemeriksaan = cls.__new__(cls)
+        pemeriksaan.__id_pemeriksaan = id_pemeriksaan
+        pemeriksaan.__tenaga_medis = tenaga_medis
+        pemeriksaan.__korban = korban
+        pemeriksaan.__tanggal_pemeriksaan = tanggal_pemeriksaan
+        pemeriksaan.__keluhan = keluhan
+        pemeriksaan.__diagnosa = diagnosa
+        pemeriksaan.__status_triase = status_triase
+        return pemeriksaan
+
     # ===== Getter =====
     def get_id_pemeriksaan(self) -> str:
         """Mengembalikan ID pemeriksaan.
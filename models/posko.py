@@ -14,6 +14,15 @@ class Posko:
         status_posko (StatusPosko): Status posko.
     """
 
+    __slots__ = (
+        "__id_posko",
+        "__nama_posko",
+        "__alamat_posko",
+        "__kapasitas_posko",
+        "__status_posko",
+        "__bencana",
+    )
+
     def __init__(self, id_posko: str, bencana: Bencana, nama_posko: str, alamat_posko: str, kapasitas_posko: int, status_posko: StatusPosko):
         """Inisialisasi objek Posko.
 
@@ -32,6 +41,29 @@ class Posko:
         self.set_kapasitas_posko(kapasitas_posko)
         self.set_status_posko(status_posko)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_posko: str,
+        bencana: Bencana,
+        nama_posko: str,
+        alamat_posko: str,
+        kapasitas_posko: int,
+        status_posko: StatusPosko,
+    ) -> "Posko":
+        """Membuat Posko dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Hanya untuk repository dan deserializer; nilai tidak divalidasi ulang.
+        """
+        posko = cls.__new__(cls)
+        posko.__id_posko = id_posko
+        posko.__bencana = bencana
+        posko.__nama_posko = nama_posko
+        posko.__alamat_posko = alamat_posko
+        posko.__kapasitas_posko = kapasitas_posko
+        posko.__status_posko = status_posko
+        return posko
+
     # ===== Getter =====
     def get_id_posko(self) -> str:
         """Mengembalikan ID posko.
@@ -12,6 +12,8 @@ class ResepItem:
         dosis (int): Dosis obat (positif).
     """
 
+    __slots__ = ("__obat", "__qty", "__dosis", "__aturan_pakai")
+
     def __init__(self, obat: Obat, qty: int, aturan_pakai: str, dosis: int):
         """
         Inisialisasi objek ResepItem.
@@ -30,6 +32,16 @@ class ResepItem:
         self.set_aturan_pakai(aturan_pakai)
         self.set_dosis(dosis)
 
+    @classmethod
+    def _dari_tepercaya(cls, obat: Obat, qty: int, aturan_pakai: str, dosis: int) -> "ResepItem":
+        """Membuat ResepItem dari data yang sudah tervalidasi (baris database) tanpa setter."""
+        item = cls.__new__(cls)
+        item.__obat = obat
+        item.__qty = qty
+        item.__aturan_pakai = aturan_pakai
+        item.__dosis = dosis
+        return item
+
     # ===== Getter =====
     def get_obat(self) -> Obat:
         """
@@ -15,6 +15,8 @@ class ResepObat:
         tanggal_resep (date): Tanggal resep dibuat.
     """
 
+    __slots__ = ("__id_resep", "__pemeriksaan", "__tanggal_resep", "__items")
+
     def __init__(
         self,
         id_resep: str,
@@ -39,6 +41,21 @@ class ResepObat:
         self.set_items(items)
         self.set_tanggal_resep(tanggal_resep or date.today())
 
+    @classmethod
+    def _dari_tepercaya(
+        cls, id_resep: str, pemeriksaan: Pemeriksaan, items: list[ResepItem], tanggal_resep: date
+    ) -> "ResepObat":
+        """Membuat ResepObat dari data yang sudah tervalidasi (snapshot/baris database) tanpa setter.
+
+        Hanya untuk repository dan deserializer; list items dipakai langsung (tidak disalin).
+        """
+        resep = cls.__new__(cls)
+        resep.__id_resep = id_resep
+        resep.__pemeriksaan = pemeriksaan
+        resep.__items = items
+        resep.__tanggal_resep = tanggal_resep
+        return resep
+
     # ===== Getter =====
     def get_id_resep(self) -> str:
         """
@@ -22,6 +22,8 @@ class TenagaMedis(Orang):
         spesialisasi (str): Spesialisasi tenaga medis.
     """
 
+    __slots__ = ("__posko", "__no_izin_praktik", "__role", "__spesialisasi")
+
     def __init__(
         self,
         id_orang: str,
@@ -53,6 +55,27 @@ class TenagaMedis(Orang):
         self.set_role(role)
         self.set_spesialisasi(spesialisasi)
 
+    @classmethod
+    def _dari_tepercaya(
+        cls,
+        id_orang: str,
+        nama_orang: str,
+        alamat_orang: str,
+        jenis_kelamin_orang: JenisKelamin,
+        tanggal_lahir_orang: date,
+        posko: Posko,
+        no_izin_praktik: str,
+        role: RoleTenagaMedis,
+        spesialisasi: str,
+    ) -> "TenagaMedis":
+        """Membuat TenagaMedis dari data yang sudah tervalidasi tanpa setter (lihat Orang._dari_tepercaya)."""
+        tenaga_medis = super()._dari_tepercaya(id_orang, nama_orang, alamat_orang, jenis_kelamin_orang, tanggal_lahir_orang)
+        tenaga_medis.__posko = posko
+        tenaga_medis.__no_izin_praktik = no_izin_praktik
+        tenaga_medis.__role = role
+        tenaga_medis.__spesialisasi = spesialisasi
+        return tenaga_medis
+
     # ===== Polymorphism (Override) =====
     def get_peran(self) -> str:
         """Mengembalikan peran orang.
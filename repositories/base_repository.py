@@ -1,4 +1,31 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+
+
+class KonflikVersi(RuntimeError):
+    """
+    Data sudah diubah pihak lain sejak versi yang dibaca pemanggil.
+
+    Dilempar oleh perbarui(..., versi_diharapkan=...) jika versi yang
+    tersimpan berbeda. Pemanggil sebaiknya membaca ulang data lalu
+    mengulangi perubahannya (atau menampilkan konflik ke pengguna).
+
+    Attributes:
+        nama_entitas (str): Nama entitas, misal "Korban".
+        data_id (str|int): ID data yang berkonflik.
+        versi_diharapkan (int): Versi yang dibaca pemanggil.
+        versi_sekarang (int): Versi yang tersimpan saat ini.
+    """
+
+    def __init__(self, nama_entitas: str, data_id, versi_diharapkan: int, versi_sekarang: int):
+        super().__init__(
+            f"{nama_entitas} ID {data_id} sudah diubah pihak lain "
+            f"(versi {versi_sekarang}, diharapkan {versi_diharapkan})"
+        )
+        self.nama_entitas = nama_entitas
+        self.data_id = data_id
+        self.versi_diharapkan = versi_diharapkan
+        self.versi_sekarang = versi_sekarang
 
 
 class BaseRepository(ABC):
@@ -19,6 +46,20 @@ class BaseRepository(ABC):
         """
         pass
 
+    def tambah_banyak(self, daftar_data):
+        """Menyimpan banyak objek baru sekaligus.
+
+        Implementasi default memanggil tambah() satu per satu; repository
+        yang punya jalur bulk (misal executemany) sebaiknya meng-override.
+
+        Args:
+            daftar_data (list): Objek-objek yang akan disimpan.
+
+        Returns:
+            list[bool]: Hasil per objek, sesuai urutan daftar_data.
+        """
+        return [self.tambah(data) for data in daftar_data]
+
     @abstractmethod
     def ambil_berdasarkan_id(self, data_id):
         """Mengambil satu objek berdasarkan ID.
@@ -41,15 +82,37 @@ class BaseRepository(ABC):
         pass
 
     @abstractmethod
-    def perbarui(self, data_id, data):
-        """Memperbarui data berdasarkan ID.
+    def ambil_dengan_versi(self, data_id):
+        """Mengambil satu objek beserta versinya dalam satu pembacaan.
+
+        Setiap data punya nomor versi yang dimulai dari 1 saat tambah() dan
+        naik satu setiap perbarui(). Versi ini dikirim kembali sebagai
+        versi_diharapkan pada perbarui() (optimistic concurrency).
+
+        Args:
+            data_id (str|int): ID data yang dicari.
+
+        Returns:
+            tuple[object | None, int | None]: Objek dan versinya, (None, None) jika tidak ada.
+        """
+        pass
+
+    @abstractmethod
+    def perbarui(self, data_id, data, versi_diharapkan=None):
+        """Memperbarui data berdasarkan ID dan menaikkan versinya.
 
         Args:
             data_id (str|int): ID data yang akan diperbarui.
             data (object): Data baru untuk memperbarui objek.
+            versi_diharapkan (int | None, optional): Jika diisi, data hanya
+                diperbarui bila versi tersimpan masih sama (compare-and-swap).
+                None = timpa tanpa cek versi.
 
         Returns:
             bool: True jika berhasil, False jika gagal.
+
+        Raises:
+            KonflikVersi: Jika versi tersimpan berbeda dari versi_diharapkan.
         """
         pass
 
@@ -64,3 +127,115 @@ class BaseRepository(ABC):
             bool: True jika berhasil, False jika gagal.
         """
         pass
+
+    @abstractmethod
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman data terurut berdasarkan ID (keyset pagination).
+
+        Args:
+            setelah_id (str|int|None): ID terakhir dari halaman sebelumnya.
+                None berarti mulai dari awal.
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list, str|int|None]: Daftar objek dan cursor (ID terakhir)
+            untuk halaman berikutnya, atau None jika sudah halaman terakhir.
+        """
+        pass
+
+    @abstractmethod
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil data dengan bawah <= ID < atas, terurut berdasarkan ID.
+
+        Dengan ID urut waktu (UUIDv7, lihat utils.generator_id), rentang
+        waktu pembuatan menjadi rentang kunci: gunakan
+        batas_id_waktu(dari) dan batas_id_waktu(sampai) sebagai batas.
+
+        Args:
+            bawah (str|int|None): Batas bawah (inklusif), None = dari awal.
+            atas (str|int|None): Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list: Objek dalam rentang ID.
+        """
+        pass
+
+    @abstractmethod
+    def hitung(self):
+        """Menghitung jumlah data tanpa menyalin isi repository.
+
+        Returns:
+            int: Jumlah data yang tersimpan.
+        """
+        pass
+
+    @abstractmethod
+    def _pulihkan(self, data_id, data, versi):
+        """Mengembalikan satu data persis ke keadaan sebelum langkah UnitOfWork.
+
+        Dipakai UnitOfWork sebagai kompensasi untuk repository yang
+        transaksi()-nya tidak membatalkan sendiri (in-memory). Versi ikut
+        dikembalikan; perbarui()/tambah() biasa akan menaikkan/mereset versi
+        dan memicu KonflikVersi palsu bagi pembaca lain.
+
+        Args:
+            data_id (str|int): ID data.
+            data (object | None): Data lama; None berarti data belum ada (hapus).
+            versi (int | None): Versi lama dari ambil_dengan_versi().
+        """
+        pass
+
+    def transaksi(self):
+        """Membuka transaksi backend untuk UnitOfWork.
+
+        Implementasi default tidak punya transaksi (in-memory); UnitOfWork
+        membatalkan penulisan ke repository seperti ini dengan kompensasi.
+
+        Returns:
+            ContextManager[bool]: Menghasilkan True jika backend membatalkan
+            sendiri seluruh penulisan di dalam blok saat terjadi error.
+        """
+        return nullcontext(False)
+
+    def berbagi_penyimpanan(self, lain):
+        """Mengecek apakah repository lain menampilkan penyimpanan yang sama.
+
+        Jika True, data yang ditulis ke repository ini sudah terlihat dari
+        `lain`, sehingga service tidak perlu menulis ulang ke sana.
+
+        Args:
+            lain (BaseRepository): Repository pembanding.
+
+        Returns:
+            bool: Default False (setiap repository menyimpan datanya sendiri).
+        """
+        return False
+
+    def _cek_versi(self, nama_entitas: str, data_id, versi_sekarang: int, versi_diharapkan) -> None:
+        """Melempar KonflikVersi jika versi_diharapkan diisi dan berbeda dari versi tersimpan."""
+        if versi_diharapkan is None or versi_diharapkan == versi_sekarang:
+            return
+        self.logger.warning(
+            "Gagal update: %s ID %s versi %s, diharapkan %s",
+            nama_entitas, data_id, versi_sekarang, versi_diharapkan,
+        )
+        raise KonflikVersi(nama_entitas, data_id, versi_diharapkan, versi_sekarang)
+
+    def iter_semua(self, ukuran_batch=500):
+        """Mengiterasi seluruh data secara bertahap (streaming).
+
+        Data diambil per halaman lewat ambil_halaman(), sehingga pemanggil
+        tidak perlu menyalin seluruh isi repository ke satu list.
+
+        Args:
+            ukuran_batch (int): Jumlah data yang diambil per halaman.
+
+        Yields:
+            object: Objek dalam repository, terurut berdasarkan ID.
+        """
+        cursor = None
+        while True:
+            halaman, cursor = self.ambil_halaman(cursor, ukuran_batch)
+            yield from halaman
+            if cursor is None:
+                return
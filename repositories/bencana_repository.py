@@ -1,6 +1,6 @@
-from datetime import datetime
 from utils.loggers import get_logger
 from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
 
 
 class BencanaRepositoryMemory(BaseRepository):
@@ -13,6 +13,8 @@ class BencanaRepositoryMemory(BaseRepository):
     def __init__(self):
         """Inisialisasi repository in-memory."""
         self._data = {}  # key: id_bencana, value: Bencana
+        self._versi = {}  # key: id_bencana, value: versi (naik setiap perbarui)
+        self._kunci = IndeksKunciTerurut()  # ID terurut untuk ambil_halaman()
         self.logger = get_logger(__name__)
 
     # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
@@ -22,15 +24,13 @@ class BencanaRepositoryMemory(BaseRepository):
         id_bencana = data.get_id_bencana()
 
         if id_bencana in self._data:
-            self.logger.warning(
-                f"Bencana ID {id_bencana} sudah ada ({datetime.now()})"
-            )
+            self.logger.warning("Bencana ID %s sudah ada", id_bencana)
             return False
 
         self._data[id_bencana] = data
-        self.logger.info(
-            f"Bencana ID {id_bencana} berhasil ditambahkan ({datetime.now()})"
-        )
+        self._kunci.tambah(id_bencana)
+        self._versi[id_bencana] = 1
+        self.logger.info("Bencana ID %s berhasil ditambahkan", id_bencana)
         return True
 
     def ambil_berdasarkan_id(self, id_bencana):
@@ -38,47 +38,102 @@ class BencanaRepositoryMemory(BaseRepository):
         bencana = self._data.get(id_bencana)
 
         if bencana is None:
-            self.logger.warning(
-                f"Bencana ID {id_bencana} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Bencana ID %s tidak ditemukan", id_bencana)
         else:
-            self.logger.info(
-                f"Bencana ID {id_bencana} berhasil diambil ({datetime.now()})"
-            )
+            self.logger.info("Bencana ID %s berhasil diambil", id_bencana)
 
         return bencana
 
+    def ambil_dengan_versi(self, id_bencana):
+        """Mengambil bencana beserta versinya ((None, None) jika tidak ada)."""
+        return self._data.get(id_bencana), self._versi.get(id_bencana)
+
     def ambil_semua(self):
         """Mengambil semua data bencana."""
+        self.logger.info("Mengambil semua bencana (jumlah=%s)", len(self._data))
+        return list(self._data.values())
+
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman bencana terurut berdasarkan ID.
+
+        Args:
+            setelah_id (str | None): ID terakhir halaman sebelumnya (None = dari awal).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Bencana], str | None]: Isi halaman dan cursor halaman berikutnya.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        kunci = self._kunci.setelah(setelah_id, batas + 1)
+        halaman = [self._data[k] for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+
         self.logger.info(
-            f"Mengambil semua bencana (jumlah={len(self._data)}) ({datetime.now()})"
+            "Mengambil halaman bencana setelah=%s (jumlah=%s)",
+            setelah_id, len(halaman),
         )
-        return list(self._data.values())
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil bencana dengan bawah <= ID < atas, terurut berdasarkan ID.
 
-    def perbarui(self, id_bencana, data):
+        Args:
+            bawah (str | None): Batas bawah (inklusif), None = dari awal.
+            atas (str | None): Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list[Bencana]: Bencana dalam rentang ID.
+        """
+        hasil = [self._data[k] for k in self._kunci.antara(bawah, atas)]
+        self.logger.info("Mengambil bencana rentang ID [%s, %s) (jumlah=%s)", bawah, atas, len(hasil))
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah bencana.
+
+        Returns:
+            int: Jumlah Bencana yang tersimpan.
+        """
+        return len(self._data)
+
+    def perbarui(self, id_bencana, data, versi_diharapkan=None):
         """Memperbarui bencana berdasarkan ID."""
         if id_bencana not in self._data:
-            self.logger.warning(
-                f"Gagal update: Bencana ID {id_bencana} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal update: Bencana ID %s tidak ditemukan", id_bencana)
             return False
 
+        versi = self._versi[id_bencana]
+        self._cek_versi("Bencana", id_bencana, versi, versi_diharapkan)
+
         self._data[id_bencana] = data
-        self.logger.info(
-            f"Bencana ID {id_bencana} berhasil diperbarui ({datetime.now()})"
-        )
+        self._versi[id_bencana] = versi + 1
+        self.logger.info("Bencana ID %s berhasil diperbarui", id_bencana)
         return True
 
     def hapus(self, id_bencana):
         """Menghapus bencana berdasarkan ID."""
         if id_bencana not in self._data:
-            self.logger.warning(
-                f"Gagal hapus: Bencana ID {id_bencana} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal hapus: Bencana ID %s tidak ditemukan", id_bencana)
             return False
 
         del self._data[id_bencana]
-        self.logger.info(
-            f"Bencana ID {id_bencana} berhasil dihapus ({datetime.now()})"
-        )
+        del self._versi[id_bencana]
+        self._kunci.hapus(id_bencana)
+        self.logger.info("Bencana ID %s berhasil dihapus", id_bencana)
         return True
+
+    def _pulihkan(self, id_bencana, data, versi):
+        """Mengembalikan bencana persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self.hapus(id_bencana)
+            return
+        if id_bencana in self._data:
+            self.perbarui(id_bencana, data)
+        else:
+            self.tambah(data)
+        self._versi[id_bencana] = versi
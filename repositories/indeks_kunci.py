@@ -0,0 +1,92 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import pairwise
+
+
+class IndeksKunciTerurut:
+    """
+    Daftar kunci terurut untuk keyset pagination dan query rentang pada
+    repository in-memory.
+
+    Dictionary tidak bisa dimulai dari kunci tertentu, sehingga repository
+    in-memory menyimpan salinan kunci yang terurut di sini. Pencarian posisi
+    memakai bisect (O(log n)); kunci yang lebih besar dari kunci terakhir
+    cukup di-append.
+    """
+
+    def __init__(self):
+        """Inisialisasi indeks kosong."""
+        self._kunci: list = []
+
+    def __len__(self) -> int:
+        return len(self._kunci)
+
+    def tambah(self, kunci) -> None:
+        """Menambahkan kunci baru ke posisi terurut.
+
+        Args:
+            kunci (str): Kunci yang ditambahkan.
+        """
+        if not self._kunci or kunci > self._kunci[-1]:
+            self._kunci.append(kunci)
+        else:
+            insort(self._kunci, kunci)
+
+    def tambah_banyak(self, daftar_kunci: list) -> None:
+        """Menambahkan banyak kunci baru sekaligus.
+
+        Jika daftar_kunci sudah terurut naik dan seluruhnya lebih besar dari
+        kunci terakhir (batch ID urut waktu), cukup satu extend. Selain itu
+        kunci di-extend lalu diurutkan ulang; timsort menggabungkan dua run
+        terurut dalam waktu linear, lebih murah daripada insort per kunci.
+
+        Args:
+            daftar_kunci (list): Kunci yang ditambahkan.
+        """
+        if not daftar_kunci:
+            return
+        if (not self._kunci or daftar_kunci[0] > self._kunci[-1]) and all(
+            a < b for a, b in pairwise(daftar_kunci)
+        ):
+            self._kunci.extend(daftar_kunci)
+        elif len(daftar_kunci) == 1:
+            self.tambah(daftar_kunci[0])
+        else:
+            self._kunci.extend(sorted(daftar_kunci))
+            self._kunci.sort()
+
+    def hapus(self, kunci) -> None:
+        """Menghapus kunci dari indeks (jika ada).
+
+        Args:
+            kunci (str): Kunci yang dihapus.
+        """
+        i = bisect_left(self._kunci, kunci)
+        if i < len(self._kunci) and self._kunci[i] == kunci:
+            del self._kunci[i]
+
+    def setelah(self, kunci, batas: int) -> list:
+        """Mengambil maksimal `batas` kunci yang lebih besar dari `kunci`.
+
+        Args:
+            kunci (str | None): Kunci terakhir halaman sebelumnya (None = dari awal).
+            batas (int): Jumlah kunci maksimal.
+
+        Returns:
+            list: Kunci berikutnya secara terurut.
+        """
+        awal = 0 if kunci is None else bisect_right(self._kunci, kunci)
+        return self._kunci[awal:awal + batas]
+
+    def antara(self, bawah, atas) -> list:
+        """Mengambil kunci dalam rentang bawah <= kunci < atas.
+
+        Args:
+            bawah: Batas bawah (inklusif), None = dari awal.
+            atas: Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list: Kunci dalam rentang, terurut.
+        """
+        awal = 0 if bawah is None else bisect_left(self._kunci, bawah)
+        akhir = len(self._kunci) if atas is None else bisect_left(self._kunci, atas)
+        return self._kunci[awal:akhir]
@@ -1,113 +1,131 @@
-from datetime import datetime
-from utils.loggers import get_logger
-from .base_repository import BaseRepository
+from utils.enums.status_triase import StatusTriase
+from .penyimpanan_orang import PenyimpananOrangMemory, RepositoryOrangMemory
 
-class KorbanRepositoryMemory(BaseRepository):
+class KorbanRepositoryMemory(RepositoryOrangMemory):
     """
     Repository in-memory untuk mengelola data korban.
 
-    Menyimpan objek Korban di dalam dictionary (key: id_orang).
-    """
+    Tampilan PenyimpananOrangMemory yang hanya berisi record dengan
+    get_peran() == "Korban", ditambah indeks sekunder per posko, per status
+    triase, dan per (posko, triase). Indeks diperbarui dari setiap perubahan
+    record di penyimpanan, termasuk yang ditulis lewat OrangRepositoryMemory
+    yang berbagi penyimpanan yang sama.
 
-    def __init__(self):
-        """Inisialisasi repository in-memory."""
-        self._data = {}  # key: id_orang, value: Korban
-        self.logger = get_logger(__name__)
+    Kunci indeks terakhir setiap korban dicatat terpisah, sehingga perubahan
+    in-place (misalnya set_status_triase() lalu perbarui() dengan objek yang
+    sama) tetap memindahkan korban ke bucket
+    yang benar.
+    """
 
-    # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
+    _NAMA_ENTITAS = "Korban"
+    _PERAN = "Korban"
 
-    def tambah(self, data):
-        """Menambahkan objek korban ke repository.
+    def __init__(self, penyimpanan: PenyimpananOrangMemory | None = None):
+        """
+        Inisialisasi repository in-memory.
 
         Args:
-            data (Korban): Objek Korban yang akan ditambahkan.
-
-        Returns:
-            bool: True jika berhasil, False jika gagal (ID sudah ada).
+            penyimpanan (PenyimpananOrangMemory | None, optional): Penyimpanan bersama.
+                Default: penyimpanan sendiri.
         """
-        id_orang = data.get_id_orang()
-
-        if id_orang in self._data:
-            self.logger.warning(
-                f"Korban ID {id_orang} sudah ada ({datetime.now()})"
-            )
-            return False
-
-        self._data[id_orang] = data
-        self.logger.info(
-            f"Korban ID {id_orang} berhasil ditambahkan ({datetime.now()})"
-        )
-        return True
-
-    def ambil_berdasarkan_id(self, id_orang):
-        """Mengambil korban berdasarkan ID.
+        super().__init__(penyimpanan)
+        self._indeks_posko = {}  # key: id_posko, value: {id_orang: Korban}
+        self._indeks_triase = {}  # key: StatusTriase, value: {id_orang: Korban}
+        self._indeks_posko_triase = {}  # key: (id_posko, StatusTriase), value: {id_orang: Korban}
+        self._kunci_indeks = {}  # key: id_orang, value: (id_posko, StatusTriase) saat diindeks
+
+        for korban in self._penyimpanan.semua(self._PERAN):
+            self._indeks_tambah(korban.get_id_orang(), korban)
+        self._penyimpanan.tambah_pendengar(self._saat_berubah)
+
+    # ====== INDEKS SEKUNDER ======
+
+    def _indeks_tambah(self, id_orang, data):
+        """Mendaftarkan korban ke seluruh indeks sekunder."""
+        id_posko = data.get_posko().get_id_posko()
+        triase = data.get_status_triase()
+
+        self._indeks_posko.setdefault(id_posko, {})[id_orang] = data
+        self._indeks_triase.setdefault(triase, {})[id_orang] = data
+        self._indeks_posko_triase.setdefault((id_posko, triase), {})[id_orang] = data
+        self._kunci_indeks[id_orang] = (id_posko, triase)
+
+    def _indeks_hapus(self, id_orang):
+        """Mengeluarkan korban dari seluruh indeks sekunder (pakai kunci lama)."""
+        kunci = self._kunci_indeks.pop(id_orang, None)
+        if kunci is None:
+            return
+
+        id_posko, triase = kunci
+        for indeks, kunci_bucket in (
+            (self._indeks_posko, id_posko),
+            (self._indeks_triase, triase),
+            (self._indeks_posko_triase, kunci),
+        ):
+            bucket = indeks.get(kunci_bucket)
+            if bucket is not None:
+                bucket.pop(id_orang, None)
+                if not bucket:
+                    del indeks[kunci_bucket]
+
+    def _saat_berubah(self, id_orang, lama, baru):
+        """Pendengar penyimpanan: memindahkan korban di indeks sekunder."""
+        self._indeks_hapus(id_orang)  # no-op jika sebelumnya bukan korban
+        if baru is not None and baru.get_peran() == self._PERAN:
+            self._indeks_tambah(id_orang, baru)
+
+    # ====== QUERY BERDASARKAN INDEKS (O(jumlah hasil)) ======
+
+    def ambil_berdasarkan_posko(self, id_posko):
+        """Mengambil semua korban di satu posko.
 
         Args:
-            id_orang (str): ID unik korban.
+            id_posko (str): ID posko.
+
         Returns:
-            Korban | None: Objek Korban jika ditemukan, None jika tidak.
+            list[Korban]: Korban yang ditangani di posko tersebut.
         """
-        korban = self._data.get(id_orang)
-        if korban is None:
-            self.logger.warning(
-                f"Korban ID {id_orang} tidak ditemukan ({datetime.now()})"
-            )
-        else:
-            self.logger.info(
-                f"Korban ID {id_orang} berhasil diambil ({datetime.now()})"
-            )
+        hasil = list(self._indeks_posko.get(id_posko, {}).values())
+        self.logger.info("Mengambil korban posko ID %s (jumlah=%s)", id_posko, len(hasil))
+        return hasil
 
-        return korban
+    def hitung_berdasarkan_posko(self, id_posko):
+        """Menghitung korban di satu posko dalam O(1) dari ukuran bucket indeks.
 
-    def ambil_semua(self):
-        """Mengambil semua data korban.
+        Args:
+            id_posko (str): ID posko.
 
         Returns:
-            list[Korban]: Daftar semua objek Korban.
+            int: Jumlah korban yang sedang ditangani di posko tersebut.
         """
-        self.logger.info(
-            f"Mengambil semua korban (jumlah={len(self._data)}) ({datetime.now()})"
-        )
-        return list(self._data.values())
+        return len(self._indeks_posko.get(id_posko, ()))
 
-    def perbarui(self, id_orang , data):
-        """Memperbarui korban berdasarkan ID.
+    def ambil_berdasarkan_triase(self, status_triase: StatusTriase):
+        """Mengambil semua korban dengan status triase tertentu.
 
         Args:
-            id_orang (str): ID unik korban yang akan diperbarui.
-            data (Korban): Data Korban baru.
+            status_triase (StatusTriase): Status triase yang dicari.
 
         Returns:
-            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+            list[Korban]: Korban dengan status triase tersebut.
         """
-        if id_orang not in self._data:
-            self.logger.warning(
-                f"Gagal update: Korban ID {id_orang} tidak ditemukan ({datetime.now()})"
-            )
-            return False
+        hasil = list(self._indeks_triase.get(status_triase, {}).values())
+        self.logger.info("Mengambil korban triase %s (jumlah=%s)", status_triase.value, len(hasil))
+        return hasil
 
-        self._data[id_orang] = data
-        self.logger.info(
-            f"Korban ID {id_orang} berhasil diperbarui ({datetime.now()})"
-        )
-        return True
-
-    def hapus(self, id_orang):
-        """Menghapus korban berdasarkan ID.
+    def ambil_berdasarkan_posko_dan_triase(self, id_posko, status_triase: StatusTriase):
+        """Mengambil korban di satu posko dengan status triase tertentu.
 
         Args:
-            id_orang (str): ID unik korban yang akan dihapus.
+            id_posko (str): ID posko.
+            status_triase (StatusTriase): Status triase yang dicari.
+
         Returns:
-            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+            list[Korban]: Korban yang cocok dengan kedua kriteria.
         """
-        if id_orang not in self._data:
-            self.logger.warning(
-                f"Gagal hapus: Korban ID {id_orang} tidak ditemukan ({datetime.now()})"
-            )
-            return False
-
-        del self._data[id_orang]
+        hasil = list(self._indeks_posko_triase.get((id_posko, status_triase), {}).values())
         self.logger.info(
-            f"Korban ID {id_orang} berhasil dihapus ({datetime.now()})"
+            "Mengambil korban posko ID %s triase %s (jumlah=%s)",
+            id_posko, status_triase.value, len(hasil),
         )
-        return True
\ No newline at end of file
+        return hasil
@@ -1,19 +1,56 @@
-from datetime import datetime
+from datetime import timedelta
+
 from utils.loggers import get_logger
 from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
 
 class ObatRepositoryMemory(BaseRepository):
     """
     Repository in-memory untuk mengelola data obat.
 
-    Menyimpan objek Obat di dalam dictionary (key: id_obat).
+    Menyimpan objek Obat di dalam dictionary (key: id_obat), ditambah
+    indeks kadaluarsa terurut per lot: (tanggal_kadaluarsa, id_obat, id_lot).
+    Indeks disinkronkan di tambah/perbarui/hapus, sehingga query rentang
+    tanggal cukup bisect tanpa memindai seluruh obat.
     """
 
     def __init__(self):
         """Inisialisasi repository in-memory."""
         self._data = {}  # key: id_obat, value: Obat
+        self._versi = {}  # key: id_obat, value: versi (naik setiap perbarui)
+        self._kunci = IndeksKunciTerurut()  # ID terurut untuk ambil_halaman()
+        self._indeks_kadaluarsa = IndeksKunciTerurut()  # (tanggal, id_obat, id_lot) terurut
+        self._kunci_kadaluarsa = {}  # key: id_obat, value: {id_lot: kunci indeks saat diindeks}
         self.logger = get_logger(__name__)
 
+    # ====== INDEKS KADALUARSA ======
+
+    def _indeks_sinkron(self, id_obat, data, id_lot_berubah=None):
+        """Menyamakan indeks kadaluarsa dengan lot obat saat ini (hanya selisihnya).
+
+        Tanpa id_lot_berubah seluruh lot obat dibandingkan; dengan
+        id_lot_berubah hanya entri lot tersebut yang diperiksa.
+        """
+        lama = self._kunci_kadaluarsa.pop(id_obat, {})
+        if id_lot_berubah is None:
+            id_lot_berubah = set(lama)
+            if data is not None:
+                id_lot_berubah.update(lot.get_id_lot() for lot in data.get_lot())
+
+        for id_lot in id_lot_berubah:
+            lot = None if data is None else data.get_lot_berdasarkan_id(id_lot)
+            kunci_baru = None if lot is None else (lot.get_tanggal_kadaluarsa(), id_obat, id_lot)
+            kunci_lama = lama.pop(id_lot, None)
+            if kunci_lama != kunci_baru:
+                if kunci_lama is not None:
+                    self._indeks_kadaluarsa.hapus(kunci_lama)
+                if kunci_baru is not None:
+                    self._indeks_kadaluarsa.tambah(kunci_baru)
+            if kunci_baru is not None:
+                lama[id_lot] = kunci_baru
+        if lama:
+            self._kunci_kadaluarsa[id_obat] = lama
+
     # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
 
     def tambah(self, data):
@@ -28,17 +65,46 @@ class ObatRepositoryMemory(BaseRepository):
         id_obat = data.get_id_obat()
 
         if id_obat in self._data:
-            self.logger.warning(
-                f"Obat ID {id_obat} sudah ada ({datetime.now()})"
-            )
+            self.logger.warning("Obat ID %s sudah ada", id_obat)
             return False
 
         self._data[id_obat] = data
-        self.logger.info(
-            f"Obat ID {id_obat} berhasil ditambahkan ({datetime.now()})"
-        )
+        self._kunci.tambah(id_obat)
+        self._versi[id_obat] = 1
+        self._indeks_sinkron(id_obat, data)
+        self.logger.info("Obat ID %s berhasil ditambahkan", id_obat)
         return True
 
+    def tambah_banyak(self, daftar_data):
+        """Menambahkan banyak obat sekaligus dengan satu baris log ringkasan.
+
+        Returns:
+            list[bool]: Hasil per objek (False jika ID sudah ada).
+        """
+        hasil = []
+        id_baru, kunci_kadaluarsa = [], []
+        for data in daftar_data:
+            id_obat = data.get_id_obat()
+            if id_obat in self._data:
+                self.logger.warning("Obat ID %s sudah ada", id_obat)
+                hasil.append(False)
+                continue
+            self._data[id_obat] = data
+            self._versi[id_obat] = 1
+            id_baru.append(id_obat)
+            # Obat baru belum punya kunci lama, jadi kunci lot langsung ditambahkan
+            baru = {lot.get_id_lot(): (lot.get_tanggal_kadaluarsa(), id_obat, lot.get_id_lot()) for lot in data.get_lot()}
+            if baru:
+                self._kunci_kadaluarsa[id_obat] = baru
+                kunci_kadaluarsa.extend(baru.values())
+            hasil.append(True)
+
+        # Indeks diperbarui sekali per batch, bukan per obat
+        self._kunci.tambah_banyak(id_baru)
+        self._indeks_kadaluarsa.tambah_banyak(kunci_kadaluarsa)
+        self.logger.info("Tambah banyak obat: %s berhasil dari %s", hasil.count(True), len(hasil))
+        return hasil
+
     def ambil_berdasarkan_id(self, id_obat):
         """Mengambil obat berdasarkan ID.
 
@@ -49,47 +115,126 @@ class ObatRepositoryMemory(BaseRepository):
         """
         obat = self._data.get(id_obat)
         if obat is None:
-            self.logger.warning(
-                f"Obat ID {id_obat} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Obat ID %s tidak ditemukan", id_obat)
         else:
-            self.logger.info(
-                f"Obat ID {id_obat} berhasil diambil ({datetime.now()})"
-            )
+            self.logger.info("Obat ID %s berhasil diambil", id_obat)
 
         return obat
 
+    def ambil_dengan_versi(self, id_obat):
+        """Mengambil obat beserta versinya.
+
+        Args:
+            id_obat (str): ID unik obat.
+        Returns:
+            tuple[Obat | None, int | None]: Objek dan versinya, (None, None) jika tidak ada.
+        """
+        return self._data.get(id_obat), self._versi.get(id_obat)
+
     def ambil_semua(self):
         """Mengambil semua data obat.
 
         Returns:
             list[Obat]: Daftar semua objek Obat.
         """
-        self.logger.info(
-            f"Mengambil semua obat (jumlah={len(self._data)}) ({datetime.now()})"
-        )
+        self.logger.info("Mengambil semua obat (jumlah=%s)", len(self._data))
         return list(self._data.values())
 
-    def perbarui(self, id_obat, data):
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman obat terurut berdasarkan ID.
+
+        Args:
+            setelah_id (str | None): ID terakhir halaman sebelumnya (None = dari awal).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Obat], str | None]: Isi halaman dan cursor halaman berikutnya.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        kunci = self._kunci.setelah(setelah_id, batas + 1)
+        halaman = [self._data[k] for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+
+        self.logger.info("Mengambil halaman obat setelah=%s (jumlah=%s)", setelah_id, len(halaman))
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil obat dengan bawah <= ID < atas, terurut berdasarkan ID.
+
+        Args:
+            bawah (str | None): Batas bawah (inklusif), None = dari awal.
+            atas (str | None): Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list[Obat]: Obat dalam rentang ID.
+        """
+        hasil = [self._data[k] for k in self._kunci.antara(bawah, atas)]
+        self.logger.info("Mengambil obat rentang ID [%s, %s) (jumlah=%s)", bawah, atas, len(hasil))
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah obat.
+
+        Returns:
+            int: Jumlah Obat yang tersimpan.
+        """
+        return len(self._data)
+
+    def perbarui(self, id_obat, data, versi_diharapkan=None):
         """Memperbarui obat berdasarkan ID.
 
         Args:
             id_obat (str): ID unik obat yang akan diperbarui.
             data (Obat): Data Obat baru.
+            versi_diharapkan (int | None): Versi hasil ambil_dengan_versi() (None = tanpa cek).
 
         Returns:
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+
+        Raises:
+            KonflikVersi: Jika versi tersimpan berbeda dari versi_diharapkan.
         """
         if id_obat not in self._data:
-            self.logger.warning(
-                f"Gagal update: Obat ID {id_obat} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal update: Obat ID %s tidak ditemukan", id_obat)
             return False
 
+        versi = self._versi[id_obat]
+        self._cek_versi("Obat", id_obat, versi, versi_diharapkan)
+
         self._data[id_obat] = data
-        self.logger.info(
-            f"Obat ID {id_obat} berhasil diperbarui ({datetime.now()})"
-        )
+        self._versi[id_obat] = versi + 1
+        self._indeks_sinkron(id_obat, data)
+        self.logger.info("Obat ID %s berhasil diperbarui", id_obat)
+        return True
+
+    def perbarui_lot(self, id_obat, data, id_lot_berubah):
+        """Memperbarui obat yang perubahannya hanya pada lot tertentu.
+
+        Sama seperti perbarui() tanpa cek versi, tetapi indeks kadaluarsa
+        hanya disentuh untuk lot di id_lot_berubah (misalnya lot yang diambil
+        FEFO), bukan membandingkan ulang seluruh lot obat.
+
+        Args:
+            id_obat (str): ID unik obat yang akan diperbarui.
+            data (Obat): Data Obat baru.
+            id_lot_berubah (Iterable[str]): ID lot yang ditambah, diubah atau dikeluarkan.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+        """
+        if id_obat not in self._data:
+            self.logger.warning("Gagal update: Obat ID %s tidak ditemukan", id_obat)
+            return False
+
+        self._data[id_obat] = data
+        self._versi[id_obat] += 1
+        self._indeks_sinkron(id_obat, data, id_lot_berubah)
+        self.logger.info("Obat ID %s berhasil diperbarui", id_obat)
         return True
 
     def hapus(self, id_obat):
@@ -101,13 +246,48 @@ class ObatRepositoryMemory(BaseRepository):
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
         """
         if id_obat not in self._data:
-            self.logger.warning(
-                f"Gagal hapus: Obat ID {id_obat} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal hapus: Obat ID %s tidak ditemukan", id_obat)
             return False
 
         del self._data[id_obat]
+        del self._versi[id_obat]
+        self._kunci.hapus(id_obat)
+        self._indeks_sinkron(id_obat, None)
+        self.logger.info("Obat ID %s berhasil dihapus", id_obat)
+        return True
+
+    def _pulihkan(self, id_obat, data, versi):
+        """Mengembalikan obat persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self.hapus(id_obat)
+            return
+        if id_obat in self._data:
+            self.perbarui(id_obat, data)
+        else:
+            self.tambah(data)
+        self._versi[id_obat] = versi
+
+    # ====== QUERY BERDASARKAN INDEKS ======
+
+    def ambil_lot_kadaluarsa_antara(self, dari, sampai):
+        """Mengambil lot yang kadaluarsa pada rentang tanggal (inklusif), urut tanggal.
+
+        Args:
+            dari (date | None): Tanggal awal (None = sejak awal).
+            sampai (date | None): Tanggal akhir (None = tanpa batas).
+
+        Returns:
+            list[tuple[Obat, LotObat]]: Pasangan obat dan lot.
+        """
+        hasil = []
+        for _, id_obat, id_lot in self._indeks_kadaluarsa.antara(
+            None if dari is None else (dari,),
+            None if sampai is None else (sampai + timedelta(days=1),),
+        ):
+            obat = self._data[id_obat]
+            hasil.append((obat, obat.get_lot_berdasarkan_id(id_lot)))
+
         self.logger.info(
-            f"Obat ID {id_obat} berhasil dihapus ({datetime.now()})"
+            "Mengambil lot kadaluarsa %s s/d %s (jumlah=%s)", dari, sampai, len(hasil)
         )
-        return True
\ No newline at end of file
+        return hasil
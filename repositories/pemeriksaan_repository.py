@@ -1,6 +1,6 @@
-from datetime import datetime
 from utils.loggers import get_logger
 from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
 
 class PemeriksaanRepositoryMemory(BaseRepository):
     """
@@ -12,6 +12,8 @@ class PemeriksaanRepositoryMemory(BaseRepository):
     def __init__(self):
         """Inisialisasi repository in-memory."""
         self._data = {}  # key: id_pemeriksaan, value: Pemeriksaan
+        self._versi = {}  # key: id_pemeriksaan, value: versi (naik setiap perbarui)
+        self._kunci = IndeksKunciTerurut()  # ID terurut untuk ambil_halaman()
         self.logger = get_logger(__name__)
 
     # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
@@ -28,15 +30,13 @@ class PemeriksaanRepositoryMemory(BaseRepository):
         id_pemeriksaan = data.get_id_pemeriksaan()
 
         if id_pemeriksaan in self._data:
-            self.logger.warning(
-                f"Pemeriksaan ID {id_pemeriksaan} sudah ada ({datetime.now()})"
-            )
+            self.logger.warning("Pemeriksaan ID %s sudah ada", id_pemeriksaan)
             return False
 
         self._data[id_pemeriksaan] = data
-        self.logger.info(
-            f"Pemeriksaan ID {id_pemeriksaan} berhasil ditambahkan ({datetime.now()})"
-        )
+        self._kunci.tambah(id_pemeriksaan)
+        self._versi[id_pemeriksaan] = 1
+        self.logger.info("Pemeriksaan ID %s berhasil ditambahkan", id_pemeriksaan)
         return True
 
     def ambil_berdasarkan_id(self, id_pemeriksaan):
@@ -49,47 +49,103 @@ class PemeriksaanRepositoryMemory(BaseRepository):
         """
         pemeriksaan = self._data.get(id_pemeriksaan)
         if pemeriksaan is None:
-            self.logger.warning(
-                f"Pemeriksaan ID {id_pemeriksaan} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Pemeriksaan ID %s tidak ditemukan", id_pemeriksaan)
         else:
-            self.logger.info(
-                f"Pemeriksaan ID {id_pemeriksaan} berhasil diambil ({datetime.now()})"
-            )
+            self.logger.info("Pemeriksaan ID %s berhasil diambil", id_pemeriksaan)
 
         return pemeriksaan
 
+    def ambil_dengan_versi(self, id_pemeriksaan):
+        """Mengambil pemeriksaan beserta versinya.
+
+        Args:
+            id_pemeriksaan (str): ID unik pemeriksaan.
+        Returns:
+            tuple[Pemeriksaan | None, int | None]: Objek dan versinya, (None, None) jika tidak ada.
+        """
+        return self._data.get(id_pemeriksaan), self._versi.get(id_pemeriksaan)
+
     def ambil_semua(self):
         """Mengambil semua data pemeriksaan.
 
         Returns:
             list[Pemeriksaan]: Daftar semua objek Pemeriksaan.
         """
+        self.logger.info("Mengambil semua pemeriksaan (jumlah=%s)", len(self._data))
+        return list(self._data.values())
+
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman pemeriksaan terurut berdasarkan ID.
+
+        Args:
+            setelah_id (str | None): ID terakhir halaman sebelumnya (None = dari awal).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Pemeriksaan], str | None]: Isi halaman dan cursor halaman berikutnya.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        kunci = self._kunci.setelah(setelah_id, batas + 1)
+        halaman = [self._data[k] for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+
         self.logger.info(
-            f"Mengambil semua pemeriksaan (jumlah={len(self._data)}) ({datetime.now()})"
+            "Mengambil halaman pemeriksaan setelah=%s (jumlah=%s)",
+            setelah_id, len(halaman),
         )
-        return list(self._data.values())
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil pemeriksaan dengan bawah <= ID < atas, terurut berdasarkan ID.
 
-    def perbarui(self, id_pemeriksaan, data):
+        Args:
+            bawah (str | None): Batas bawah (inklusif), None = dari awal.
+            atas (str | None): Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list[Pemeriksaan]: Pemeriksaan dalam rentang ID.
+        """
+        hasil = [self._data[k] for k in self._kunci.antara(bawah, atas)]
+        self.logger.info("Mengambil pemeriksaan rentang ID [%s, %s) (jumlah=%s)", bawah, atas, len(hasil))
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah pemeriksaan.
+
+        Returns:
+            int: Jumlah Pemeriksaan yang tersimpan.
+        """
+        return len(self._data)
+
+    def perbarui(self, id_pemeriksaan, data, versi_diharapkan=None):
         """Memperbarui pemeriksaan berdasarkan ID.
 
         Args:
             id_pemeriksaan (str): ID unik pemeriksaan yang akan diperbarui.
             data (Pemeriksaan): Data Pemeriksaan baru.
+            versi_diharapkan (int | None): Versi hasil ambil_dengan_versi() (None = tanpa cek).
 
         Returns:
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+
+        Raises:
+            KonflikVersi: Jika versi tersimpan berbeda dari versi_diharapkan.
         """
         if id_pemeriksaan not in self._data:
-            self.logger.warning(
-                f"Gagal update: Pemeriksaan ID {id_pemeriksaan} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal update: Pemeriksaan ID %s tidak ditemukan", id_pemeriksaan)
             return False
 
+        versi = self._versi[id_pemeriksaan]
+        self._cek_versi("Pemeriksaan", id_pemeriksaan, versi, versi_diharapkan)
+
         self._data[id_pemeriksaan] = data
-        self.logger.info(
-            f"Pemeriksaan ID {id_pemeriksaan} berhasil diperbarui ({datetime.now()})"
-        )
+        self._versi[id_pemeriksaan] = versi + 1
+        self.logger.info("Pemeriksaan ID %s berhasil diperbarui", id_pemeriksaan)
         return True
 
     def hapus(self, id_pemeriksaan):
@@ -101,13 +157,22 @@ class PemeriksaanRepositoryMemory(BaseRepository):
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
         """
         if id_pemeriksaan not in self._data:
-            self.logger.warning(
-                f"Gagal hapus: Pemeriksaan ID {id_pemeriksaan} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal hapus: Pemeriksaan ID %s tidak ditemukan", id_pemeriksaan)
             return False
 
         del self._data[id_pemeriksaan]
-        self.logger.info(
-            f"Pemeriksaan ID {id_pemeriksaan} berhasil dihapus ({datetime.now()})"
-        )
-        return True
\ No newline at end of file
+        del self._versi[id_pemeriksaan]
+        self._kunci.hapus(id_pemeriksaan)
+        self.logger.info("Pemeriksaan ID %s berhasil dihapus", id_pemeriksaan)
+        return True
+
+    def _pulihkan(self, id_pemeriksaan, data, versi):
+        """Mengembalikan pemeriksaan persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self.hapus(id_pemeriksaan)
+            return
+        if id_pemeriksaan in self._data:
+            self.perbarui(id_pemeriksaan, data)
+        else:
+            self.tambah(data)
+        self._versi[id_pemeriksaan] = versi
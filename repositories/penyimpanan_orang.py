@@ -0,0 +1,354 @@
+from collections.abc import Callable
+
+from utils.loggers import get_logger
+from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
+
+
+class PenyimpananOrangMemory:
+    """
+    Penyimpanan in-memory tunggal untuk seluruh Orang (Korban, Tenaga Medis, ...).
+
+    Setiap id_orang hanya punya satu record. Repository Orang, Korban dan
+    TenagaMedis yang dibuat dengan penyimpanan yang sama hanyalah tampilan
+    (view) atas record ini, sehingga satu penulisan langsung terlihat dari
+    semua repository tersebut.
+
+    Selain indeks ID terurut, record dikelompokkan per get_peran() agar
+    tampilan per peran bisa menghitung dan mem-paging tanpa memindai
+    seluruh orang. Perubahan record diumumkan ke pendengar (misalnya indeks
+    sekunder milik repository Korban).
+    """
+
+    def __init__(self):
+        """Inisialisasi penyimpanan kosong."""
+        self._data = {}  # key: id_orang, value: Orang
+        self._peran = {}  # key: id_orang, value: peran saat disimpan
+        self._versi = {}  # key: id_orang, value: versi (naik setiap ganti)
+        self._kunci = IndeksKunciTerurut()  # seluruh ID terurut
+        self._kunci_peran: dict[str, IndeksKunciTerurut] = {}  # key: peran, value: ID terurut
+        self._pendengar: list[Callable] = []
+
+    def tambah_pendengar(self, fungsi: Callable) -> None:
+        """
+        Mendaftarkan fungsi yang dipanggil setiap record berubah.
+
+        Args:
+            fungsi (Callable): Dipanggil dengan (id_orang, lama, baru); lama/baru None
+                jika record baru ditambahkan/dihapus.
+        """
+        self._pendengar.append(fungsi)
+
+    def _umumkan(self, id_orang, lama, baru) -> None:
+        for fungsi in self._pendengar:
+            fungsi(id_orang, lama, baru)
+
+    def _indeks_peran(self, peran: str) -> IndeksKunciTerurut:
+        indeks = self._kunci_peran.get(peran)
+        if indeks is None:
+            indeks = self._kunci_peran[peran] = IndeksKunciTerurut()
+        return indeks
+
+    # ====== OPERASI RECORD ======
+
+    def ambil(self, id_orang, peran: str | None = None):
+        """Mengambil record (None jika tidak ada atau perannya berbeda)."""
+        if peran is not None and self._peran.get(id_orang) != peran:
+            return None
+        return self._data.get(id_orang)
+
+    def tambah(self, data) -> bool:
+        """Menambahkan record baru; False jika id_orang sudah ada."""
+        id_orang = data.get_id_orang()
+        if id_orang in self._data:
+            return False
+
+        peran = data.get_peran()
+        self._data[id_orang] = data
+        self._peran[id_orang] = peran
+        self._versi[id_orang] = 1
+        self._kunci.tambah(id_orang)
+        self._indeks_peran(peran).tambah(id_orang)
+        self._umumkan(id_orang, None, data)
+        return True
+
+    def tambah_banyak(self, daftar_data) -> list[bool]:
+        """Menambahkan banyak record baru; indeks ID diperbarui sekali per peran."""
+        hasil = []
+        kunci_baru: dict[str, list] = {}
+        for data in daftar_data:
+            id_orang = data.get_id_orang()
+            if id_orang in self._data:
+                hasil.append(False)
+                continue
+            peran = data.get_peran()
+            self._data[id_orang] = data
+            self._peran[id_orang] = peran
+            self._versi[id_orang] = 1
+            kunci_baru.setdefault(peran, []).append(id_orang)
+            hasil.append(True)
+
+        for peran, daftar_kunci in kunci_baru.items():
+            self._indeks_peran(peran).tambah_banyak(daftar_kunci)
+        self._kunci.tambah_banyak([k for daftar in kunci_baru.values() for k in daftar])
+        for data, sukses in zip(daftar_data, hasil):
+            if sukses:
+                self._umumkan(data.get_id_orang(), None, data)
+        return hasil
+
+    def ganti(self, id_orang, data) -> bool:
+        """Mengganti record yang sudah ada; False jika id_orang tidak ada."""
+        lama = self._data.get(id_orang)
+        if lama is None:
+            return False
+
+        peran_lama, peran_baru = self._peran[id_orang], data.get_peran()
+        if peran_lama != peran_baru:
+            self._kunci_peran[peran_lama].hapus(id_orang)
+            self._indeks_peran(peran_baru).tambah(id_orang)
+            self._peran[id_orang] = peran_baru
+
+        self._data[id_orang] = data
+        self._versi[id_orang] += 1
+        self._umumkan(id_orang, lama, data)
+        return True
+
+    def hapus(self, id_orang):
+        """Menghapus record; mengembalikan record lama atau None."""
+        lama = self._data.pop(id_orang, None)
+        if lama is None:
+            return None
+
+        del self._versi[id_orang]
+        self._kunci.hapus(id_orang)
+        self._kunci_peran[self._peran.pop(id_orang)].hapus(id_orang)
+        self._umumkan(id_orang, lama, None)
+        return lama
+
+    def atur_versi(self, id_orang, versi: int) -> None:
+        """Menimpa versi record yang ada (untuk kompensasi UnitOfWork)."""
+        if id_orang in self._versi:
+            self._versi[id_orang] = versi
+
+    # ====== QUERY ======
+
+    def versi(self, id_orang) -> int | None:
+        """Versi record yang tersimpan (None jika tidak ada)."""
+        return self._versi.get(id_orang)
+
+    def peran_dari(self, id_orang) -> str | None:
+        """Peran record yang tersimpan (None jika tidak ada)."""
+        return self._peran.get(id_orang)
+
+    def hitung(self, peran: str | None = None) -> int:
+        """Jumlah record (opsional untuk satu peran)."""
+        if peran is None:
+            return len(self._data)
+        indeks = self._kunci_peran.get(peran)
+        return 0 if indeks is None else len(indeks)
+
+    def semua(self, peran: str | None = None) -> list:
+        """Seluruh record (opsional untuk satu peran)."""
+        if peran is None:
+            return list(self._data.values())
+        indeks = self._kunci_peran.get(peran)
+        return [] if indeks is None else [self._data[k] for k in indeks.setelah(None, len(indeks))]
+
+    def kunci_antara(self, bawah, atas, peran: str | None = None) -> list:
+        """ID terurut dalam rentang bawah <= ID < atas (opsional untuk satu peran)."""
+        indeks = self._kunci if peran is None else self._kunci_peran.get(peran)
+        return [] if indeks is None else indeks.antara(bawah, atas)
+
+    def kunci_setelah(self, setelah_id, batas: int, peran: str | None = None) -> list:
+        """ID terurut setelah setelah_id (opsional untuk satu peran)."""
+        indeks = self._kunci if peran is None else self._kunci_peran.get(peran)
+        return [] if indeks is None else indeks.setelah(setelah_id, batas)
+
+
+class RepositoryOrangMemory(BaseRepository):
+    """
+    Kerangka umum repository in-memory di atas PenyimpananOrangMemory.
+
+    Subclass cukup mendefinisikan nama entitas (untuk log) dan peran yang
+    ditampilkan (None = semua orang). Jika tidak diberi penyimpanan,
+    repository membuat penyimpanannya sendiri (perilaku lama: setiap
+    repository menyimpan salinan sendiri).
+    """
+
+    _NAMA_ENTITAS = ""
+    _PERAN: str | None = None  # None = seluruh orang
+
+    def __init__(self, penyimpanan: PenyimpananOrangMemory | None = None):
+        """
+        Inisialisasi repository.
+
+        Args:
+            penyimpanan (PenyimpananOrangMemory | None, optional): Penyimpanan yang dipakai
+                bersama repository orang lain. Default: penyimpanan baru.
+        """
+        self._penyimpanan = penyimpanan if penyimpanan is not None else PenyimpananOrangMemory()
+        self.logger = get_logger(self.__class__.__module__)
+
+    def berbagi_penyimpanan(self, lain) -> bool:
+        """True jika `lain` adalah tampilan atas penyimpanan yang sama."""
+        return isinstance(lain, RepositoryOrangMemory) and lain._penyimpanan is self._penyimpanan
+
+    def _cocok(self, data) -> bool:
+        return self._PERAN is None or data.get_peran() == self._PERAN
+
+    # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
+
+    def tambah(self, data):
+        """Menambahkan objek ke repository.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal (ID sudah ada / peran tidak sesuai).
+        """
+        id_orang = data.get_id_orang()
+
+        if not self._cocok(data):
+            self.logger.warning(
+                "%s ID %s ditolak: peran tidak sesuai (%s, seharusnya %s)",
+                self._NAMA_ENTITAS, id_orang, data.get_peran(), self._PERAN,
+            )
+            return False
+
+        if not self._penyimpanan.tambah(data):
+            self.logger.warning("%s ID %s sudah ada", self._NAMA_ENTITAS, id_orang)
+            return False
+
+        self.logger.info("%s ID %s berhasil ditambahkan", self._NAMA_ENTITAS, id_orang)
+        return True
+
+    def tambah_banyak(self, daftar_data):
+        """Menambahkan banyak objek sekaligus dengan satu baris log ringkasan.
+
+        Returns:
+            list[bool]: Hasil per objek (False jika ID sudah ada / peran tidak sesuai).
+        """
+        cocok = [self._cocok(data) for data in daftar_data]
+        sukses = iter(self._penyimpanan.tambah_banyak([d for d, c in zip(daftar_data, cocok) if c]))
+        hasil = []
+        for data, c in zip(daftar_data, cocok):
+            if not c:
+                self.logger.warning(
+                    "%s ID %s ditolak: peran tidak sesuai (%s, seharusnya %s)",
+                    self._NAMA_ENTITAS, data.get_id_orang(), data.get_peran(), self._PERAN,
+                )
+                hasil.append(False)
+                continue
+            if not next(sukses):
+                self.logger.warning("%s ID %s sudah ada", self._NAMA_ENTITAS, data.get_id_orang())
+                hasil.append(False)
+                continue
+            hasil.append(True)
+
+        self.logger.info(
+            "Tambah banyak %s: %s berhasil dari %s",
+            self._NAMA_ENTITAS.lower(), hasil.count(True), len(hasil),
+        )
+        return hasil
+
+    def ambil_berdasarkan_id(self, id_orang):
+        """Mengambil objek berdasarkan ID.
+
+        Returns:
+            Orang | None: Objek jika ditemukan, None jika tidak.
+        """
+        data = self._penyimpanan.ambil(id_orang, self._PERAN)
+        if data is None:
+            self.logger.warning("%s ID %s tidak ditemukan", self._NAMA_ENTITAS, id_orang)
+        else:
+            self.logger.info("%s ID %s berhasil diambil", self._NAMA_ENTITAS, id_orang)
+
+        return data
+
+    def ambil_dengan_versi(self, id_orang):
+        """Mengambil objek beserta versinya ((None, None) jika tidak ada)."""
+        data = self._penyimpanan.ambil(id_orang, self._PERAN)
+        return (None, None) if data is None else (data, self._penyimpanan.versi(id_orang))
+
+    def ambil_semua(self):
+        """Mengambil semua objek."""
+        hasil = self._penyimpanan.semua(self._PERAN)
+        self.logger.info("Mengambil semua %s (jumlah=%s)", self._NAMA_ENTITAS.lower(), len(hasil))
+        return hasil
+
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman objek terurut berdasarkan ID.
+
+        Returns:
+            tuple[list, str | None]: Isi halaman dan cursor halaman berikutnya.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        kunci = self._penyimpanan.kunci_setelah(setelah_id, batas + 1, self._PERAN)
+        halaman = [self._penyimpanan.ambil(k) for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+
+        self.logger.info(
+            "Mengambil halaman %s setelah=%s (jumlah=%s)",
+            self._NAMA_ENTITAS.lower(), setelah_id, len(halaman),
+        )
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil objek dengan bawah <= ID < atas, terurut berdasarkan ID."""
+        hasil = [self._penyimpanan.ambil(k) for k in self._penyimpanan.kunci_antara(bawah, atas, self._PERAN)]
+        self.logger.info(
+            "Mengambil %s rentang ID [%s, %s) (jumlah=%s)",
+            self._NAMA_ENTITAS.lower(), bawah, atas, len(hasil),
+        )
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah objek."""
+        return self._penyimpanan.hitung(self._PERAN)
+
+    def perbarui(self, id_orang, data, versi_diharapkan=None):
+        """Memperbarui objek berdasarkan ID.
+
+        Versi disimpan per record, sehingga tampilan Orang/Korban/TenagaMedis
+        atas penyimpanan yang sama melihat versi yang sama.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+
+        Raises:
+            KonflikVersi: Jika versi tersimpan berbeda dari versi_diharapkan.
+        """
+        if self._penyimpanan.ambil(id_orang, self._PERAN) is None or not self._cocok(data):
+            self.logger.warning("Gagal update: %s ID %s tidak ditemukan", self._NAMA_ENTITAS, id_orang)
+            return False
+
+        self._cek_versi(self._NAMA_ENTITAS, id_orang, self._penyimpanan.versi(id_orang), versi_diharapkan)
+        self._penyimpanan.ganti(id_orang, data)
+        self.logger.info("%s ID %s berhasil diperbarui", self._NAMA_ENTITAS, id_orang)
+        return True
+
+    def hapus(self, id_orang):
+        """Menghapus objek berdasarkan ID.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+        """
+        if self._penyimpanan.ambil(id_orang, self._PERAN) is None:
+            self.logger.warning("Gagal hapus: %s ID %s tidak ditemukan", self._NAMA_ENTITAS, id_orang)
+            return False
+
+        self._penyimpanan.hapus(id_orang)
+        self.logger.info("%s ID %s berhasil dihapus", self._NAMA_ENTITAS, id_orang)
+        return True
+
+    def _pulihkan(self, id_orang, data, versi):
+        """Mengembalikan record persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self._penyimpanan.hapus(id_orang)
+            return
+        if not self._penyimpanan.ganti(id_orang, data):
+            self._penyimpanan.tambah(data)
+        self._penyimpanan.atur_versi(id_orang, versi)
@@ -1,19 +1,42 @@
-from datetime import datetime
 from utils.loggers import get_logger
 from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
 
 class PoskoRepositoryMemory(BaseRepository):
     """
     Repository in-memory untuk mengelola data posko.
 
-    Menyimpan objek Posko di dalam dictionary (key: id_posko).
+    Menyimpan objek Posko di dalam dictionary (key: id_posko), ditambah
+    indeks sekunder per bencana agar daftar posko satu bencana tidak
+    perlu memindai seluruh posko.
     """
 
     def __init__(self):
         """Inisialisasi repository in-memory."""
         self._data = {}  # key: id_posko, value: Posko
+        self._versi = {}  # key: id_posko, value: versi (naik setiap perbarui)
+        self._kunci = IndeksKunciTerurut()  # ID terurut untuk ambil_halaman()
+        self._indeks_bencana = {}  # key: id_bencana, value: {id_posko: Posko}
+        self._kunci_indeks = {}  # key: id_posko, value: id_bencana saat diindeks
         self.logger = get_logger(__name__)
 
+    # ====== INDEKS SEKUNDER ======
+
+    def _indeks_tambah(self, id_posko, data):
+        """Mendaftarkan posko ke indeks per bencana."""
+        id_bencana = data.get_bencana().get_id_bencana()
+        self._indeks_bencana.setdefault(id_bencana, {})[id_posko] = data
+        self._kunci_indeks[id_posko] = id_bencana
+
+    def _indeks_hapus(self, id_posko):
+        """Mengeluarkan posko dari indeks per bencana (pakai kunci lama)."""
+        id_bencana = self._kunci_indeks.pop(id_posko, None)
+        bucket = self._indeks_bencana.get(id_bencana)
+        if bucket is not None:
+            bucket.pop(id_posko, None)
+            if not bucket:
+                del self._indeks_bencana[id_bencana]
+
     # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
 
     def tambah(self, data):
@@ -28,15 +51,14 @@ class PoskoRepositoryMemory(BaseRepository):
         id_posko = data.get_id_posko()
 
         if id_posko in self._data:
-            self.logger.warning(
-                f"Posko ID {id_posko} sudah ada ({datetime.now()})"
-            )
+            self.logger.warning("Posko ID %s sudah ada", id_posko)
             return False
 
         self._data[id_posko] = data
-        self.logger.info(
-            f"Posko ID {id_posko} berhasil ditambahkan ({datetime.now()})"
-        )
+        self._kunci.tambah(id_posko)
+        self._versi[id_posko] = 1
+        self._indeks_tambah(id_posko, data)
+        self.logger.info("Posko ID %s berhasil ditambahkan", id_posko)
         return True
 
     def ambil_berdasarkan_id(self, id_posko):
@@ -49,47 +71,102 @@ class PoskoRepositoryMemory(BaseRepository):
         """
         posko = self._data.get(id_posko)
         if posko is None:
-            self.logger.warning(
-                f"Posko ID {id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Posko ID %s tidak ditemukan", id_posko)
         else:
-            self.logger.info(
-                f"Posko ID {id_posko} berhasil diambil ({datetime.now()})"
-            )
+            self.logger.info("Posko ID %s berhasil diambil", id_posko)
 
         return posko
 
+    def ambil_dengan_versi(self, id_posko):
+        """Mengambil posko beserta versinya.
+
+        Args:
+            id_posko (str): ID unik posko.
+        Returns:
+            tuple[Posko | None, int | None]: Objek dan versinya, (None, None) jika tidak ada.
+        """
+        return self._data.get(id_posko), self._versi.get(id_posko)
+
     def ambil_semua(self):
         """Mengambil semua data posko.
 
         Returns:
             list[Posko]: Daftar semua objek Posko.
         """
-        self.logger.info(
-            f"Mengambil semua posko (jumlah={len(self._data)}) ({datetime.now()})"
-        )
+        self.logger.info("Mengambil semua posko (jumlah=%s)", len(self._data))
         return list(self._data.values())
 
-    def perbarui(self, id_posko, data):
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman posko terurut berdasarkan ID.
+
+        Args:
+            setelah_id (str | None): ID terakhir halaman sebelumnya (None = dari awal).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Posko], str | None]: Isi halaman dan cursor halaman berikutnya.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        kunci = self._kunci.setelah(setelah_id, batas + 1)
+        halaman = [self._data[k] for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+
+        self.logger.info("Mengambil halaman posko setelah=%s (jumlah=%s)", setelah_id, len(halaman))
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil posko dengan bawah <= ID < atas, terurut berdasarkan ID.
+
+        Args:
+            bawah (str | None): Batas bawah (inklusif), None = dari awal.
+            atas (str | None): Batas atas (eksklusif), None = sampai akhir.
+
+        Returns:
+            list[Posko]: Posko dalam rentang ID.
+        """
+        hasil = [self._data[k] for k in self._kunci.antara(bawah, atas)]
+        self.logger.info("Mengambil posko rentang ID [%s, %s) (jumlah=%s)", bawah, atas, len(hasil))
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah posko.
+
+        Returns:
+            int: Jumlah Posko yang tersimpan.
+        """
+        return len(self._data)
+
+    def perbarui(self, id_posko, data, versi_diharapkan=None):
         """Memperbarui posko berdasarkan ID.
 
         Args:
             id_posko (str): ID unik posko yang akan diperbarui.
             data (Posko): Data Posko baru.
+            versi_diharapkan (int | None): Versi hasil ambil_dengan_versi() (None = tanpa cek).
 
         Returns:
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+
+        Raises:
+            KonflikVersi: Jika versi tersimpan berbeda dari versi_diharapkan.
         """
         if id_posko not in self._data:
-            self.logger.warning(
-                f"Gagal update: Posko ID {id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal update: Posko ID %s tidak ditemukan", id_posko)
             return False
 
+        versi = self._versi[id_posko]
+        self._cek_versi("Posko", id_posko, versi, versi_diharapkan)
+
         self._data[id_posko] = data
-        self.logger.info(
-            f"Posko ID {id_posko} berhasil diperbarui ({datetime.now()})"
-        )
+        self._versi[id_posko] = versi + 1
+        self._indeks_hapus(id_posko)
+        self._indeks_tambah(id_posko, data)
+        self.logger.info("Posko ID %s berhasil diperbarui", id_posko)
         return True
 
     def hapus(self, id_posko):
@@ -101,13 +178,38 @@ class PoskoRepositoryMemory(BaseRepository):
             bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
         """
         if id_posko not in self._data:
-            self.logger.warning(
-                f"Gagal hapus: Posko ID {id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self.logger.warning("Gagal hapus: Posko ID %s tidak ditemukan", id_posko)
             return False
 
         del self._data[id_posko]
-        self.logger.info(
-            f"Posko ID {id_posko} berhasil dihapus ({datetime.now()})"
-        )
-        return True
\ No newline at end of file
+        del self._versi[id_posko]
+        self._kunci.hapus(id_posko)
+        self._indeks_hapus(id_posko)
+        self.logger.info("Posko ID %s berhasil dihapus", id_posko)
+        return True
+
+    def _pulihkan(self, id_posko, data, versi):
+        """Mengembalikan posko persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self.hapus(id_posko)
+            return
+        if id_posko in self._data:
+            self.perbarui(id_posko, data)
+        else:
+            self.tambah(data)
+        self._versi[id_posko] = versi
+
+    # ====== QUERY BERDASARKAN INDEKS ======
+
+    def ambil_berdasarkan_bencana(self, id_bencana):
+        """Mengambil semua posko milik satu bencana.
+
+        Args:
+            id_bencana (str): ID bencana.
+
+        Returns:
+            list[Posko]: Posko yang terdaftar untuk bencana tersebut.
+        """
+        hasil = list(self._indeks_bencana.get(id_bencana, {}).values())
+        self.logger.info("Mengambil posko bencana ID %s (jumlah=%s)", id_bencana, len(hasil))
+        return hasil
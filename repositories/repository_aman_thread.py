@@ -0,0 +1,118 @@
+from collections.abc import Callable
+
+from utils.kunci_baca_tulis import KunciBacaTulis, KunciMutex
+from .base_repository import BaseRepository
+
+
+class RepositoryAmanThread(BaseRepository):
+    """
+    Pembungkus repository agar aman dipakai banyak thread sekaligus.
+
+    Setiap operasi dijalankan di bawah kunci, sehingga check-then-act di
+    dalam repository (misalnya cek ID lalu insert) tidak bisa disela
+    thread lain. Kunci default adalah KunciMutex (baca dan tulis sama-sama
+    eksklusif): di CPython dengan GIL, operasi in-memory yang singkat tidak
+    mendapat manfaat dari baca paralel, dan KunciMutex lebih cepat daripada
+    KunciBacaTulis di 1-64 thread (benchmarks/bench_kunci_repository.py).
+    Berikan KunciBacaTulis jika baca memang bisa berjalan paralel (build
+    free-threaded, atau repository yang melakukan I/O saat membaca): operasi
+    baca (ambil_*, hitung*) lalu memakai kunci baca dan tulis memakai kunci
+    tulis.
+
+    Method khusus repository yang dibungkus (misal ambil_berdasarkan_posko)
+    diteruskan otomatis: nama berawalan "ambil" atau "hitung" dianggap baca,
+    selain itu dianggap tulis.
+
+    Repository yang berbagi penyimpanan (Orang/Korban/TenagaMedis in-memory)
+    wajib memakai satu kunci yang sama, karena penulisan lewat satu
+    repository mengubah data yang dibaca repository lainnya.
+
+    UnitOfWork tetap bekerja seperti biasa: setiap langkahnya atomik, tetapi
+    kunci tidak ditahan di antara langkah.
+    """
+
+    _AWALAN_BACA = ("ambil", "hitung")
+
+    def __init__(self, repo: BaseRepository, kunci: KunciMutex | KunciBacaTulis | None = None):
+        """
+        Inisialisasi pembungkus.
+
+        Args:
+            repo (BaseRepository): Repository yang dibungkus.
+            kunci (KunciMutex | KunciBacaTulis | None, optional): Kunci yang dipakai
+                bersama repository lain. Default: KunciMutex baru.
+        """
+        self._repo = repo
+        self._kunci = kunci if kunci is not None else KunciMutex()
+
+    def __getattr__(self, nama: str):
+        atribut = getattr(self._repo, nama)
+        if not callable(atribut) or nama.startswith("_"):
+            return atribut
+
+        jalankan = self._baca if nama.startswith(self._AWALAN_BACA) else self._tulis
+
+        def terkunci(*args, **kwargs):
+            return jalankan(lambda: atribut(*args, **kwargs))
+
+        return terkunci
+
+    # ambil/lepas langsung (bukan with kunci.baca()) karena dipanggil di
+    # setiap operasi dan overhead generator contextmanager ikut terukur
+    def _baca(self, fungsi: Callable, *args):
+        diambil = self._kunci.ambil_baca()
+        try:
+            return fungsi(*args)
+        finally:
+            if diambil:
+                self._kunci.lepas_baca()
+
+    def _tulis(self, fungsi: Callable, *args):
+        self._kunci.ambil_tulis()
+        try:
+            return fungsi(*args)
+        finally:
+            self._kunci.lepas_tulis()
+
+    # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
+
+    def tambah(self, data):
+        return self._tulis(self._repo.tambah, data)
+
+    def tambah_banyak(self, daftar_data):
+        return self._tulis(self._repo.tambah_banyak, daftar_data)
+
+    def ambil_berdasarkan_id(self, data_id):
+        return self._baca(self._repo.ambil_berdasarkan_id, data_id)
+
+    def ambil_dengan_versi(self, data_id):
+        return self._baca(self._repo.ambil_dengan_versi, data_id)
+
+    def ambil_semua(self):
+        return self._baca(self._repo.ambil_semua)
+
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        return self._baca(self._repo.ambil_halaman, setelah_id, batas)
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        return self._baca(self._repo.ambil_rentang_id, bawah, atas)
+
+    def hitung(self):
+        return self._baca(self._repo.hitung)
+
+    def perbarui(self, data_id, data, versi_diharapkan=None):
+        return self._tulis(self._repo.perbarui, data_id, data, versi_diharapkan)
+
+    def hapus(self, data_id):
+        return self._tulis(self._repo.hapus, data_id)
+
+    def _pulihkan(self, data_id, data, versi):
+        return self._tulis(self._repo._pulihkan, data_id, data, versi)
+
+    def transaksi(self):
+        return self._repo.transaksi()
+
+    def berbagi_penyimpanan(self, lain):
+        if isinstance(lain, RepositoryAmanThread):
+            lain = lain._repo
+        return self._repo.berbagi_penyimpanan(lain)
@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+
+from .base_repository import BaseRepository
+
+
+async def iter_di_executor(
+    buat_iterator: Callable[[], Iterator],
+    executor: Executor | None = None,
+    ukuran_batch: int = 500,
+) -> AsyncIterator:
+    """
+    Mengiterasi iterator sinkron (misal iter_semua()) dari coroutine.
+
+    Iterator dibuat dan dimajukan di executor per batch, sehingga query
+    halaman berikutnya tidak pernah berjalan di thread event loop.
+
+    Args:
+        buat_iterator (Callable[[], Iterator]): Fungsi tanpa argumen yang mengembalikan iterator.
+        executor (Executor | None, optional): Executor tujuan. Default: executor bawaan loop.
+        ukuran_batch (int, optional): Jumlah item yang diambil per perpindahan thread. Default: 500.
+
+    Yields:
+        object: Item dari iterator, sesuai urutan.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = await loop.run_in_executor(executor, lambda: iter(buat_iterator()))
+    while True:
+        batch = await loop.run_in_executor(executor, lambda: list(islice(iterator, ukuran_batch)))
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+class RepositoryAsync:
+    """
+    Adapter async untuk repository sinkron (SQLite, in-memory, ...).
+
+    Setiap method repository menjadi coroutine yang dijalankan di executor,
+    sehingga I/O SQLite dan penulisan log di dalam repository tidak
+    memblokir event loop. Koneksi SQLite diambil dari SQLiteConnectionPool
+    yang memang aman dipakai banyak thread; repository in-memory sebaiknya
+    dibungkus RepositoryAmanThread lebih dulu.
+
+    Bukan turunan BaseRepository: kontraknya sama, tetapi setiap method
+    harus di-await.
+
+    Contoh:
+        korban_repo = RepositoryAsync(KorbanRepositorySQLite(pool, posko_repo))
+        korban, tenaga_medis = await asyncio.gather(
+            korban_repo.ambil_berdasarkan_id(id_korban),
+            tenaga_medis_repo.ambil_berdasarkan_id(id_tenaga_medis),
+        )
+    """
+
+    def __init__(self, repo: BaseRepository, executor: Executor | None = None):
+        """
+        Inisialisasi adapter.
+
+        Args:
+            repo (BaseRepository): Repository sinkron yang dibungkus.
+            executor (Executor | None, optional): Executor untuk menjalankan
+                operasi repository. Default: executor bawaan event loop.
+        """
+        self._repo = repo
+        self._executor = executor
+
+    @property
+    def repo(self) -> BaseRepository:
+        """Repository sinkron yang dibungkus."""
+        return self._repo
+
+    async def _jalankan(self, fungsi: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fungsi, *args, **kwargs))
+
+    def __getattr__(self, nama: str):
+        atribut = getattr(self._repo, nama)
+        if not callable(atribut) or nama.startswith("_"):
+            return atribut
+
+        async def di_executor(*args, **kwargs):
+            return await self._jalankan(atribut, *args, **kwargs)
+
+        return di_executor
+
+    def iter_semua(self, ukuran_batch: int = 500) -> AsyncIterator:
+        """
+        Mengiterasi seluruh data secara streaming (async for).
+
+        Args:
+            ukuran_batch (int, optional): Jumlah data per halaman. Default: 500.
+
+        Returns:
+            AsyncIterator: Objek dalam repository, terurut berdasarkan ID.
+        """
+        return iter_di_executor(lambda: self._repo.iter_semua(ukuran_batch), self._executor, ukuran_batch)
@@ -1,7 +1,7 @@
 # src/repositories/resep_obat_repository_memory.py
-from datetime import datetime
 from utils.loggers import get_logger
 from .base_repository import BaseRepository
+from .indeks_kunci import IndeksKunciTerurut
 
 
 class ResepObatRepositoryMemory(BaseRepository):
@@ -12,41 +12,81 @@ class ResepObatRepositoryMemory(BaseRepository):
 
     def __init__(self):
         self._data = {}
+        self._versi = {}  # key: id_resep, value: versi (naik setiap perbarui)
+        self._kunci = IndeksKunciTerurut()
         self.logger = get_logger(__name__)
 
     def tambah(self, data):
         id_resep = data.get_id_resep()
         if id_resep in self._data:
-            self.logger.warning(f"Resep ID {id_resep} sudah ada ({datetime.now()})")
+            self.logger.warning("Resep ID %s sudah ada", id_resep)
             return False
         self._data[id_resep] = data
-        self.logger.info(f"Resep ID {id_resep} berhasil ditambahkan ({datetime.now()})")
+        self._kunci.tambah(id_resep)
+        self._versi[id_resep] = 1
+        self.logger.info("Resep ID %s berhasil ditambahkan", id_resep)
         return True
 
     def ambil_berdasarkan_id(self, data_id):
         resep = self._data.get(data_id)
         if resep is None:
-            self.logger.warning(f"Resep ID {data_id} tidak ditemukan ({datetime.now()})")
+            self.logger.warning("Resep ID %s tidak ditemukan", data_id)
         else:
-            self.logger.info(f"Resep ID {data_id} berhasil diambil ({datetime.now()})")
+            self.logger.info("Resep ID %s berhasil diambil", data_id)
         return resep
 
+    def ambil_dengan_versi(self, data_id):
+        return self._data.get(data_id), self._versi.get(data_id)
+
     def ambil_semua(self):
-        self.logger.info(f"Mengambil semua resep (jumlah={len(self._data)}) ({datetime.now()})")
+        self.logger.info("Mengambil semua resep (jumlah=%s)", len(self._data))
         return list(self._data.values())
 
-    def perbarui(self, data_id, data):
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+        kunci = self._kunci.setelah(setelah_id, batas + 1)
+        halaman = [self._data[k] for k in kunci[:batas]]
+        cursor = kunci[batas - 1] if len(kunci) > batas else None
+        self.logger.info("Mengambil halaman resep setelah=%s (jumlah=%s)", setelah_id, len(halaman))
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        hasil = [self._data[k] for k in self._kunci.antara(bawah, atas)]
+        self.logger.info("Mengambil resep rentang ID [%s, %s) (jumlah=%s)", bawah, atas, len(hasil))
+        return hasil
+
+    def hitung(self):
+        return len(self._data)
+
+    def perbarui(self, data_id, data, versi_diharapkan=None):
         if data_id not in self._data:
-            self.logger.warning(f"Gagal update: Resep ID {data_id} tidak ditemukan ({datetime.now()})")
+            self.logger.warning("Gagal update: Resep ID %s tidak ditemukan", data_id)
             return False
+        versi = self._versi[data_id]
+        self._cek_versi("Resep", data_id, versi, versi_diharapkan)
         self._data[data_id] = data
-        self.logger.info(f"Resep ID {data_id} berhasil diperbarui ({datetime.now()})")
+        self._versi[data_id] = versi + 1
+        self.logger.info("Resep ID %s berhasil diperbarui", data_id)
         return True
 
     def hapus(self, data_id):
         if data_id not in self._data:
-            self.logger.warning(f"Gagal hapus: Resep ID {data_id} tidak ditemukan ({datetime.now()})")
+            self.logger.warning("Gagal hapus: Resep ID %s tidak ditemukan", data_id)
             return False
         del self._data[data_id]
-        self.logger.info(f"Resep ID {data_id} berhasil dihapus ({datetime.now()})")
+        del self._versi[data_id]
+        self._kunci.hapus(data_id)
+        self.logger.info("Resep ID %s berhasil dihapus", data_id)
         return True
+
+    def _pulihkan(self, data_id, data, versi):
+        """Mengembalikan resep persis ke data & versi sebelum langkah UnitOfWork (data None = tidak ada)."""
+        if data is None:
+            self.hapus(data_id)
+            return
+        if data_id in self._data:
+            self.perbarui(data_id, data)
+        else:
+            self.tambah(data)
+        self._versi[data_id] = versi
@@ -0,0 +1,24 @@
+from .connection_pool import SQLiteConnectionPool
+from .base_sqlite_repository import BaseSQLiteRepository
+from .bencana_repository import BencanaRepositorySQLite
+from .posko_repository import PoskoRepositorySQLite
+from .orang_repository import OrangRepositorySQLite
+from .korban_repository import KorbanRepositorySQLite
+from .tenaga_medis_repository import TenagaMedisRepositorySQLite
+from .obat_repository import ObatRepositorySQLite
+from .pemeriksaan_repository import PemeriksaanRepositorySQLite
+from .resep_obat_repository import ResepObatRepositorySQLite
+
+
+__all__ = [
+    "SQLiteConnectionPool",
+    "BaseSQLiteRepository",
+    "BencanaRepositorySQLite",
+    "PoskoRepositorySQLite",
+    "OrangRepositorySQLite",
+    "KorbanRepositorySQLite",
+    "TenagaMedisRepositorySQLite",
+    "ObatRepositorySQLite",
+    "PemeriksaanRepositorySQLite",
+    "ResepObatRepositorySQLite",
+]
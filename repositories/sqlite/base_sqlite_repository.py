@@ -0,0 +1,348 @@
+import sqlite3
+from abc import abstractmethod
+from contextlib import contextmanager
+
+from utils.loggers import get_logger
+from ..base_repository import BaseRepository
+from .connection_pool import SQLiteConnectionPool
+
+
+class BaseSQLiteRepository(BaseRepository):
+    """
+    Kerangka umum repository berbasis SQLite.
+
+    Subclass cukup mendefinisikan nama tabel, daftar kolom (kolom pertama
+    adalah primary key), DDL tambahan, serta konversi objek <-> baris.
+    Seluruh query memakai parameter (prepared statement) yang di-cache
+    per koneksi oleh modul sqlite3.
+
+    Setiap tabel juga punya kolom `versi` (di luar _KOLOM) yang dinaikkan
+    oleh setiap UPDATE; perbarui(..., versi_diharapkan) menjadi satu
+    UPDATE ... WHERE versi = ? sehingga aman antar-thread maupun antar-proses
+    tanpa mengunci baris selama service bekerja.
+    """
+
+    _NAMA_ENTITAS = ""
+    _TABEL = ""
+    _KOLOM: tuple[str, ...] = ()
+    _TIPE_KOLOM: dict[str, str] = {}
+    _SKEMA_TAMBAHAN: tuple[str, ...] = ()
+    _UKURAN_CHUNK_IN = 500  # di bawah batas parameter SQLite (999 pada versi lama)
+    _DEFINISI_VERSI = "INTEGER NOT NULL DEFAULT 1"  # INSERT tidak menyebut versi -> 1
+
+    def __init__(self, pool: SQLiteConnectionPool):
+        """
+        Inisialisasi repository dan membuat tabel jika belum ada.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+        """
+        self._pool = pool
+        self.logger = get_logger(self.__class__.__module__)
+
+        kolom_id = self._KOLOM[0]
+        kolom = ", ".join(self._KOLOM)
+        placeholder = ", ".join("?" for _ in self._KOLOM)
+        kolom_set = ", ".join(f"{k} = ?" for k in self._KOLOM[1:])
+
+        self._sql_insert = f"INSERT INTO {self._TABEL} ({kolom}) VALUES ({placeholder})"
+        self._sql_ambil = f"SELECT {kolom} FROM {self._TABEL} WHERE {kolom_id} = ?"
+        self._sql_ambil_versi = f"SELECT {kolom}, versi FROM {self._TABEL} WHERE {kolom_id} = ?"
+        self._sql_versi = f"SELECT versi FROM {self._TABEL} WHERE {kolom_id} = ?"
+        self._sql_ambil_semua = f"SELECT {kolom} FROM {self._TABEL}"
+        self._sql_halaman_awal = f"{self._sql_ambil_semua} ORDER BY {kolom_id} LIMIT ?"
+        self._sql_halaman = f"{self._sql_ambil_semua} WHERE {kolom_id} > ? ORDER BY {kolom_id} LIMIT ?"
+        self._sql_hitung = f"SELECT COUNT(*) FROM {self._TABEL}"
+        self._sql_perbarui = f"UPDATE {self._TABEL} SET {kolom_set}, versi = versi + 1 WHERE {kolom_id} = ?"
+        self._sql_perbarui_cas = f"{self._sql_perbarui} AND versi = ?"
+        self._sql_hapus = f"DELETE FROM {self._TABEL} WHERE {kolom_id} = ?"
+
+        definisi = ", ".join(
+            f"{k} {self._TIPE_KOLOM.get(k, 'TEXT')}" + (" PRIMARY KEY" if k == kolom_id else "")
+            for k in self._KOLOM
+        ) + f", versi {self._DEFINISI_VERSI}"
+        with self._pool.transaksi() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self._TABEL} ({definisi})")
+            # Database lama: tambahkan kolom yang belum ada (nilainya NULL untuk baris lama)
+            kolom_ada = {b[1] for b in conn.execute(f"PRAGMA table_info({self._TABEL})")}
+            for k in self._KOLOM:
+                if k not in kolom_ada:
+                    conn.execute(f"ALTER TABLE {self._TABEL} ADD COLUMN {k} {self._TIPE_KOLOM.get(k, 'TEXT')}")
+            if "versi" not in kolom_ada:
+                conn.execute(f"ALTER TABLE {self._TABEL} ADD COLUMN versi {self._DEFINISI_VERSI}")
+            for ddl in self._SKEMA_TAMBAHAN:
+                conn.execute(ddl)
+
+    # ====== HOOK UNTUK SUBCLASS ======
+
+    @abstractmethod
+    def _ambil_id(self, data) -> str:
+        """Mengembalikan primary key dari objek."""
+        pass
+
+    @abstractmethod
+    def _ke_baris(self, data) -> tuple:
+        """Mengonversi objek menjadi tuple sesuai urutan _KOLOM."""
+        pass
+
+    @abstractmethod
+    def _dari_baris(self, conn: sqlite3.Connection, baris: tuple, cache: dict):
+        """Mengonversi satu baris menjadi objek model.
+
+        Args:
+            conn (sqlite3.Connection): Koneksi aktif (untuk memuat data anak).
+            baris (tuple): Baris hasil SELECT sesuai urutan _KOLOM.
+            cache (dict): Cache referensi FK selama satu pemanggilan.
+        """
+        pass
+
+    def _simpan_anak(self, conn: sqlite3.Connection, data) -> None:
+        """Menyimpan baris tabel anak (jika ada). Default: tidak ada."""
+
+    def _hapus_anak(self, conn: sqlite3.Connection, data_id) -> None:
+        """Menghapus baris tabel anak (jika ada). Default: tidak ada."""
+
+    # ====== HELPER INTERNAL ======
+
+    def _muat(self, data_id, cache: dict | None = None):
+        """
+        Memuat objek berdasarkan ID tanpa logging.
+
+        Dipakai repository lain untuk menyelesaikan referensi FK.
+        """
+        if cache is not None:
+            kunci = (self._TABEL, data_id)
+            if kunci in cache:
+                return cache[kunci]
+
+        with self._pool.koneksi() as conn:
+            baris = conn.execute(self._sql_ambil, (data_id,)).fetchone()
+            obj = None if baris is None else self._dari_baris(conn, baris, cache if cache is not None else {})
+
+        if cache is not None:
+            cache[(self._TABEL, data_id)] = obj
+        return obj
+
+    def _cari(self, klausa_where: str, parameter: tuple) -> list:
+        """
+        Mengambil objek yang memenuhi klausa WHERE (tanpa logging).
+
+        Args:
+            klausa_where (str): Klausa WHERE berparameter, misal "id_posko = ?".
+            parameter (tuple): Nilai parameter klausa.
+
+        Returns:
+            list: Objek yang cocok.
+        """
+        cache: dict = {}
+        with self._pool.koneksi() as conn:
+            return [
+                self._dari_baris(conn, baris, cache)
+                for baris in conn.execute(
+                    f"{self._sql_ambil_semua} WHERE {klausa_where}", parameter
+                ).fetchall()
+            ]
+
+    # ====== OVERRIDING METHOD DARI BaseRepository (Polymorphism) ======
+
+    @contextmanager
+    def transaksi(self):
+        """Transaksi database; repository dengan pool yang sama berbagi satu transaksi."""
+        with self._pool.transaksi():
+            yield True
+
+    def _pulihkan(self, data_id, data, versi):
+        """Tidak dipakai: transaksi() sudah membatalkan seluruh penulisan UnitOfWork."""
+        raise RuntimeError(
+            f"{type(self).__name__} dibatalkan lewat transaksi database, bukan kompensasi _pulihkan()"
+        )
+
+    def tambah(self, data):
+        """Menambahkan objek ke tabel."""
+        data_id = self._ambil_id(data)
+
+        try:
+            with self._pool.transaksi() as conn:
+                conn.execute(self._sql_insert, self._ke_baris(data))
+                self._simpan_anak(conn, data)
+        except sqlite3.IntegrityError:
+            self.logger.warning("%s ID %s sudah ada", self._NAMA_ENTITAS, data_id)
+            return False
+
+        self.logger.info("%s ID %s berhasil ditambahkan", self._NAMA_ENTITAS, data_id)
+        return True
+
+    def tambah_banyak(self, daftar_data):
+        """Menambahkan banyak objek dalam satu transaksi (executemany).
+
+        ID yang sudah ada di tabel atau muncul dua kali di daftar_data
+        ditolak lebih dulu, sehingga satu baris duplikat tidak
+        membatalkan seluruh batch.
+        """
+        daftar_id = [self._ambil_id(data) for data in daftar_data]
+        hasil = [False] * len(daftar_data)
+        kolom_id = self._KOLOM[0]
+
+        with self._pool.transaksi() as conn:
+            sudah_ada = set()
+            for i in range(0, len(daftar_id), self._UKURAN_CHUNK_IN):
+                chunk = daftar_id[i:i + self._UKURAN_CHUNK_IN]
+                placeholder = ", ".join("?" for _ in chunk)
+                sudah_ada.update(
+                    baris[0] for baris in conn.execute(
+                        f"SELECT {kolom_id} FROM {self._TABEL} WHERE {kolom_id} IN ({placeholder})",
+                        chunk,
+                    )
+                )
+
+            baru = []
+            for i, (data_id, data) in enumerate(zip(daftar_id, daftar_data)):
+                if data_id in sudah_ada:
+                    self.logger.warning("%s ID %s sudah ada", self._NAMA_ENTITAS, data_id)
+                    continue
+                sudah_ada.add(data_id)
+                hasil[i] = True
+                baru.append(data)
+
+            conn.executemany(self._sql_insert, (self._ke_baris(data) for data in baru))
+            for data in baru:
+                self._simpan_anak(conn, data)
+
+        self.logger.info(
+            "Tambah banyak %s: %s berhasil dari %s",
+            self._NAMA_ENTITAS.lower(), len(baru), len(hasil),
+        )
+        return hasil
+
+    def ambil_berdasarkan_id(self, data_id):
+        """Mengambil objek berdasarkan ID."""
+        obj = self._muat(data_id)
+
+        if obj is None:
+            self.logger.warning("%s ID %s tidak ditemukan", self._NAMA_ENTITAS, data_id)
+        else:
+            self.logger.info("%s ID %s berhasil diambil", self._NAMA_ENTITAS, data_id)
+
+        return obj
+
+    def ambil_dengan_versi(self, data_id):
+        """Mengambil objek beserta kolom versi dalam satu SELECT."""
+        with self._pool.koneksi() as conn:
+            baris = conn.execute(self._sql_ambil_versi, (data_id,)).fetchone()
+            if baris is None:
+                return None, None
+            return self._dari_baris(conn, baris[:-1], {}), baris[-1]
+
+    def ambil_semua(self):
+        """Mengambil seluruh objek di tabel."""
+        cache: dict = {}
+        with self._pool.koneksi() as conn:
+            hasil = [
+                self._dari_baris(conn, baris, cache)
+                for baris in conn.execute(self._sql_ambil_semua).fetchall()
+            ]
+
+        self.logger.info("Mengambil semua %s (jumlah=%s)", self._NAMA_ENTITAS.lower(), len(hasil))
+        return hasil
+
+    def ambil_halaman(self, setelah_id=None, batas=100):
+        """Mengambil satu halaman objek terurut berdasarkan primary key.
+
+        Raises:
+            ValueError: Jika batas bukan integer positif.
+        """
+        if not isinstance(batas, int) or batas <= 0:
+            raise ValueError("Batas halaman harus integer positif")
+
+        cache: dict = {}
+        with self._pool.koneksi() as conn:
+            if setelah_id is None:
+                baris_halaman = conn.execute(self._sql_halaman_awal, (batas + 1,)).fetchall()
+            else:
+                baris_halaman = conn.execute(self._sql_halaman, (setelah_id, batas + 1)).fetchall()
+            halaman = [self._dari_baris(conn, baris, cache) for baris in baris_halaman[:batas]]
+
+        cursor = baris_halaman[batas - 1][0] if len(baris_halaman) > batas else None
+
+        self.logger.info(
+            "Mengambil halaman %s setelah=%s (jumlah=%s)",
+            self._NAMA_ENTITAS.lower(), setelah_id, len(halaman),
+        )
+        return halaman, cursor
+
+    def ambil_rentang_id(self, bawah=None, atas=None):
+        """Mengambil objek dengan bawah <= primary key < atas (range scan indeks primary key)."""
+        kolom_id = self._KOLOM[0]
+        klausa, parameter = [], []
+        if bawah is not None:
+            klausa.append(f"{kolom_id} >= ?")
+            parameter.append(bawah)
+        if atas is not None:
+            klausa.append(f"{kolom_id} < ?")
+            parameter.append(atas)
+        where = f" WHERE {' AND '.join(klausa)}" if klausa else ""
+
+        cache: dict = {}
+        with self._pool.koneksi() as conn:
+            hasil = [
+                self._dari_baris(conn, baris, cache)
+                for baris in conn.execute(f"{self._sql_ambil_semua}{where} ORDER BY {kolom_id}", parameter).fetchall()
+            ]
+
+        self.logger.info(
+            "Mengambil %s rentang ID [%s, %s) (jumlah=%s)",
+            self._NAMA_ENTITAS.lower(), bawah, atas, len(hasil),
+        )
+        return hasil
+
+    def hitung(self):
+        """Menghitung jumlah baris di tabel."""
+        with self._pool.koneksi() as conn:
+            return conn.execute(self._sql_hitung).fetchone()[0]
+
+    def perbarui(self, data_id, data, versi_diharapkan=None):
+        """Memperbarui objek berdasarkan ID (compare-and-swap jika versi_diharapkan diisi).
+
+        Raises:
+            KonflikVersi: Jika versi baris berbeda dari versi_diharapkan.
+        """
+        baris = self._ke_baris(data)
+
+        with self._pool.transaksi() as conn:
+            if versi_diharapkan is None:
+                cursor = conn.execute(self._sql_perbarui, (*baris[1:], data_id))
+            else:
+                cursor = conn.execute(self._sql_perbarui_cas, (*baris[1:], data_id, versi_diharapkan))
+                if not cursor.rowcount:
+                    sekarang = conn.execute(self._sql_versi, (data_id,)).fetchone()
+                    if sekarang is not None:
+                        self._cek_versi(self._NAMA_ENTITAS, data_id, sekarang[0], versi_diharapkan)
+            if cursor.rowcount:
+                self._hapus_anak(conn, data_id)
+                self._simpan_anak(conn, data)
+
+        if not cursor.rowcount:
+            self.logger.warning(
+                "Gagal update: %s ID %s tidak ditemukan",
+                self._NAMA_ENTITAS, data_id,
+            )
+            return False
+
+        self.logger.info("%s ID %s berhasil diperbarui", self._NAMA_ENTITAS, data_id)
+        return True
+
+    def hapus(self, data_id):
+        """Menghapus objek berdasarkan ID."""
+        with self._pool.transaksi() as conn:
+            self._hapus_anak(conn, data_id)
+            cursor = conn.execute(self._sql_hapus, (data_id,))
+
+        if not cursor.rowcount:
+            self.logger.warning(
+                "Gagal hapus: %s ID %s tidak ditemukan",
+                self._NAMA_ENTITAS, data_id,
+            )
+            return False
+
+        self.logger.info("%s ID %s berhasil dihapus", self._NAMA_ENTITAS, data_id)
+        return True
@@ -0,0 +1,39 @@
+from datetime import date
+
+from models.bencana import Bencana
+from utils.enums.status_bencana import StatusBencana
+from .base_sqlite_repository import BaseSQLiteRepository
+
+
+class BencanaRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data bencana.
+
+    Menyimpan objek Bencana di tabel `bencana` (primary key: id_bencana).
+    """
+
+    _NAMA_ENTITAS = "Bencana"
+    _TABEL = "bencana"
+    _KOLOM = ("id_bencana", "jenis", "lokasi", "tanggal_mulai", "status")
+
+    def _ambil_id(self, data):
+        return data.get_id_bencana()
+
+    def _ke_baris(self, data):
+        return (
+            data.get_id_bencana(),
+            data.get_jenis(),
+            data.get_lokasi(),
+            data.get_tanggal_mulai().isoformat(),
+            data.get_status().value,
+        )
+
+    def _dari_baris(self, conn, baris, cache):
+        id_bencana, jenis, lokasi, tanggal_mulai, status = baris
+        return Bencana._dari_tepercaya(
+            id_bencana=id_bencana,
+            jenis=jenis,
+            lokasi=lokasi,
+            tanggal_mulai=date.fromisoformat(tanggal_mulai),
+            status=StatusBencana(status),
+        )
@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from queue import Queue
+
+
+class SQLiteConnectionPool:
+    """
+    Pool koneksi SQLite yang dipakai bersama oleh seluruh repository SQLite.
+
+    Setiap koneksi dibuka sekali dengan mode WAL (pembaca tidak memblokir
+    penulis) dan cache prepared statement, lalu dipinjamkan bergantian
+    ke thread yang membutuhkan.
+
+    Attributes:
+        path_db (str): Lokasi file database (atau ":memory:").
+        ukuran (int): Jumlah koneksi di dalam pool.
+    """
+
+    def __init__(self, path_db: str, ukuran: int = 4, timeout: float = 30.0):
+        """
+        Inisialisasi pool dan membuka seluruh koneksi.
+
+        Args:
+            path_db (str): Lokasi file database. ":memory:" hanya didukung dengan satu koneksi.
+            ukuran (int, optional): Jumlah koneksi. Default: 4.
+            timeout (float, optional): Waktu tunggu lock database (detik). Default: 30.0.
+
+        Raises:
+            ValueError: Jika ukuran pool kurang dari 1.
+        """
+        if not isinstance(ukuran, int) or ukuran < 1:
+            raise ValueError("Ukuran pool minimal 1")
+
+        if path_db == ":memory:":
+            # Setiap koneksi :memory: adalah database terpisah
+            ukuran = 1
+        else:
+            Path(path_db).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path_db = path_db
+        self.ukuran = ukuran
+        self._timeout = timeout
+        self._pool: Queue = Queue(maxsize=ukuran)
+        self._semua: list[sqlite3.Connection] = []
+        self._lokal = threading.local()
+
+        for _ in range(ukuran):
+            conn = self._buka_koneksi()
+            self._semua.append(conn)
+            self._pool.put(conn)
+
+    def _buka_koneksi(self) -> sqlite3.Connection:
+        """Membuka satu koneksi baru dengan pengaturan standar pool."""
+        conn = sqlite3.connect(
+            self.path_db,
+            timeout=self._timeout,
+            check_same_thread=False,
+            isolation_level=None,  # transaksi dikelola manual lewat transaksi()
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _pinjam(self):
+        """
+        Meminjam koneksi untuk thread saat ini.
+
+        Peminjaman bersarang pada thread yang sama memakai koneksi yang sama,
+        sehingga pemuatan FK di dalam pemuatan lain tidak menghabiskan pool.
+        """
+        conn = getattr(self._lokal, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._pool.get()
+        self._lokal.conn = conn
+        try:
+            yield conn
+        finally:
+            self._lokal.conn = None
+            self._pool.put(conn)
+
+    @contextmanager
+    def koneksi(self):
+        """
+        Meminjam satu koneksi dari pool.
+
+        Jika thread saat ini sedang berada di dalam transaksi(), koneksi
+        transaksi tersebut yang dipakai agar pembacaan melihat tulisan
+        yang belum di-commit.
+
+        Yields:
+            sqlite3.Connection: Koneksi yang dipinjam.
+        """
+        with self._pinjam() as conn:
+            yield conn
+
+    @contextmanager
+    def transaksi(self):
+        """
+        Menjalankan blok kode di dalam satu transaksi database.
+
+        Bersifat reentrant: transaksi bersarang pada thread yang sama
+        digabung ke transaksi terluar, dan COMMIT hanya dijalankan sekali
+        saat transaksi terluar selesai. ROLLBACK dijalankan jika terjadi error.
+
+        Yields:
+            sqlite3.Connection: Koneksi yang dipakai transaksi.
+        """
+        with self._pinjam() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def tutup(self) -> None:
+        """Menutup seluruh koneksi di dalam pool."""
+        for conn in self._semua:
+            conn.close()
+        self._semua.clear()
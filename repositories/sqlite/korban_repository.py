@@ -0,0 +1,116 @@
+from datetime import date
+
+from models.korban import Korban
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.status_triase import StatusTriase
+from .base_sqlite_repository import BaseSQLiteRepository
+from .connection_pool import SQLiteConnectionPool
+from .posko_repository import PoskoRepositorySQLite
+
+
+def korban_ke_kolom(korban: Korban) -> dict:
+    """Mengonversi Korban menjadi dict kolom (dipakai juga oleh tabel orang)."""
+    return {
+        "id_orang": korban.get_id_orang(),
+        "nama_orang": korban.get_nama_orang(),
+        "alamat_orang": korban.get_alamat_orang(),
+        "jenis_kelamin_orang": korban.get_jenis_kelamin_orang().value,
+        "tanggal_lahir_orang": korban.get_tanggal_lahir_orang().isoformat(),
+        "status_triase": korban.get_status_triase().value,
+        "kondisi_awal": korban.get_kondisi_awal(),
+        "lokasi_ditemukan": korban.get_lokasi_ditemukan(),
+        "id_posko": korban.get_posko().get_id_posko(),
+    }
+
+
+def korban_dari_kolom(kolom: dict, posko) -> Korban:
+    """Membangun Korban dari dict kolom dan objek Posko yang sudah dimuat (tanpa validasi ulang)."""
+    return Korban._dari_tepercaya(
+        id_orang=kolom["id_orang"],
+        nama_orang=kolom["nama_orang"],
+        alamat_orang=kolom["alamat_orang"],
+        jenis_kelamin_orang=JenisKelamin(kolom["jenis_kelamin_orang"]),
+        tanggal_lahir_orang=date.fromisoformat(kolom["tanggal_lahir_orang"]),
+        status_triase=StatusTriase(kolom["status_triase"]),
+        kondisi_awal=kolom["kondisi_awal"],
+        lokasi_ditemukan=kolom["lokasi_ditemukan"],
+        posko=posko,
+    )
+
+
+class KorbanRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data korban.
+
+    Menyimpan objek Korban di tabel `korban` (primary key: id_orang).
+    """
+
+    _NAMA_ENTITAS = "Korban"
+    _TABEL = "korban"
+    _KOLOM = (
+        "id_orang",
+        "nama_orang",
+        "alamat_orang",
+        "jenis_kelamin_orang",
+        "tanggal_lahir_orang",
+        "status_triase",
+        "kondisi_awal",
+        "lokasi_ditemukan",
+        "id_posko",
+    )
+    _SKEMA_TAMBAHAN = (
+        "CREATE INDEX IF NOT EXISTS idx_korban_triase ON korban (status_triase)",
+        "CREATE INDEX IF NOT EXISTS idx_korban_posko_triase ON korban (id_posko, status_triase)",
+    )
+
+    def __init__(self, pool: SQLiteConnectionPool, posko_repo: PoskoRepositorySQLite):
+        """
+        Inisialisasi repository korban.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            posko_repo (PoskoRepositorySQLite): Repository untuk memuat Posko.
+        """
+        self._posko_repo = posko_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_orang()
+
+    def _ke_baris(self, data):
+        kolom = korban_ke_kolom(data)
+        return tuple(kolom[k] for k in self._KOLOM)
+
+    def _dari_baris(self, conn, baris, cache):
+        kolom = dict(zip(self._KOLOM, baris))
+        return korban_dari_kolom(kolom, self._posko_repo._muat(kolom["id_posko"], cache))
+
+    # ====== QUERY BERDASARKAN INDEKS ======
+
+    def ambil_berdasarkan_posko(self, id_posko):
+        """Mengambil semua korban di satu posko."""
+        hasil = self._cari("id_posko = ?", (id_posko,))
+        self.logger.info("Mengambil korban posko ID %s (jumlah=%s)", id_posko, len(hasil))
+        return hasil
+
+    def hitung_berdasarkan_posko(self, id_posko):
+        """Menghitung korban di satu posko (memakai indeks id_posko, tanpa memuat objek)."""
+        with self._pool.koneksi() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM korban WHERE id_posko = ?", (id_posko,)
+            ).fetchone()[0]
+
+    def ambil_berdasarkan_triase(self, status_triase: StatusTriase):
+        """Mengambil semua korban dengan status triase tertentu."""
+        hasil = self._cari("status_triase = ?", (status_triase.value,))
+        self.logger.info("Mengambil korban triase %s (jumlah=%s)", status_triase.value, len(hasil))
+        return hasil
+
+    def ambil_berdasarkan_posko_dan_triase(self, id_posko, status_triase: StatusTriase):
+        """Mengambil korban di satu posko dengan status triase tertentu."""
+        hasil = self._cari("id_posko = ? AND status_triase = ?", (id_posko, status_triase.value))
+        self.logger.info(
+            "Mengambil korban posko ID %s triase %s (jumlah=%s)",
+            id_posko, status_triase.value, len(hasil),
+        )
+        return hasil
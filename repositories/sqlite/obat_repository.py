@@ -0,0 +1,157 @@
+from datetime import date
+
+from models.obat import Obat
+from .base_sqlite_repository import BaseSQLiteRepository
+
+
+class ObatRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data obat.
+
+    Menyimpan objek Obat di tabel `obat` (primary key: id_obat). Lot stok
+    disimpan di tabel anak `obat_lot` (id_obat, id_lot) dengan urutan FEFO;
+    kolom stock_obat tetap diisi total stok agar mudah di-query.
+    """
+
+    _NAMA_ENTITAS = "Obat"
+    _TABEL = "obat"
+    _KOLOM = (
+        "id_obat", "nama_obat", "stock_obat", "satuan_obat", "tanggal_kadaluarsa_obat", "titik_pesan_ulang",
+    )
+    _TIPE_KOLOM = {"stock_obat": "INTEGER", "titik_pesan_ulang": "INTEGER"}
+    _SKEMA_TAMBAHAN = (
+        "CREATE TABLE IF NOT EXISTS obat_lot ("
+        "id_obat TEXT, id_lot TEXT, urutan INTEGER, jumlah INTEGER, "
+        "tanggal_kadaluarsa TEXT, PRIMARY KEY (id_obat, id_lot))",
+        "CREATE INDEX IF NOT EXISTS idx_obat_lot_kadaluarsa ON obat_lot (tanggal_kadaluarsa)",
+    )
+
+    _SQL_INSERT_LOT = (
+        "INSERT INTO obat_lot (id_obat, id_lot, urutan, jumlah, tanggal_kadaluarsa) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    _SQL_AMBIL_LOT = (
+        "SELECT id_lot, jumlah, tanggal_kadaluarsa FROM obat_lot "
+        "WHERE id_obat = ? ORDER BY urutan"
+    )
+    _SQL_HAPUS_LOT = "DELETE FROM obat_lot WHERE id_obat = ?"
+    _SQL_HAPUS_SATU_LOT = "DELETE FROM obat_lot WHERE id_obat = ? AND id_lot = ?"
+    # Lot baru diberi urutan terakhir (sama seperti tambah_lot di model);
+    # lot lama hanya berubah jumlahnya dan urutan FEFO-nya tetap
+    _SQL_SIMPAN_SATU_LOT = (
+        "INSERT INTO obat_lot (id_obat, id_lot, urutan, jumlah, tanggal_kadaluarsa) "
+        "VALUES (?1, ?2, (SELECT COALESCE(MAX(urutan) + 1, 0) FROM obat_lot WHERE id_obat = ?1), ?3, ?4) "
+        "ON CONFLICT (id_obat, id_lot) DO UPDATE SET jumlah = excluded.jumlah"
+    )
+
+    def _ambil_id(self, data):
+        return data.get_id_obat()
+
+    def _ke_baris(self, data):
+        return (
+            data.get_id_obat(),
+            data.get_nama_obat(),
+            data.get_stock_obat(),
+            data.get_satuan_obat(),
+            data.get_tanggal_kadaluarsa_obat().isoformat(),
+            data.get_titik_pesan_ulang(),
+        )
+
+    def _simpan_anak(self, conn, data):
+        conn.executemany(
+            self._SQL_INSERT_LOT,
+            [
+                (
+                    data.get_id_obat(),
+                    lot.get_id_lot(),
+                    urutan,
+                    lot.get_jumlah(),
+                    lot.get_tanggal_kadaluarsa().isoformat(),
+                )
+                for urutan, lot in enumerate(data.get_lot())
+            ],
+        )
+
+    def _hapus_anak(self, conn, data_id):
+        conn.execute(self._SQL_HAPUS_LOT, (data_id,))
+
+    def perbarui_lot(self, id_obat, data, id_lot_berubah):
+        """Memperbarui obat yang perubahannya hanya pada lot tertentu.
+
+        Baris obat diperbarui seperti perbarui() tanpa cek versi, tetapi hanya
+        baris obat_lot untuk id_lot_berubah yang ditulis (bukan hapus lalu
+        tulis ulang seluruh lot).
+
+        Args:
+            id_obat (str): ID unik obat yang akan diperbarui.
+            data (Obat): Data Obat baru.
+            id_lot_berubah (Iterable[str]): ID lot yang ditambah, diubah atau dikeluarkan.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal (ID tidak ditemukan).
+        """
+        with self._pool.transaksi() as conn:
+            cursor = conn.execute(self._sql_perbarui, (*self._ke_baris(data)[1:], id_obat))
+            if cursor.rowcount:
+                for id_lot in id_lot_berubah:
+                    lot = data.get_lot_berdasarkan_id(id_lot)
+                    if lot is None:
+                        conn.execute(self._SQL_HAPUS_SATU_LOT, (id_obat, id_lot))
+                    else:
+                        conn.execute(
+                            self._SQL_SIMPAN_SATU_LOT,
+                            (id_obat, id_lot, lot.get_jumlah(), lot.get_tanggal_kadaluarsa().isoformat()),
+                        )
+
+        if not cursor.rowcount:
+            self.logger.warning("Gagal update: Obat ID %s tidak ditemukan", id_obat)
+            return False
+
+        self.logger.info("Obat ID %s berhasil diperbarui", id_obat)
+        return True
+
+    def _dari_baris(self, conn, baris, cache):
+        id_obat, nama_obat, stock_obat, satuan_obat, tanggal_kadaluarsa_obat, titik_pesan_ulang = baris
+        # Baris lama tanpa lot: _dari_tepercaya memasukkan stok ke lot default
+        return Obat._dari_tepercaya(
+            id_obat=id_obat,
+            nama_obat=nama_obat,
+            stock_obat=stock_obat,
+            satuan_obat=satuan_obat,
+            tanggal_kadaluarsa_obat=date.fromisoformat(tanggal_kadaluarsa_obat),
+            titik_pesan_ulang=titik_pesan_ulang or 0,
+            lot=[
+                (id_lot, jumlah, date.fromisoformat(tanggal_kadaluarsa))
+                for id_lot, jumlah, tanggal_kadaluarsa in conn.execute(self._SQL_AMBIL_LOT, (id_obat,))
+            ],
+        )
+
+    # ====== QUERY BERDASARKAN INDEKS ======
+
+    def ambil_lot_kadaluarsa_antara(self, dari, sampai):
+        """Mengambil lot yang kadaluarsa pada rentang tanggal (inklusif), urut tanggal."""
+        klausa, parameter = [], []
+        if dari is not None:
+            klausa.append("tanggal_kadaluarsa >= ?")
+            parameter.append(dari.isoformat())
+        if sampai is not None:
+            klausa.append("tanggal_kadaluarsa <= ?")
+            parameter.append(sampai.isoformat())
+        where = f"WHERE {' AND '.join(klausa)} " if klausa else ""
+
+        cache: dict = {}
+        with self._pool.koneksi() as conn:
+            baris_lot = conn.execute(
+                f"SELECT id_obat, id_lot FROM obat_lot {where}"
+                "ORDER BY tanggal_kadaluarsa, id_obat, id_lot",
+                parameter,
+            ).fetchall()
+            hasil = []
+            for id_obat, id_lot in baris_lot:
+                obat = self._muat(id_obat, cache)
+                hasil.append((obat, obat.get_lot_berdasarkan_id(id_lot)))
+
+        self.logger.info(
+            "Mengambil lot kadaluarsa %s s/d %s (jumlah=%s)", dari, sampai, len(hasil)
+        )
+        return hasil
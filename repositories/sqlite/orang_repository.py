@@ -0,0 +1,66 @@
+from models.korban import Korban
+from models.tenaga_medis import TenagaMedis
+from .base_sqlite_repository import BaseSQLiteRepository
+from .connection_pool import SQLiteConnectionPool
+from .korban_repository import korban_dari_kolom, korban_ke_kolom
+from .posko_repository import PoskoRepositorySQLite
+from .tenaga_medis_repository import tenaga_medis_dari_kolom, tenaga_medis_ke_kolom
+
+
+class OrangRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data orang.
+
+    Menyimpan objek Orang (Korban maupun TenagaMedis) di tabel `orang`
+    (primary key: id_orang). Kolom `peran` berisi hasil get_peran() dan
+    menentukan subclass yang dibangun saat data dimuat.
+    """
+
+    _NAMA_ENTITAS = "Orang"
+    _TABEL = "orang"
+    _KOLOM = (
+        "id_orang",
+        "peran",
+        "nama_orang",
+        "alamat_orang",
+        "jenis_kelamin_orang",
+        "tanggal_lahir_orang",
+        "id_posko",
+        "status_triase",
+        "kondisi_awal",
+        "lokasi_ditemukan",
+        "no_izin_praktik",
+        "role",
+        "spesialisasi",
+    )
+
+    def __init__(self, pool: SQLiteConnectionPool, posko_repo: PoskoRepositorySQLite):
+        """
+        Inisialisasi repository orang.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            posko_repo (PoskoRepositorySQLite): Repository untuk memuat Posko.
+        """
+        self._posko_repo = posko_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_orang()
+
+    def _ke_baris(self, data):
+        if isinstance(data, Korban):
+            kolom = korban_ke_kolom(data)
+        elif isinstance(data, TenagaMedis):
+            kolom = tenaga_medis_ke_kolom(data)
+        else:
+            raise ValueError(f"Peran orang tidak didukung: {data.get_peran()}")
+        kolom["peran"] = data.get_peran()
+        return tuple(kolom.get(k) for k in self._KOLOM)
+
+    def _dari_baris(self, conn, baris, cache):
+        kolom = dict(zip(self._KOLOM, baris))
+        posko = self._posko_repo._muat(kolom["id_posko"], cache)
+        if kolom["peran"] == "Korban":
+            return korban_dari_kolom(kolom, posko)
+        return tenaga_medis_dari_kolom(kolom, posko)
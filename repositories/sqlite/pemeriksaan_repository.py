@@ -0,0 +1,83 @@
+from datetime import date
+
+from models.pemeriksaan import Pemeriksaan
+from utils.enums.status_triase import StatusTriase
+from .base_sqlite_repository import BaseSQLiteRepository
+from .connection_pool import SQLiteConnectionPool
+from .korban_repository import KorbanRepositorySQLite
+from .tenaga_medis_repository import TenagaMedisRepositorySQLite
+
+
+class PemeriksaanRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data pemeriksaan.
+
+    Menyimpan objek Pemeriksaan di tabel `pemeriksaan` (primary key: id_pemeriksaan).
+    """
+
+    _NAMA_ENTITAS = "Pemeriksaan"
+    _TABEL = "pemeriksaan"
+    _KOLOM = (
+        "id_pemeriksaan",
+        "id_tenaga_medis",
+        "id_korban",
+        "tanggal_pemeriksaan",
+        "keluhan",
+        "diagnosa",
+        "status_triase",
+    )
+    _SKEMA_TAMBAHAN = (
+        "CREATE INDEX IF NOT EXISTS idx_pemeriksaan_korban ON pemeriksaan (id_korban)",
+    )
+
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        korban_repo: KorbanRepositorySQLite,
+        tenaga_medis_repo: TenagaMedisRepositorySQLite,
+    ):
+        """
+        Inisialisasi repository pemeriksaan.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            korban_repo (KorbanRepositorySQLite): Repository untuk memuat Korban.
+            tenaga_medis_repo (TenagaMedisRepositorySQLite): Repository untuk memuat TenagaMedis.
+        """
+        self._korban_repo = korban_repo
+        self._tenaga_medis_repo = tenaga_medis_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_pemeriksaan()
+
+    def _ke_baris(self, data):
+        return (
+            data.get_id_pemeriksaan(),
+            data.get_tenaga_medis().get_id_orang(),
+            data.get_korban().get_id_orang(),
+            data.get_tanggal_pemeriksaan().isoformat(),
+            data.get_keluhan(),
+            data.get_diagnosa(),
+            data.get_status_triase().value,
+        )
+
+    def _dari_baris(self, conn, baris, cache):
+        (
+            id_pemeriksaan,
+            id_tenaga_medis,
+            id_korban,
+            tanggal_pemeriksaan,
+            keluhan,
+            diagnosa,
+            status_triase,
+        ) = baris
+        return Pemeriksaan._dari_tepercaya(
+            id_pemeriksaan=id_pemeriksaan,
+            tenaga_medis=self._tenaga_medis_repo._muat(id_tenaga_medis, cache),
+            korban=self._korban_repo._muat(id_korban, cache),
+            tanggal_pemeriksaan=date.fromisoformat(tanggal_pemeriksaan),
+            keluhan=keluhan,
+            diagnosa=diagnosa,
+            status_triase=StatusTriase(status_triase),
+        )
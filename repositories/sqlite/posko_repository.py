@@ -0,0 +1,66 @@
+from models.posko import Posko
+from utils.enums.status_posko import StatusPosko
+from .base_sqlite_repository import BaseSQLiteRepository
+from .bencana_repository import BencanaRepositorySQLite
+from .connection_pool import SQLiteConnectionPool
+
+
+class PoskoRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data posko.
+
+    Menyimpan objek Posko di tabel `posko` (primary key: id_posko).
+    Referensi Bencana disimpan sebagai id_bencana dan dimuat ulang
+    melalui BencanaRepositorySQLite.
+    """
+
+    _NAMA_ENTITAS = "Posko"
+    _TABEL = "posko"
+    _KOLOM = ("id_posko", "id_bencana", "nama_posko", "alamat_posko", "kapasitas_posko", "status_posko")
+    _TIPE_KOLOM = {"kapasitas_posko": "INTEGER"}
+    _SKEMA_TAMBAHAN = (
+        "CREATE INDEX IF NOT EXISTS idx_posko_bencana ON posko (id_bencana)",
+    )
+
+    def __init__(self, pool: SQLiteConnectionPool, bencana_repo: BencanaRepositorySQLite):
+        """
+        Inisialisasi repository posko.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            bencana_repo (BencanaRepositorySQLite): Repository untuk memuat Bencana.
+        """
+        self._bencana_repo = bencana_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_posko()
+
+    def _ke_baris(self, data):
+        return (
+            data.get_id_posko(),
+            data.get_bencana().get_id_bencana(),
+            data.get_nama_posko(),
+            data.get_alamat_posko(),
+            data.get_kapasitas_posko(),
+            data.get_status_posko().value,
+        )
+
+    def _dari_baris(self, conn, baris, cache):
+        id_posko, id_bencana, nama_posko, alamat_posko, kapasitas_posko, status_posko = baris
+        return Posko._dari_tepercaya(
+            id_posko=id_posko,
+            bencana=self._bencana_repo._muat(id_bencana, cache),
+            nama_posko=nama_posko,
+            alamat_posko=alamat_posko,
+            kapasitas_posko=kapasitas_posko,
+            status_posko=StatusPosko(status_posko),
+        )
+
+    # ====== QUERY BERDASARKAN INDEKS ======
+
+    def ambil_berdasarkan_bencana(self, id_bencana):
+        """Mengambil semua posko milik satu bencana."""
+        hasil = self._cari("id_bencana = ?", (id_bencana,))
+        self.logger.info("Mengambil posko bencana ID %s (jumlah=%s)", id_bencana, len(hasil))
+        return hasil
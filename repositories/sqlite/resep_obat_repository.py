@@ -0,0 +1,101 @@
+from datetime import date
+
+from models.resep_item import ResepItem
+from models.resep_obat import ResepObat
+from .base_sqlite_repository import BaseSQLiteRepository
+from .connection_pool import SQLiteConnectionPool
+from .obat_repository import ObatRepositorySQLite
+from .pemeriksaan_repository import PemeriksaanRepositorySQLite
+
+
+class ResepObatRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk ResepObat.
+
+    Header disimpan di tabel `resep_obat` (primary key: id_resep),
+    item disimpan di tabel anak `resep_item` (id_resep, urutan).
+    """
+
+    _NAMA_ENTITAS = "Resep"
+    _TABEL = "resep_obat"
+    _KOLOM = ("id_resep", "id_pemeriksaan", "tanggal_resep")
+    _SKEMA_TAMBAHAN = (
+        "CREATE TABLE IF NOT EXISTS resep_item ("
+        "id_resep TEXT, urutan INTEGER, id_obat TEXT, qty INTEGER, "
+        "aturan_pakai TEXT, dosis INTEGER, PRIMARY KEY (id_resep, urutan))",
+    )
+
+    _SQL_INSERT_ITEM = (
+        "INSERT INTO resep_item (id_resep, urutan, id_obat, qty, aturan_pakai, dosis) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    _SQL_AMBIL_ITEM = (
+        "SELECT id_obat, qty, aturan_pakai, dosis FROM resep_item "
+        "WHERE id_resep = ? ORDER BY urutan"
+    )
+    _SQL_HAPUS_ITEM = "DELETE FROM resep_item WHERE id_resep = ?"
+
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        pemeriksaan_repo: PemeriksaanRepositorySQLite,
+        obat_repo: ObatRepositorySQLite,
+    ):
+        """
+        Inisialisasi repository resep obat.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            pemeriksaan_repo (PemeriksaanRepositorySQLite): Repository untuk memuat Pemeriksaan.
+            obat_repo (ObatRepositorySQLite): Repository untuk memuat Obat.
+        """
+        self._pemeriksaan_repo = pemeriksaan_repo
+        self._obat_repo = obat_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_resep()
+
+    def _ke_baris(self, data):
+        return (
+            data.get_id_resep(),
+            data.get_pemeriksaan().get_id_pemeriksaan(),
+            data.get_tanggal_resep().isoformat(),
+        )
+
+    def _simpan_anak(self, conn, data):
+        conn.executemany(
+            self._SQL_INSERT_ITEM,
+            [
+                (
+                    data.get_id_resep(),
+                    urutan,
+                    item.get_obat().get_id_obat(),
+                    item.get_qty(),
+                    item.get_aturan_pakai(),
+                    item.get_dosis(),
+                )
+                for urutan, item in enumerate(data.get_items())
+            ],
+        )
+
+    def _hapus_anak(self, conn, data_id):
+        conn.execute(self._SQL_HAPUS_ITEM, (data_id,))
+
+    def _dari_baris(self, conn, baris, cache):
+        id_resep, id_pemeriksaan, tanggal_resep = baris
+        items = [
+            ResepItem._dari_tepercaya(
+                obat=self._obat_repo._muat(id_obat, cache),
+                qty=qty,
+                aturan_pakai=aturan_pakai,
+                dosis=dosis,
+            )
+            for id_obat, qty, aturan_pakai, dosis in conn.execute(self._SQL_AMBIL_ITEM, (id_resep,)).fetchall()
+        ]
+        return ResepObat._dari_tepercaya(
+            id_resep=id_resep,
+            pemeriksaan=self._pemeriksaan_repo._muat(id_pemeriksaan, cache),
+            items=items,
+            tanggal_resep=date.fromisoformat(tanggal_resep),
+        )
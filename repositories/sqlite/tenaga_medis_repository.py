@@ -0,0 +1,82 @@
+from datetime import date
+
+from models.tenaga_medis import TenagaMedis
+from utils.enums.jenis_kelamin import JenisKelamin
+from utils.enums.role_tenaga_medis import RoleTenagaMedis
+from .base_sqlite_repository import BaseSQLiteRepository
+from .connection_pool import SQLiteConnectionPool
+from .posko_repository import PoskoRepositorySQLite
+
+
+def tenaga_medis_ke_kolom(tenaga_medis: TenagaMedis) -> dict:
+    """Mengonversi TenagaMedis menjadi dict kolom (dipakai juga oleh tabel orang)."""
+    return {
+        "id_orang": tenaga_medis.get_id_orang(),
+        "nama_orang": tenaga_medis.get_nama_orang(),
+        "alamat_orang": tenaga_medis.get_alamat_orang(),
+        "jenis_kelamin_orang": tenaga_medis.get_jenis_kelamin_orang().value,
+        "tanggal_lahir_orang": tenaga_medis.get_tanggal_lahir_orang().isoformat(),
+        "id_posko": tenaga_medis.get_posko().get_id_posko(),
+        "no_izin_praktik": tenaga_medis.get_no_izin_praktik(),
+        "role": tenaga_medis.get_role().value,
+        "spesialisasi": tenaga_medis.get_spesialisasi(),
+    }
+
+
+def tenaga_medis_dari_kolom(kolom: dict, posko) -> TenagaMedis:
+    """Membangun TenagaMedis dari dict kolom dan objek Posko yang sudah dimuat (tanpa validasi ulang)."""
+    return TenagaMedis._dari_tepercaya(
+        id_orang=kolom["id_orang"],
+        nama_orang=kolom["nama_orang"],
+        alamat_orang=kolom["alamat_orang"],
+        jenis_kelamin_orang=JenisKelamin(kolom["jenis_kelamin_orang"]),
+        tanggal_lahir_orang=date.fromisoformat(kolom["tanggal_lahir_orang"]),
+        posko=posko,
+        no_izin_praktik=kolom["no_izin_praktik"],
+        role=RoleTenagaMedis(kolom["role"]),
+        spesialisasi=kolom["spesialisasi"],
+    )
+
+
+class TenagaMedisRepositorySQLite(BaseSQLiteRepository):
+    """
+    Repository SQLite untuk mengelola data tenaga medis.
+
+    Menyimpan objek TenagaMedis di tabel `tenaga_medis` (primary key: id_orang).
+    """
+
+    _NAMA_ENTITAS = "TenagaMedis"
+    _TABEL = "tenaga_medis"
+    _KOLOM = (
+        "id_orang",
+        "nama_orang",
+        "alamat_orang",
+        "jenis_kelamin_orang",
+        "tanggal_lahir_orang",
+        "id_posko",
+        "no_izin_praktik",
+        "role",
+        "spesialisasi",
+    )
+
+    def __init__(self, pool: SQLiteConnectionPool, posko_repo: PoskoRepositorySQLite):
+        """
+        Inisialisasi repository tenaga medis.
+
+        Args:
+            pool (SQLiteConnectionPool): Pool koneksi yang dipakai bersama.
+            posko_repo (PoskoRepositorySQLite): Repository untuk memuat Posko.
+        """
+        self._posko_repo = posko_repo
+        super().__init__(pool)
+
+    def _ambil_id(self, data):
+        return data.get_id_orang()
+
+    def _ke_baris(self, data):
+        kolom = tenaga_medis_ke_kolom(data)
+        return tuple(kolom[k] for k in self._KOLOM)
+
+    def _dari_baris(self, conn, baris, cache):
+        kolom = dict(zip(self._KOLOM, baris))
+        return tenaga_medis_dari_kolom(kolom, self._posko_repo._muat(kolom["id_posko"], cache))
@@ -0,0 +1,210 @@
+from collections.abc import Callable
+from contextlib import ExitStack
+
+from utils.loggers import get_logger
+from .base_repository import BaseRepository
+
+
+class UnitOfWork:
+    """
+    Satu unit kerja yang menulis ke beberapa repository sekaligus (semua atau tidak sama sekali).
+
+    Penulisan (tambah/tambah_banyak/perbarui/hapus) hanya dicatat (staged) lalu dijalankan
+    berurutan saat commit(). Selama commit, transaksi() setiap repository
+    dibuka lebih dulu: repository SQLite yang berbagi pool digabung ke satu
+    transaksi database (satu COMMIT untuk seluruh penulisan), sedangkan
+    repository in-memory dibatalkan dengan operasi kompensasi (hapus yang
+    ditambah, kembalikan objek lama yang diperbarui/dihapus beserta versi
+    lamanya lewat repo._pulihkan()).
+
+    Jika satu langkah gagal (repository mengembalikan False) atau terjadi
+    exception, seluruh langkah dibatalkan, fungsi saat_rollback() dijalankan,
+    dan exception diteruskan ke pemanggil. Konflik versi pada perbarui()
+    diteruskan sebagai KonflikVersi (subclass RuntimeError).
+
+    Contoh:
+        with UnitOfWork() as uow:
+            uow.tambah(orang_repo, korban.get_id_orang(), korban)
+            uow.tambah(korban_repo, korban.get_id_orang(), korban)
+        # commit otomatis di akhir blok, rollback jika ada exception
+    """
+
+    def __init__(self):
+        """Inisialisasi unit kerja kosong."""
+        self._langkah: list[tuple[str, BaseRepository, object, object, int | None]] = []  # (operasi, repo, data_id, data, versi_diharapkan)
+        self._saat_rollback: list[Callable[[], None]] = []
+        self._selesai = False
+        self._logger = get_logger(__name__)
+
+    # ====== STAGING ======
+
+    def tambah(self, repo: BaseRepository, data_id, data) -> None:
+        """
+        Menjadwalkan repo.tambah(data).
+
+        Args:
+            repo (BaseRepository): Repository tujuan.
+            data_id (str|int): ID data (untuk kompensasi).
+            data (object): Objek yang akan disimpan.
+        """
+        self._jadwalkan("tambah", repo, data_id, data)
+
+    def tambah_banyak(self, repo: BaseRepository, daftar_id: list, daftar_data: list) -> None:
+        """
+        Menjadwalkan repo.tambah_banyak(daftar_data) sebagai satu langkah.
+
+        Seluruh objek harus tersimpan; jika satu saja ditolak (misal ID
+        duplikat), seluruh unit kerja dibatalkan.
+
+        Args:
+            repo (BaseRepository): Repository tujuan.
+            daftar_id (list): ID per objek (untuk kompensasi), sesuai urutan daftar_data.
+            daftar_data (list): Objek-objek yang akan disimpan.
+        """
+        self._jadwalkan("tambah_banyak", repo, list(daftar_id), list(daftar_data))
+
+    def perbarui(self, repo: BaseRepository, data_id, data, versi_diharapkan: int | None = None) -> None:
+        """
+        Menjadwalkan repo.perbarui(data_id, data, versi_diharapkan).
+
+        Args:
+            repo (BaseRepository): Repository tujuan.
+            data_id (str|int): ID data yang diperbarui.
+            data (object): Data baru.
+            versi_diharapkan (int | None, optional): Versi yang dibaca pemanggil
+                (None = timpa tanpa cek versi).
+        """
+        self._jadwalkan("perbarui", repo, data_id, data, versi_diharapkan)
+
+    def hapus(self, repo: BaseRepository, data_id) -> None:
+        """
+        Menjadwalkan repo.hapus(data_id).
+
+        Args:
+            repo (BaseRepository): Repository tujuan.
+            data_id (str|int): ID data yang dihapus.
+        """
+        self._jadwalkan("hapus", repo, data_id, None)
+
+    def saat_rollback(self, fungsi: Callable[[], None]) -> None:
+        """
+        Mendaftarkan fungsi yang dijalankan jika unit kerja dibatalkan.
+
+        Dipakai untuk efek di luar repository, misalnya membatalkan reservasi
+        stok atau mengembalikan perubahan objek yang dimutasi langsung.
+        Dijalankan sebelum kompensasi repository.
+
+        Args:
+            fungsi (Callable[[], None]): Fungsi kompensasi tanpa argumen.
+        """
+        self._saat_rollback.append(fungsi)
+
+    def _jadwalkan(self, operasi: str, repo: BaseRepository, data_id, data, versi_diharapkan=None) -> None:
+        if self._selesai:
+            raise RuntimeError("Unit of work sudah selesai")
+        self._langkah.append((operasi, repo, data_id, data, versi_diharapkan))
+
+    # ====== COMMIT / ROLLBACK ======
+
+    def commit(self) -> None:
+        """
+        Menjalankan seluruh langkah yang dijadwalkan dalam satu transaksi.
+
+        Raises:
+            RuntimeError: Jika salah satu langkah gagal (seluruh langkah dibatalkan).
+        """
+        if self._selesai:
+            raise RuntimeError("Unit of work sudah selesai")
+        self._selesai = True
+
+        kompensasi: list[Callable[[], None]] = []
+        try:
+            with ExitStack() as stack:
+                atomik: dict[int, bool] = {}
+                for _, repo, _, _, _ in self._langkah:
+                    if id(repo) not in atomik:
+                        atomik[id(repo)] = stack.enter_context(repo.transaksi())
+
+                for operasi, repo, data_id, data, versi in self._langkah:
+                    batalkan = self._jalankan(operasi, repo, data_id, data, versi, simpan_lama=not atomik[id(repo)])
+                    if not atomik[id(repo)]:
+                        kompensasi.append(batalkan)
+        except BaseException:
+            self._logger.error("Unit of work gagal, rollback %s langkah", len(kompensasi))
+            # Objek yang dimutasi langsung dikembalikan dulu, agar kompensasi
+            # repository (misal indeks sekunder) memakai keadaan lamanya.
+            self._jalankan_saat_rollback()
+            for batalkan in reversed(kompensasi):
+                try:
+                    batalkan()
+                except Exception:
+                    self._logger.exception("Kompensasi unit of work gagal")
+            raise
+        finally:
+            self._langkah.clear()
+
+        self._saat_rollback.clear()
+
+    def rollback(self) -> None:
+        """Membuang langkah yang belum di-commit dan menjalankan fungsi saat_rollback()."""
+        if self._selesai:
+            return
+        self._selesai = True
+        self._langkah.clear()
+        self._jalankan_saat_rollback()
+
+    def _jalankan_saat_rollback(self) -> None:
+        for fungsi in reversed(self._saat_rollback):
+            try:
+                fungsi()
+            except Exception:
+                self._logger.exception("Fungsi saat_rollback gagal")
+        self._saat_rollback.clear()
+
+    @staticmethod
+    def _jalankan(operasi: str, repo: BaseRepository, data_id, data, versi, simpan_lama: bool) -> Callable[[], None]:
+        """Menjalankan satu langkah; mengembalikan fungsi kompensasinya."""
+        # Versi lama ikut disimpan: kompensasi lewat perbarui()/tambah() biasa akan
+        # menaikkan/mereset versi dan memicu KonflikVersi palsu bagi pembaca lain
+        lama, versi_lama = (
+            repo.ambil_dengan_versi(data_id)
+            if simpan_lama and operasi not in ("tambah", "tambah_banyak")
+            else (None, None)
+        )
+
+        if operasi == "tambah":
+            sukses = repo.tambah(data)
+            batalkan = lambda: repo.hapus(data_id)  # noqa: E731
+        elif operasi == "tambah_banyak":
+            tersimpan = [i for i, ok in zip(data_id, repo.tambah_banyak(data)) if ok]
+            batalkan = lambda: [repo.hapus(i) for i in reversed(tersimpan)]  # noqa: E731
+            sukses = len(tersimpan) == len(data)
+            if not sukses and simpan_lama:
+                batalkan()  # langkah gagal tidak masuk daftar kompensasi
+        elif operasi == "perbarui":
+            sukses = repo.perbarui(data_id, data, versi)
+            batalkan = lambda: repo._pulihkan(data_id, lama, versi_lama)  # noqa: E731
+        else:
+            sukses = repo.hapus(data_id)
+            batalkan = lambda: repo._pulihkan(data_id, lama, versi_lama)  # noqa: E731
+
+        if not sukses:
+            if operasi == "tambah_banyak":
+                raise RuntimeError(
+                    f"Gagal tambah_banyak {len(data) - len(tersimpan)} dari {len(data)} data di {type(repo).__name__}"
+                )
+            raise RuntimeError(f"Gagal {operasi} data (id={data_id}) di {type(repo).__name__}")
+        return batalkan
+
+    # ====== CONTEXT MANAGER ======
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, tipe_error, error, traceback) -> bool:
+        if tipe_error is None:
+            if not self._selesai:  # commit() boleh dipanggil eksplisit di dalam blok
+                self.commit()
+        else:
+            self.rollback()
+        return False
@@ -0,0 +1,310 @@
+import threading
+from collections.abc import Iterable
+from datetime import date
+
+import numpy as np
+
+from utils.loggers import get_logger
+
+from models.obat import Obat
+from models.resep_obat import ResepObat
+from services.reservasi_stok import ReservasiStok
+
+
+class AnalitikKonsumsi:
+    """
+    Analitik konsumsi obat per bencana: laju pemakaian, ramalan, dan sisa hari persediaan.
+
+    Setiap pasangan (id_bencana, id_obat) punya satu baris counter harian
+    di matriks NumPy berbentuk (baris, jendela_hari). Kolom dipakai
+    bergilir (ring buffer) menurut nomor hari, jadi resep yang dicatat
+    cukup menambah satu sel dan pergantian hari hanya mengosongkan kolom
+    hari yang baru masuk jendela. Seluruh perhitungan dilakukan sekaligus
+    untuk semua baris (vektor), tanpa memutar ulang riwayat resep.
+
+    Stok terkini tiap obat diikuti lewat pendengar ReservasiStok. Karena
+    stok tidak dibagi per bencana, sisa hari persediaan dihitung dari
+    stok obat dibagi total ramalan pemakaian obat itu di semua bencana.
+
+    Membutuhkan NumPy (pip install numpy).
+    """
+
+    def __init__(self, reservasi_stok: ReservasiStok | None = None, jendela_hari: int = 28):
+        """
+        Inisialisasi analitik konsumsi.
+
+        Args:
+            reservasi_stok (ReservasiStok | None, optional): Jika diisi, stok obat
+                diikuti otomatis dari perubahan stok. Default: None.
+            jendela_hari (int, optional): Banyaknya hari terakhir yang disimpan. Default: 28.
+
+        Raises:
+            ValueError: Jika jendela_hari bukan integer positif.
+        """
+        if not isinstance(jendela_hari, int) or jendela_hari <= 0:
+            raise ValueError("Jendela hari harus integer positif")
+
+        self._jendela = jendela_hari
+        self._baris: dict[tuple[str, str], int] = {}  # key: (id_bencana, id_obat), value: nomor baris
+        self._kunci_baris: list[tuple[str, str]] = []
+        self._indeks_obat: dict[str, int] = {}  # key: id_obat, value: indeks di _stok
+        self._harian = np.zeros((64, jendela_hari))  # float64 agar langsung bisa dikali bobot
+        self._obat_baris = np.zeros(64, dtype=np.int64)  # indeks obat untuk tiap baris
+        self._stok = np.zeros(64, dtype=np.int64)
+        self._hari_terakhir: int | None = None  # date.toordinal() kolom terbaru
+        self._kunci = threading.Lock()
+        self._logger = get_logger(__name__)
+
+        if reservasi_stok is not None:
+            reservasi_stok.tambah_pendengar(self.perbarui_stok)
+
+    # ====== HELPER INTERNAL (lock sudah dipegang) ======
+
+    def _idx_obat(self, id_obat: str) -> int:
+        idx = self._indeks_obat.get(id_obat)
+        if idx is None:
+            idx = len(self._indeks_obat)
+            self._indeks_obat[id_obat] = idx
+            if idx >= len(self._stok):
+                self._stok = np.concatenate([self._stok, np.zeros(len(self._stok), dtype=np.int64)])
+        return idx
+
+    def _idx_baris(self, id_bencana: str, id_obat: str) -> int:
+        kunci = (id_bencana, id_obat)
+        idx = self._baris.get(kunci)
+        if idx is None:
+            idx = len(self._kunci_baris)
+            if idx >= len(self._harian):
+                self._harian = np.vstack([self._harian, np.zeros_like(self._harian)])
+                self._obat_baris = np.concatenate([self._obat_baris, np.zeros_like(self._obat_baris)])
+            self._baris[kunci] = idx
+            self._kunci_baris.append(kunci)
+            self._obat_baris[idx] = self._idx_obat(id_obat)
+        return idx
+
+    def _geser_ke(self, hari: int) -> None:
+        """Memajukan jendela ke hari tertentu dan mengosongkan kolom hari yang terlewati."""
+        if self._hari_terakhir is None:
+            self._hari_terakhir = hari
+            return
+        if hari <= self._hari_terakhir:
+            return
+
+        lompat = min(hari - self._hari_terakhir, self._jendela)
+        kolom = [(hari - i) % self._jendela for i in range(lompat)]
+        self._harian[:, kolom] = 0
+        self._hari_terakhir = hari
+
+    def _kali_bobot(self, bobot: np.ndarray, hari_ini: date | None) -> np.ndarray:
+        """
+        Mengalikan counter semua baris dengan bobot per hari (urut terlama -> hari_ini).
+
+        Bobot yang diputar ke posisi kolom ring buffer, bukan matriksnya,
+        jadi tidak ada salinan matriks per query. Query tidak memajukan
+        jendela: hari setelah hari terakhir tercatat diberi bobot nol
+        (belum ada pemakaian), sehingga pembacaan tidak mengubah counter.
+
+        Raises:
+            ValueError: Jika hari_ini sebelum hari terakhir yang sudah tercatat
+                (kolom hari sebelum jendelanya sudah ditimpa).
+        """
+        hari = (hari_ini or date.today()).toordinal()
+        with self._kunci:
+            jumlah_baris = len(self._kunci_baris)
+            if self._hari_terakhir is None:
+                return np.zeros(jumlah_baris)
+            if hari < self._hari_terakhir:
+                raise ValueError(
+                    f"hari_ini tidak boleh sebelum hari terakhir yang tercatat "
+                    f"({date.fromordinal(self._hari_terakhir)})"
+                )
+
+            daftar_hari = np.arange(hari - self._jendela + 1, hari + 1)
+            tercatat = daftar_hari <= self._hari_terakhir
+            bobot_kolom = np.zeros(self._jendela)
+            bobot_kolom[daftar_hari[tercatat] % self._jendela] = bobot[tercatat]
+            return self._harian[:jumlah_baris] @ bobot_kolom
+
+    # ====== PENCATATAN ======
+
+    def catat(self, id_bencana: str, id_obat: str, qty: int, tanggal: date) -> None:
+        """
+        Mencatat pemakaian obat pada satu hari.
+
+        Pemakaian yang lebih tua dari jendela hari diabaikan.
+
+        Args:
+            id_bencana (str): ID bencana.
+            id_obat (str): ID obat.
+            qty (int): Jumlah yang dikeluarkan.
+            tanggal (date): Tanggal pemakaian.
+        """
+        hari = tanggal.toordinal()
+        with self._kunci:
+            self._geser_ke(hari)
+            if hari <= self._hari_terakhir - self._jendela:
+                return
+            baris = self._idx_baris(id_bencana, id_obat)  # bisa memperbesar _harian
+            self._harian[baris, hari % self._jendela] += qty
+
+    def catat_resep(self, resep: ResepObat) -> None:
+        """
+        Mencatat seluruh item resep yang sudah tersimpan.
+
+        Args:
+            resep (ResepObat): Resep yang baru dibuat.
+        """
+        id_bencana = resep.get_pemeriksaan().get_korban().get_posko().get_bencana().get_id_bencana()
+        for item in resep.get_items():
+            self.catat(id_bencana, item.get_obat().get_id_obat(), item.get_qty(), resep.get_tanggal_resep())
+
+    def isi_dari(self, daftar_resep: Iterable[ResepObat]) -> None:
+        """
+        Mengisi counter dari resep yang sudah tersimpan (misal saat start dengan backend SQLite).
+
+        Args:
+            daftar_resep (Iterable[ResepObat]): Resep yang akan dicatat.
+        """
+        for resep in daftar_resep:
+            self.catat_resep(resep)
+
+    def perbarui_stok(self, id_obat: str, obat: Obat | None) -> None:
+        """
+        Mengikuti stok terkini satu obat (dipanggil oleh ReservasiStok).
+
+        Args:
+            id_obat (str): ID obat.
+            obat (Obat | None): Obat terkini, atau None jika obat dihapus.
+        """
+        with self._kunci:
+            idx = self._idx_obat(id_obat)  # bisa memperbesar _stok
+            self._stok[idx] = 0 if obat is None else obat.get_stock_obat()
+
+    def isi_stok_dari(self, daftar_obat: Iterable[Obat]) -> None:
+        """
+        Mengisi stok awal dari obat yang sudah tersimpan.
+
+        Args:
+            daftar_obat (Iterable[Obat]): Obat yang akan dicatat stoknya.
+        """
+        for obat in daftar_obat:
+            self.perbarui_stok(obat.get_id_obat(), obat)
+
+    # ====== ANALITIK (vektor untuk semua baris) ======
+
+    def kunci(self) -> list[tuple[str, str]]:
+        """
+        Mengambil urutan baris hasil analitik.
+
+        Returns:
+            list[tuple[str, str]]: (id_bencana, id_obat) sesuai urutan array hasil.
+        """
+        with self._kunci:
+            return list(self._kunci_baris)
+
+    def laju_konsumsi(self, hari: int = 7, hari_ini: date | None = None) -> np.ndarray:
+        """
+        Menghitung rata-rata pemakaian per hari selama beberapa hari terakhir.
+
+        Args:
+            hari (int, optional): Banyaknya hari (maks. jendela_hari). Default: 7.
+            hari_ini (date | None, optional): Default: date.today().
+
+        Returns:
+            np.ndarray: Laju per hari untuk tiap baris kunci().
+
+        Raises:
+            ValueError: Jika hari di luar 1..jendela_hari atau hari_ini sebelum
+                hari terakhir yang tercatat.
+        """
+        if not isinstance(hari, int) or not 0 < hari <= self._jendela:
+            raise ValueError(f"Hari harus antara 1 dan {self._jendela}")
+        bobot = np.zeros(self._jendela)
+        bobot[-hari:] = 1 / hari
+        return self._kali_bobot(bobot, hari_ini)
+
+    def ramalan_eksponensial(self, alpha: float = 0.3, hari_ini: date | None = None) -> np.ndarray:
+        """
+        Meramal pemakaian per hari berikutnya dengan exponential smoothing sederhana.
+
+        Smoothing s_t = alpha * x_t + (1 - alpha) * s_(t-1) atas seluruh jendela
+        (s_0 = x_0) dihitung sebagai satu perkalian matriks dengan bobot
+        alpha * (1 - alpha)^k.
+
+        Args:
+            alpha (float, optional): Faktor smoothing (0 < alpha <= 1). Default: 0.3.
+            hari_ini (date | None, optional): Default: date.today().
+
+        Returns:
+            np.ndarray: Ramalan pemakaian per hari untuk tiap baris kunci().
+
+        Raises:
+            ValueError: Jika alpha di luar (0, 1] atau hari_ini sebelum hari
+                terakhir yang tercatat.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("Alpha harus di antara 0 dan 1")
+
+        umur = np.arange(self._jendela - 1, -1, -1)  # 0 = hari_ini
+        bobot = alpha * (1 - alpha) ** umur
+        bobot[0] = (1 - alpha) ** (self._jendela - 1)
+        return self._kali_bobot(bobot, hari_ini)
+
+    def hari_sampai_habis(self, alpha: float = 0.3, hari_ini: date | None = None) -> np.ndarray:
+        """
+        Memperkirakan sisa hari sampai stok obat habis.
+
+        Args:
+            alpha (float, optional): Faktor smoothing ramalan. Default: 0.3.
+            hari_ini (date | None, optional): Default: date.today().
+
+        Returns:
+            np.ndarray: Sisa hari untuk tiap baris kunci() (inf jika tidak ada pemakaian).
+        """
+        ramalan = self.ramalan_eksponensial(alpha, hari_ini)
+        with self._kunci:
+            obat_baris = self._obat_baris[: len(ramalan)]
+            stok = self._stok[: len(self._indeks_obat)]
+        total_per_obat = np.bincount(obat_baris, weights=ramalan, minlength=len(stok))
+        pemakaian = total_per_obat[obat_baris]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hasil = stok[obat_baris] / pemakaian
+        hasil[pemakaian <= 0] = np.inf
+        return hasil
+
+    def ringkasan(
+        self,
+        id_bencana: str | None = None,
+        hari: int = 7,
+        alpha: float = 0.3,
+        hari_ini: date | None = None,
+    ) -> list[dict]:
+        """
+        Menyusun laporan hari persediaan per obat (opsional untuk satu bencana).
+
+        Args:
+            id_bencana (str | None, optional): Filter bencana. Default: semua.
+            hari (int, optional): Jendela laju konsumsi. Default: 7.
+            alpha (float, optional): Faktor smoothing ramalan. Default: 0.3.
+            hari_ini (date | None, optional): Default: date.today().
+
+        Returns:
+            list[dict]: {"id_bencana", "id_obat", "laju", "ramalan", "hari_sampai_habis"} per baris.
+        """
+        kunci = self.kunci()
+        laju = self.laju_konsumsi(hari, hari_ini)[: len(kunci)]
+        ramalan = self.ramalan_eksponensial(alpha, hari_ini)[: len(kunci)]
+        sisa_hari = self.hari_sampai_habis(alpha, hari_ini)[: len(kunci)]
+
+        return [
+            {
+                "id_bencana": b,
+                "id_obat": o,
+                "laju": float(laju[i]),
+                "ramalan": float(ramalan[i]),
+                "hari_sampai_habis": float(sisa_hari[i]),
+            }
+            for i, (b, o) in enumerate(kunci)
+            if id_bencana is None or b == id_bencana
+        ]
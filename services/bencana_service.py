@@ -1,4 +1,5 @@
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
 
 from utils.loggers import get_logger
 from utils.generator_id import generate_id
@@ -58,7 +59,8 @@ class BencanaService:
         status_enum: StatusBencana = parse_enum(StatusBencana, status)
 
         self._logger.info(
-            f"Membuat bencana baru id_bencana={id_bencana}, status={status_enum.value} ({datetime.now()})"
+            "Membuat bencana baru id_bencana=%s, status=%s",
+            id_bencana, status_enum.value,
         )
 
         # Setter dipanggil otomatis di constructor model
@@ -71,9 +73,7 @@ class BencanaService:
         )
 
         if not self._repo.tambah(bencana):
-            self._logger.error(
-                f"Gagal menyimpan bencana id_bencana={id_bencana} ({datetime.now()})"
-            )
+            self._logger.error("Gagal menyimpan bencana id_bencana=%s", id_bencana)
             raise RuntimeError("Gagal menyimpan bencana (ID duplikat).")
 
         return id_bencana
@@ -83,18 +83,54 @@ class BencanaService:
         """
         Mengambil bencana berdasarkan ID.
         """
-        self._logger.info(
-            f"Mengambil bencana id_bencana={id_bencana} ({datetime.now()})"
-        )
+        self._logger.info("Mengambil bencana id_bencana=%s", id_bencana)
         return self._repo.ambil_berdasarkan_id(id_bencana)
 
+    def ambil_bencana_dengan_versi(self, id_bencana: str) -> tuple[Bencana | None, int | None]:
+        """
+        Mengambil bencana beserta versinya, untuk perbarui_bencana(versi=...).
+        """
+        self._logger.info("Mengambil bencana id_bencana=%s beserta versi", id_bencana)
+        return self._repo.ambil_dengan_versi(id_bencana)
+
     def ambil_semua_bencana(self) -> list[Bencana]:
         """
         Mengambil semua data bencana.
         """
-        self._logger.info(f"Mengambil semua bencana ({datetime.now()})")
+        self._logger.info("Mengambil semua bencana")
         return self._repo.ambil_semua()
 
+    def iter_semua_bencana(self, ukuran_batch: int = 500) -> Iterator[Bencana]:
+        """
+        Mengiterasi seluruh data bencana secara streaming tanpa menyalin isi repository.
+        """
+        self._logger.info("Streaming semua bencana")
+        return self._repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_bencana(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[Bencana], str | None]:
+        """
+        Mengambil satu halaman data bencana (keyset pagination).
+
+        Args:
+            setelah_id (str | None): Cursor dari halaman sebelumnya (None = halaman pertama).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Bencana], str | None]: Isi halaman dan cursor halaman berikutnya.
+        """
+        self._logger.info("Mengambil halaman bencana setelah=%s batas=%s", setelah_id, batas)
+        return self._repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_bencana(self) -> int:
+        """
+        Menghitung jumlah data bencana.
+        """
+        return self._repo.hitung()
+
     # ===== UPDATE =====
     def perbarui_bencana(
         self,
@@ -103,14 +139,23 @@ class BencanaService:
         lokasi: str,
         tanggal_mulai: date,
         status: str,
+        versi: int | None = None,
     ) -> bool:
         """
-        Memperbarui data bencana berdasarkan ID.
+        Memperbarui data bencana berdasarkan ID tanpa mengunci (optimistic concurrency).
+
+        Args:
+            versi (int | None, optional): Versi dari ambil_bencana_dengan_versi().
+                None = versi yang dibaca di awal pemanggilan ini.
+
+        Raises:
+            KonflikVersi: Jika bencana sudah diubah pihak lain sejak versi tersebut.
         """
-        existing = self._repo.ambil_berdasarkan_id(id_bencana)
+        existing, versi_sekarang = self._repo.ambil_dengan_versi(id_bencana)
         if existing is None:
             self._logger.warning(
-                f"Gagal perbarui: bencana id_bencana={id_bencana} tidak ditemukan ({datetime.now()})"
+                "Gagal perbarui: bencana id_bencana=%s tidak ditemukan",
+                id_bencana,
             )
             return False
 
@@ -125,11 +170,11 @@ class BencanaService:
             status=status_enum,
         )
 
-        sukses = self._repo.perbarui(id_bencana, bencana_baru)
+        sukses = self._repo.perbarui(
+            id_bencana, bencana_baru, versi_diharapkan=versi_sekarang if versi is None else versi
+        )
         if sukses:
-            self._logger.info(
-                f"Bencana id_bencana={id_bencana} berhasil diperbarui ({datetime.now()})"
-            )
+            self._logger.info("Bencana id_bencana=%s berhasil diperbarui", id_bencana)
 
         return sukses
 
@@ -138,19 +183,13 @@ class BencanaService:
         """
         Menghapus bencana berdasarkan ID.
         """
-        self._logger.info(
-            f"Menghapus bencana id_bencana={id_bencana} ({datetime.now()})"
-        )
+        self._logger.info("Menghapus bencana id_bencana=%s", id_bencana)
         sukses = self._repo.hapus(id_bencana)
 
         if sukses:
-            self._logger.info(
-                f"Bencana id_bencana={id_bencana} berhasil dihapus ({datetime.now()})"
-            )
+            self._logger.info("Bencana id_bencana=%s berhasil dihapus", id_bencana)
         else:
-            self._logger.warning(
-                f"Gagal hapus: bencana id_bencana={id_bencana} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal hapus: bencana id_bencana=%s tidak ditemukan", id_bencana)
 
         return sukses
 
@@ -162,7 +201,8 @@ class BencanaService:
         bencana = self._repo.ambil_berdasarkan_id(id_bencana)
         if bencana is None:
             self._logger.warning(
-                f"Gagal ubah status: bencana id_bencana={id_bencana} tidak ditemukan ({datetime.now()})"
+                "Gagal ubah status: bencana id_bencana=%s tidak ditemukan",
+                id_bencana,
             )
             return False
 
@@ -174,7 +214,8 @@ class BencanaService:
         sukses = self._repo.perbarui(id_bencana, bencana)
         if sukses:
             self._logger.info(
-                f"Status bencana id_bencana={id_bencana} diubah menjadi {status_enum.value} ({datetime.now()})"
+                "Status bencana id_bencana=%s diubah menjadi %s",
+                id_bencana, status_enum.value,
             )
 
         return sukses
@@ -1,16 +1,23 @@
-from datetime import date, datetime
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timedelta
 
 from utils.loggers import get_logger
-from utils.generator_id import generate_id
+from utils.generator_id import adalah_id_waktu, batas_id_waktu, generate_id, generate_id_batch
 from utils.enums.jenis_kelamin import JenisKelamin
 from utils.enums.status_triase import StatusTriase
+from utils.enums.status_posko import StatusPosko
 from utils.enum_parser import parse_enum
+from utils.antrian_triase import AntrianTriase
 
 from models.korban import Korban
 from models.posko import Posko
 from models.orang import Orang
 
-from repositories.base_repository import BaseRepository
+from repositories.base_repository import BaseRepository, KonflikVersi
+from repositories.unit_of_work import UnitOfWork
 
 
 class KorbanService:
@@ -20,16 +27,28 @@ class KorbanService:
     Tanggung jawab:
     - Generate id_orang
     - Konversi enum (jenis_kelamin, status_triase)
-    - Validasi FK ke Posko
+    - Validasi FK ke Posko & kapasitas posko
     - Membuat object Korban (child dari Orang)
     - Menyimpan ke OrangRepository & KorbanRepository
+    - Menjaga antrian triase per posko tetap sinkron
+
+    Cek sisa kapasitas dan penyimpanan korban dilakukan di bawah lock per
+    posko, sehingga dua pendaftaran serentak tidak bisa sama-sama lolos cek
+    lalu membuat posko melebihi kapasitas. Lock dibagi semua KorbanService
+    di atas korban_repo yang sama (satu proses).
     """
 
+    _kunci_posko_per_repo: "weakref.WeakKeyDictionary[BaseRepository, dict[str, threading.Lock]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _kunci_daftar = threading.Lock()
+
     def __init__(
         self,
         korban_repo: BaseRepository,
         orang_repo: BaseRepository,
         posko_repo: BaseRepository,
+        antrian_triase: AntrianTriase | None = None,
     ):
         """
         Inisialisasi KorbanService.
@@ -38,11 +57,24 @@ class KorbanService:
             korban_repo (BaseRepository): Repository Korban.
             orang_repo (BaseRepository): Repository Orang.
             posko_repo (BaseRepository): Repository Posko.
+            antrian_triase (AntrianTriase | None, optional): Antrian yang dipakai
+                bersama PemeriksaanService. Jika None, dibuat baru dan diisi dari
+                korban yang sudah ada di repository. Default: None.
         """
         self._korban_repo = korban_repo
         self._orang_repo = orang_repo
         self._posko_repo = posko_repo
+        # Jika korban_repo dan orang_repo menampilkan penyimpanan yang sama,
+        # satu penulisan ke korban_repo sudah cukup (tanpa salinan kedua).
+        self._tulis_orang = not korban_repo.berbagi_penyimpanan(orang_repo)
         self._logger = get_logger(__name__)
+        with KorbanService._kunci_daftar:
+            self._kunci_posko_repo = KorbanService._kunci_posko_per_repo.setdefault(korban_repo, {})
+
+        if antrian_triase is None:
+            antrian_triase = AntrianTriase()
+            antrian_triase.isi_dari(korban_repo.iter_semua())
+        self._antrian_triase = antrian_triase
 
     # ===== CREATE =====
     def buat_korban(
@@ -55,78 +87,398 @@ class KorbanService:
         kondisi_awal: str,
         lokasi_ditemukan: str,
         id_posko: str,
+        alihkan_jika_penuh: bool = False,
     ) -> str:
         """
         Membuat Korban baru.
 
+        Args:
+            alihkan_jika_penuh (bool, optional): Jika True dan posko sudah penuh,
+                korban dialihkan ke posko aktif lain dari bencana yang sama yang
+                sisa kapasitasnya paling banyak. Default: False (ditolak).
+
         Returns:
             str: id_orang korban yang dibuat.
+
+        Raises:
+            ValueError: Jika posko tidak ditemukan atau sudah penuh.
         """
-        self._logger.info(f"Membuat korban baru ({datetime.now()})")
+        self._logger.info("Membuat korban baru")
 
         # ===== Validasi FK Posko =====
         posko: Posko | None = self._posko_repo.ambil_berdasarkan_id(id_posko)
         if posko is None:
             raise ValueError("Posko tidak ditemukan")
 
-        # ===== Generate ID =====
-        id_orang = generate_id()
-
         # ===== Parse Enum =====
         jk_enum: JenisKelamin = parse_enum(JenisKelamin, jenis_kelamin_orang)
         triase_enum: StatusTriase = parse_enum(StatusTriase, status_triase)
+        data = {
+            "nama_orang": nama_orang,
+            "alamat_orang": alamat_orang,
+            "jenis_kelamin_orang": jk_enum,
+            "tanggal_lahir_orang": tanggal_lahir_orang,
+            "status_triase": triase_enum,
+            "kondisi_awal": kondisi_awal,
+            "lokasi_ditemukan": lokasi_ditemukan,
+        }
 
-        # ===== Buat object Korban (child Orang) =====
-        korban = Korban(
-            id_orang=id_orang,
-            nama_orang=nama_orang,
-            alamat_orang=alamat_orang,
-            jenis_kelamin_orang=jk_enum,
-            tanggal_lahir_orang=tanggal_lahir_orang,
-            status_triase=triase_enum,
-            kondisi_awal=kondisi_awal,
-            lokasi_ditemukan=lokasi_ditemukan,
-            posko=posko,
+        # ===== Validasi kapasitas Posko + simpan (atomik per posko) =====
+        with self._kunci_posko(id_posko):
+            if self._sisa_kapasitas(posko) > 0:
+                return self._simpan_korban(posko, data)
+
+        if not alihkan_jika_penuh:
+            self._logger.warning("Posko id_posko=%s sudah penuh", id_posko)
+            raise ValueError("Posko sudah penuh")
+
+        # Kandidat dibaca tanpa lock; sisa kapasitasnya dicek ulang di bawah lock
+        for kandidat in self.cari_posko_tersedia(posko.get_bencana().get_id_bencana()):
+            with self._kunci_posko(kandidat.get_id_posko()):
+                if self._sisa_kapasitas(kandidat) > 0:
+                    self._logger.info(
+                        "Korban dialihkan dari posko id_posko=%s ke id_posko=%s",
+                        id_posko, kandidat.get_id_posko(),
+                    )
+                    return self._simpan_korban(kandidat, data)
+
+        self._logger.warning(
+            "Semua posko bencana id_bencana=%s sudah penuh", posko.get_bencana().get_id_bencana()
         )
+        raise ValueError("Semua posko untuk bencana ini sudah penuh")
 
-        # ===== Simpan ke OrangRepository =====
-        if not self._orang_repo.tambah(korban):
-            self._logger.error(
-                f"Gagal simpan Orang (Korban) id_orang={id_orang} ({datetime.now()})"
-            )
-            raise RuntimeError("Gagal menyimpan data orang (Korban)")
-
-        # ===== Simpan ke KorbanRepository =====
-        if not self._korban_repo.tambah(korban):
-            # rollback sederhana (opsional)
-            self._orang_repo.hapus(id_orang)
-            self._logger.error(
-                f"Gagal simpan Korban id_orang={id_orang} ({datetime.now()})"
-            )
+    def _simpan_korban(self, posko: Posko, data: dict) -> str:
+        """Membuat dan menyimpan satu Korban; dipanggil dengan lock posko tersebut."""
+        # ===== Generate ID =====
+        id_orang = generate_id()
+
+        # ===== Buat object Korban (child Orang) =====
+        korban = Korban(id_orang=id_orang, posko=posko, **data)
+
+        # ===== Simpan ke OrangRepository & KorbanRepository (semua atau tidak sama sekali) =====
+        try:
+            with UnitOfWork() as uow:
+                if self._tulis_orang:
+                    uow.tambah(self._orang_repo, id_orang, korban)
+                uow.tambah(self._korban_repo, id_orang, korban)
+        except RuntimeError:
+            self._logger.error("Gagal simpan Korban id_orang=%s", id_orang)
             raise RuntimeError("Gagal menyimpan data korban")
 
+        self._antrian_triase.masukkan(id_orang, posko.get_id_posko(), data["status_triase"])
+
+        self._logger.info("Korban id_orang=%s berhasil dibuat", id_orang)
+        return id_orang
+
+    def buat_korban_batch(self, records: list[dict], daftar_id: list[str] | None = None) -> list[dict]:
+        """
+        Membuat banyak Korban sekaligus (registrasi massal di lapangan).
+
+        Setiap record berisi key yang sama dengan parameter buat_korban().
+        Seluruh record divalidasi lebih dulu; record yang tidak valid tidak
+        menghentikan record lain. Record yang melebihi sisa kapasitas posko
+        ikut ditolak; posko yang dirujuk dikunci selama cek kapasitas dan
+        penyimpanan. Setiap posko hanya diambil sekali, ID
+        dialokasikan sekaligus, dan penyimpanan ke orang_repo/korban_repo
+        masing-masing dilakukan lewat satu tambah_banyak() dalam satu
+        UnitOfWork: jika penyimpanan gagal, seluruh record valid ikut gagal.
+
+        Args:
+            records (list[dict]): Data korban per baris.
+            daftar_id (list[str] | None, optional): ID per record sesuai urutan
+                records (misalnya ID deterministik dari impor). Default: None
+                (ID baru dibuat).
+
+        Returns:
+            list[dict]: Hasil per record sesuai urutan input, berisi
+            "indeks", "sukses", "id_orang" (None jika gagal) dan "error"
+            (None jika sukses).
+
+        Raises:
+            ValueError: Jika panjang daftar_id berbeda dengan records.
+        """
+        self._logger.info("Membuat korban batch (jumlah=%s)", len(records))
+
+        hasil = [
+            {"indeks": i, "sukses": False, "id_orang": None, "error": None}
+            for i in range(len(records))
+        ]
+        if daftar_id is None:
+            daftar_id = generate_id_batch(len(records))
+        elif len(daftar_id) != len(records):
+            raise ValueError("Jumlah daftar_id harus sama dengan jumlah records")
+        cache_posko: dict[str, Posko | None] = {}
+        sisa_posko: dict[str, int] = {}
+        valid: list[tuple[int, Korban]] = []
+
+        # Posko yang dirujuk batch dikunci dari cek kapasitas sampai selesai disimpan
+        id_posko_batch = [r["id_posko"] for r in records if isinstance(r, dict) and isinstance(r.get("id_posko"), str)]
+        with self._kunci_posko(*id_posko_batch):
+            # ===== Validasi seluruh record =====
+            for i, record in enumerate(records):
+                try:
+                    id_posko = record["id_posko"]
+                    if id_posko not in cache_posko:
+                        cache_posko[id_posko] = self._posko_repo.ambil_berdasarkan_id(id_posko)
+                    posko = cache_posko[id_posko]
+                    if posko is None:
+                        raise ValueError("Posko tidak ditemukan")
+                    if id_posko not in sisa_posko:
+                        sisa_posko[id_posko] = self._sisa_kapasitas(posko)
+                    if sisa_posko[id_posko] <= 0:
+                        raise ValueError("Posko sudah penuh")
+
+                    korban = Korban(
+                        id_orang=daftar_id[i],
+                        nama_orang=record["nama_orang"],
+                        alamat_orang=record["alamat_orang"],
+                        jenis_kelamin_orang=parse_enum(JenisKelamin, record["jenis_kelamin_orang"]),
+                        tanggal_lahir_orang=record["tanggal_lahir_orang"],
+                        status_triase=parse_enum(StatusTriase, record["status_triase"]),
+                        kondisi_awal=record["kondisi_awal"],
+                        lokasi_ditemukan=record["lokasi_ditemukan"],
+                        posko=posko,
+                    )
+                except KeyError as e:
+                    hasil[i]["error"] = f"Field wajib tidak ada: {e.args[0]}"
+                except (TypeError, ValueError) as e:
+                    hasil[i]["error"] = str(e)
+                else:
+                    sisa_posko[id_posko] -= 1
+                    valid.append((i, korban))
+
+            # ===== Simpan ke OrangRepository & KorbanRepository (semua atau tidak sama sekali) =====
+            daftar_id_valid = [korban.get_id_orang() for _, korban in valid]
+            daftar_korban = [korban for _, korban in valid]
+            masuk_antrian = []
+            try:
+                with UnitOfWork() as uow:
+                    if self._tulis_orang:
+                        uow.tambah_banyak(self._orang_repo, daftar_id_valid, daftar_korban)
+                    uow.tambah_banyak(self._korban_repo, daftar_id_valid, daftar_korban)
+            except RuntimeError:
+                self._logger.error("Gagal simpan korban batch (jumlah valid=%s)", len(valid))
+                for i, _ in valid:
+                    hasil[i]["error"] = "Gagal menyimpan data korban"
+            else:
+                for i, korban in valid:
+                    hasil[i]["sukses"] = True
+                    hasil[i]["id_orang"] = korban.get_id_orang()
+                    masuk_antrian.append(
+                        (korban.get_id_orang(), korban.get_posko().get_id_posko(), korban.get_status_triase())
+                    )
+        self._antrian_triase.masukkan_banyak(masuk_antrian)
+
+        jumlah_sukses = sum(1 for h in hasil if h["sukses"])
         self._logger.info(
-            f"Korban id_orang={id_orang} berhasil dibuat ({datetime.now()})"
+            "Korban batch selesai: %s berhasil, %s gagal",
+            jumlah_sukses, len(hasil) - jumlah_sukses,
         )
-        return id_orang
+        return hasil
 
     # ===== READ =====
     def ambil_korban(self, id_orang: str) -> Korban | None:
         """
         Mengambil Korban berdasarkan id_orang.
         """
-        self._logger.info(
-            f"Mengambil korban id_orang={id_orang} ({datetime.now()})"
-        )
+        self._logger.info("Mengambil korban id_orang=%s", id_orang)
         return self._korban_repo.ambil_berdasarkan_id(id_orang)
 
+    def ambil_korban_dengan_versi(self, id_orang: str) -> tuple[Korban | None, int | None]:
+        """
+        Mengambil Korban beserta versinya, untuk dikirim kembali ke perbarui_korban(versi=...).
+        """
+        self._logger.info("Mengambil korban id_orang=%s beserta versi", id_orang)
+        return self._korban_repo.ambil_dengan_versi(id_orang)
+
     def ambil_semua_korban(self) -> list[Korban]:
         """
         Mengambil semua data Korban.
         """
-        self._logger.info(f"Mengambil semua korban ({datetime.now()})")
+        self._logger.info("Mengambil semua korban")
         return self._korban_repo.ambil_semua()
 
+    def iter_semua_korban(self, ukuran_batch: int = 500) -> Iterator[Korban]:
+        """
+        Mengiterasi seluruh data Korban secara streaming tanpa menyalin isi repository.
+        """
+        self._logger.info("Streaming semua korban")
+        return self._korban_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_korban(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[Korban], str | None]:
+        """
+        Mengambil satu halaman data Korban (keyset pagination).
+
+        Args:
+            setelah_id (str | None): Cursor dari halaman sebelumnya (None = halaman pertama).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Korban], str | None]: Isi halaman dan cursor halaman berikutnya.
+        """
+        self._logger.info("Mengambil halaman korban setelah=%s batas=%s", setelah_id, batas)
+        return self._korban_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_korban(self) -> int:
+        """
+        Menghitung jumlah data Korban.
+        """
+        return self._korban_repo.hitung()
+
+    def ambil_korban_berdasarkan_posko(self, id_posko: str) -> list[Korban]:
+        """
+        Mengambil semua Korban di satu posko (memakai indeks repository).
+        """
+        self._logger.info("Mengambil korban id_posko=%s", id_posko)
+        return self._korban_repo.ambil_berdasarkan_posko(id_posko)
+
+    def ambil_korban_berdasarkan_triase(self, status_triase: str) -> list[Korban]:
+        """
+        Mengambil semua Korban dengan status triase tertentu.
+
+        Raises:
+            ValueError: Jika status_triase tidak valid.
+        """
+        triase_enum: StatusTriase = parse_enum(StatusTriase, status_triase)
+        self._logger.info("Mengambil korban status_triase=%s", triase_enum.value)
+        return self._korban_repo.ambil_berdasarkan_triase(triase_enum)
+
+    def ambil_korban_berdasarkan_posko_dan_triase(
+        self,
+        id_posko: str,
+        status_triase: str,
+    ) -> list[Korban]:
+        """
+        Mengambil Korban di satu posko dengan status triase tertentu,
+        misalnya semua korban triase merah di posko X.
+
+        Raises:
+            ValueError: Jika status_triase tidak valid.
+        """
+        triase_enum: StatusTriase = parse_enum(StatusTriase, status_triase)
+        self._logger.info(
+            "Mengambil korban id_posko=%s status_triase=%s",
+            id_posko, triase_enum.value,
+        )
+        return self._korban_repo.ambil_berdasarkan_posko_dan_triase(id_posko, triase_enum)
+
+    def ambil_korban_terdaftar_antara(self, dari: datetime, sampai: datetime | None = None) -> list[Korban]:
+        """
+        Mengambil Korban yang didaftarkan pada rentang waktu [dari, sampai).
+
+        ID korban urut waktu (UUIDv7), jadi rentang waktu dicari sebagai
+        rentang kunci di repository, bukan memindai seluruh korban.
+        Korban lama dengan ID UUIDv4 (tanpa timestamp) tidak ikut.
+
+        Args:
+            dari (datetime): Awal rentang (inklusif).
+            sampai (datetime | None, optional): Akhir rentang (eksklusif). Default: sekarang.
+
+        Raises:
+            ValueError: Jika dari lebih besar dari sampai.
+        """
+        if sampai is not None and dari > sampai:
+            raise ValueError("Awal rentang tidak boleh setelah akhir rentang")
+
+        self._logger.info("Mengambil korban terdaftar dari=%s sampai=%s", dari, sampai)
+        hasil = self._korban_repo.ambil_rentang_id(
+            batas_id_waktu(dari), None if sampai is None else batas_id_waktu(sampai)
+        )
+        return [korban for korban in hasil if adalah_id_waktu(korban.get_id_orang())]
+
+    def ambil_korban_terdaftar_dalam(self, jam: float = 1) -> list[Korban]:
+        """
+        Mengambil Korban yang didaftarkan dalam beberapa jam terakhir.
+
+        Args:
+            jam (float, optional): Lebar jendela dalam jam. Default: 1.
+
+        Raises:
+            ValueError: Jika jam tidak positif.
+        """
+        if jam <= 0:
+            raise ValueError("Jam harus lebih dari 0")
+        return self.ambil_korban_terdaftar_antara(datetime.now() - timedelta(hours=jam))
+
+    # ===== ANTRIAN TRIASE =====
+    def ambil_pasien_berikutnya(self, id_posko: str) -> Korban | None:
+        """
+        Mengambil pasien berikutnya yang harus diperiksa di satu posko.
+
+        Urutan: triase merah > kuning > hijau, lalu yang paling lama menunggu.
+        Korban triase hitam tidak ikut antrian. Pasien yang diambil keluar
+        dari antrian.
+
+        Returns:
+            Korban | None: Korban berikutnya, atau None jika antrian kosong.
+        """
+        while True:
+            id_orang = self._antrian_triase.ambil_berikutnya(id_posko)
+            if id_orang is None:
+                self._logger.info("Antrian triase posko id_posko=%s kosong", id_posko)
+                return None
+
+            korban = self._korban_repo.ambil_berdasarkan_id(id_orang)
+            if korban is not None:
+                self._logger.info(
+                    "Pasien berikutnya di posko id_posko=%s: id_orang=%s", id_posko, id_orang
+                )
+                return korban
+
+    # ===== KAPASITAS POSKO =====
+    def _sisa_kapasitas(self, posko: Posko) -> int:
+        """Sisa kapasitas posko; hunian dibaca dari indeks repository, bukan memindai korban."""
+        return posko.get_kapasitas_posko() - self._korban_repo.hitung_berdasarkan_posko(posko.get_id_posko())
+
+    @contextmanager
+    def _kunci_posko(self, *daftar_id_posko: str):
+        """Mengunci satu atau beberapa posko (urut id_posko untuk mencegah deadlock)."""
+        with ExitStack() as stack:
+            for id_posko in sorted(set(daftar_id_posko)):
+                kunci = self._kunci_posko_repo.get(id_posko)
+                if kunci is None:
+                    with KorbanService._kunci_daftar:
+                        kunci = self._kunci_posko_repo.setdefault(id_posko, threading.Lock())
+                stack.enter_context(kunci)
+            yield
+
+    def sisa_kapasitas_posko(self, id_posko: str) -> int:
+        """
+        Mengambil sisa kapasitas posko (kapasitas - jumlah korban saat ini).
+
+        Raises:
+            ValueError: Jika posko tidak ditemukan.
+        """
+        posko = self._posko_repo.ambil_berdasarkan_id(id_posko)
+        if posko is None:
+            raise ValueError("Posko tidak ditemukan")
+        return self._sisa_kapasitas(posko)
+
+    def cari_posko_tersedia(self, id_bencana: str) -> list[Posko]:
+        """
+        Mencari posko aktif milik satu bencana yang masih punya ruang.
+
+        Hanya posko bencana tersebut yang diperiksa (indeks per bencana),
+        dan hunian tiap posko dibaca dalam O(1).
+
+        Returns:
+            list[Posko]: Posko dengan sisa kapasitas > 0, sisa terbanyak lebih dulu.
+        """
+        tersedia = []
+        for posko in self._posko_repo.ambil_berdasarkan_bencana(id_bencana):
+            if posko.get_status_posko() != StatusPosko.AKTIF:
+                continue
+            sisa = self._sisa_kapasitas(posko)
+            if sisa > 0:
+                tersedia.append((sisa, posko))
+
+        tersedia.sort(key=lambda item: item[0], reverse=True)
+        return [posko for _, posko in tersedia]
+
     # ===== UPDATE =====
     def perbarui_korban(
         self,
@@ -139,69 +491,84 @@ class KorbanService:
         kondisi_awal: str,
         lokasi_ditemukan: str,
         id_posko: str,
+        versi: int | None = None,
     ) -> bool:
         """
-        Memperbarui data Korban.
+        Memperbarui data Korban tanpa mengunci (optimistic concurrency).
+
+        Args:
+            versi (int | None, optional): Versi dari ambil_korban_dengan_versi()
+                saat form dibuka. None = versi yang dibaca di awal pemanggilan ini.
+
+        Raises:
+            KonflikVersi: Jika korban sudah diubah pihak lain sejak versi tersebut.
         """
-        existing = self._korban_repo.ambil_berdasarkan_id(id_orang)
+        existing, versi_sekarang = self._korban_repo.ambil_dengan_versi(id_orang)
         if existing is None:
-            self._logger.warning(
-                f"Gagal update: korban id_orang={id_orang} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal update: korban id_orang=%s tidak ditemukan", id_orang)
             return False
 
         posko = self._posko_repo.ambil_berdasarkan_id(id_posko)
         if posko is None:
             raise ValueError("Posko tidak ditemukan")
 
-        jk_enum = parse_enum(JenisKelamin, jenis_kelamin_orang)
-        triase_enum = parse_enum(StatusTriase, status_triase)
-
-        korban_baru = Korban(
-            id_orang=id_orang,
-            nama_orang=nama_orang,
-            alamat_orang=alamat_orang,
-            jenis_kelamin_orang=jk_enum,
-            tanggal_lahir_orang=tanggal_lahir_orang,
-            status_triase=triase_enum,
-            kondisi_awal=kondisi_awal,
-            lokasi_ditemukan=lokasi_ditemukan,
-            posko=posko,
-        )
+        # Pindah posko hanya boleh jika posko tujuan masih punya ruang; cek dan
+        # simpan di bawah lock posko tujuan agar tidak didahului pendaftaran lain
+        with self._kunci_posko(id_posko):
+            if existing.get_posko().get_id_posko() != id_posko and self._sisa_kapasitas(posko) <= 0:
+                self._logger.warning("Posko id_posko=%s sudah penuh", id_posko)
+                raise ValueError("Posko sudah penuh")
 
-        sukses_orang = self._orang_repo.perbarui(id_orang, korban_baru)
-        sukses_korban = self._korban_repo.perbarui(id_orang, korban_baru)
+            jk_enum = parse_enum(JenisKelamin, jenis_kelamin_orang)
+            triase_enum = parse_enum(StatusTriase, status_triase)
 
-        if sukses_orang and sukses_korban:
-            self._logger.info(
-                f"Korban id_orang={id_orang} berhasil diperbarui ({datetime.now()})"
+            korban_baru = Korban(
+                id_orang=id_orang,
+                nama_orang=nama_orang,
+                alamat_orang=alamat_orang,
+                jenis_kelamin_orang=jk_enum,
+                tanggal_lahir_orang=tanggal_lahir_orang,
+                status_triase=triase_enum,
+                kondisi_awal=kondisi_awal,
+                lokasi_ditemukan=lokasi_ditemukan,
+                posko=posko,
             )
-            return True
 
-        self._logger.warning(
-            f"Gagal update sebagian korban id_orang={id_orang} ({datetime.now()})"
-        )
-        return False
+            try:
+                with UnitOfWork() as uow:
+                    if self._tulis_orang:
+                        uow.perbarui(self._orang_repo, id_orang, korban_baru)
+                    uow.perbarui(
+                        self._korban_repo, id_orang, korban_baru,
+                        versi_diharapkan=versi_sekarang if versi is None else versi,
+                    )
+            except KonflikVersi:
+                self._logger.warning("Konflik versi saat update korban id_orang=%s", id_orang)
+                raise
+            except RuntimeError:
+                self._logger.warning("Gagal update korban id_orang=%s", id_orang)
+                return False
+
+        self._antrian_triase.perbarui(id_orang, id_posko, triase_enum)
+        self._logger.info("Korban id_orang=%s berhasil diperbarui", id_orang)
+        return True
 
     # ===== DELETE =====
     def hapus_korban(self, id_orang: str) -> bool:
         """
         Menghapus Korban.
         """
-        self._logger.info(
-            f"Menghapus korban id_orang={id_orang} ({datetime.now()})"
-        )
-
-        sukses_korban = self._korban_repo.hapus(id_orang)
-        sukses_orang = self._orang_repo.hapus(id_orang)
+        self._logger.info("Menghapus korban id_orang=%s", id_orang)
 
-        if sukses_korban and sukses_orang:
-            self._logger.info(
-                f"Korban id_orang={id_orang} berhasil dihapus ({datetime.now()})"
-            )
-            return True
+        try:
+            with UnitOfWork() as uow:
+                uow.hapus(self._korban_repo, id_orang)
+                if self._tulis_orang:
+                    uow.hapus(self._orang_repo, id_orang)
+        except RuntimeError:
+            self._logger.warning("Gagal hapus korban id_orang=%s", id_orang)
+            return False
 
-        self._logger.warning(
-            f"Gagal hapus korban id_orang={id_orang} ({datetime.now()})"
-        )
-        return False
+        self._antrian_triase.keluarkan(id_orang)
+        self._logger.info("Korban id_orang=%s berhasil dihapus", id_orang)
+        return True
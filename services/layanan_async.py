@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
+from datetime import date
+from functools import partial
+
+from repositories.repository_async import RepositoryAsync, iter_di_executor
+from services.pemeriksaan_service import PemeriksaanService
+
+
+class LayananAsync:
+    """
+    Fasad async untuk service sinkron (KorbanService, ResepObatService, ...).
+
+    Setiap method publik service tersedia sebagai coroutine dengan nama dan
+    argumen yang sama. Pemanggilan dijalankan di executor, sehingga query
+    repository, penguncian stok, dan penulisan log tidak memblokir event
+    loop gateway. Method iter_* menjadi async iterator (async for).
+
+    Service di belakang fasad dipanggil dari banyak thread sekaligus, jadi
+    repository-nya harus aman thread: SQLite (pool koneksi) atau in-memory
+    yang dibungkus RepositoryAmanThread.
+
+    Contoh:
+        korban_async = LayananAsync(korban_service)
+        id_korban = await korban_async.buat_korban(...)
+        async for korban in korban_async.iter_semua_korban():
+            ...
+    """
+
+    def __init__(self, layanan, executor: Executor | None = None):
+        """
+        Inisialisasi fasad.
+
+        Args:
+            layanan (object): Service sinkron yang dibungkus.
+            executor (Executor | None, optional): Executor untuk menjalankan
+                method service. Default: executor bawaan event loop.
+        """
+        self._layanan = layanan
+        self._executor = executor
+
+    @property
+    def layanan(self):
+        """Service sinkron yang dibungkus."""
+        return self._layanan
+
+    async def _jalankan(self, fungsi: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fungsi, *args, **kwargs))
+
+    def __getattr__(self, nama: str):
+        atribut = getattr(self._layanan, nama)
+        if not callable(atribut) or nama.startswith("_"):
+            return atribut
+
+        if nama.startswith("iter_"):
+            def iter_async(*args, **kwargs) -> AsyncIterator:
+                return iter_di_executor(lambda: atribut(*args, **kwargs), self._executor)
+
+            return iter_async
+
+        async def di_executor(*args, **kwargs):
+            return await self._jalankan(atribut, *args, **kwargs)
+
+        return di_executor
+
+
+class PemeriksaanServiceAsync(LayananAsync):
+    """
+    Fasad async PemeriksaanService dengan pemuatan FK secara bersamaan.
+
+    Pada buat_pemeriksaan(), korban dan tenaga medis tidak saling bergantung,
+    jadi keduanya dimuat bersamaan lewat repository async; penyimpanan
+    pemeriksaan (unit kerja) tetap dijalankan oleh PemeriksaanService.
+    """
+
+    def __init__(
+        self,
+        layanan: PemeriksaanService,
+        korban_repo: RepositoryAsync,
+        tenaga_medis_repo: RepositoryAsync,
+        executor: Executor | None = None,
+    ):
+        """
+        Inisialisasi fasad.
+
+        Args:
+            layanan (PemeriksaanService): Service sinkron yang dibungkus.
+            korban_repo (RepositoryAsync): Repository korban yang sama dengan milik layanan.
+            tenaga_medis_repo (RepositoryAsync): Repository tenaga medis yang sama dengan milik layanan.
+            executor (Executor | None, optional): Executor untuk method service. Default: executor bawaan loop.
+        """
+        super().__init__(layanan, executor)
+        self._korban_repo = korban_repo
+        self._tenaga_medis_repo = tenaga_medis_repo
+
+    async def buat_pemeriksaan(
+        self,
+        id_korban: str,
+        id_tenaga_medis: str,
+        keluhan: str,
+        diagnosa: str,
+        status_triase: str,
+        tanggal_pemeriksaan: date | None = None,
+        sinkron_triase_korban: bool = True,
+    ) -> str:
+        """
+        Membuat pemeriksaan baru (lihat PemeriksaanService.buat_pemeriksaan).
+
+        Returns:
+            str: id_pemeriksaan yang dibuat.
+
+        Raises:
+            ValueError: Jika FK tidak ditemukan / enum tidak valid.
+            KonflikVersi: Jika korban diubah pihak lain sebelum triase disinkron.
+            RuntimeError: Jika penyimpanan gagal.
+        """
+        (korban, versi_korban), tenaga_medis = await asyncio.gather(
+            self._korban_repo.ambil_dengan_versi(id_korban),
+            self._tenaga_medis_repo.ambil_berdasarkan_id(id_tenaga_medis),
+        )
+        if korban is None:
+            raise ValueError("Korban tidak ditemukan")
+        if tenaga_medis is None:
+            raise ValueError("Tenaga medis tidak ditemukan")
+
+        return await self._jalankan(
+            self._layanan._simpan_pemeriksaan_baru,
+            korban, versi_korban, tenaga_medis, keluhan, diagnosa, status_triase,
+            tanggal_pemeriksaan, sinkron_triase_korban,
+        )
@@ -1,15 +1,21 @@
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date, timedelta
 
 from utils.loggers import get_logger
-from utils.generator_id import generate_id
+from utils.generator_id import generate_id, generate_id_batch
 
 from models.obat import Obat
+from models.lot_obat import LotObat
 from repositories.base_repository import BaseRepository
+from repositories.unit_of_work import UnitOfWork
+from services.reservasi_stok import ReservasiStok
 
 
 class ObatService:
-    def __init__(self, obat_repo: BaseRepository):
+    def __init__(self, obat_repo: BaseRepository, reservasi_stok: ReservasiStok | None = None):
         self._obat_repo = obat_repo
+        self._reservasi_stok = reservasi_stok or ReservasiStok.untuk_repo(obat_repo)
+        self._batas_sapuan: date | None = None  # lot dengan tanggal < batas ini sudah disapu
         self._logger = get_logger(__name__)
 
     # ===== CREATE =====
@@ -19,9 +25,9 @@ class ObatService:
         stok: int,
         satuan: str,
         tanggal_kadaluarsa: date,
+        titik_pesan_ulang: int = 0,
     ) -> str:
-        now = datetime.now()
-        self._logger.info(f"Membuat obat baru ({now})")
+        self._logger.info("Membuat obat baru")
 
         if isinstance(tanggal_kadaluarsa, date) and tanggal_kadaluarsa < date.today():
             raise ValueError("Tanggal kadaluarsa tidak boleh di masa lalu")
@@ -34,24 +40,119 @@ class ObatService:
             stock_obat=stok,
             satuan_obat=satuan,
             tanggal_kadaluarsa_obat=tanggal_kadaluarsa,
+            titik_pesan_ulang=titik_pesan_ulang,
         )
 
         if not self._obat_repo.tambah(obat):
-            self._logger.error(f"Gagal simpan obat id_obat={id_obat} ({datetime.now()})")
+            self._logger.error("Gagal simpan obat id_obat=%s", id_obat)
             raise RuntimeError("Gagal menyimpan obat (ID duplikat)")
+        self._reservasi_stok.umumkan(id_obat, obat)
 
-        self._logger.info(f"Obat id_obat={id_obat} berhasil dibuat ({datetime.now()})")
+        self._logger.info("Obat id_obat=%s berhasil dibuat", id_obat)
         return id_obat
 
+    def buat_obat_batch(self, records: list[dict], daftar_id: list[str] | None = None) -> list[dict]:
+        """
+        Membuat banyak Obat sekaligus (impor manifest stok gudang).
+
+        Setiap record berisi key yang sama dengan parameter buat_obat().
+        Record yang tidak valid tidak menghentikan record lain; record yang
+        valid disimpan lewat satu tambah_banyak() dalam UnitOfWork: jika
+        penyimpanan gagal, seluruh record valid ikut gagal.
+
+        Args:
+            records (list[dict]): Data obat per baris.
+            daftar_id (list[str] | None, optional): ID per record sesuai urutan
+                records (misalnya ID deterministik dari impor). Default: None
+                (ID baru dibuat).
+
+        Returns:
+            list[dict]: Hasil per record sesuai urutan input, berisi
+            "indeks", "sukses", "id_obat" (None jika gagal) dan "error"
+            (None jika sukses).
+
+        Raises:
+            ValueError: Jika panjang daftar_id berbeda dengan records.
+        """
+        self._logger.info("Membuat obat batch (jumlah=%s)", len(records))
+
+        hasil = [
+            {"indeks": i, "sukses": False, "id_obat": None, "error": None}
+            for i in range(len(records))
+        ]
+        if daftar_id is None:
+            daftar_id = generate_id_batch(len(records))
+        elif len(daftar_id) != len(records):
+            raise ValueError("Jumlah daftar_id harus sama dengan jumlah records")
+        hari_ini = date.today()
+        valid: list[tuple[int, Obat]] = []
+
+        for i, record in enumerate(records):
+            try:
+                tanggal_kadaluarsa = record["tanggal_kadaluarsa"]
+                if isinstance(tanggal_kadaluarsa, date) and tanggal_kadaluarsa < hari_ini:
+                    raise ValueError("Tanggal kadaluarsa tidak boleh di masa lalu")
+                obat = Obat(
+                    id_obat=daftar_id[i],
+                    nama_obat=record["nama"],
+                    stock_obat=record["stok"],
+                    satuan_obat=record["satuan"],
+                    tanggal_kadaluarsa_obat=tanggal_kadaluarsa,
+                    titik_pesan_ulang=record.get("titik_pesan_ulang", 0),
+                )
+            except KeyError as e:
+                hasil[i]["error"] = f"Field wajib tidak ada: {e.args[0]}"
+            except (TypeError, ValueError) as e:
+                hasil[i]["error"] = str(e)
+            else:
+                valid.append((i, obat))
+
+        try:
+            with UnitOfWork() as uow:
+                uow.tambah_banyak(
+                    self._obat_repo, [obat.get_id_obat() for _, obat in valid], [obat for _, obat in valid]
+                )
+        except RuntimeError:
+            self._logger.error("Gagal simpan obat batch (jumlah valid=%s)", len(valid))
+            for i, _ in valid:
+                hasil[i]["error"] = "Gagal menyimpan data obat"
+        else:
+            for i, obat in valid:
+                hasil[i]["sukses"] = True
+                hasil[i]["id_obat"] = obat.get_id_obat()
+                self._reservasi_stok.umumkan(obat.get_id_obat(), obat)
+
+        jumlah_sukses = sum(1 for h in hasil if h["sukses"])
+        self._logger.info(
+            "Obat batch selesai: %s berhasil, %s gagal",
+            jumlah_sukses, len(hasil) - jumlah_sukses,
+        )
+        return hasil
+
     # ===== READ =====
     def ambil_obat(self, id_obat: str) -> Obat | None:
-        self._logger.info(f"Mengambil obat id_obat={id_obat} ({datetime.now()})")
+        self._logger.info("Mengambil obat id_obat=%s", id_obat)
         return self._obat_repo.ambil_berdasarkan_id(id_obat)
 
     def ambil_semua_obat(self) -> list[Obat]:
-        self._logger.info(f"Mengambil semua obat ({datetime.now()})")
+        self._logger.info("Mengambil semua obat")
         return self._obat_repo.ambil_semua()
 
+    def iter_semua_obat(self, ukuran_batch: int = 500) -> Iterator[Obat]:
+        self._logger.info("Streaming semua obat")
+        return self._obat_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_obat(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[Obat], str | None]:
+        self._logger.info("Mengambil halaman obat setelah=%s batas=%s", setelah_id, batas)
+        return self._obat_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_obat(self) -> int:
+        return self._obat_repo.hitung()
+
     # ===== UPDATE =====
     def perbarui_obat(
         self,
@@ -61,37 +162,46 @@ class ObatService:
         satuan: str,
         tanggal_kadaluarsa: date,
     ) -> bool:
-        now = datetime.now()
-        existing = self._obat_repo.ambil_berdasarkan_id(id_obat)
-        if existing is None:
-            self._logger.warning(f"Gagal update: obat id_obat={id_obat} tidak ditemukan ({now})")
-            return False
-
         if tanggal_kadaluarsa < date.today():
             raise ValueError("Tanggal kadaluarsa tidak boleh di masa lalu")
 
-        obat_baru = Obat(
-            id_obat=id_obat,
-            nama_obat=nama,
-            stock_obat=stok,
-            satuan_obat=satuan,
-            tanggal_kadaluarsa_obat=tanggal_kadaluarsa,
-        )
+        with self._reservasi_stok.kunci(id_obat):
+            existing = self._obat_repo.ambil_berdasarkan_id(id_obat)
+            if existing is None:
+                self._logger.warning("Gagal update: obat id_obat=%s tidak ditemukan", id_obat)
+                return False
+
+            obat_baru = Obat(
+                id_obat=id_obat,
+                nama_obat=nama,
+                stock_obat=0,
+                satuan_obat=satuan,
+                tanggal_kadaluarsa_obat=tanggal_kadaluarsa,
+                titik_pesan_ulang=existing.get_titik_pesan_ulang(),
+            )
+            # Lot lama dipertahankan; selisih stok diterapkan FEFO / ke lot default
+            for lot in existing.get_lot():
+                obat_baru.tambah_lot(lot.get_id_lot(), lot.get_jumlah(), lot.get_tanggal_kadaluarsa())
+            obat_baru.set_stock_obat(stok)
+
+            sukses = self._reservasi_stok.simpan(obat_baru)
 
-        sukses = self._obat_repo.perbarui(id_obat, obat_baru)
         if sukses:
-            self._logger.info(f"Obat id_obat={id_obat} berhasil diperbarui ({datetime.now()})")
+            self._logger.info("Obat id_obat=%s berhasil diperbarui", id_obat)
         return sukses
 
     # ===== DELETE =====
     def hapus_obat(self, id_obat: str) -> bool:
-        self._logger.info(f"Menghapus obat id_obat={id_obat} ({datetime.now()})")
-        sukses = self._obat_repo.hapus(id_obat)
+        self._logger.info("Menghapus obat id_obat=%s", id_obat)
+        with self._reservasi_stok.kunci(id_obat):
+            sukses = self._obat_repo.hapus(id_obat)
+            if sukses:
+                self._reservasi_stok.umumkan(id_obat, None)
 
         if sukses:
-            self._logger.info(f"Obat id_obat={id_obat} berhasil dihapus ({datetime.now()})")
+            self._logger.info("Obat id_obat=%s berhasil dihapus", id_obat)
         else:
-            self._logger.warning(f"Gagal hapus: obat id_obat={id_obat} tidak ditemukan ({datetime.now()})")
+            self._logger.warning("Gagal hapus: obat id_obat=%s tidak ditemukan", id_obat)
 
         return sukses
 
@@ -100,46 +210,139 @@ class ObatService:
         if not isinstance(qty, int) or qty <= 0:
             raise ValueError("Qty harus integer positif")
 
-        now = datetime.now()
-        obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
-        if obat is None:
-            self._logger.warning(f"Gagal tambah stok: obat id_obat={id_obat} tidak ditemukan ({now})")
-            return False
-
-        # Perbaikan nama method getter/setter
-        stok_baru = obat.get_stock_obat() + qty
-        obat.set_stock_obat(stok_baru)
-
-        sukses = self._obat_repo.perbarui(id_obat, obat)
+        sukses = self._reservasi_stok.ubah_stok(id_obat, qty)
         if sukses:
-            self._logger.info(f"Stok obat id_obat={id_obat} ditambah qty={qty} ({datetime.now()})")
+            self._logger.info("Stok obat id_obat=%s ditambah qty=%s", id_obat, qty)
+        else:
+            self._logger.warning("Gagal tambah stok: obat id_obat=%s tidak ditemukan", id_obat)
         return sukses
 
     def kurangi_stok(self, id_obat: str, qty: int) -> bool:
         if not isinstance(qty, int) or qty <= 0:
             raise ValueError("Qty harus integer positif")
 
-        now = datetime.now()
+        # Cek stok & pengurangan terjadi di bawah lock obat yang sama
+        sukses = self._reservasi_stok.ubah_stok(id_obat, -qty)
+        if sukses:
+            self._logger.info("Stok obat id_obat=%s dikurangi qty=%s", id_obat, qty)
+        else:
+            self._logger.warning(
+                "Gagal kurangi stok: obat id_obat=%s tidak ditemukan atau stok tidak cukup qty=%s",
+                id_obat, qty,
+            )
+        return sukses
+
+    def tambah_lot(
+        self,
+        id_obat: str,
+        jumlah: int,
+        tanggal_kadaluarsa: date,
+        id_lot: str | None = None,
+    ) -> str:
+        if not isinstance(jumlah, int) or jumlah <= 0:
+            raise ValueError("Jumlah lot harus integer positif")
+        if isinstance(tanggal_kadaluarsa, date) and tanggal_kadaluarsa < date.today():
+            raise ValueError("Tanggal kadaluarsa tidak boleh di masa lalu")
+
+        id_lot = id_lot or generate_id()
+        with self._reservasi_stok.kunci(id_obat):
+            obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
+            if obat is None:
+                raise ValueError(f"Obat tidak ditemukan (id_obat={id_obat})")
+
+            obat.tambah_lot(id_lot, jumlah, tanggal_kadaluarsa)
+            if not self._reservasi_stok.simpan(obat, (id_lot,)):
+                raise RuntimeError(f"Gagal update stok obat (id_obat={id_obat})")
+
+        self._logger.info(
+            "Lot id_lot=%s ditambahkan ke obat id_obat=%s jumlah=%s kadaluarsa=%s",
+            id_lot, id_obat, jumlah, tanggal_kadaluarsa,
+        )
+        return id_lot
+
+    def atur_titik_pesan_ulang(self, id_obat: str, titik_pesan_ulang: int) -> bool:
+        with self._reservasi_stok.kunci(id_obat):
+            obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
+            if obat is None:
+                self._logger.warning("Gagal atur titik pesan ulang: obat id_obat=%s tidak ditemukan", id_obat)
+                return False
+
+            obat.set_titik_pesan_ulang(titik_pesan_ulang)
+            sukses = self._reservasi_stok.simpan(obat, ())
+
+        if sukses:
+            self._logger.info("Titik pesan ulang obat id_obat=%s diatur ke %s", id_obat, titik_pesan_ulang)
+        return sukses
+
+    def ambil_lot(self, id_obat: str) -> list[LotObat]:
         obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
         if obat is None:
-            self._logger.warning(f"Gagal kurangi stok: obat id_obat={id_obat} tidak ditemukan ({now})")
-            return False
+            return []
+        return obat.get_lot()
 
-        # Perbaikan nama method getter
-        stok_saat_ini = obat.get_stock_obat()
-        if stok_saat_ini < qty:
+    # ===== KADALUARSA =====
+    def ambil_lot_kadaluarsa_antara(self, dari: date, sampai: date) -> list[tuple[Obat, LotObat]]:
+        if dari > sampai:
+            raise ValueError("Tanggal awal tidak boleh setelah tanggal akhir")
+        return self._obat_repo.ambil_lot_kadaluarsa_antara(dari, sampai)
+
+    def ambil_lot_kadaluarsa_dalam(self, hari: int = 30) -> list[tuple[Obat, LotObat]]:
+        if not isinstance(hari, int) or hari < 0:
+            raise ValueError("Jumlah hari harus integer non-negatif")
+        hari_ini = date.today()
+        return self._obat_repo.ambil_lot_kadaluarsa_antara(hari_ini, hari_ini + timedelta(days=hari))
+
+    def ambil_lot_sudah_kadaluarsa(self) -> list[tuple[Obat, LotObat]]:
+        return self._obat_repo.ambil_lot_kadaluarsa_antara(None, date.today() - timedelta(days=1))
+
+    def sapu_kadaluarsa(
+        self,
+        hari_ini: date | None = None,
+        keluarkan: bool = False,
+    ) -> list[tuple[Obat, LotObat]]:
+        """
+        Sapuan kadaluarsa harian yang hanya mengunjungi lot yang baru kadaluarsa.
+
+        Sapuan mencatat batas tanggal terakhir, jadi pemanggilan berikutnya hanya
+        mengambil rentang [batas sebelumnya, hari_ini) dari indeks kadaluarsa.
+
+        Args:
+            hari_ini (date | None): Tanggal sapuan. Default: date.today().
+            keluarkan (bool): Jika True, lot yang kadaluarsa dikeluarkan dari stok.
+
+        Returns:
+            list[tuple[Obat, LotObat]]: Lot yang baru kadaluarsa sejak sapuan sebelumnya.
+        """
+        hari_ini = hari_ini or date.today()
+        if self._batas_sapuan is not None and self._batas_sapuan >= hari_ini:
+            return []
+
+        hasil = self._obat_repo.ambil_lot_kadaluarsa_antara(
+            self._batas_sapuan, hari_ini - timedelta(days=1)
+        )
+        self._batas_sapuan = hari_ini
+
+        for obat, lot in hasil:
             self._logger.warning(
-                f"Gagal kurangi stok: stok tidak cukup id_obat={id_obat} stok={stok_saat_ini} qty={qty} ({now})"
+                "Lot kadaluarsa: obat id_obat=%s id_lot=%s jumlah=%s tanggal=%s",
+                obat.get_id_obat(), lot.get_id_lot(), lot.get_jumlah(), lot.get_tanggal_kadaluarsa(),
             )
-            return False
+            if keluarkan:
+                self._keluarkan_lot(obat.get_id_obat(), lot.get_id_lot())
 
-        # Perbaikan nama method setter
-        obat.set_stock_obat(stok_saat_ini - qty)
+        return hasil
 
-        sukses = self._obat_repo.perbarui(id_obat, obat)
-        if sukses:
-            self._logger.info(f"Stok obat id_obat={id_obat} dikurangi qty={qty} ({datetime.now()})")
-        return sukses
+    def _keluarkan_lot(self, id_obat: str, id_lot: str) -> int:
+        with self._reservasi_stok.kunci(id_obat):
+            obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
+            if obat is None:
+                return 0
+            jumlah = obat.keluarkan_lot(id_lot)
+            if jumlah and not self._reservasi_stok.simpan(obat, (id_lot,)):
+                raise RuntimeError(f"Gagal update stok obat (id_obat={id_obat})")
+
+        self._logger.info("Lot id_lot=%s obat id_obat=%s dikeluarkan (jumlah=%s)", id_lot, id_obat, jumlah)
+        return jumlah
 
     # ===== HELPERS =====
     def cek_kadaluarsa(self, id_obat: str) -> bool:
@@ -0,0 +1,137 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from utils.loggers import get_logger
+
+from models.obat import Obat
+from services.reservasi_stok import ReservasiStok
+
+
+class PemantauStok:
+    """
+    Pemantau stok menipis berdasarkan titik pesan ulang tiap obat.
+
+    Pemantau mendengarkan setiap perubahan stok dari ReservasiStok
+    (kurangi_stok, buat_resep, pembatalan, update obat) dan hanya
+    memeriksa obat yang berubah, jadi tidak pernah memindai seluruh obat.
+    Himpunan obat di bawah titik pesan ulang dijaga secara inkremental
+    sehingga pengecekan satu obat dan jumlahnya O(1).
+
+    Peringatan dibatasi per obat: dalam satu jeda_peringatan paling banyak
+    satu peringatan dicatat; peringatan berikutnya ditahan dan jumlahnya
+    disebutkan pada peringatan selanjutnya.
+    """
+
+    def __init__(
+        self,
+        reservasi_stok: ReservasiStok,
+        jeda_peringatan: float = 300.0,
+        saat_peringatan: Callable[[Obat], None] | None = None,
+    ):
+        """
+        Inisialisasi pemantau dan mendaftarkannya ke mesin reservasi.
+
+        Args:
+            reservasi_stok (ReservasiStok): Mesin reservasi yang perubahan stoknya dipantau.
+            jeda_peringatan (float, optional): Jeda minimal (detik) antar peringatan
+                untuk obat yang sama. Default: 300.
+            saat_peringatan (Callable[[Obat], None] | None, optional): Dipanggil setiap
+                kali peringatan dikirim (selain dicatat ke log). Default: None.
+
+        Raises:
+            ValueError: Jika jeda_peringatan negatif.
+        """
+        if jeda_peringatan < 0:
+            raise ValueError("Jeda peringatan tidak boleh negatif")
+
+        self._jeda_peringatan = jeda_peringatan
+        self._saat_peringatan = saat_peringatan
+        self._di_bawah: dict[str, tuple[int, int]] = {}  # key: id_obat, value: (stok, titik_pesan_ulang)
+        self._terakhir: dict[str, float] = {}  # key: id_obat, value: waktu peringatan terakhir
+        self._ditahan: dict[str, int] = {}  # key: id_obat, value: jumlah peringatan yang ditahan
+        self._kunci = threading.Lock()
+        self._logger = get_logger(__name__)
+
+        reservasi_stok.tambah_pendengar(self.perbarui)
+
+    def isi_dari(self, daftar_obat: Iterable[Obat]) -> None:
+        """
+        Mengisi himpunan stok menipis dari obat yang sudah tersimpan, tanpa peringatan.
+
+        Args:
+            daftar_obat (Iterable[Obat]): Obat yang akan diperiksa (misal repo.iter_semua()).
+        """
+        with self._kunci:
+            for obat in daftar_obat:
+                if obat.perlu_pesan_ulang():
+                    self._di_bawah[obat.get_id_obat()] = (obat.get_stock_obat(), obat.get_titik_pesan_ulang())
+
+    def perbarui(self, id_obat: str, obat: Obat | None) -> None:
+        """
+        Memproses perubahan stok satu obat (dipanggil oleh ReservasiStok).
+
+        Args:
+            id_obat (str): ID obat.
+            obat (Obat | None): Obat terkini, atau None jika obat dihapus.
+        """
+        with self._kunci:
+            if obat is None or not obat.perlu_pesan_ulang():
+                if self._di_bawah.pop(id_obat, None) is not None and obat is not None:
+                    self._logger.info(
+                        "Stok obat id_obat=%s kembali di atas titik pesan ulang (stok=%s)",
+                        id_obat, obat.get_stock_obat(),
+                    )
+                if obat is None:
+                    self._terakhir.pop(id_obat, None)
+                    self._ditahan.pop(id_obat, None)
+                return
+
+            stok, titik = obat.get_stock_obat(), obat.get_titik_pesan_ulang()
+            self._di_bawah[id_obat] = (stok, titik)
+
+            sekarang = time.monotonic()
+            terakhir = self._terakhir.get(id_obat)
+            if terakhir is not None and sekarang - terakhir < self._jeda_peringatan:
+                self._ditahan[id_obat] = self._ditahan.get(id_obat, 0) + 1
+                return
+
+            self._terakhir[id_obat] = sekarang
+            ditahan = self._ditahan.pop(id_obat, 0)
+
+        self._logger.warning(
+            "Stok menipis: obat '%s' id_obat=%s stok=%s titik_pesan_ulang=%s (%s peringatan ditahan)",
+            obat.get_nama_obat(), id_obat, stok, titik, ditahan,
+        )
+        if self._saat_peringatan is not None:
+            self._saat_peringatan(obat)
+
+    # ====== QUERY ======
+
+    def di_bawah_titik(self, id_obat: str) -> bool:
+        """
+        Mengecek apakah stok obat sedang di bawah titik pesan ulang.
+
+        Returns:
+            bool: True jika obat perlu dipesan ulang.
+        """
+        return id_obat in self._di_bawah
+
+    def jumlah_di_bawah_titik(self) -> int:
+        """
+        Menghitung obat yang stoknya di bawah titik pesan ulang.
+
+        Returns:
+            int: Jumlah obat.
+        """
+        return len(self._di_bawah)
+
+    def daftar_di_bawah_titik(self) -> dict[str, tuple[int, int]]:
+        """
+        Mengambil salinan himpunan obat yang perlu dipesan ulang.
+
+        Returns:
+            dict[str, tuple[int, int]]: id_obat -> (stok, titik_pesan_ulang).
+        """
+        with self._kunci:
+            return dict(self._di_bawah)
@@ -1,15 +1,18 @@
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
 
 from utils.loggers import get_logger
 from utils.generator_id import generate_id
 from utils.enums.status_triase import StatusTriase
 from utils.enum_parser import parse_enum
+from utils.antrian_triase import AntrianTriase
 
 from models.pemeriksaan import Pemeriksaan
 from models.korban import Korban
 from models.tenaga_medis import TenagaMedis
 
-from repositories.base_repository import BaseRepository
+from repositories.base_repository import BaseRepository, KonflikVersi
+from repositories.unit_of_work import UnitOfWork
 
 
 class PemeriksaanService:
@@ -31,6 +34,7 @@ class PemeriksaanService:
         korban_repo: BaseRepository,
         tenaga_medis_repo: BaseRepository,
         orang_repo: BaseRepository,
+        antrian_triase: AntrianTriase | None = None,
     ):
         """
         Inisialisasi PemeriksaanService.
@@ -40,11 +44,17 @@ class PemeriksaanService:
             korban_repo (BaseRepository): Repository Korban.
             tenaga_medis_repo (BaseRepository): Repository Tenaga Medis.
             orang_repo (BaseRepository): Repository Orang (untuk sinkron Korban sebagai Orang).
+            antrian_triase (AntrianTriase | None, optional): Antrian triase yang sama
+                dengan KorbanService; jika diisi, perubahan triase ikut
+                memindahkan posisi korban di antrian. Default: None.
         """
         self._pemeriksaan_repo = pemeriksaan_repo
         self._korban_repo = korban_repo
         self._tenaga_medis_repo = tenaga_medis_repo
         self._orang_repo = orang_repo
+        self._antrian_triase = antrian_triase
+        # Penyimpanan bersama: update korban_repo sudah terlihat di orang_repo
+        self._tulis_orang = not korban_repo.berbagi_penyimpanan(orang_repo)
         self._logger = get_logger(__name__)
 
     # ===== CREATE =====
@@ -75,13 +85,13 @@ class PemeriksaanService:
 
         Raises:
             ValueError: Jika FK tidak ditemukan / enum tidak valid.
+            KonflikVersi: Jika korban diubah pihak lain sebelum triase disinkron.
             RuntimeError: Jika penyimpanan gagal.
         """
-        now = datetime.now()
-        self._logger.info(f"Membuat pemeriksaan baru ({now})")
+        self._logger.info("Membuat pemeriksaan baru")
 
         # ===== FK: korban harus ada =====
-        korban: Korban | None = self._korban_repo.ambil_berdasarkan_id(id_korban)
+        korban, versi_korban = self._korban_repo.ambil_dengan_versi(id_korban)
         if korban is None:
             raise ValueError("Korban tidak ditemukan")
 
@@ -90,12 +100,38 @@ class PemeriksaanService:
         if tenaga_medis is None:
             raise ValueError("Tenaga medis tidak ditemukan")
 
+        return self._simpan_pemeriksaan_baru(
+            korban, versi_korban, tenaga_medis, keluhan, diagnosa, status_triase,
+            tanggal_pemeriksaan, sinkron_triase_korban,
+        )
+
+    def _simpan_pemeriksaan_baru(
+        self,
+        korban: Korban,
+        versi_korban: int,
+        tenaga_medis: TenagaMedis,
+        keluhan: str,
+        diagnosa: str,
+        status_triase: str,
+        tanggal_pemeriksaan: date | None,
+        sinkron_triase_korban: bool,
+    ) -> str:
+        """
+        Bagian buat_pemeriksaan() setelah FK dimuat.
+
+        Dipisah agar PemeriksaanServiceAsync bisa memuat korban dan tenaga
+        medis secara bersamaan lalu melanjutkan alur yang sama.
+        """
+        id_korban = korban.get_id_orang()
+
         # ===== tanggal default =====
         if tanggal_pemeriksaan is None:
             tanggal_pemeriksaan = date.today()
 
         # ===== parse triase =====
         triase_enum: StatusTriase = parse_enum(StatusTriase, status_triase)
+        if sinkron_triase_korban:
+            korban = self._korban_dengan_triase(korban, triase_enum)
 
         # ===== buat object pemeriksaan =====
         id_pemeriksaan = generate_id()
@@ -109,28 +145,29 @@ class PemeriksaanService:
             status_triase=triase_enum,
         )
 
-        # ===== simpan pemeriksaan =====
-        if not self._pemeriksaan_repo.tambah(pemeriksaan):
-            self._logger.error(
-                f"Gagal menyimpan pemeriksaan id_pemeriksaan={id_pemeriksaan} ({datetime.now()})"
-            )
+        # ===== simpan pemeriksaan (+ opsional sinkron triase korban) dalam satu unit kerja =====
+        try:
+            with UnitOfWork() as uow:
+                uow.tambah(self._pemeriksaan_repo, id_pemeriksaan, pemeriksaan)
+                if sinkron_triase_korban:
+                    self._jadwalkan_sinkron_triase(uow, korban, versi_korban)
+        except KonflikVersi:
+            self._logger.warning("Konflik versi korban id_orang=%s saat membuat pemeriksaan", id_korban)
+            raise
+        except RuntimeError:
+            self._logger.error("Gagal menyimpan pemeriksaan id_pemeriksaan=%s", id_pemeriksaan)
             raise RuntimeError("Gagal menyimpan data pemeriksaan")
 
-        # ===== opsional: sinkron triase korban =====
         if sinkron_triase_korban:
-            korban.set_status_triase(triase_enum)
-
-            # update di korban_repo dan orang_repo (karena korban juga tersimpan sebagai Orang)
-            self._korban_repo.perbarui(id_korban, korban)
-            self._orang_repo.perbarui(id_korban, korban)
+            if self._antrian_triase is not None:
+                self._antrian_triase.perbarui(id_korban, korban.get_posko().get_id_posko(), triase_enum)
 
             self._logger.info(
-                f"Triase korban id_orang={id_korban} disinkron menjadi {triase_enum.value} ({datetime.now()})"
+                "Triase korban id_orang=%s disinkron menjadi %s",
+                id_korban, triase_enum.value,
             )
 
-        self._logger.info(
-            f"Pemeriksaan id_pemeriksaan={id_pemeriksaan} berhasil dibuat ({datetime.now()})"
-        )
+        self._logger.info("Pemeriksaan id_pemeriksaan=%s berhasil dibuat", id_pemeriksaan)
         return id_pemeriksaan
 
     # ===== READ =====
@@ -138,18 +175,54 @@ class PemeriksaanService:
         """
         Mengambil pemeriksaan berdasarkan id_pemeriksaan.
         """
-        self._logger.info(
-            f"Mengambil pemeriksaan id_pemeriksaan={id_pemeriksaan} ({datetime.now()})"
-        )
+        self._logger.info("Mengambil pemeriksaan id_pemeriksaan=%s", id_pemeriksaan)
         return self._pemeriksaan_repo.ambil_berdasarkan_id(id_pemeriksaan)
 
+    def ambil_pemeriksaan_dengan_versi(self, id_pemeriksaan: str) -> tuple[Pemeriksaan | None, int | None]:
+        """
+        Mengambil pemeriksaan beserta versinya, untuk perbarui_pemeriksaan(versi=...).
+        """
+        self._logger.info("Mengambil pemeriksaan id_pemeriksaan=%s beserta versi", id_pemeriksaan)
+        return self._pemeriksaan_repo.ambil_dengan_versi(id_pemeriksaan)
+
     def ambil_semua_pemeriksaan(self) -> list[Pemeriksaan]:
         """
         Mengambil semua data pemeriksaan.
         """
-        self._logger.info(f"Mengambil semua pemeriksaan ({datetime.now()})")
+        self._logger.info("Mengambil semua pemeriksaan")
         return self._pemeriksaan_repo.ambil_semua()
 
+    def iter_semua_pemeriksaan(self, ukuran_batch: int = 500) -> Iterator[Pemeriksaan]:
+        """
+        Mengiterasi seluruh data pemeriksaan secara streaming tanpa menyalin isi repository.
+        """
+        self._logger.info("Streaming semua pemeriksaan")
+        return self._pemeriksaan_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_pemeriksaan(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[Pemeriksaan], str | None]:
+        """
+        Mengambil satu halaman data pemeriksaan (keyset pagination).
+
+        Args:
+            setelah_id (str | None): Cursor dari halaman sebelumnya (None = halaman pertama).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Pemeriksaan], str | None]: Isi halaman dan cursor halaman berikutnya.
+        """
+        self._logger.info("Mengambil halaman pemeriksaan setelah=%s batas=%s", setelah_id, batas)
+        return self._pemeriksaan_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_pemeriksaan(self) -> int:
+        """
+        Menghitung jumlah data pemeriksaan.
+        """
+        return self._pemeriksaan_repo.hitung()
+
     # ===== UPDATE =====
     def perbarui_pemeriksaan(
         self,
@@ -161,18 +234,28 @@ class PemeriksaanService:
         diagnosa: str,
         status_triase: str,
         sinkron_triase_korban: bool = True,
+        versi: int | None = None,
     ) -> bool:
         """
-        Memperbarui data pemeriksaan.
+        Memperbarui data pemeriksaan tanpa mengunci (optimistic concurrency).
+
+        Args:
+            versi (int | None, optional): Versi dari ambil_pemeriksaan_dengan_versi().
+                None = versi yang dibaca di awal pemanggilan ini.
+
+        Raises:
+            KonflikVersi: Jika pemeriksaan (atau korban yang disinkron) sudah
+                diubah pihak lain.
         """
-        existing = self._pemeriksaan_repo.ambil_berdasarkan_id(id_pemeriksaan)
+        existing, versi_sekarang = self._pemeriksaan_repo.ambil_dengan_versi(id_pemeriksaan)
         if existing is None:
             self._logger.warning(
-                f"Gagal update: pemeriksaan id_pemeriksaan={id_pemeriksaan} tidak ditemukan ({datetime.now()})"
+                "Gagal update: pemeriksaan id_pemeriksaan=%s tidak ditemukan",
+                id_pemeriksaan,
             )
             return False
 
-        korban = self._korban_repo.ambil_berdasarkan_id(id_korban)
+        korban, versi_korban = self._korban_repo.ambil_dengan_versi(id_korban)
         if korban is None:
             raise ValueError("Korban tidak ditemukan")
 
@@ -181,6 +264,8 @@ class PemeriksaanService:
             raise ValueError("Tenaga medis tidak ditemukan")
 
         triase_enum = parse_enum(StatusTriase, status_triase)
+        if sinkron_triase_korban:
+            korban = self._korban_dengan_triase(korban, triase_enum)
 
         pemeriksaan_baru = Pemeriksaan(
             id_pemeriksaan=id_pemeriksaan,
@@ -192,36 +277,67 @@ class PemeriksaanService:
             status_triase=triase_enum,
         )
 
-        sukses = self._pemeriksaan_repo.perbarui(id_pemeriksaan, pemeriksaan_baru)
-        if sukses:
-            self._logger.info(
-                f"Pemeriksaan id_pemeriksaan={id_pemeriksaan} berhasil diperbarui ({datetime.now()})"
-            )
+        try:
+            with UnitOfWork() as uow:
+                uow.perbarui(
+                    self._pemeriksaan_repo, id_pemeriksaan, pemeriksaan_baru,
+                    versi_diharapkan=versi_sekarang if versi is None else versi,
+                )
+                if sinkron_triase_korban:
+                    self._jadwalkan_sinkron_triase(uow, korban, versi_korban)
+        except KonflikVersi:
+            self._logger.warning("Konflik versi saat update pemeriksaan id_pemeriksaan=%s", id_pemeriksaan)
+            raise
+        except RuntimeError:
+            self._logger.warning("Gagal update pemeriksaan id_pemeriksaan=%s", id_pemeriksaan)
+            return False
 
-            if sinkron_triase_korban:
-                korban.set_status_triase(triase_enum)
-                self._korban_repo.perbarui(id_korban, korban)
-                self._orang_repo.perbarui(id_korban, korban)
+        self._logger.info("Pemeriksaan id_pemeriksaan=%s berhasil diperbarui", id_pemeriksaan)
+        if sinkron_triase_korban and self._antrian_triase is not None:
+            self._antrian_triase.perbarui(id_korban, korban.get_posko().get_id_posko(), triase_enum)
 
-        return sukses
+        return True
+
+    @staticmethod
+    def _korban_dengan_triase(korban: Korban, triase_enum: StatusTriase) -> Korban:
+        """
+        Salinan korban dengan status triase baru.
+
+        Objek yang tersimpan tidak dimutasi, sehingga jika compare-and-swap
+        versinya kalah dari penulis lain, tidak ada yang perlu dikembalikan.
+        """
+        return Korban._dari_tepercaya(
+            id_orang=korban.get_id_orang(),
+            nama_orang=korban.get_nama_orang(),
+            alamat_orang=korban.get_alamat_orang(),
+            jenis_kelamin_orang=korban.get_jenis_kelamin_orang(),
+            tanggal_lahir_orang=korban.get_tanggal_lahir_orang(),
+            status_triase=triase_enum,
+            kondisi_awal=korban.get_kondisi_awal(),
+            lokasi_ditemukan=korban.get_lokasi_ditemukan(),
+            posko=korban.get_posko(),
+        )
+
+    def _jadwalkan_sinkron_triase(self, uow: UnitOfWork, korban: Korban, versi_korban: int) -> None:
+        """Menjadwalkan update korban (triase baru) di korban_repo & orang_repo."""
+        uow.perbarui(self._korban_repo, korban.get_id_orang(), korban, versi_diharapkan=versi_korban)
+        if self._tulis_orang:  # korban juga tersimpan terpisah sebagai Orang
+            uow.perbarui(self._orang_repo, korban.get_id_orang(), korban)
 
     # ===== DELETE =====
     def hapus_pemeriksaan(self, id_pemeriksaan: str) -> bool:
         """
         Menghapus pemeriksaan berdasarkan id_pemeriksaan.
         """
-        self._logger.info(
-            f"Menghapus pemeriksaan id_pemeriksaan={id_pemeriksaan} ({datetime.now()})"
-        )
+        self._logger.info("Menghapus pemeriksaan id_pemeriksaan=%s", id_pemeriksaan)
         sukses = self._pemeriksaan_repo.hapus(id_pemeriksaan)
 
         if sukses:
-            self._logger.info(
-                f"Pemeriksaan id_pemeriksaan={id_pemeriksaan} berhasil dihapus ({datetime.now()})"
-            )
+            self._logger.info("Pemeriksaan id_pemeriksaan=%s berhasil dihapus", id_pemeriksaan)
         else:
             self._logger.warning(
-                f"Gagal hapus: pemeriksaan id_pemeriksaan={id_pemeriksaan} tidak ditemukan ({datetime.now()})"
+                "Gagal hapus: pemeriksaan id_pemeriksaan=%s tidak ditemukan",
+                id_pemeriksaan,
             )
 
         return sukses
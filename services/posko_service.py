@@ -1,4 +1,4 @@
-from datetime import datetime
+from collections.abc import Iterator
 
 from utils.loggers import get_logger
 from utils.generator_id import generate_id
@@ -65,9 +65,7 @@ class PoskoService:
             ValueError: Jika bencana tidak valid atau status enum tidak valid.
             RuntimeError: Jika repository menolak penyimpanan.
         """
-        self._logger.info(
-            f"Membuat posko untuk bencana_id={bencana_id} ({datetime.now()})"
-        )
+        self._logger.info("Membuat posko untuk bencana_id=%s", bencana_id)
 
         # ===== Validasi FK: Bencana harus ada =====
         bencana: Bencana | None = self._bencana_repo.ambil_berdasarkan_id(bencana_id)
@@ -91,14 +89,10 @@ class PoskoService:
         )
 
         if not self._posko_repo.tambah(posko):
-            self._logger.error(
-                f"Gagal menyimpan posko id_posko={id_posko} ({datetime.now()})"
-            )
+            self._logger.error("Gagal menyimpan posko id_posko=%s", id_posko)
             raise RuntimeError("Gagal menyimpan posko (ID duplikat).")
 
-        self._logger.info(
-            f"Posko id_posko={id_posko} berhasil dibuat ({datetime.now()})"
-        )
+        self._logger.info("Posko id_posko=%s berhasil dibuat", id_posko)
         return id_posko
 
     # ===== READ =====
@@ -106,18 +100,54 @@ class PoskoService:
         """
         Mengambil posko berdasarkan ID.
         """
-        self._logger.info(
-            f"Mengambil posko id_posko={id_posko} ({datetime.now()})"
-        )
+        self._logger.info("Mengambil posko id_posko=%s", id_posko)
         return self._posko_repo.ambil_berdasarkan_id(id_posko)
 
+    def ambil_posko_dengan_versi(self, id_posko: str) -> tuple[Posko | None, int | None]:
+        """
+        Mengambil posko beserta versinya, untuk perbarui_posko(versi=...).
+        """
+        self._logger.info("Mengambil posko id_posko=%s beserta versi", id_posko)
+        return self._posko_repo.ambil_dengan_versi(id_posko)
+
     def ambil_semua_posko(self) -> list[Posko]:
         """
         Mengambil semua data posko.
         """
-        self._logger.info(f"Mengambil semua posko ({datetime.now()})")
+        self._logger.info("Mengambil semua posko")
         return self._posko_repo.ambil_semua()
 
+    def iter_semua_posko(self, ukuran_batch: int = 500) -> Iterator[Posko]:
+        """
+        Mengiterasi seluruh data posko secara streaming tanpa menyalin isi repository.
+        """
+        self._logger.info("Streaming semua posko")
+        return self._posko_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_posko(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[Posko], str | None]:
+        """
+        Mengambil satu halaman data posko (keyset pagination).
+
+        Args:
+            setelah_id (str | None): Cursor dari halaman sebelumnya (None = halaman pertama).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[Posko], str | None]: Isi halaman dan cursor halaman berikutnya.
+        """
+        self._logger.info("Mengambil halaman posko setelah=%s batas=%s", setelah_id, batas)
+        return self._posko_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_posko(self) -> int:
+        """
+        Menghitung jumlah data posko.
+        """
+        return self._posko_repo.hitung()
+
     # ===== UPDATE =====
     def perbarui_posko(
         self,
@@ -127,15 +157,21 @@ class PoskoService:
         alamat_posko: str,
         kapasitas_posko: int,
         status_posko: str,
+        versi: int | None = None,
     ) -> bool:
         """
-        Memperbarui data posko berdasarkan ID.
+        Memperbarui data posko berdasarkan ID tanpa mengunci (optimistic concurrency).
+
+        Args:
+            versi (int | None, optional): Versi dari ambil_posko_dengan_versi().
+                None = versi yang dibaca di awal pemanggilan ini.
+
+        Raises:
+            KonflikVersi: Jika posko sudah diubah pihak lain sejak versi tersebut.
         """
-        existing = self._posko_repo.ambil_berdasarkan_id(id_posko)
+        existing, versi_sekarang = self._posko_repo.ambil_dengan_versi(id_posko)
         if existing is None:
-            self._logger.warning(
-                f"Gagal perbarui: posko id_posko={id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal perbarui: posko id_posko=%s tidak ditemukan", id_posko)
             return False
 
         bencana = self._bencana_repo.ambil_berdasarkan_id(bencana_id)
@@ -153,11 +189,11 @@ class PoskoService:
             status_posko=status_enum,
         )
 
-        sukses = self._posko_repo.perbarui(id_posko, posko_baru)
+        sukses = self._posko_repo.perbarui(
+            id_posko, posko_baru, versi_diharapkan=versi_sekarang if versi is None else versi
+        )
         if sukses:
-            self._logger.info(
-                f"Posko id_posko={id_posko} berhasil diperbarui ({datetime.now()})"
-            )
+            self._logger.info("Posko id_posko=%s berhasil diperbarui", id_posko)
 
         return sukses
 
@@ -166,19 +202,13 @@ class PoskoService:
         """
         Menghapus posko berdasarkan ID.
         """
-        self._logger.info(
-            f"Menghapus posko id_posko={id_posko} ({datetime.now()})"
-        )
+        self._logger.info("Menghapus posko id_posko=%s", id_posko)
         sukses = self._posko_repo.hapus(id_posko)
 
         if sukses:
-            self._logger.info(
-                f"Posko id_posko={id_posko} berhasil dihapus ({datetime.now()})"
-            )
+            self._logger.info("Posko id_posko=%s berhasil dihapus", id_posko)
         else:
-            self._logger.warning(
-                f"Gagal hapus: posko id_posko={id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal hapus: posko id_posko=%s tidak ditemukan", id_posko)
 
         return sukses
 
@@ -189,9 +219,7 @@ class PoskoService:
         """
         posko = self._posko_repo.ambil_berdasarkan_id(id_posko)
         if posko is None:
-            self._logger.warning(
-                f"Gagal ubah status: posko id_posko={id_posko} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal ubah status: posko id_posko=%s tidak ditemukan", id_posko)
             return False
 
         status_enum: StatusPosko = parse_enum(StatusPosko, status_posko)
@@ -201,7 +229,8 @@ class PoskoService:
         sukses = self._posko_repo.perbarui(id_posko, posko)
         if sukses:
             self._logger.info(
-                f"Status posko id_posko={id_posko} diubah menjadi {status_enum.value} ({datetime.now()})"
+                "Status posko id_posko=%s diubah menjadi %s",
+                id_posko, status_enum.value,
             )
 
         return sukses
\ No newline at end of file
@@ -1,14 +1,20 @@
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
+from typing import TYPE_CHECKING
 
 from utils.loggers import get_logger
 from utils.generator_id import generate_id
 
 from models.resep_obat import ResepObat
 from models.resep_item import ResepItem
-from models.obat import Obat
 from models.pemeriksaan import Pemeriksaan
 
 from repositories.base_repository import BaseRepository
+from repositories.unit_of_work import UnitOfWork
+from services.reservasi_stok import ReservasiStok
+
+if TYPE_CHECKING:  # NumPy hanya dibutuhkan jika analitik dipakai
+    from services.analitik_konsumsi import AnalitikKonsumsi
 
 
 class ResepObatService:
@@ -17,10 +23,14 @@ class ResepObatService:
         resep_repo: BaseRepository,
         pemeriksaan_repo: BaseRepository,
         obat_repo: BaseRepository,
+        reservasi_stok: ReservasiStok | None = None,
+        analitik_konsumsi: "AnalitikKonsumsi | None" = None,
     ):
         self._resep_repo = resep_repo
         self._pemeriksaan_repo = pemeriksaan_repo
         self._obat_repo = obat_repo
+        self._reservasi_stok = reservasi_stok or ReservasiStok.untuk_repo(obat_repo)
+        self._analitik_konsumsi = analitik_konsumsi
         self._logger = get_logger(__name__)
 
     def buat_resep(
@@ -29,8 +39,7 @@ class ResepObatService:
         items_input: list[dict],
         tanggal_resep: date | None = None,
     ) -> str:
-        now = datetime.now()
-        self._logger.info(f"Membuat resep obat baru ({now})")
+        self._logger.info("Membuat resep obat baru")
 
         # ===== FK: pemeriksaan harus ada =====
         pemeriksaan: Pemeriksaan | None = self._pemeriksaan_repo.ambil_berdasarkan_id(id_pemeriksaan)
@@ -75,48 +84,28 @@ class ResepObatService:
             else:
                 merged_items[id_obat]["qty"] += qty
 
-        resep_items: list[ResepItem] = []
-        stok_awal: dict[str, int] = {}  # id_obat -> stok sebelum transaksi
-
-        for id_obat, item in merged_items.items():
-            obat: Obat | None = self._obat_repo.ambil_berdasarkan_id(id_obat)
-            if obat is None:
-                raise ValueError(f"Obat tidak ditemukan (id_obat={id_obat})")
+        # ===== Cek & kurangi stok secara atomik (lock per obat, urut id_obat) =====
+        nomor_reservasi, daftar_obat = self._reservasi_stok.reservasi(
+            {id_obat: item["qty"] for id_obat, item in merged_items.items()}
+        )
 
-            # Perbaikan: getter stok
-            stok_awal[id_obat] = obat.get_stock_obat()
+        with UnitOfWork() as uow:
+            # ===== ROLLBACK stok (dikembalikan sebagai delta) jika resep gagal disimpan =====
+            uow.saat_rollback(lambda: self._batalkan_reservasi(nomor_reservasi))
 
-            if obat.get_stock_obat() < item["qty"]:
-                # Perbaikan: getter nama
-                raise ValueError(f"Stok obat '{obat.get_nama_obat()}' tidak cukup")
-
-            resep_items.append(
+            resep_items: list[ResepItem] = [
                 ResepItem(
-                    obat=obat,
+                    obat=daftar_obat[id_obat],
                     qty=item["qty"],
                     aturan_pakai=item["aturan_pakai"],
                     dosis=item["dosis"],
                 )
-            )
-
-        # ===== Jika semua valid, baru kurangi stok (transaksi) =====
-        changed_obats: list[Obat] = []
-
-        try:
+                for id_obat, item in merged_items.items()
+            ]
             for resep_item in resep_items:
-                obat = resep_item.get_obat()
-                id_obat = obat.get_id_obat()
-
-                # Perbaikan: getter & setter stok
-                stok_baru = obat.get_stock_obat() - resep_item.get_qty()
-                obat.set_stock_obat(stok_baru)
-
-                if not self._obat_repo.perbarui(id_obat, obat):
-                    raise RuntimeError(f"Gagal update stok obat (id_obat={id_obat})")
-
-                changed_obats.append(obat)
                 self._logger.info(
-                    f"Stok obat id_obat={id_obat} dikurangi qty={resep_item.get_qty()} ({now})"
+                    "Stok obat id_obat=%s dikurangi qty=%s",
+                    resep_item.get_obat().get_id_obat(), resep_item.get_qty(),
                 )
 
             # ===== Buat & simpan resep =====
@@ -128,37 +117,45 @@ class ResepObatService:
                 tanggal_resep=tanggal_resep,
             )
 
-            if not self._resep_repo.tambah(resep):
+            uow.tambah(self._resep_repo, id_resep, resep)
+            try:
+                uow.commit()
+            except RuntimeError:
                 raise RuntimeError("Gagal menyimpan resep (ID duplikat)")
 
-            self._logger.info(f"Resep id_resep={id_resep} berhasil dibuat ({now})")
-            return id_resep
-
-        except Exception as e:
-            # ===== ROLLBACK stok =====
-            self._logger.error(f"Transaksi resep gagal, rollback stok... ({now})")
+        self._reservasi_stok.konfirmasi(nomor_reservasi)
+        if self._analitik_konsumsi is not None:
+            self._analitik_konsumsi.catat_resep(resep)
+        self._logger.info("Resep id_resep=%s berhasil dibuat", id_resep)
+        return id_resep
 
-            for obat in changed_obats:
-                id_obat = obat.get_id_obat()
-                if id_obat in stok_awal:
-                    try:
-                        # Perbaikan: setter stok
-                        obat.set_stock_obat(stok_awal[id_obat])
-                        if not self._obat_repo.perbarui(id_obat, obat):
-                            self._logger.error(f"Rollback gagal update repo untuk id_obat={id_obat} ({now})")
-                    except Exception:
-                        self._logger.error(f"Rollback gagal untuk id_obat={id_obat} ({now})")
-
-            raise e
+    def _batalkan_reservasi(self, nomor_reservasi: int) -> None:
+        self._logger.error("Transaksi resep gagal, rollback stok...")
+        self._reservasi_stok.batal(nomor_reservasi)
 
     def ambil_resep(self, id_resep: str) -> ResepObat | None:
-        self._logger.info(f"Mengambil resep id_resep={id_resep} ({datetime.now()})")
+        self._logger.info("Mengambil resep id_resep=%s", id_resep)
         return self._resep_repo.ambil_berdasarkan_id(id_resep)
 
     def ambil_semua_resep(self) -> list[ResepObat]:
-        self._logger.info(f"Mengambil semua resep ({datetime.now()})")
+        self._logger.info("Mengambil semua resep")
         return self._resep_repo.ambil_semua()
 
+    def iter_semua_resep(self, ukuran_batch: int = 500) -> Iterator[ResepObat]:
+        self._logger.info("Streaming semua resep")
+        return self._resep_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_resep(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[ResepObat], str | None]:
+        self._logger.info("Mengambil halaman resep setelah=%s batas=%s", setelah_id, batas)
+        return self._resep_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_resep(self) -> int:
+        return self._resep_repo.hitung()
+
     def hapus_resep(self, id_resep: str) -> bool:
-        self._logger.info(f"Menghapus resep id_resep={id_resep} ({datetime.now()})")
+        self._logger.info("Menghapus resep id_resep=%s", id_resep)
         return self._resep_repo.hapus(id_resep)
\ No newline at end of file
@@ -0,0 +1,284 @@
+import itertools
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from contextlib import ExitStack, contextmanager
+
+from utils.loggers import get_logger
+
+from models.obat import Obat
+from repositories.base_repository import BaseRepository
+
+
+class ReservasiStok:
+    """
+    Mesin reservasi stok obat yang aman dipakai banyak thread.
+
+    Setiap obat punya lock sendiri. Operasi yang menyentuh beberapa obat
+    mengambil lock-nya berurutan menurut id_obat, sehingga dua resep yang
+    berbagi obat tidak bisa saling menunggu (deadlock). Cek stok dan
+    pengurangan dilakukan di bawah lock yang sama, jadi dua resep tidak
+    bisa sama-sama lolos cek lalu membuat stok negatif.
+
+    Perubahan stok selalu berupa delta terhadap stok terkini (bukan menimpa
+    dengan nilai lama), sehingga pembatalan satu reservasi tidak menghapus
+    pengurangan milik transaksi lain. Pengurangan diambil FEFO dari lot
+    obat yang belum kadaluarsa, dan pembatalan mengembalikan jumlah ke lot
+    asalnya.
+
+    Gunakan untuk_repo() agar seluruh service yang memakai repository obat
+    yang sama berbagi satu mesin reservasi (dan satu set lock).
+
+    Setiap perubahan stok yang tersimpan diumumkan ke pendengar yang
+    didaftarkan lewat tambah_pendengar() (misalnya PemantauStok), masih di
+    bawah lock obat tersebut sehingga urutan kejadian per obat terjaga.
+    """
+
+    _per_repo: "weakref.WeakKeyDictionary[BaseRepository, ReservasiStok]" = weakref.WeakKeyDictionary()
+    _kunci_per_repo = threading.Lock()
+
+    def __init__(self, obat_repo: BaseRepository):
+        """
+        Inisialisasi mesin reservasi.
+
+        Args:
+            obat_repo (BaseRepository): Repository Obat.
+        """
+        self._obat_repo = obat_repo
+        self._kunci_obat: dict[str, threading.RLock] = {}
+        self._kunci_daftar = threading.Lock()
+        self._aktif: dict[int, dict[str, list]] = {}  # key: id reservasi, value: {id_obat: lot yang diambil}
+        self._nomor = itertools.count(1)
+        self._pendengar: list[Callable[[str, Obat | None], None]] = []
+        self._logger = get_logger(__name__)
+
+    @classmethod
+    def untuk_repo(cls, obat_repo: BaseRepository) -> "ReservasiStok":
+        """
+        Mengambil mesin reservasi bersama untuk satu repository obat.
+
+        Args:
+            obat_repo (BaseRepository): Repository Obat.
+
+        Returns:
+            ReservasiStok: Instance yang sama untuk repository yang sama.
+        """
+        with cls._kunci_per_repo:
+            mesin = cls._per_repo.get(obat_repo)
+            if mesin is None:
+                mesin = cls(obat_repo)
+                cls._per_repo[obat_repo] = mesin
+            return mesin
+
+    # ====== LOCK PER OBAT ======
+
+    def _kunci_untuk(self, id_obat: str) -> threading.RLock:
+        kunci = self._kunci_obat.get(id_obat)
+        if kunci is None:
+            with self._kunci_daftar:
+                kunci = self._kunci_obat.setdefault(id_obat, threading.RLock())
+        return kunci
+
+    @contextmanager
+    def kunci(self, *daftar_id_obat: str):
+        """
+        Mengunci satu atau beberapa obat (urut id_obat untuk mencegah deadlock).
+
+        Args:
+            *daftar_id_obat (str): ID obat yang akan dikunci.
+        """
+        with ExitStack() as stack:
+            for id_obat in sorted(set(daftar_id_obat)):
+                stack.enter_context(self._kunci_untuk(id_obat))
+            yield
+
+    # ====== PENDENGAR PERUBAHAN STOK ======
+
+    def tambah_pendengar(self, fungsi: Callable[[str, Obat | None], None]) -> None:
+        """
+        Mendaftarkan fungsi yang dipanggil setiap kali stok obat berubah.
+
+        Args:
+            fungsi (Callable[[str, Obat | None], None]): Dipanggil dengan
+                (id_obat, obat terkini), atau (id_obat, None) jika obat dihapus.
+        """
+        self._pendengar.append(fungsi)
+
+    def umumkan(self, id_obat: str, obat: Obat | None) -> None:
+        """
+        Memberi tahu pendengar tentang kondisi terbaru satu obat.
+
+        Kesalahan di pendengar hanya dicatat dan tidak menggagalkan operasi stok.
+
+        Args:
+            id_obat (str): ID obat.
+            obat (Obat | None): Obat terkini, atau None jika obat dihapus.
+        """
+        for fungsi in self._pendengar:
+            try:
+                fungsi(id_obat, obat)
+            except Exception:
+                self._logger.exception("Pendengar stok gagal untuk id_obat=%s", id_obat)
+
+    def simpan(self, obat: Obat, id_lot_berubah: Iterable[str] | None = None) -> bool:
+        """
+        Menyimpan obat ke repository lalu mengumumkan perubahannya.
+
+        Pemanggil harus memegang kunci(id_obat).
+
+        Args:
+            obat (Obat): Obat yang disimpan.
+            id_lot_berubah (Iterable[str] | None, optional): Lot yang berubah.
+                Jika diisi, repository hanya menulis lot tersebut
+                (perbarui_lot); None = simpan seluruh obat.
+
+        Returns:
+            bool: False jika penyimpanan gagal.
+        """
+        id_obat = obat.get_id_obat()
+        if id_lot_berubah is None:
+            sukses = self._obat_repo.perbarui(id_obat, obat)
+        else:
+            sukses = self._obat_repo.perbarui_lot(id_obat, obat, id_lot_berubah)
+        if not sukses:
+            return False
+        self.umumkan(id_obat, obat)
+        return True
+
+    # ====== HELPER INTERNAL (lock sudah dipegang) ======
+
+    def _simpan(self, obat: Obat, id_lot_berubah: Iterable[str] | None = None) -> None:
+        if not self.simpan(obat, id_lot_berubah):
+            raise RuntimeError(f"Gagal update stok obat (id_obat={obat.get_id_obat()})")
+
+    def _kurangi(self, obat: Obat, qty: int) -> list[tuple]:
+        """Mengurangi stok FEFO lalu menyimpan; mengembalikan lot yang diambil."""
+        diambil = obat.ambil_fefo(qty)
+        try:
+            self._simpan(obat, self._id_lot(diambil))
+        except Exception:
+            self._kembalikan_lot(obat, diambil)
+            raise
+        return diambil
+
+    @staticmethod
+    def _kembalikan_lot(obat: Obat, diambil: list[tuple]) -> None:
+        for id_lot, tanggal, jumlah in diambil:
+            obat.tambah_lot(id_lot, jumlah, tanggal)
+
+    @staticmethod
+    def _id_lot(diambil: list[tuple]) -> set[str]:
+        return {id_lot for id_lot, _, _ in diambil}
+
+    # ====== OPERASI STOK ======
+
+    def ubah_stok(self, id_obat: str, delta: int) -> bool:
+        """
+        Menambah (delta > 0) atau mengurangi (delta < 0) stok satu obat secara atomik.
+
+        Returns:
+            bool: False jika obat tidak ditemukan atau stok tidak cukup.
+        """
+        with self.kunci(id_obat):
+            obat: Obat | None = self._obat_repo.ambil_berdasarkan_id(id_obat)
+            if obat is None:
+                return False
+
+            if delta < 0:
+                # Lot kadaluarsa tidak ikut dihitung sebagai stok yang bisa dikeluarkan
+                tersedia = obat.get_stok_tersedia()
+                if tersedia + delta < 0:
+                    self._logger.warning(
+                        "Stok tidak cukup id_obat=%s stok tersedia=%s delta=%s", id_obat, tersedia, delta
+                    )
+                    return False
+                self._kurangi(obat, -delta)
+            else:
+                lot = obat.tambah_lot_default(delta)
+                self._simpan(obat, (lot.get_id_lot(),))
+            return True
+
+    def reservasi(self, kebutuhan: dict[str, int]) -> tuple[int, dict[str, Obat]]:
+        """
+        Memesan stok beberapa obat sekaligus (semua atau tidak sama sekali).
+
+        Stok langsung dikurangi; panggil konfirmasi() jika transaksi berhasil
+        atau batal() untuk mengembalikan stok.
+
+        Args:
+            kebutuhan (dict[str, int]): Qty per id_obat (qty > 0).
+
+        Returns:
+            tuple[int, dict[str, Obat]]: ID reservasi dan objek Obat per id_obat.
+
+        Raises:
+            ValueError: Jika obat tidak ditemukan atau stok tidak cukup.
+        """
+        with self.kunci(*kebutuhan):
+            daftar_obat: dict[str, Obat] = {}
+            for id_obat, qty in kebutuhan.items():
+                obat: Obat | None = self._obat_repo.ambil_berdasarkan_id(id_obat)
+                if obat is None:
+                    raise ValueError(f"Obat tidak ditemukan (id_obat={id_obat})")
+                if obat.get_stok_tersedia() < qty:
+                    raise ValueError(f"Stok obat '{obat.get_nama_obat()}' tidak cukup")
+                daftar_obat[id_obat] = obat
+
+            terpakai: dict[str, list] = {}
+            try:
+                for id_obat, qty in kebutuhan.items():
+                    terpakai[id_obat] = self._kurangi(daftar_obat[id_obat], qty)
+            except Exception:
+                for id_obat, diambil in terpakai.items():
+                    self._kembalikan_lot(daftar_obat[id_obat], diambil)
+                    self._simpan(daftar_obat[id_obat], self._id_lot(diambil))
+                raise
+
+            nomor = next(self._nomor)
+            self._aktif[nomor] = terpakai
+
+        self._logger.info("Reservasi #%s dibuat untuk %s obat", nomor, len(terpakai))
+        return nomor, daftar_obat
+
+    def konfirmasi(self, nomor: int) -> None:
+        """
+        Menandai reservasi selesai; stok yang sudah dikurangi tetap terpakai.
+
+        Args:
+            nomor (int): ID reservasi dari reservasi().
+        """
+        self._aktif.pop(nomor, None)
+
+    def batal(self, nomor: int) -> None:
+        """
+        Membatalkan reservasi dan mengembalikan stok ke lot asalnya (sebagai delta).
+
+        Args:
+            nomor (int): ID reservasi dari reservasi().
+        """
+        terpakai = self._aktif.pop(nomor, None)
+        if not terpakai:
+            return
+
+        with self.kunci(*terpakai):
+            for id_obat, diambil in terpakai.items():
+                obat = self._obat_repo.ambil_berdasarkan_id(id_obat)
+                if obat is None:
+                    self._logger.error("Rollback gagal: obat id_obat=%s sudah tidak ada", id_obat)
+                    continue
+                try:
+                    self._kembalikan_lot(obat, diambil)
+                    self._simpan(obat, self._id_lot(diambil))
+                except Exception:
+                    self._logger.error("Rollback gagal untuk id_obat=%s", id_obat)
+
+        self._logger.info("Reservasi #%s dibatalkan, stok dikembalikan", nomor)
+
+    def jumlah_aktif(self) -> int:
+        """
+        Menghitung reservasi yang belum dikonfirmasi/dibatalkan.
+
+        Returns:
+            int: Jumlah reservasi aktif.
+        """
+        return len(self._aktif)
@@ -1,14 +1,16 @@
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
 
 from utils.loggers import get_logger
-from utils.generator_id import generate_id
+from utils.generator_id import generate_id, generate_id_batch
 from utils.enums.jenis_kelamin import JenisKelamin
 from utils.enums.role_tenaga_medis import RoleTenagaMedis
 from utils.enum_parser import parse_enum
 
 from models.tenaga_medis import TenagaMedis
 from models.posko import Posko
-from repositories.base_repository import BaseRepository
+from repositories.base_repository import BaseRepository, KonflikVersi
+from repositories.unit_of_work import UnitOfWork
 
 
 class TenagaMedisService:
@@ -40,6 +42,8 @@ class TenagaMedisService:
         self._tenaga_medis_repo = tenaga_medis_repo
         self._orang_repo = orang_repo
         self._posko_repo = posko_repo
+        # Penyimpanan bersama: satu penulisan ke tenaga_medis_repo sudah terlihat di orang_repo
+        self._tulis_orang = not tenaga_medis_repo.berbagi_penyimpanan(orang_repo)
         self._logger = get_logger(__name__)
 
     # ===== CREATE =====
@@ -74,7 +78,7 @@ class TenagaMedisService:
             ValueError: Jika posko tidak ditemukan atau enum tidak valid.
             RuntimeError: Jika penyimpanan gagal.
         """
-        self._logger.info(f"Membuat tenaga medis baru ({datetime.now()})")
+        self._logger.info("Membuat tenaga medis baru")
 
         # ===== Validasi FK Posko =====
         posko: Posko | None = self._posko_repo.ambil_berdasarkan_id(id_posko)
@@ -100,44 +104,162 @@ class TenagaMedisService:
             spesialisasi=spesialisasi,
         )
 
-        # ===== Simpan ke OrangRepository =====
-        if not self._orang_repo.tambah(tenaga_medis):
-            self._logger.error(
-                f"Gagal simpan Orang (TenagaMedis) id_orang={id_orang} ({datetime.now()})"
-            )
-            raise RuntimeError("Gagal menyimpan data orang (Tenaga Medis)")
-
-        # ===== Simpan ke TenagaMedisRepository =====
-        if not self._tenaga_medis_repo.tambah(tenaga_medis):
-            # rollback sederhana
-            self._orang_repo.hapus(id_orang)
-            self._logger.error(
-                f"Gagal simpan TenagaMedis id_orang={id_orang} ({datetime.now()})"
-            )
+        # ===== Simpan ke OrangRepository & TenagaMedisRepository (semua atau tidak sama sekali) =====
+        try:
+            with UnitOfWork() as uow:
+                if self._tulis_orang:
+                    uow.tambah(self._orang_repo, id_orang, tenaga_medis)
+                uow.tambah(self._tenaga_medis_repo, id_orang, tenaga_medis)
+        except RuntimeError:
+            self._logger.error("Gagal simpan TenagaMedis id_orang=%s", id_orang)
             raise RuntimeError("Gagal menyimpan data tenaga medis")
 
+        self._logger.info("TenagaMedis id_orang=%s berhasil dibuat", id_orang)
+        return id_orang
+
+    def buat_tenaga_medis_batch(self, records: list[dict], daftar_id: list[str] | None = None) -> list[dict]:
+        """
+        Membuat banyak Tenaga Medis sekaligus (impor data relawan medis).
+
+        Setiap record berisi key yang sama dengan parameter buat_tenaga_medis().
+        Record yang tidak valid tidak menghentikan record lain. Setiap posko
+        hanya diambil sekali, ID dialokasikan sekaligus, dan penyimpanan ke
+        orang_repo/tenaga_medis_repo masing-masing lewat satu tambah_banyak()
+        dalam satu UnitOfWork: jika penyimpanan gagal, seluruh record valid
+        ikut gagal.
+
+        Args:
+            records (list[dict]): Data tenaga medis per baris.
+            daftar_id (list[str] | None, optional): ID per record sesuai urutan
+                records (misalnya ID deterministik dari impor). Default: None
+                (ID baru dibuat).
+
+        Returns:
+            list[dict]: Hasil per record sesuai urutan input, berisi
+            "indeks", "sukses", "id_orang" (None jika gagal) dan "error"
+            (None jika sukses).
+
+        Raises:
+            ValueError: Jika panjang daftar_id berbeda dengan records.
+        """
+        self._logger.info("Membuat tenaga medis batch (jumlah=%s)", len(records))
+
+        hasil = [
+            {"indeks": i, "sukses": False, "id_orang": None, "error": None}
+            for i in range(len(records))
+        ]
+        if daftar_id is None:
+            daftar_id = generate_id_batch(len(records))
+        elif len(daftar_id) != len(records):
+            raise ValueError("Jumlah daftar_id harus sama dengan jumlah records")
+        cache_posko: dict[str, Posko | None] = {}
+        valid: list[tuple[int, TenagaMedis]] = []
+
+        # ===== Validasi seluruh record =====
+        for i, record in enumerate(records):
+            try:
+                id_posko = record["id_posko"]
+                if id_posko not in cache_posko:
+                    cache_posko[id_posko] = self._posko_repo.ambil_berdasarkan_id(id_posko)
+                posko = cache_posko[id_posko]
+                if posko is None:
+                    raise ValueError("Posko tidak ditemukan")
+
+                tenaga_medis = TenagaMedis(
+                    id_orang=daftar_id[i],
+                    nama_orang=record["nama_orang"],
+                    alamat_orang=record["alamat_orang"],
+                    jenis_kelamin_orang=parse_enum(JenisKelamin, record["jenis_kelamin_orang"]),
+                    tanggal_lahir_orang=record["tanggal_lahir_orang"],
+                    posko=posko,
+                    no_izin_praktik=record["no_izin_praktik"],
+                    role=parse_enum(RoleTenagaMedis, record["role"]),
+                    spesialisasi=record["spesialisasi"],
+                )
+            except KeyError as e:
+                hasil[i]["error"] = f"Field wajib tidak ada: {e.args[0]}"
+            except (TypeError, ValueError) as e:
+                hasil[i]["error"] = str(e)
+            else:
+                valid.append((i, tenaga_medis))
+
+        # ===== Simpan ke OrangRepository & TenagaMedisRepository (semua atau tidak sama sekali) =====
+        daftar_id_valid = [tm.get_id_orang() for _, tm in valid]
+        daftar_tm = [tm for _, tm in valid]
+        try:
+            with UnitOfWork() as uow:
+                if self._tulis_orang:
+                    uow.tambah_banyak(self._orang_repo, daftar_id_valid, daftar_tm)
+                uow.tambah_banyak(self._tenaga_medis_repo, daftar_id_valid, daftar_tm)
+        except RuntimeError:
+            self._logger.error("Gagal simpan tenaga medis batch (jumlah valid=%s)", len(valid))
+            for i, _ in valid:
+                hasil[i]["error"] = "Gagal menyimpan data tenaga medis"
+        else:
+            for i, tenaga_medis in valid:
+                hasil[i]["sukses"] = True
+                hasil[i]["id_orang"] = tenaga_medis.get_id_orang()
+
+        jumlah_sukses = sum(1 for h in hasil if h["sukses"])
         self._logger.info(
-            f"TenagaMedis id_orang={id_orang} berhasil dibuat ({datetime.now()})"
+            "Tenaga medis batch selesai: %s berhasil, %s gagal",
+            jumlah_sukses, len(hasil) - jumlah_sukses,
         )
-        return id_orang
+        return hasil
 
     # ===== READ =====
     def ambil_tenaga_medis(self, id_orang: str) -> TenagaMedis | None:
         """
         Mengambil Tenaga Medis berdasarkan id_orang.
         """
-        self._logger.info(
-            f"Mengambil tenaga medis id_orang={id_orang} ({datetime.now()})"
-        )
+        self._logger.info("Mengambil tenaga medis id_orang=%s", id_orang)
         return self._tenaga_medis_repo.ambil_berdasarkan_id(id_orang)
 
+    def ambil_tenaga_medis_dengan_versi(self, id_orang: str) -> tuple[TenagaMedis | None, int | None]:
+        """
+        Mengambil Tenaga Medis beserta versinya, untuk perbarui_tenaga_medis(versi=...).
+        """
+        self._logger.info("Mengambil tenaga medis id_orang=%s beserta versi", id_orang)
+        return self._tenaga_medis_repo.ambil_dengan_versi(id_orang)
+
     def ambil_semua_tenaga_medis(self) -> list[TenagaMedis]:
         """
         Mengambil semua data Tenaga Medis.
         """
-        self._logger.info(f"Mengambil semua tenaga medis ({datetime.now()})")
+        self._logger.info("Mengambil semua tenaga medis")
         return self._tenaga_medis_repo.ambil_semua()
 
+    def iter_semua_tenaga_medis(self, ukuran_batch: int = 500) -> Iterator[TenagaMedis]:
+        """
+        Mengiterasi seluruh data Tenaga Medis secara streaming tanpa menyalin isi repository.
+        """
+        self._logger.info("Streaming semua tenaga medis")
+        return self._tenaga_medis_repo.iter_semua(ukuran_batch)
+
+    def ambil_halaman_tenaga_medis(
+        self,
+        setelah_id: str | None = None,
+        batas: int = 100,
+    ) -> tuple[list[TenagaMedis], str | None]:
+        """
+        Mengambil satu halaman data Tenaga Medis (keyset pagination).
+
+        Args:
+            setelah_id (str | None): Cursor dari halaman sebelumnya (None = halaman pertama).
+            batas (int): Jumlah data maksimal per halaman.
+
+        Returns:
+            tuple[list[TenagaMedis], str | None]: Isi halaman dan cursor halaman berikutnya.
+        """
+        self._logger.info("Mengambil halaman tenaga medis setelah=%s batas=%s", setelah_id, batas)
+        return self._tenaga_medis_repo.ambil_halaman(setelah_id, batas)
+
+    def hitung_tenaga_medis(self) -> int:
+        """
+        Menghitung jumlah data Tenaga Medis.
+        """
+        return self._tenaga_medis_repo.hitung()
+
     # ===== UPDATE =====
     def perbarui_tenaga_medis(
         self,
@@ -150,15 +272,21 @@ class TenagaMedisService:
         no_izin_praktik: str,
         role: str,
         spesialisasi: str,
+        versi: int | None = None,
     ) -> bool:
         """
-        Memperbarui data Tenaga Medis.
+        Memperbarui data Tenaga Medis tanpa mengunci (optimistic concurrency).
+
+        Args:
+            versi (int | None, optional): Versi dari ambil_tenaga_medis_dengan_versi().
+                None = versi yang dibaca di awal pemanggilan ini.
+
+        Raises:
+            KonflikVersi: Jika data sudah diubah pihak lain sejak versi tersebut.
         """
-        existing = self._tenaga_medis_repo.ambil_berdasarkan_id(id_orang)
+        existing, versi_sekarang = self._tenaga_medis_repo.ambil_dengan_versi(id_orang)
         if existing is None:
-            self._logger.warning(
-                f"Gagal update: tenaga medis id_orang={id_orang} tidak ditemukan ({datetime.now()})"
-            )
+            self._logger.warning("Gagal update: tenaga medis id_orang=%s tidak ditemukan", id_orang)
             return False
 
         posko = self._posko_repo.ambil_berdasarkan_id(id_posko)
@@ -180,39 +308,39 @@ class TenagaMedisService:
             spesialisasi=spesialisasi,
         )
 
-        sukses_orang = self._orang_repo.perbarui(id_orang, tenaga_medis_baru)
-        sukses_tm = self._tenaga_medis_repo.perbarui(id_orang, tenaga_medis_baru)
-
-        if sukses_orang and sukses_tm:
-            self._logger.info(
-                f"TenagaMedis id_orang={id_orang} berhasil diperbarui ({datetime.now()})"
-            )
-            return True
+        try:
+            with UnitOfWork() as uow:
+                if self._tulis_orang:
+                    uow.perbarui(self._orang_repo, id_orang, tenaga_medis_baru)
+                uow.perbarui(
+                    self._tenaga_medis_repo, id_orang, tenaga_medis_baru,
+                    versi_diharapkan=versi_sekarang if versi is None else versi,
+                )
+        except KonflikVersi:
+            self._logger.warning("Konflik versi saat update tenaga medis id_orang=%s", id_orang)
+            raise
+        except RuntimeError:
+            self._logger.warning("Gagal update tenaga medis id_orang=%s", id_orang)
+            return False
 
-        self._logger.warning(
-            f"Gagal update sebagian tenaga medis id_orang={id_orang} ({datetime.now()})"
-        )
-        return False
+        self._logger.info("TenagaMedis id_orang=%s berhasil diperbarui", id_orang)
+        return True
 
     # ===== DELETE =====
     def hapus_tenaga_medis(self, id_orang: str) -> bool:
         """
         Menghapus Tenaga Medis.
         """
-        self._logger.info(
-            f"Menghapus tenaga medis id_orang={id_orang} ({datetime.now()})"
-        )
+        self._logger.info("Menghapus tenaga medis id_orang=%s", id_orang)
 
-        sukses_tm = self._tenaga_medis_repo.hapus(id_orang)
-        sukses_orang = self._orang_repo.hapus(id_orang)
-
-        if sukses_tm and sukses_orang:
-            self._logger.info(
-                f"TenagaMedis id_orang={id_orang} berhasil dihapus ({datetime.now()})"
-            )
-            return True
+        try:
+            with UnitOfWork() as uow:
+                uow.hapus(self._tenaga_medis_repo, id_orang)
+                if self._tulis_orang:
+                    uow.hapus(self._orang_repo, id_orang)
+        except RuntimeError:
+            self._logger.warning("Gagal hapus tenaga medis id_orang=%s", id_orang)
+            return False
 
-        self._logger.warning(
-            f"Gagal hapus tenaga medis id_orang={id_orang} ({datetime.now()})"
-        )
-        return False
+        self._logger.info("TenagaMedis id_orang=%s berhasil dihapus", id_orang)
+        return True
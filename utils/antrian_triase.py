@@ -0,0 +1,202 @@
+import heapq
+import itertools
+import threading
+
+from utils.enums.status_triase import StatusTriase
+
+# Semakin kecil semakin didahulukan; HITAM tidak masuk heap
+PRIORITAS_TRIASE = {
+    StatusTriase.MERAH: 0,
+    StatusTriase.KUNING: 1,
+    StatusTriase.HIJAU: 2,
+}
+
+
+class AntrianTriase:
+    """
+    Antrian prioritas pasien per posko berdasarkan triase lalu lama menunggu.
+
+    Urutan: merah > kuning > hijau, lalu yang lebih dulu masuk antrian.
+    Korban triase hitam dicatat terpisah dan tidak pernah dikembalikan
+    oleh ambil_berikutnya().
+
+    Setiap posko punya heap sendiri. Perubahan triase/posko tidak mencari
+    entri lama di heap; entri baru didorong dan entri lama dianggap basi
+    (lazy invalidation), sehingga push, pop dan reprioritas O(log n).
+    Nomor urut kedatangan dipertahankan saat reprioritas agar korban tidak
+    kehilangan waktu tunggunya.
+    """
+
+    def __init__(self):
+        """Inisialisasi antrian kosong."""
+        self._heap = {}  # key: id_posko, value: list[(prioritas, urutan, id_orang)]
+        self._jumlah = {}  # key: id_posko, value: jumlah entri heap yang masih berlaku
+        self._hitam = {}  # key: id_posko, value: {id_orang: urutan} (urut kedatangan)
+        self._entri = {}  # key: id_orang, value: (id_posko, prioritas | None, urutan) yang berlaku
+        self._urutan = itertools.count()
+        self._kunci = threading.Lock()
+
+    # ====== HELPER INTERNAL ======
+
+    def _keluarkan(self, id_orang) -> tuple | None:
+        """Menandai entri korban sebagai basi; mengembalikan entri lama."""
+        entri = self._entri.pop(id_orang, None)
+        if entri is not None and entri[1] is not None:
+            self._jumlah[entri[0]] -= 1
+        elif entri is not None:
+            bucket = self._hitam.get(entri[0])
+            if bucket is not None:
+                bucket.pop(id_orang, None)
+                if not bucket:
+                    del self._hitam[entri[0]]
+        return entri
+
+    def _dorong(self, id_orang, id_posko, status_triase: StatusTriase, urutan: int) -> None:
+        prioritas = PRIORITAS_TRIASE.get(status_triase)
+        self._entri[id_orang] = (id_posko, prioritas, urutan)
+
+        if prioritas is None:
+            self._hitam.setdefault(id_posko, {})[id_orang] = urutan
+            return
+
+        heap = self._heap.setdefault(id_posko, [])
+        heapq.heappush(heap, (prioritas, urutan, id_orang))
+        self._jumlah[id_posko] = self._jumlah.get(id_posko, 0) + 1
+
+        # Entri basi di tengah heap hanya terbuang saat naik ke puncak;
+        # bangun ulang heap jika jumlahnya sudah mendominasi.
+        if len(heap) > 2 * self._jumlah[id_posko] + 64:
+            heap[:] = [e for e in heap if self._entri.get(e[2]) == (id_posko, e[0], e[1])]
+            heapq.heapify(heap)
+
+    def _buang_basi(self, id_posko, heap: list) -> None:
+        """Membuang entri basi di puncak heap."""
+        while heap:
+            prioritas, urutan, id_orang = heap[0]
+            if self._entri.get(id_orang) == (id_posko, prioritas, urutan):
+                return
+            heapq.heappop(heap)
+
+    # ====== OPERASI ANTRIAN ======
+
+    def masukkan(self, id_orang: str, id_posko: str, status_triase: StatusTriase) -> None:
+        """
+        Memasukkan korban ke antrian posko, atau memperbarui posisinya jika sudah ada.
+
+        Args:
+            id_orang (str): ID korban.
+            id_posko (str): ID posko tempat korban menunggu.
+            status_triase (StatusTriase): Status triase saat ini.
+        """
+        with self._kunci:
+            lama = self._keluarkan(id_orang)
+            urutan = lama[2] if lama is not None else next(self._urutan)
+            self._dorong(id_orang, id_posko, status_triase, urutan)
+
+    def masukkan_banyak(self, daftar_entri) -> None:
+        """
+        Seperti masukkan() untuk banyak korban dengan satu kali penguncian (registrasi/impor massal).
+
+        Args:
+            daftar_entri (Iterable[tuple[str, str, StatusTriase]]): (id_orang, id_posko, status_triase),
+                urutan kedatangan mengikuti urutan iterasi.
+        """
+        with self._kunci:
+            for id_orang, id_posko, status_triase in daftar_entri:
+                lama = self._keluarkan(id_orang)
+                urutan = lama[2] if lama is not None else next(self._urutan)
+                self._dorong(id_orang, id_posko, status_triase, urutan)
+
+    def isi_dari(self, daftar_korban) -> None:
+        """
+        Mengisi antrian dari korban yang sudah tersimpan (misal saat start dengan backend SQLite).
+
+        Urutan kedatangan mengikuti urutan iterasi daftar_korban.
+
+        Args:
+            daftar_korban (Iterable[Korban]): Korban yang akan dimasukkan.
+        """
+        self.masukkan_banyak(
+            (korban.get_id_orang(), korban.get_posko().get_id_posko(), korban.get_status_triase())
+            for korban in daftar_korban
+        )
+
+    def perbarui(self, id_orang: str, id_posko: str, status_triase: StatusTriase) -> bool:
+        """
+        Memperbarui triase/posko korban yang masih menunggu (reprioritas).
+
+        Returns:
+            bool: True jika korban ada di antrian, False jika tidak (tidak ditambahkan).
+        """
+        with self._kunci:
+            lama = self._keluarkan(id_orang)
+            if lama is None:
+                return False
+            self._dorong(id_orang, id_posko, status_triase, lama[2])
+            return True
+
+    def keluarkan(self, id_orang: str) -> bool:
+        """
+        Mengeluarkan korban dari antrian (misalnya karena dihapus).
+
+        Returns:
+            bool: True jika korban sebelumnya ada di antrian.
+        """
+        with self._kunci:
+            return self._keluarkan(id_orang) is not None
+
+    def ambil_berikutnya(self, id_posko: str) -> str | None:
+        """
+        Mengeluarkan pasien berikutnya (prioritas tertinggi) dari antrian posko.
+
+        Returns:
+            str | None: id_orang korban, atau None jika antrian kosong.
+        """
+        with self._kunci:
+            heap = self._heap.get(id_posko)
+            if not heap:
+                return None
+
+            self._buang_basi(id_posko, heap)
+            if not heap:
+                del self._heap[id_posko]
+                return None
+
+            _, _, id_orang = heapq.heappop(heap)
+            del self._entri[id_orang]
+            self._jumlah[id_posko] -= 1
+            return id_orang
+
+    def lihat_berikutnya(self, id_posko: str) -> str | None:
+        """
+        Melihat pasien berikutnya tanpa mengeluarkannya dari antrian.
+
+        Returns:
+            str | None: id_orang korban, atau None jika antrian kosong.
+        """
+        with self._kunci:
+            heap = self._heap.get(id_posko)
+            if not heap:
+                return None
+            self._buang_basi(id_posko, heap)
+            return heap[0][2] if heap else None
+
+    def daftar_hitam(self, id_posko: str) -> list[str]:
+        """
+        Mengambil korban triase hitam di posko, urut kedatangan.
+
+        Returns:
+            list[str]: Daftar id_orang.
+        """
+        with self._kunci:
+            bucket = self._hitam.get(id_posko, {})
+            return sorted(bucket, key=bucket.__getitem__)
+
+    def panjang(self, id_posko: str) -> int:
+        """
+        Menghitung pasien yang menunggu di posko (tanpa triase hitam).
+
+        Returns:
+            int: Jumlah pasien di antrian posko.
+        """
+        return self._jumlah.get(id_posko, 0)
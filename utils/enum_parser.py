@@ -4,6 +4,36 @@ from typing import Type, TypeVar
 
 E = TypeVar("E", bound=Enum)
 
+# key: kelas Enum, value: (tabel lookup, pesan error). Dibangun sekali per kelas.
+_TABEL_ENUM: dict[type, tuple[dict[str, Enum], str]] = {}
+
+
+def _tabel_untuk(enum_cls: Type[E]) -> tuple[dict[str, E], str]:
+    """
+    Mengambil (atau membangun sekali) tabel lookup untuk satu kelas Enum.
+
+    Tabel berisi value anggota Enum beserta variasi huruf yang umum
+    ("Kuning", "KUNING", "Laki-Laki"), sehingga input seperti itu langsung
+    ketemu tanpa lower(). Penulisan lain tetap dicari lewat lower(), jadi
+    hasilnya sama dengan enum_cls(value.lower()).
+    """
+    entri = _TABEL_ENUM.get(enum_cls)
+    if entri is None:
+        tabel = {}
+        for anggota in enum_cls:
+            nilai = anggota.value
+            # Value non-string/berhuruf besar tidak pernah cocok dengan value.lower()
+            if not isinstance(nilai, str) or nilai != nilai.lower():
+                continue
+            for variasi in (nilai, nilai.upper(), nilai.capitalize(), nilai.title()):
+                if variasi.lower() == nilai:
+                    tabel[variasi] = anggota
+
+        valid_values = [e.value for e in enum_cls]
+        entri = (tabel, f"Nilai tidak valid. Pilihan yang tersedia: {valid_values}")
+        _TABEL_ENUM[enum_cls] = entri
+    return entri
+
 
 def parse_enum(enum_cls: Type[E], value: str) -> E:
     """
@@ -13,6 +43,9 @@ def parse_enum(enum_cls: Type[E], value: str) -> E:
     Contoh:
         "Aktif", "AKTIF", "aktif" -> StatusBencana.AKTIF
 
+    Lookup memakai tabel per kelas Enum yang dibangun sekali (lihat
+    _tabel_untuk), bukan Enum.__call__ di setiap panggilan.
+
     Args:
         enum_cls (Type[Enum]): Kelas Enum tujuan.
         value (str): Nilai input (biasanya dari user).
@@ -26,13 +59,13 @@ def parse_enum(enum_cls: Type[E], value: str) -> E:
     if not isinstance(value, str):
         raise ValueError("Nilai enum harus berupa string")
 
-    try:
-        return enum_cls(value.lower())
-    except ValueError:
-        valid_values = [e.value for e in enum_cls]
-        raise ValueError(
-            f"Nilai tidak valid. Pilihan yang tersedia: {valid_values}"
-        )
+    tabel, pesan_error = _TABEL_ENUM.get(enum_cls) or _tabel_untuk(enum_cls)
+    anggota = tabel.get(value)
+    if anggota is None:
+        anggota = tabel.get(value.lower())
+        if anggota is None:
+            raise ValueError(pesan_error)
+    return anggota
 # Contoh penggunaan:
 # from utils.enums.status_bencana import StatusBencana
 # status = parse_enum(StatusBencana, "Aktif")
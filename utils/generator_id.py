@@ -1,14 +1,230 @@
+import hashlib
+import os
+import threading
+import time
 import uuid
+from datetime import datetime, timezone
+
+# Status generator UUIDv7 (dibagi semua thread, dijaga _kunci_generator)
+_kunci_generator = threading.Lock()
+_ms_terakhir = 0
+_counter_terakhir = 0
+
+_MAKS_COUNTER = 0xFFF  # 12 bit rand_a dipakai sebagai counter per milidetik
+_SISA_ID_TERKECIL = "7000-8000-000000000000"  # counter 0 & bit acak 0
+
+
+def _ambil_waktu_dan_counter(jumlah: int = 1) -> tuple[int, int]:
+    """
+    Memesan `jumlah` pasangan (ms, counter) berurutan yang selalu naik.
+
+    Dalam milidetik yang sama counter dinaikkan; jika counter habis atau jam
+    sistem mundur, timestamp dipinjam maju 1 ms dari nilai terakhir sehingga
+    ID tetap monoton di dalam satu proses.
+
+    Returns:
+        tuple[int, int]: (ms, counter) untuk ID pertama.
+    """
+    global _ms_terakhir, _counter_terakhir
+
+    sekarang = time.time_ns() // 1_000_000
+    with _kunci_generator:
+        if sekarang > _ms_terakhir:
+            ms, counter = sekarang, 0
+        else:
+            ms, counter = _ms_terakhir, _counter_terakhir + 1
+            if counter > _MAKS_COUNTER:
+                ms, counter = ms + 1, 0
+
+        # ID terakhir batch: geser ke milidetik berikutnya jika counter meluap
+        akhir = counter + jumlah - 1
+        _ms_terakhir = ms + akhir // (_MAKS_COUNTER + 1)
+        _counter_terakhir = akhir % (_MAKS_COUNTER + 1)
+    return ms, counter
+
+
+def _uuid7_bytes(ms: int, counter: int, acak: bytes) -> bytes:
+    """Menyusun 16 byte UUIDv7: 48 bit ms | ver 7 | 12 bit counter | var 10 | 62 bit acak."""
+    rand_b = int.from_bytes(acak, "big") & 0x3FFF_FFFF_FFFF_FFFF
+    nilai = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return nilai.to_bytes(16, "big")
+
+
+def _ke_string(b: bytes) -> str:
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def generate_id_bytes() -> bytes:
+    """
+    Menghasilkan ID baru dalam bentuk biner 16 byte (UUIDv7).
+
+    Returns:
+        bytes: 16 byte ID, urut waktu pembuatan jika dibandingkan per byte.
+    """
+    ms, counter = _ambil_waktu_dan_counter()
+    return _uuid7_bytes(ms, counter, os.urandom(8))
 
 
 def generate_id() -> str:
     """
-    Menghasilkan ID unik berbasis UUID v4.
+    Menghasilkan ID unik berbasis UUID v7 (urut waktu).
+
+    48 bit pertama adalah timestamp milidetik, diikuti counter per
+    milidetik dan bit acak. ID yang dibuat belakangan selalu lebih besar
+    (perbandingan string biasa), sehingga insert ke indeks terurut/B-tree
+    hampir selalu di ujung dan rentang waktu bisa dicari sebagai rentang
+    kunci (lihat batas_id_waktu()). Formatnya tetap string UUID 36 karakter.
 
     Returns:
         str: ID unik dalam bentuk string.
     """
-    return str(uuid.uuid4())
+    return _ke_string(generate_id_bytes())
+
+
+def generate_id_batch(jumlah: int) -> list[str]:
+    """
+    Menghasilkan banyak ID UUID v7 sekaligus.
+
+    Seluruh byte acak diambil dengan satu panggilan os.urandom() dan
+    rentang counter dipesan sekali, bukan satu kali per ID seperti generate_id().
+
+    Args:
+        jumlah (int): Banyaknya ID yang dibutuhkan.
+
+    Returns:
+        list[str]: Daftar ID unik dalam bentuk string, terurut naik.
+
+    Raises:
+        ValueError: Jika jumlah negatif.
+    """
+    if not isinstance(jumlah, int) or jumlah < 0:
+        raise ValueError("Jumlah ID harus integer non-negatif")
+    if jumlah == 0:
+        return []
+
+    ms, counter = _ambil_waktu_dan_counter(jumlah)
+    # Bit varian (10) dipasang langsung di byte pertama setiap 8 byte acak,
+    # lalu seluruhnya di-hex sekali; string ID cukup disusun dari potongan.
+    acak = bytearray(os.urandom(8 * jumlah))
+    acak[::8] = bytes((b & 0x3F) | 0x80 for b in acak[::8])
+    hex_acak = acak.hex()
+
+    hasil = []
+    geser_awalan, awalan = -1, ""
+    for i in range(jumlah):
+        geser, c = divmod(counter + i, _MAKS_COUNTER + 1)
+        if geser != geser_awalan:
+            h = f"{ms + geser:012x}"
+            geser_awalan, awalan = geser, f"{h[:8]}-{h[8:]}-7"
+        r = hex_acak[16 * i:16 * i + 16]
+        hasil.append(f"{awalan}{c:03x}-{r[:4]}-{r[4:]}")
+    return hasil
+
+
+def generate_id_deterministik(ms: int, sumber: str, daftar_nomor: list[int]) -> list[str]:
+    """
+    Menghasilkan ID UUID v7 yang selalu sama untuk (ms, sumber, nomor).
+
+    Dipakai proses yang bisa diulang (misalnya impor yang dilanjutkan):
+    baris yang sama selalu mendapat ID yang sama, jadi baris yang sudah
+    tersimpan bisa dikenali. nomor mengisi counter 12 bit dan meluap ke
+    timestamp, sehingga ID tetap naik mengikuti nomor; 62 bit acak diganti
+    hash dari sumber (dihitung sekali per panggilan).
+
+    Args:
+        ms (int): Timestamp dasar dalam milidetik (misalnya awal impor).
+        sumber (str): Identitas sumber data (misalnya path file).
+        daftar_nomor (list[int]): Nomor urut di dalam sumber (misalnya nomor baris).
+
+    Returns:
+        list[str]: ID per nomor dalam bentuk string, sesuai urutan daftar_nomor.
+
+    Raises:
+        ValueError: Jika ms atau salah satu nomor negatif.
+    """
+    if not isinstance(ms, int) or ms < 0:
+        raise ValueError("ms harus integer non-negatif")
+    acak = bytearray(hashlib.blake2b(sumber.encode("utf-8"), digest_size=8).digest())
+    acak[0] = (acak[0] & 0x3F) | 0x80  # bit varian 10
+    r = acak.hex()
+    akhiran = f"{r[:4]}-{r[4:]}"
+
+    hasil = []
+    geser_awalan, awalan = -1, ""
+    for nomor in daftar_nomor:
+        if not isinstance(nomor, int) or nomor < 0:
+            raise ValueError("Nomor harus integer non-negatif")
+        geser, c = divmod(nomor, _MAKS_COUNTER + 1)
+        if geser != geser_awalan:
+            h = f"{ms + geser:012x}"
+            geser_awalan, awalan = geser, f"{h[:8]}-{h[8:]}-7"
+        hasil.append(f"{awalan}{c:03x}-{akhiran}")
+    return hasil
+
+
+# ====== KONVERSI & RENTANG WAKTU ======
+
+def id_ke_bytes(id_str: str) -> bytes:
+    """
+    Mengubah ID string menjadi bentuk biner 16 byte (misal untuk kolom BLOB).
+
+    Raises:
+        ValueError: Jika id_str bukan UUID yang valid.
+    """
+    return uuid.UUID(id_str).bytes
+
+
+def id_dari_bytes(id_bytes: bytes) -> str:
+    """
+    Mengubah ID biner 16 byte kembali menjadi string UUID.
+
+    Raises:
+        ValueError: Jika panjangnya bukan 16 byte.
+    """
+    if len(id_bytes) != 16:
+        raise ValueError("ID biner harus 16 byte")
+    return _ke_string(id_bytes)
+
+
+def adalah_id_waktu(id_str: str) -> bool:
+    """True jika ID berformat UUIDv7 (punya timestamp), bukan UUIDv4 lama."""
+    return len(id_str) == 36 and id_str[14] == "7"
+
+
+def waktu_dari_id(id_str: str) -> datetime:
+    """
+    Mengambil waktu pembuatan dari ID UUIDv7.
+
+    Returns:
+        datetime: Waktu pembuatan (UTC, presisi milidetik).
+
+    Raises:
+        ValueError: Jika ID bukan UUIDv7.
+    """
+    if not adalah_id_waktu(id_str):
+        raise ValueError("ID tidak memuat timestamp (bukan UUIDv7)")
+    ms = int(id_str[:8] + id_str[9:13], 16)
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def batas_id_waktu(waktu: datetime) -> str:
+    """
+    Menghasilkan ID terkecil untuk satu waktu, sebagai batas rentang kunci.
+
+    Semua ID yang dibuat pada atau setelah `waktu` >= hasil ini, dan semua ID
+    sebelumnya lebih kecil. Rentang waktu [dari, sampai) menjadi rentang
+    kunci [batas_id_waktu(dari), batas_id_waktu(sampai)).
+
+    Args:
+        waktu (datetime): Waktu batas (tanpa tzinfo dianggap waktu lokal).
+
+    Returns:
+        str: Batas ID dalam bentuk string.
+    """
+    ms = max(0, int(waktu.timestamp() * 1000))
+    h = f"{ms:012x}"
+    return f"{h[:8]}-{h[8:]}-{_SISA_ID_TERKECIL}"
 # Contoh penggunaan:
 # unique_id = generate_id()
-# print(unique_id)  # Output: Sebuah UUID v4 unik, misalnya "f47ac10b-58cc-4372-a567-0e02b2c3d479"
\ No newline at end of file
+# print(unique_id)  # Output: Sebuah UUID v7 unik, misalnya "01963f3a-8c2e-7000-8a1b-4f0c9d2e7b13"
\ No newline at end of file
@@ -0,0 +1,150 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class KunciMutex:
+    """
+    Kunci eksklusif dengan antarmuka yang sama seperti KunciBacaTulis.
+
+    Baca dan tulis sama-sama memakai satu RLock (reentrant, sehingga baca
+    di tengah tulis oleh thread yang sama tidak macet). Di CPython dengan
+    GIL pembaca tidak berjalan paralel, jadi kunci ini lebih murah daripada
+    KunciBacaTulis untuk operasi in-memory yang singkat (lihat
+    benchmarks/bench_kunci_repository.py).
+    """
+
+    def __init__(self):
+        """Inisialisasi kunci tanpa pemegang."""
+        self._kunci = threading.RLock()
+
+    def ambil_baca(self) -> bool:
+        """Mengambil kunci (eksklusif); selalu True, lepas dengan lepas_baca()."""
+        self._kunci.acquire()
+        return True
+
+    def lepas_baca(self) -> None:
+        """Melepas kunci yang diambil lewat ambil_baca()."""
+        self._kunci.release()
+
+    def ambil_tulis(self) -> None:
+        """Mengambil kunci (eksklusif); reentrant untuk thread pemilik."""
+        self._kunci.acquire()
+
+    def lepas_tulis(self) -> None:
+        """Melepas kunci yang diambil lewat ambil_tulis()."""
+        self._kunci.release()
+
+    @contextmanager
+    def baca(self) -> Iterator[None]:
+        """Memegang kunci selama blok with berjalan."""
+        with self._kunci:
+            yield
+
+    tulis = baca
+
+
+class KunciBacaTulis:
+    """
+    Kunci baca-tulis (reader-writer lock) untuk data yang lebih sering dibaca.
+
+    Banyak thread boleh membaca bersamaan; penulis mendapat akses eksklusif.
+    Penulis yang sedang menunggu didahulukan dari pembaca baru, sehingga
+    aliran baca yang terus-menerus tidak membuat penulis kelaparan.
+
+    Kunci tulis reentrant untuk thread pemiliknya: thread yang memegang
+    kunci tulis boleh mengambil kunci tulis lagi atau membaca tanpa
+    menunggu (misalnya UnitOfWork yang membaca data lama di tengah
+    penulisan). Kunci baca tidak boleh dinaikkan menjadi kunci tulis.
+
+    Contoh:
+        kunci = KunciBacaTulis()
+        with kunci.baca():
+            ...
+        with kunci.tulis():
+            ...
+    """
+
+    def __init__(self):
+        """Inisialisasi kunci tanpa pemegang."""
+        mutex = threading.Lock()
+        # Dua kondisi terpisah agar pelepasan kunci hanya membangunkan pihak
+        # yang bisa lanjut, bukan seluruh thread yang menunggu
+        self._boleh_baca = threading.Condition(mutex)
+        self._boleh_tulis = threading.Condition(mutex)
+        self._pembaca = 0  # jumlah thread yang sedang membaca
+        self._penulis: int | None = None  # ident thread pemegang kunci tulis
+        self._kedalaman_tulis = 0  # jumlah tulis() bersarang milik _penulis
+        self._penulis_menunggu = 0
+
+    def ambil_baca(self) -> bool:
+        """
+        Mengambil kunci baca, menunggu selama ada penulis aktif/menunggu.
+
+        Returns:
+            bool: True jika kunci baca benar-benar diambil (harus dilepas
+            dengan lepas_baca), False jika thread ini sudah memegang kunci
+            tulis sehingga tidak ada yang perlu dilepas.
+        """
+        if self._penulis == threading.get_ident():
+            return False
+        with self._boleh_baca:
+            while self._penulis is not None or self._penulis_menunggu:
+                self._boleh_baca.wait()
+            self._pembaca += 1
+        return True
+
+    def lepas_baca(self) -> None:
+        """Melepas kunci baca yang diambil lewat ambil_baca()."""
+        with self._boleh_baca:
+            self._pembaca -= 1
+            if not self._pembaca and self._penulis_menunggu:
+                self._boleh_tulis.notify()
+
+    def ambil_tulis(self) -> None:
+        """Mengambil kunci tulis (eksklusif); reentrant untuk thread pemilik."""
+        saya = threading.get_ident()
+        with self._boleh_tulis:
+            if self._penulis != saya:
+                self._penulis_menunggu += 1
+                try:
+                    while self._penulis is not None or self._pembaca:
+                        self._boleh_tulis.wait()
+                except BaseException:  # batal menunggu (misal KeyboardInterrupt)
+                    self._penulis_menunggu -= 1
+                    if self._penulis is None and not self._penulis_menunggu:
+                        self._boleh_baca.notify_all()
+                    raise
+                self._penulis_menunggu -= 1
+                self._penulis = saya
+            self._kedalaman_tulis += 1
+
+    def lepas_tulis(self) -> None:
+        """Melepas satu tingkat kunci tulis yang diambil lewat ambil_tulis()."""
+        with self._boleh_tulis:
+            self._kedalaman_tulis -= 1
+            if not self._kedalaman_tulis:
+                self._penulis = None
+                if self._penulis_menunggu:
+                    self._boleh_tulis.notify()
+                else:
+                    self._boleh_baca.notify_all()
+
+    @contextmanager
+    def baca(self) -> Iterator[None]:
+        """Memegang kunci baca selama blok with berjalan."""
+        diambil = self.ambil_baca()
+        try:
+            yield
+        finally:
+            if diambil:
+                self.lepas_baca()
+
+    @contextmanager
+    def tulis(self) -> Iterator[None]:
+        """Memegang kunci tulis (eksklusif) selama blok with berjalan."""
+        self.ambil_tulis()
+        try:
+            yield
+        finally:
+            self.lepas_tulis()
@@ -1,8 +1,267 @@
 # src/utils/logger.py
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+KEBIJAKAN_ANTRIAN = ("blok", "buang", "sampel")
+
+
+class AntrianLogHandler(QueueHandler):
+    """
+    QueueHandler dengan antrian terbatas dan kebijakan saat antrian penuh.
+
+    Kebijakan:
+        - "blok": pemanggil menunggu sampai antrian punya ruang (backpressure).
+        - "buang": record dibuang jika antrian penuh (dihitung di jumlah_dibuang).
+        - "sampel": jika antrian sudah di atas ambang, record di bawah WARNING
+          hanya diteruskan satu dari setiap `rasio_sampel`; WARNING ke atas
+          selalu diteruskan (menunggu jika perlu).
+    """
+
+    def __init__(
+        self,
+        antrian: queue.Queue,
+        kebijakan: str = "blok",
+        rasio_sampel: int = 10,
+        ambang_sampel: float = 0.8,
+        tulis_file: bool = True,
+    ):
+        """
+        Inisialisasi handler antrian.
+
+        Args:
+            antrian (queue.Queue): Antrian terbatas yang dibaca thread penulis.
+            kebijakan (str, optional): "blok", "buang" atau "sampel". Default: "blok".
+            rasio_sampel (int, optional): 1 dari N record diteruskan saat sampling. Default: 10.
+            ambang_sampel (float, optional): Fraksi isi antrian yang memicu sampling. Default: 0.8.
+            tulis_file (bool, optional): Jika False, record tidak ditulis ke file log. Default: True.
+
+        Raises:
+            ValueError: Jika kebijakan tidak dikenal.
+        """
+        if kebijakan not in KEBIJAKAN_ANTRIAN:
+            raise ValueError(f"Kebijakan antrian tidak valid. Pilihan: {list(KEBIJAKAN_ANTRIAN)}")
+
+        super().__init__(antrian)
+        self.kebijakan = kebijakan
+        self.rasio_sampel = max(1, rasio_sampel)
+        self._ambang = max(1, int(antrian.maxsize * ambang_sampel)) if antrian.maxsize > 0 else 0
+        self._tulis_file = tulis_file
+        self._penghitung = 0
+        self.jumlah_dibuang = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Menerapkan kebijakan antrian, lalu memformat dan memasukkan record.
+
+        Keputusan buang/sampel diambil sebelum prepare(): memformat pesan
+        adalah bagian termahal di thread pemanggil, jadi record yang toh akan
+        dibuang tidak ikut membayarnya.
+        """
+        try:
+            if self._dibuang(record):
+                self.jumlah_dibuang += 1
+                return
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def _dibuang(self, record: logging.LogRecord) -> bool:
+        """True jika record dibuang oleh kebijakan "buang"/"sampel" (tanpa memformatnya)."""
+        if self.kebijakan == "blok" or record.levelno >= logging.WARNING:
+            return False
+        if self.kebijakan == "sampel" and self._ambang and self.queue.qsize() >= self._ambang:
+            self._penghitung += 1
+            return self._penghitung % self.rasio_sampel != 0
+        return self.queue.full()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Memformat pesan di thread pemanggil sebelum masuk antrian.
+
+        Seperti QueueHandler standar, args dan exc_info dilebur ke pesan lalu
+        dikosongkan, sehingga objek yang berubah setelah logging (model, dict)
+        tidak ikut mengubah isi log saat ditulis thread penulis. Yang tersisa
+        untuk thread penulis hanya format baris (waktu, level, nama) dan I/O.
+        Berbeda dengan QueueHandler, record tidak disalin: logger dari
+        get_logger() hanya punya handler ini dan tidak propagate, jadi tidak
+        ada handler lain yang masih membutuhkan args aslinya.
+        """
+        pesan = self.format(record)
+        record.message = record.msg = pesan
+        record.args = record.exc_info = record.exc_text = record.stack_info = None
+        if not self._tulis_file:
+            record.tanpa_file = True
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Memasukkan record ke antrian; hanya "blok" dan WARNING ke atas yang menunggu ruang."""
+        if self.kebijakan == "blok" or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.jumlah_dibuang += 1  # antrian terisi di antara _dibuang() dan put
+
+
+class _PenulisLog(QueueListener):
+    """QueueListener yang menunggu ruang antrian saat mengirim sinyal berhenti."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _FilterTanpaFile(logging.Filter):
+    """Menolak record dari logger yang dibuat dengan log_to_file=False."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not getattr(record, "tanpa_file", False)
+
+
+_kunci_handler = threading.Lock()
+_handler_bersama: dict[str, logging.Handler] = {}  # registry handler untuk seluruh proses
+
+_kunci_asinkron = threading.Lock()
+_asinkron: dict = {}  # berisi listener & handler saat mode asinkron aktif
+
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+def _buat_console_handler() -> logging.Handler:
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_FORMATTER)
+    return console_handler
+
+
+def _buat_file_handler() -> logging.Handler:
+    logs_dir = Path("logs")
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        logs_dir / "app.log",
+        maxBytes=1_000_000,  # ~1 MB
+        backupCount=3,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(_FORMATTER)
+    file_handler.addFilter(_FilterTanpaFile())
+    return file_handler
+
+
+def _ambil_handler(nama: str) -> logging.Handler:
+    """
+    Mengambil handler bersama dari registry, membuatnya sekali jika belum ada.
+
+    Seluruh logger memakai satu console handler dan satu RotatingFileHandler,
+    sehingga logs/app.log hanya dibuka sekali dan rotasi dilakukan oleh satu
+    handler (dengan satu lock) untuk seluruh proses. Level handler dibiarkan
+    NOTSET; penyaringan level dilakukan oleh masing-masing logger.
+
+    Args:
+        nama (str): "console" atau "file".
+
+    Returns:
+        logging.Handler: Handler bersama.
+    """
+    handler = _handler_bersama.get(nama)
+    if handler is not None:
+        return handler
+
+    with _kunci_handler:
+        if nama not in _handler_bersama:
+            pembuat = _buat_console_handler if nama == "console" else _buat_file_handler
+            _handler_bersama[nama] = pembuat()
+        return _handler_bersama[nama]
+
+
+def aktifkan_logging_asinkron(
+    ukuran_antrian: int = 10_000,
+    kebijakan: str = "blok",
+    rasio_sampel: int = 10,
+) -> None:
+    """
+    Mengaktifkan mode logging asinkron untuk seluruh proses.
+
+    Logger yang dibuat get_logger() setelah fungsi ini dipanggil hanya
+    memasukkan record ke antrian terbatas; satu thread latar belakang
+    (QueueListener) yang menulis ke console dan logs/app.log.
+
+    Args:
+        ukuran_antrian (int, optional): Kapasitas antrian. Default: 10_000.
+        kebijakan (str, optional): "blok", "buang" atau "sampel" saat antrian penuh. Default: "blok".
+        rasio_sampel (int, optional): 1 dari N record diteruskan pada kebijakan "sampel". Default: 10.
+
+    Raises:
+        ValueError: Jika ukuran antrian atau kebijakan tidak valid.
+    """
+    if not isinstance(ukuran_antrian, int) or ukuran_antrian <= 0:
+        raise ValueError("Ukuran antrian harus integer positif")
+
+    with _kunci_asinkron:
+        if _asinkron:
+            return
+
+        antrian: queue.Queue = queue.Queue(maxsize=ukuran_antrian)
+
+        listener = _PenulisLog(antrian, _ambil_handler("console"), _ambil_handler("file"))
+        listener.start()
+
+        _asinkron["listener"] = listener
+        _asinkron["handler_file"] = AntrianLogHandler(antrian, kebijakan, rasio_sampel)
+        _asinkron["handler_tanpa_file"] = AntrianLogHandler(antrian, kebijakan, rasio_sampel, tulis_file=False)
+
+
+def hentikan_logging_asinkron() -> None:
+    """
+    Menghentikan mode asinkron dan menunggu antrian dikosongkan.
+
+    Logger yang memegang handler antrian dikembalikan ke handler console/file
+    bersama lebih dulu, baru thread penulis dihentikan. Tanpa itu record
+    berikutnya masuk ke antrian yang tidak lagi dibaca, dan dengan kebijakan
+    "blok" pemanggil akan menunggu selamanya begitu antrian penuh.
+    """
+    with _kunci_asinkron:
+        if not _asinkron:
+            return
+
+        handler_file, handler_tanpa_file = _asinkron["handler_file"], _asinkron["handler_tanpa_file"]
+        for logger in list(logging.Logger.manager.loggerDict.values()):
+            handlers = getattr(logger, "handlers", None)  # PlaceHolder tidak punya handler
+            if not handlers:
+                continue
+            if handler_file in handlers or handler_tanpa_file in handlers:
+                langsung = [_ambil_handler("console")]
+                if handler_file in handlers:
+                    langsung.append(_ambil_handler("file"))
+                logger.handlers = [
+                    h for h in handlers if h is not handler_file and h is not handler_tanpa_file
+                ] + langsung
+
+        _asinkron["listener"].stop()
+        _asinkron.clear()
+
+
+def jumlah_log_dibuang() -> int:
+    """
+    Mengembalikan jumlah record yang dibuang oleh kebijakan "buang"/"sampel".
+
+    Returns:
+        int: Total record yang tidak sampai ke thread penulis.
+    """
+    if not _asinkron:
+        return 0
+    return _asinkron["handler_file"].jumlah_dibuang + _asinkron["handler_tanpa_file"].jumlah_dibuang
+
+
+atexit.register(hentikan_logging_asinkron)
+
 
 def get_logger(
     name: str,
@@ -12,6 +271,11 @@ def get_logger(
     """
     Mendapatkan logger yang sudah terkonfigurasi dengan format dan handler konsisten.
 
+    Semua logger berbagi handler console dan file yang sama (lihat
+    _ambil_handler), sehingga memanggil fungsi ini berulang kali tidak membuka
+    file baru. Jika aktifkan_logging_asinkron() sudah dipanggil, logger hanya
+    diberi handler antrian dan penulisan dilakukan oleh thread latar belakang.
+
     Args:
         name (str): Biasanya __name__ dari modul pemanggil.
         log_to_file (bool, optional): Jika True, log juga ditulis ke logs/app.log (rotating). Default: True.
@@ -24,33 +288,15 @@ def get_logger(
     logger.setLevel(level)
     logger.propagate = False
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
-
-    fmt = logging.Formatter(
-        fmt="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if _asinkron:
+        handlers = [_asinkron["handler_file" if log_to_file else "handler_tanpa_file"]]
+    else:
+        handlers = [_ambil_handler("console")]
+        if log_to_file:
+            handlers.append(_ambil_handler("file"))
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(fmt)
-    logger.addHandler(console_handler)
-
-    # Optional file handler (rotating)
-    if log_to_file:
-        logs_dir = Path("logs")
-        logs_dir.mkdir(parents=True, exist_ok=True)
-
-        file_handler = RotatingFileHandler(
-            logs_dir / "app.log",
-            maxBytes=1_000_000,  # ~1 MB
-            backupCount=3,
-            encoding="utf-8",
-        )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(fmt)
-        logger.addHandler(file_handler)
+    # Logger yang sudah terpasang dengan handler yang sama tidak disentuh lagi
+    if logger.handlers != handlers:
+        logger.handlers = handlers
 
     return logger